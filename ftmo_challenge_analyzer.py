@@ -24,7 +24,6 @@ Usage:
 
 import argparse
 import json
-import csv
 import os
 import random
 import numpy as np
@@ -37,8 +36,10 @@ import pandas as pd
 from strategy_core import (
     StrategyParams,
     Trade,
+    TradeBuffer,
     Signal,
     compute_confluence,
+    generate_signals,
     simulate_trades,
     _infer_trend,
     _pick_direction_from_bias,
@@ -52,19 +53,27 @@ from strategy_core import (
 
 from ftmo_config import FTMO_CONFIG, FTMO10KConfig, get_pip_size, get_sl_limits
 from config import FOREX_PAIRS, METALS, INDICES, CRYPTO_ASSETS
-from tradr.risk.position_sizing import calculate_lot_size, get_contract_specs
-from params.params_loader import save_optimized_params
+from params.params_loader import get_transaction_costs, save_optimized_params
+from tradr.data.resample import load_symbol_timeframes
+from tradr.utils.trade_export import export_backtest_trades
 
 # Professional Quant Suite Integration
 from professional_quant_suite import (
     RiskMetrics,
+    TradeFrame,
     calculate_risk_metrics,
+    calculate_risk_metrics_from_arrays,
+    trade_entry_epochs,
+    trade_rr_array,
     WalkForwardTester,
     ParameterSensitivityAnalyzer,
     generate_professional_report,
 )
 
 from tradr.utils.output_manager import get_output_manager, set_output_manager
+from tradr.utils.study_status import StudyStatusReader, ensure_value_index, sqlite_path
+from tradr.utils.trial_artifacts import ARTIFACT_ATTR, TrialArtifactStore, load_trial_artifacts
+from tradr.utils.trial_journal import TrialJournalReader, find_journals, write_json_atomic
 
 OUTPUT_DIR = Path("ftmo_analysis_output")
 OUTPUT_DIR.mkdir(exist_ok=True)
@@ -73,10 +82,13 @@ def save_best_params_persistent(best_params: Dict) -> None:
     """
     Save best parameters to best_params.json for instant bot updates.
     This persists even if optimization run is halted abruptly.
+    
+    Written once per run (temp file + rename, so the bot never reads a
+    partial file); per-trial improvements go to the trial journal instead.
     """
     try:
         params_file = Path("best_params.json")
-        params_file.write_text(json.dumps(best_params, indent=2))
+        write_json_atomic(params_file, best_params)
         print(f"✓ Best parameters saved to best_params.json")
     except Exception as e:
         print(f"[!] Error saving best_params.json: {e}")
@@ -87,6 +99,13 @@ DEFAULT_STUDY_NAME = "regime_adaptive_v2_clean"
 OPTUNA_DB_PATH = DEFAULT_OPTUNA_DB_PATH
 
 _DATA_CACHE: Dict[str, List[Dict]] = {}
+# Per cache key: (time_ms, bad, bad_run) arrays aligned with _DATA_CACHE
+_DATA_INDEX: Dict[str, Tuple[np.ndarray, np.ndarray, np.ndarray]] = {}
+
+# How load_ohlcv_data treats bars flagged by tradr.data.quality:
+#   "keep" - return them; "skip" - drop runs of degenerate bars;
+#   "mask" - drop every flat/invalid bar
+OHLCV_QUALITY_MODE = os.getenv("OHLCV_QUALITY_MODE", "skip")
 OPTUNA_STUDY_NAME = DEFAULT_STUDY_NAME
 PROGRESS_LOG_FILE = "ftmo_optimization_progress.txt"
 
@@ -138,6 +157,25 @@ TRAINING_QUARTERS = {
 
 ACCOUNT_SIZE = 60000.0  # 5ers 60K High Stakes
 
+
+def build_quarters(start: datetime, end: datetime) -> Dict[str, Tuple[datetime, datetime]]:
+    """
+    Build calendar quarters overlapping [start, end] in the same
+    {"YYYY_QN": (first_day, last_day)} form as TRAINING_QUARTERS.
+    """
+    quarters = {}
+    for year in range(start.year, end.year + 1):
+        for quarter in range(1, 5):
+            q_start = datetime(year, 3 * quarter - 2, 1)
+            if quarter == 4:
+                q_end = datetime(year, 12, 31)
+            else:
+                q_end = datetime(year, 3 * quarter + 1, 1) - timedelta(days=1)
+            if q_end < start or q_start > end:
+                continue
+            quarters[f"{year}_Q{quarter}"] = (q_start, q_end)
+    return quarters
+
 DEFAULT_EXCLUDED_ASSETS: List[str] = []
 
 # TIMEFRAME CONFIGURATION
@@ -415,7 +453,7 @@ class FTMOComplianceTracker:
     @property
     def daily_loss_pct(self) -> float:
         """Current daily loss as percentage of day start balance."""
-        if self.current_balance >= self.day_start_balance:
+        if self.current_balance >= self.day_start_balance or self.day_start_balance <= 0:
             return 0.0
         return ((self.day_start_balance - self.current_balance) / self.day_start_balance) * 100
 
@@ -430,7 +468,7 @@ class FTMOComplianceTracker:
         This is NOT peak-to-trough! If you grow to €250k then drop to €210k,
         your FTMO drawdown is 0% (still above €200k start).
         """
-        if self.current_balance >= self.starting_balance:
+        if self.current_balance >= self.starting_balance or self.starting_balance <= 0:
             return 0.0
         return ((self.starting_balance - self.current_balance) / self.starting_balance) * 100
 
@@ -440,14 +478,14 @@ class FTMOComplianceTracker:
         Traditional peak-to-trough drawdown (for informational purposes).
         NOT used for FTMO compliance, but useful for risk analysis.
         """
-        if self.current_balance >= self.highest_balance:
+        if self.current_balance >= self.highest_balance or self.highest_balance <= 0:
             return 0.0
         return ((self.highest_balance - self.current_balance) / self.highest_balance) * 100
 
     @property
     def max_ftmo_dd_pct(self) -> float:
         """Maximum FTMO drawdown experienced (lowest point below start)."""
-        if self.lowest_balance >= self.starting_balance:
+        if self.lowest_balance >= self.starting_balance or self.starting_balance <= 0:
             return 0.0
         return ((self.starting_balance - self.lowest_balance) / self.starting_balance) * 100
 
@@ -509,7 +547,7 @@ class FTMOComplianceTracker:
             'final_balance': self.current_balance,
             'highest_balance': self.highest_balance,
             'lowest_balance': self.lowest_balance,
-            'total_return_pct': ((self.current_balance - self.starting_balance) / self.starting_balance) * 100,
+            'total_return_pct': ((self.current_balance - self.starting_balance) / self.starting_balance) * 100 if self.starting_balance > 0 else 0.0,
             'max_ftmo_dd_pct': self.max_ftmo_dd_pct,
             'max_peak_trough_dd_pct': ((self.highest_balance - self.lowest_balance) / self.highest_balance) * 100 if self.highest_balance > 0 else 0,
             'trades_skipped_daily': self.trades_skipped_daily,
@@ -520,9 +558,14 @@ class FTMOComplianceTracker:
             'challenge_passed': self.halted_reason is None and self.max_ftmo_dd_pct < 10.0,
         }
 
-def compute_ftmo_compliance(trades: List[Any], risk_per_trade_usd: float) -> Dict:
-    """Compute FTMO compliance metrics for a list of trades."""
+def compute_ftmo_compliance(trades: Union[List[Any], TradeFrame], risk_per_trade_usd: float) -> Dict:
+    """
+    Compute FTMO compliance metrics for a list of trades (or a TradeFrame).
 
+    Vectorized equivalent of replaying the trades in entry order through
+    FTMOComplianceTracker.update_after_trade().
+    """
+    frame = TradeFrame.from_trades(trades)
     tracker = FTMOComplianceTracker(
         account_size=ACCOUNT_SIZE,
         starting_balance=ACCOUNT_SIZE,
@@ -531,27 +574,53 @@ def compute_ftmo_compliance(trades: List[Any], risk_per_trade_usd: float) -> Dic
         lowest_balance=ACCOUNT_SIZE,
         day_start_balance=ACCOUNT_SIZE,
     )
-
-    trades_sorted = sorted(trades, key=lambda t: str(getattr(t, 'entry_date', '')))
-
-    for trade in trades_sorted:
-        entry = getattr(trade, 'entry_date', None)
-        trade_date: Optional[date] = None
-
-        if isinstance(entry, str):
-            try:
-                parsed = datetime.fromisoformat(entry.replace("Z", "+00:00"))
-                trade_date = parsed.date()
-            except Exception:
-                trade_date = None
-        elif isinstance(entry, datetime):
-            trade_date = entry.date()
-        elif isinstance(entry, date):
-            trade_date = entry
-
-        rr_value = getattr(trade, 'rr', getattr(trade, 'r_multiple', 0))
-        pnl = rr_value * risk_per_trade_usd
-        tracker.update_after_trade(pnl=pnl, trade_date=trade_date)
+    if len(frame) == 0:
+        return tracker.get_report()
+
+    order = frame.entry_order()
+    pnl = frame.rr[order] * risk_per_trade_usd
+    balance = tracker.starting_balance + np.cumsum(pnl)
+    balance_before = balance - pnl
+
+    # Trades without a date stay on the current day, so forward-fill day keys
+    days = frame.day_index()[order]
+    last_dated = np.maximum.accumulate(np.where(days >= 0, np.arange(len(days)), -1))
+    day_key = np.where(last_dated >= 0, days[np.maximum(last_dated, 0)], -1)
+    new_day = (day_key >= 0) & (day_key != np.concatenate(([-1], day_key[:-1])))
+    day_starts = np.concatenate(([tracker.starting_balance], balance_before[new_day]))
+    day_start_balance = day_starts[np.cumsum(new_day)]
+
+    # A zero (or blown) reference balance counts as 0%, like the tracker's
+    # properties, instead of dividing by zero
+    daily_loss_pct = np.divide(
+        day_start_balance - balance,
+        day_start_balance,
+        out=np.zeros_like(balance),
+        where=(balance < day_start_balance) & (day_start_balance > 0),
+    ) * 100
+    starting = tracker.starting_balance
+    total_dd_pct = np.divide(
+        starting - balance,
+        starting,
+        out=np.zeros_like(balance),
+        where=(balance < starting) & (starting > 0),
+    ) * 100
+
+    tracker.current_balance = float(balance[-1])
+    tracker.highest_balance = max(tracker.highest_balance, float(balance.max()))
+    tracker.lowest_balance = min(tracker.lowest_balance, float(balance.min()))
+    tracker.day_start_balance = float(day_start_balance[-1])
+
+    # The tracker keeps the reason of the last breach; total DD is checked first
+    total_breach = total_dd_pct >= 10.0
+    daily_breach = ~total_breach & (daily_loss_pct >= 5.0)
+    breaches = np.flatnonzero(total_breach | daily_breach)
+    if len(breaches):
+        i = breaches[-1]
+        if total_breach[i]:
+            tracker.halted_reason = f"FAILED: Total DD {total_dd_pct[i]:.1f}% >= 10% (below starting balance)"
+        else:
+            tracker.halted_reason = f"FAILED: Daily loss {daily_loss_pct[i]:.1f}% >= 5%"
 
     return tracker.get_report()
 
@@ -569,41 +638,93 @@ def log_optimization_progress(trial_num: int, value: float, best_value: float, b
         f.write(log_entry)
 
 
+def show_journal_status(journal_path: Path, top_k: int = 5, recent: int = 10) -> None:
+    """Print status of one trial journal (memory-mapped; no Optuna DB access)."""
+    reader = TrialJournalReader(journal_path)
+    summary = reader.summary()
+    
+    print(f"\nJournal: {journal_path}")
+    print(f"Logged Trials: {summary['trials']} ({summary['unique_trials']} unique)")
+    print(f"FTMO Challenge Passed: {summary['ftmo_passed']}")
+    print(f"Last Update: {summary['last_logged']}")
+    
+    best = summary['best']
+    if best:
+        print(f"\nBest Value: {best['score']:.0f} (Trial #{best['trial_number']})")
+        latest = reader.latest_params()
+        if latest and latest.get('params'):
+            print(f"Best Parameters (Trial #{latest['trial_number']}):")
+            for k, v in sorted(latest['params'].items()):
+                if isinstance(v, float):
+                    print(f"  {k}: {v:.3f}")
+                else:
+                    print(f"  {k}: {v}")
+    
+    print(f"\nTOP {top_k} TRIALS:")
+    for row in reader.top(top_k):
+        print(f"  #{row['trial_number']:<6} Score={row['score']:.2f} R={row['total_r']:+.1f} "
+              f"WR={row['win_rate']:.1f}% Sharpe={row['sharpe_ratio']:.2f} Trades={row['total_trades']}")
+    
+    print(f"\nRECENT TRIALS (last {recent}):")
+    for row in reader.recent(recent):
+        print(f"  [{row['timestamp']}] #{row['trial_number']:<6} Score={row['score']:.2f} "
+              f"R={row['total_r']:+.1f} WR={row['win_rate']:.1f}%")
+
+
 def show_optimization_status():
     """Display current optimization status without running new trials."""
-    import optuna
-    
     print("\n" + "=" * 60)
     print("FTMO OPTIMIZATION STATUS CHECK")
     print("=" * 60)
     
-    db_file = "regime_adaptive_v2_clean.db"
-    if not os.path.exists(db_file):
+    # Trial journals answer from a memory map without loading the Optuna study
+    journals = find_journals(OUTPUT_DIR)
+    if journals:
+        for journal_path in journals:
+            show_journal_status(journal_path)
+        print(f"\n{'='*60}")
+        print("To resume optimization: python ftmo_challenge_analyzer.py")
+        print("=" * 60)
+        return
+    
+    # Indexed column queries on the storage DB (no optuna.load_study / study.trials)
+    db_file = sqlite_path(OPTUNA_DB_PATH)
+    if not db_file.exists():
         print("\nNo optimization study found.")
         print("Run 'python ftmo_challenge_analyzer.py' to start optimization.")
         return
     
     try:
-        study = optuna.load_study(
-            study_name=OPTUNA_STUDY_NAME,
-            storage=OPTUNA_DB_PATH
-        )
+        with StudyStatusReader(OPTUNA_DB_PATH, OPTUNA_STUDY_NAME) as status:
+            counts = status.state_counts()
+            best = status.best()
+            best_params = status.best_params() if best else {}
+            top = status.top(5)
+            last_complete = status.last_complete()
         
         print(f"\nStudy Name: {OPTUNA_STUDY_NAME}")
-        print(f"Completed Trials: {len(study.trials)}")
+        print(f"Total Trials: {sum(counts.values())}")
+        for state in sorted(counts):
+            print(f"  {state}: {counts[state]}")
         
-        if study.best_trial:
-            print(f"\nBest Value: {study.best_value:.0f}")
+        if best:
+            print(f"\nBest Value: {best['value']:.0f} (Trial #{best['number']})")
             print(f"Best Parameters:")
-            for k, v in sorted(study.best_params.items()):
+            for k, v in sorted(best_params.items()):
                 if isinstance(v, float):
                     print(f"  {k}: {v:.3f}")
                 else:
                     print(f"  {k}: {v}")
             
-            best_trial = study.best_trial
-            if best_trial.datetime_complete:
-                print(f"\nLast Update: {best_trial.datetime_complete.strftime('%Y-%m-%d %H:%M:%S')}")
+            print(f"\nTOP {len(top)} TRIALS:")
+            for row in top:
+                attrs = row['user_attrs']
+                print(f"  #{row['number']:<6} Score={row['value']:.2f} "
+                      f"R={attrs.get('total_r', 'N/A')} WR={attrs.get('win_rate', 'N/A')}% "
+                      f"Sharpe={attrs.get('sharpe_ratio', 'N/A')}")
+            
+            if last_complete:
+                print(f"\nLast Update: {str(last_complete)[:19]}")
         else:
             print("\nNo completed trials yet.")
         
@@ -914,8 +1035,256 @@ def simulate_ftmo_challenge(trades: List[Any], start_month: str = "2024-01", ris
     }
 
 
-def load_ohlcv_data(symbol: str, timeframe: str, start_date: datetime, end_date: datetime) -> List[Dict]:
-    """Load OHLCV data from local CSV files only (no API calls). Uses cache for performance."""
+class FTMOChallengeMonteCarlo:
+    """
+    Batched 5ers/FTMO challenge simulator for pass-probability estimation.
+
+    simulate_ftmo_challenge() walks a single deterministic path. This class
+    collapses the trade list into a weekday calendar of (day P/L, intraday
+    trough) pairs once, then resamples thousands of day sequences at the same
+    time and runs the daily-balance accounting as NumPy array operations.
+
+    Rules come from FTMO_CONFIG (ftmo_config.py):
+    - Daily loss: intraday trough vs. day-start balance >= max_daily_loss_pct
+    - Total DD: intraday low below starting balance by >= max_total_drawdown_pct
+    - Pass: closing balance >= target AND >= min_profitable_days profitable days
+
+    Resampling modes:
+    - "bootstrap": days drawn independently with replacement
+    - "block": contiguous blocks of block_size days (keeps streaks/clustering)
+    """
+
+    def __init__(
+        self,
+        trades: List[Any],
+        risk_pct: float = 0.6,
+        target_pct: Optional[float] = None,
+        max_days: Optional[int] = None,
+        method: str = "block",
+        block_size: int = 10,
+        seed: int = 42,
+    ):
+        self.account_size = FTMO_CONFIG.account_size
+        self.risk_pct = risk_pct
+        self.target_pct = target_pct if target_pct is not None else FTMO_CONFIG.phase1_target_pct
+        self.max_daily_loss_pct = FTMO_CONFIG.max_daily_loss_pct
+        self.max_total_dd_pct = FTMO_CONFIG.max_total_drawdown_pct
+        self.min_profitable_days = FTMO_CONFIG.min_profitable_days
+        self.method = method
+        self.block_size = max(1, int(block_size))
+        self.seed = seed
+
+        self.day_r, self.day_trough_r = self._build_daily_series(trades)
+        self.max_days = int(max_days) if max_days else len(self.day_r)
+
+    @staticmethod
+    def _build_daily_series(trades: List[Any]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Collapse trades onto a weekday calendar.
+
+        Returns:
+            (day_r, day_trough_r) arrays, one entry per weekday between the first
+            and last trade. day_trough_r is the lowest intraday cumulative R
+            (<= 0) reached while that day's trades were applied in entry order.
+        """
+        keys = []
+        rr = []
+        for trade in trades:
+            entry = getattr(trade, 'entry_date', None)
+            if not entry:
+                continue
+            keys.append(str(entry)[:19])
+            rr.append(float(getattr(trade, 'rr', 0) or 0.0))
+
+        if not keys:
+            return np.zeros(0), np.zeros(0)
+
+        order = np.argsort(np.array(keys), kind='stable')
+        rr_sorted = np.asarray(rr, dtype=np.float64)[order]
+        days = np.array([keys[i][:10] for i in order], dtype='datetime64[D]')
+
+        calendar_start = days[0]
+        n_calendar = int(np.busday_count(calendar_start, days[-1])) + 1
+        day_idx = np.busday_count(calendar_start, days)
+        # Weekend entries (crypto) are folded onto the next trading day
+        day_idx = np.minimum(day_idx, n_calendar - 1)
+
+        starts = np.flatnonzero(np.r_[True, day_idx[1:] != day_idx[:-1]])
+        cum = np.cumsum(rr_sorted)
+        day_offset = np.repeat(cum[starts] - rr_sorted[starts], np.diff(np.r_[starts, len(cum)]))
+        intraday = cum - day_offset
+
+        day_r = np.zeros(n_calendar)
+        day_trough = np.zeros(n_calendar)
+        day_r[day_idx[starts]] = np.add.reduceat(rr_sorted, starts)
+        day_trough[day_idx[starts]] = np.minimum(np.minimum.reduceat(intraday, starts), 0.0)
+        return day_r, day_trough
+
+    def _sample_indices(self, rng: np.random.Generator, n_sims: int) -> np.ndarray:
+        """Draw (n_sims, max_days) indices into the daily series."""
+        n_days = len(self.day_r)
+        if self.method == "bootstrap" or self.block_size == 1:
+            return rng.integers(0, n_days, size=(n_sims, self.max_days))
+
+        block = min(self.block_size, n_days)
+        n_blocks = -(-self.max_days // block)
+        block_starts = rng.integers(0, n_days - block + 1, size=(n_sims, n_blocks))
+        idx = block_starts[:, :, None] + np.arange(block)[None, None, :]
+        return idx.reshape(n_sims, -1)[:, :self.max_days]
+
+    def _simulate_batch(self, idx: np.ndarray) -> Dict[str, np.ndarray]:
+        """Run vectorized daily-balance accounting for one batch of paths."""
+        risk_usd = self.account_size * (self.risk_pct / 100)
+        day_pnl = self.day_r[idx] * risk_usd
+        trough_pnl = self.day_trough_r[idx] * risk_usd
+
+        close_balance = self.account_size + np.cumsum(day_pnl, axis=1)
+        open_balance = np.empty_like(close_balance)
+        open_balance[:, 0] = self.account_size
+        open_balance[:, 1:] = close_balance[:, :-1]
+        intraday_low = open_balance + trough_pnl
+
+        daily_loss_pct = -trough_pnl / open_balance * 100
+        total_dd_pct = np.maximum(0.0, (self.account_size - intraday_low) / self.account_size * 100)
+
+        daily_breach = daily_loss_pct >= self.max_daily_loss_pct
+        total_breach = total_dd_pct >= self.max_total_dd_pct
+        target_balance = self.account_size * (1 + self.target_pct / 100)
+        profitable_days = np.cumsum(day_pnl > 0, axis=1)
+        target_hit = (close_balance >= target_balance) & (profitable_days >= self.min_profitable_days)
+
+        never = idx.shape[1]
+        first_daily = np.where(daily_breach.any(axis=1), daily_breach.argmax(axis=1), never)
+        first_total = np.where(total_breach.any(axis=1), total_breach.argmax(axis=1), never)
+        first_fail = np.minimum(first_daily, first_total)
+        first_pass = np.where(target_hit.any(axis=1), target_hit.argmax(axis=1), never)
+
+        passed = first_pass < first_fail
+        failed = first_fail < never
+        failed &= ~passed
+
+        # Only the portion of each path that was actually traded counts toward
+        # the breach distribution (stop at pass/fail, whichever came first).
+        stop = np.minimum(first_pass, first_fail)
+        live = np.arange(never)[None, :] <= stop[:, None]
+
+        return {
+            'passed': passed,
+            'failed_daily': failed & (first_daily <= first_total),
+            'failed_total': failed & (first_total < first_daily),
+            'days_to_target': np.where(passed, first_pass + 1, -1),
+            'max_daily_loss_pct': np.where(live, daily_loss_pct, 0.0).max(axis=1),
+            'max_total_dd_pct': np.where(live, total_dd_pct, 0.0).max(axis=1),
+        }
+
+    def run(self, num_simulations: int = 5000, batch_size: int = 2000) -> Dict[str, Any]:
+        """
+        Estimate challenge pass probability across resampled day sequences.
+
+        Args:
+            num_simulations: Number of resampled paths
+            batch_size: Paths per vectorized batch (bounds peak memory)
+
+        Returns:
+            Dict with pass/fail probabilities, days-to-target statistics and
+            percentile distributions of daily loss and total DD.
+        """
+        if len(self.day_r) == 0 or self.max_days == 0:
+            return {"error": "No trades to simulate", "num_simulations": 0}
+
+        rng = np.random.default_rng(self.seed)
+        batches = []
+        remaining = num_simulations
+        while remaining > 0:
+            n = min(batch_size, remaining)
+            batches.append(self._simulate_batch(self._sample_indices(rng, n)))
+            remaining -= n
+
+        res = {k: np.concatenate([b[k] for b in batches]) for k in batches[0]}
+        days = res['days_to_target'][res['passed']]
+        pct = [5, 25, 50, 75, 95]
+
+        return {
+            'num_simulations': num_simulations,
+            'method': self.method,
+            'block_size': self.block_size,
+            'horizon_days': self.max_days,
+            'risk_pct': self.risk_pct,
+            'target_pct': self.target_pct,
+            'pass_probability': float(res['passed'].mean()),
+            'fail_daily_loss_probability': float(res['failed_daily'].mean()),
+            'fail_total_dd_probability': float(res['failed_total'].mean()),
+            'timeout_probability': float((~res['passed'] & ~res['failed_daily'] & ~res['failed_total']).mean()),
+            'expected_days_to_target': float(days.mean()) if len(days) else None,
+            'median_days_to_target': float(np.median(days)) if len(days) else None,
+            'max_daily_loss_pct': {f"p{p}": float(np.percentile(res['max_daily_loss_pct'], p)) for p in pct},
+            'max_total_dd_pct': {f"p{p}": float(np.percentile(res['max_total_dd_pct'], p)) for p in pct},
+        }
+
+
+def run_ftmo_pass_probability_analysis(
+    trades: List[Any],
+    risk_pct: float = 0.6,
+    num_simulations: int = 5000,
+    method: str = "block",
+    block_size: int = 10,
+) -> Dict:
+    """Estimate 5ers/FTMO challenge pass probability with resampled trade days."""
+    if not trades:
+        return {"error": "No trades provided"}
+
+    simulator = FTMOChallengeMonteCarlo(
+        trades,
+        risk_pct=risk_pct,
+        method=method,
+        block_size=block_size,
+    )
+    results = simulator.run(num_simulations=num_simulations)
+    if 'error' in results:
+        return results
+
+    expected_days = results.get('expected_days_to_target')
+    print(f"\nChallenge Pass Probability ({results['num_simulations']} paths, {results['method']} resampling):")
+    print(f"  Pass: {results['pass_probability'] * 100:.1f}%")
+    print(f"  Fail (daily loss): {results['fail_daily_loss_probability'] * 100:.1f}%")
+    print(f"  Fail (total DD): {results['fail_total_dd_probability'] * 100:.1f}%")
+    print(f"  Target not reached: {results['timeout_probability'] * 100:.1f}%")
+    if expected_days is not None:
+        print(f"  Expected days to target: {expected_days:.1f}")
+    print(f"  Max daily loss (95th): {results['max_daily_loss_pct']['p95']:.2f}%")
+    print(f"  Max total DD (95th): {results['max_total_dd_pct']['p95']:.2f}%")
+
+    return results
+
+
+def _series_to_candles(series: Dict[str, np.ndarray]) -> List[Dict]:
+    """Convert resampler arrays to candle dicts with UTC timestamps."""
+    df = pd.DataFrame({
+        'time': pd.to_datetime(series['time_ms'], unit='ms', utc=True),
+        'open': series['open'],
+        'high': series['high'],
+        'low': series['low'],
+        'close': series['close'],
+        'volume': series['volume'],
+    })
+    return df.to_dict('records')
+
+
+def load_ohlcv_data(
+    symbol: str,
+    timeframe: str,
+    start_date: datetime,
+    end_date: datetime,
+    quality: Optional[str] = None,
+) -> List[Dict]:
+    """
+    Load OHLCV data from local CSV files only (no API calls). Uses cache for performance.
+    
+    All timeframes of a symbol are filled at once from the finest CSV
+    available (see tradr.data.resample), so D1/W1/MN share the H4 bars.
+    Bars flagged when the cache was built are handled per `quality`
+    ("keep", "skip" or "mask"; default OHLCV_QUALITY_MODE).
+    """
     global _DATA_CACHE
     data_dir = Path("data/ohlcv")
     
@@ -927,53 +1296,18 @@ def load_ohlcv_data(symbol: str, timeframe: str, start_date: datetime, end_date:
     cache_key = f"{symbol_normalized}_{tf}"
     
     if cache_key not in _DATA_CACHE:
-        pattern = f"{symbol_normalized}_{tf}_*.csv"
-        matches = list(data_dir.glob(pattern))
-        
-        if not matches:
-            _DATA_CACHE[cache_key] = []
-            return []
-        
-        csv_path = matches[0]
         try:
-            df = pd.read_csv(csv_path)
-            
-            date_col = None
-            for col in ['time', 'timestamp', 'date', 'Date', 'Time']:
-                if col in df.columns:
-                    date_col = col
-                    break
-            
-            if date_col:
-                df[date_col] = pd.to_datetime(df[date_col], utc=True)
-            
-            col_map = {}
-            for target, options in [
-                ('time', [date_col] if date_col else []),
-                ('open', ['open', 'Open']),
-                ('high', ['high', 'High']),
-                ('low', ['low', 'Low']),
-                ('close', ['close', 'Close']),
-                ('volume', ['volume', 'Volume']),
-            ]:
-                for opt in options:
-                    if opt and opt in df.columns:
-                        col_map[target] = opt
-                        break
-            
-            result_df = pd.DataFrame()
-            for target, source in col_map.items():
-                result_df[target] = df[source]
-            
-            if 'volume' not in result_df.columns:
-                result_df['volume'] = 0
-            
-            candles = result_df.to_dict('records')
-            
-            _DATA_CACHE[cache_key] = candles
+            series_by_tf = load_symbol_timeframes(symbol_normalized, data_dir)
         except Exception as e:
-            print(f"Error loading {csv_path}: {e}")
-            _DATA_CACHE[cache_key] = []
+            print(f"Error loading {symbol_normalized} from {data_dir}: {e}")
+            series_by_tf = {}
+        
+        for series_tf, series in series_by_tf.items():
+            key = f"{symbol_normalized}_{series_tf}"
+            if key not in _DATA_CACHE:
+                _DATA_CACHE[key] = _series_to_candles(series)
+                _DATA_INDEX[key] = (series['time_ms'], series['bad'], series['bad_run'])
+        _DATA_CACHE.setdefault(cache_key, [])
     
     all_candles = _DATA_CACHE[cache_key]
     if not all_candles:
@@ -982,8 +1316,15 @@ def load_ohlcv_data(symbol: str, timeframe: str, start_date: datetime, end_date:
     start_ts = pd.Timestamp(start_date, tz='UTC') if start_date.tzinfo is None else pd.Timestamp(start_date)
     end_ts = pd.Timestamp(end_date, tz='UTC') if end_date.tzinfo is None else pd.Timestamp(end_date)
     
-    filtered = [c for c in all_candles if c.get("time") and start_ts <= c["time"] <= end_ts]
-    return filtered
+    time_ms, bad, bad_run = _DATA_INDEX[cache_key]
+    lo = int(np.searchsorted(time_ms, start_ts.value // 1_000_000, side='left'))
+    hi = int(np.searchsorted(time_ms, end_ts.value // 1_000_000, side='right'))
+    
+    mode = quality or OHLCV_QUALITY_MODE
+    drop = bad_run[lo:hi] if mode == "skip" else bad[lo:hi] if mode == "mask" else None
+    if drop is None or not drop.any():
+        return all_candles[lo:hi]
+    return [c for c, dropped in zip(all_candles[lo:hi], drop) if not dropped]
 
 
 def get_all_trading_assets() -> List[str]:
@@ -1057,9 +1398,15 @@ def run_full_period_backtest(
     daily_loss_halt_pct: float = 4.0,
     max_total_dd_warning: float = 8.0,
     consecutive_loss_halt: int = 999,  # 999 = disabled
+    signal_cache: Optional[Dict[str, Tuple[Dict, List[Signal]]]] = None,
 ) -> List[Trade]:
     """
     Run backtest for a given period with Regime-Adaptive V2 filtering.
+
+    signal_cache, when given, maps symbol -> (regime_info, signals) and is
+    filled on first use. It is only valid for one period and one set of
+    entry parameters; callers may vary EXIT_ONLY_PARAMS between calls that
+    share it (see run_parameter_sensitivity).
     
     REGIME-ADAPTIVE V2 SYSTEM:
     ==========================
@@ -1091,6 +1438,12 @@ def run_full_period_backtest(
     all_trades: List[Trade] = []
     seen_trades = set()
     
+    # Resolve costs once per run so every asset sees the same params snapshot
+    try:
+        transaction_costs = {symbol: get_transaction_costs(symbol) for symbol in assets}
+    except Exception:
+        transaction_costs = {}
+    
     # Get timeframe configuration (defaults to D1/H4/W1/MN if not specified)
     if tf_config is None:
         tf_config = TIMEFRAME_CONFIG['TPE']
@@ -1115,16 +1468,23 @@ def run_full_period_backtest(
             if not entry_candles or len(entry_candles) < 30:
                 continue
             
-            regime_info = detect_regime(
-                daily_candles=entry_candles,
-                adx_trend_threshold=adx_trend_threshold,
-                adx_range_threshold=adx_range_threshold,
-                use_adx_slope_rising=use_adx_slope_rising,
-                use_adx_regime_filter=use_adx_regime_filter  # Pass ADX filter toggle
-            )
+            cached = signal_cache.get(symbol) if signal_cache is not None else None
+            if cached is not None:
+                regime_info, signals = cached
+            else:
+                regime_info = detect_regime(
+                    daily_candles=entry_candles,
+                    adx_trend_threshold=adx_trend_threshold,
+                    adx_range_threshold=adx_range_threshold,
+                    use_adx_slope_rising=use_adx_slope_rising,
+                    use_adx_regime_filter=use_adx_regime_filter  # Pass ADX filter toggle
+                )
+                signals = None
             
             # Only skip Transition mode if ADX filter is enabled
             if use_adx_regime_filter and regime_info['mode'] == 'Transition':
+                if signal_cache is not None:
+                    signal_cache[symbol] = (regime_info, [])
                 continue
             
             if regime_info['mode'] == 'Trend':
@@ -1165,6 +1525,14 @@ def run_full_period_backtest(
                 partial_exit_pct=partial_exit_pct,
             )
             
+            if signals is None:
+                signals = generate_signals(
+                    entry_candles, symbol, params,
+                    sr_candles, bias_candles, confirmation_candles
+                )
+                if signal_cache is not None:
+                    signal_cache[symbol] = (regime_info, signals)
+            
             trades = simulate_trades(
                 candles=entry_candles,
                 symbol=symbol,
@@ -1173,6 +1541,8 @@ def run_full_period_backtest(
                 weekly_candles=bias_candles,
                 monthly_candles=sr_candles,
                 include_transaction_costs=True,
+                signals=signals,
+                transaction_costs=transaction_costs.get(symbol),
             )
             
             for trade in trades:
@@ -1233,147 +1603,41 @@ def run_full_period_backtest(
     return filtered_trades
 
 
-def convert_to_backtest_trade(
-    trade: Trade,
-    trade_num: int,
-    risk_per_trade_pct: float,
-    adx_value: float = 0.0
-) -> BacktestTrade:
-    """Convert strategy Trade to BacktestTrade for CSV export."""
-    entry_dt = trade.entry_date
-    exit_dt = trade.exit_date
-    
-    if isinstance(entry_dt, str):
-        try:
-            entry_dt = datetime.fromisoformat(entry_dt.replace("Z", "+00:00"))
-        except:
-            entry_dt = datetime.now()
-    
-    if isinstance(exit_dt, str):
-        try:
-            exit_dt = datetime.fromisoformat(exit_dt.replace("Z", "+00:00"))
-        except:
-            exit_dt = datetime.now()
-    
-    specs = get_contract_specs(trade.symbol)
-    pip_value_unit = specs.get("pip_value", 0.0001)
-    stop_distance = abs(trade.entry_price - trade.stop_loss)
-    risk_pips = stop_distance / pip_value_unit if pip_value_unit > 0 else 0
+def export_trades_to_csv(trades: Union[List[Trade], TradeBuffer], filename: str, risk_per_trade_pct: float = 0.5):
+    """
+    Export trades to CSV with all required columns.
     
-    holding_hours = 0.0
-    if entry_dt and exit_dt:
-        if isinstance(entry_dt, datetime) and isinstance(exit_dt, datetime):
-            try:
-                if entry_dt.tzinfo is not None and exit_dt.tzinfo is None:
-                    exit_dt = exit_dt.replace(tzinfo=entry_dt.tzinfo)
-                elif entry_dt.tzinfo is None and exit_dt.tzinfo is not None:
-                    entry_dt = entry_dt.replace(tzinfo=exit_dt.tzinfo)
-                delta = exit_dt - entry_dt
-                holding_hours = delta.total_seconds() / 3600
-                if holding_hours < 0:
-                    holding_hours = abs(holding_hours)
-            except:
-                holding_hours = 0.0
-    
-    risk_usd = ACCOUNT_SIZE * (risk_per_trade_pct / 100)
-    profit_usd = trade.rr * risk_usd
-    
-    exit_reason = trade.exit_reason or ""
-    tp1_hit = "TP1" in exit_reason or "TP2" in exit_reason or "TP3" in exit_reason or "TP4" in exit_reason or "TP5" in exit_reason
-    tp2_hit = "TP2" in exit_reason or "TP3" in exit_reason or "TP4" in exit_reason or "TP5" in exit_reason
-    tp3_hit = "TP3" in exit_reason or "TP4" in exit_reason or "TP5" in exit_reason
-    tp4_hit = "TP4" in exit_reason or "TP5" in exit_reason
-    tp5_hit = "TP5" in exit_reason
-    sl_hit = exit_reason == "SL"
-    
-    sizing_result = calculate_lot_size(
-        symbol=trade.symbol,
-        account_balance=ACCOUNT_SIZE,
-        risk_percent=risk_per_trade_pct / 100,
-        entry_price=trade.entry_price,
-        stop_loss_price=trade.stop_loss,
-        max_lot=100.0,
-        min_lot=0.01,
-    )
-    lot_size = sizing_result.get("lot_size", 0.01)
-    
-    # Use profit_usd directly - spread/slippage already accounted for in backtest simulation
-    # The R multiple already reflects the actual trade outcome
-    adjusted_profit = profit_usd
-
-    return BacktestTrade(
-        trade_num=trade_num,
-        symbol=trade.symbol,
-        direction=trade.direction.upper(),
-        entry_date=entry_dt,
-        entry_price=trade.entry_price,
-        stop_loss_price=trade.stop_loss,
-        tp1_price=trade.tp1 or 0.0,
-        tp2_price=trade.tp2,
-        tp3_price=trade.tp3,
-        tp4_price=trade.tp4,
-        tp5_price=trade.tp5,
-        exit_date=exit_dt,
-        exit_price=trade.exit_price,
-        tp1_hit=tp1_hit,
-        tp2_hit=tp2_hit,
-        tp3_hit=tp3_hit,
-        tp4_hit=tp4_hit,
-        tp5_hit=tp5_hit,
-        sl_hit=sl_hit,
-        exit_reason=exit_reason,
-        r_multiple=trade.rr,
-        profit_loss_usd=adjusted_profit,
-        confluence_score=trade.confluence_score,
-        holding_time_hours=holding_hours,
-        lot_size=lot_size,
-        risk_pips=risk_pips,
-        adx_value=adx_value,
-        validation_notes="Regime-Adaptive V2: Trend (ADX >= threshold) + Conservative Range (ADX < threshold)",
-    )
-
-
-def export_trades_to_csv(trades: List[Trade], filename: str, risk_per_trade_pct: float = 0.5):
-    """Export trades to CSV with all required columns."""
+    Streams the BacktestTrade layout in chunks from a columnar TradeBuffer
+    (see tradr.utils.trade_export); a .parquet filename writes Parquet.
+    """
     filepath = OUTPUT_DIR / filename
     
     if not trades:
         print(f"No trades to export to {filename}")
         return
     
-    backtest_trades = []
-    for i, trade in enumerate(trades, 1):
-        bt_trade = convert_to_backtest_trade(trade, i, risk_per_trade_pct)
-        backtest_trades.append(bt_trade)
-    
-    with open(filepath, 'w', newline='') as f:
-        if backtest_trades:
-            fieldnames = list(backtest_trades[0].to_dict().keys())
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            for trade in backtest_trades:
-                writer.writerow(trade.to_dict())
-    
-    print(f"Exported {len(backtest_trades)} trades to: {filepath}")
+    rows = export_backtest_trades(trades, filepath, risk_per_trade_pct, account_size=ACCOUNT_SIZE)
+    print(f"Exported {rows} trades to: {filepath}")
 
 
-def print_period_results(trades: List[Trade], period_name: str, start: datetime, end: datetime) -> Dict:
+def print_period_results(trades: Union[List[Trade], TradeFrame], period_name: str, start: datetime, end: datetime) -> Dict:
     """Print results for a specific period."""
-    if not trades:
+    frame = TradeFrame.from_trades(trades)
+    if len(frame) == 0:
         print(f"\n{period_name}: No trades generated")
         return {'trades': 0, 'total_r': 0, 'win_rate': 0, 'net_profit': 0}
     
-    total_r = sum(getattr(t, 'rr', 0) for t in trades)
-    wins = sum(1 for t in trades if getattr(t, 'rr', 0) > 0)
-    losses = sum(1 for t in trades if getattr(t, 'rr', 0) <= 0)
-    win_rate = (wins / len(trades) * 100) if trades else 0
+    total_r = frame.total_r
+    wins = frame.wins
+    losses = len(frame) - wins
+    win_rate = wins / len(frame) * 100
     
     risk_usd = ACCOUNT_SIZE * 0.005
     total_profit = total_r * risk_usd
     
     print(f"\n{period_name}")
     print(f"  Period: {start.strftime('%Y-%m-%d')} to {end.strftime('%Y-%m-%d')}")
-    print(f"  Total Trades: {len(trades)}")
+    print(f"  Total Trades: {len(frame)}")
     print(f"  Wins: {wins}, Losses: {losses}")
     print(f"  Win Rate: {win_rate:.1f}%")
     print(f"  Total R: {total_r:+.2f}R")
@@ -1381,7 +1645,7 @@ def print_period_results(trades: List[Trade], period_name: str, start: datetime,
     print(f"  Regime-Adaptive V2: Trend (ADX >= threshold) + Conservative Range (ADX < threshold)")
     
     return {
-        'trades': len(trades),
+        'trades': len(frame),
         'total_r': total_r,
         'win_rate': win_rate,
         'net_profit': total_profit,
@@ -1480,11 +1744,37 @@ class OptunaOptimizer:
     Uses persistent SQLite storage for resumability.
     """
     
-    def __init__(self, tf_config: Optional[Dict] = None, use_warm_start: bool = False):
+    def __init__(
+        self,
+        tf_config: Optional[Dict] = None,
+        use_warm_start: bool = False,
+        train_start: datetime = TRAINING_START,
+        train_end: datetime = TRAINING_END,
+        artifact_store: Optional[TrialArtifactStore] = None,
+    ):
         self.best_params: Dict = {}
         self.best_score: float = -float('inf')
+        # Heavy per-trial reports; None keeps only scalar attrs (in-memory studies)
+        self.artifact_store = artifact_store
         self.tf_config = tf_config if tf_config else TIMEFRAME_CONFIG['TPE']
         self.use_warm_start = use_warm_start
+        self.train_start = train_start
+        self.train_end = train_end
+        if (train_start, train_end) == (TRAINING_START, TRAINING_END):
+            self.quarters = TRAINING_QUARTERS
+        else:
+            self.quarters = build_quarters(train_start, train_end)
+    
+    def _save_artifacts(self, trial, **artifacts):
+        """
+        Keep nested per-trial reports out of Optuna's user_attrs.
+        
+        The trial gets scalar total_trades plus the side-store key; the
+        reports themselves go to self.artifact_store.
+        """
+        trial.set_user_attr('total_trades', artifacts.get('overall_stats', {}).get('trades', 0))
+        if self.artifact_store is not None:
+            trial.set_user_attr(ARTIFACT_ATTR, self.artifact_store.put(trial.number, artifacts))
     
     def _objective(self, trial) -> float:
         """
@@ -1600,28 +1890,25 @@ class OptunaOptimizer:
         # TP R-Multiple monotonic constraint: TP1 < TP2 < TP3
         if not (params['tp1_r_multiple'] < params['tp2_r_multiple'] < params['tp3_r_multiple']):
             trial.set_user_attr('rejection_reason', 'TP R-multiples not ascending')
-            trial.set_user_attr('quarterly_stats', {})
-            trial.set_user_attr('overall_stats', {'trades': 0, 'profit': 0, 'win_rate': 0})
+            self._save_artifacts(trial, quarterly_stats={}, overall_stats={'trades': 0, 'profit': 0, 'win_rate': 0})
             return -999999.0
         
         # TP Close percentage sum constraint: tp1 + tp2 + tp3 <= 0.85
         total_close_pct = params['tp1_close_pct'] + params['tp2_close_pct'] + params['tp3_close_pct']
         if total_close_pct > 0.85:
             trial.set_user_attr('rejection_reason', f'TP close sum {total_close_pct:.2f} > 0.85')
-            trial.set_user_attr('quarterly_stats', {})
-            trial.set_user_attr('overall_stats', {'trades': 0, 'profit': 0, 'win_rate': 0})
+            self._save_artifacts(trial, quarterly_stats={}, overall_stats={'trades': 0, 'profit': 0, 'win_rate': 0})
             return -999999.0
         
         # ADX threshold constraint: range < trend
         if params['adx_range_threshold'] >= params['adx_trend_threshold']:
             trial.set_user_attr('rejection_reason', 'ADX range >= trend threshold')
-            trial.set_user_attr('quarterly_stats', {})
-            trial.set_user_attr('overall_stats', {'trades': 0, 'profit': 0, 'win_rate': 0})
+            self._save_artifacts(trial, quarterly_stats={}, overall_stats={'trades': 0, 'profit': 0, 'win_rate': 0})
             return -999999.0
         
         training_trades = run_full_period_backtest(
-            start_date=TRAINING_START,
-            end_date=TRAINING_END,
+            start_date=self.train_start,
+            end_date=self.train_end,
             min_confluence=params['min_confluence_score'],
             min_quality_factors=params['min_quality_factors'],
             risk_per_trade_pct=params['risk_per_trade_pct'],
@@ -1663,48 +1950,34 @@ class OptunaOptimizer:
         )
         
         if not training_trades or len(training_trades) == 0:
-            trial.set_user_attr('quarterly_stats', {})
-            trial.set_user_attr('overall_stats', {'trades': 0, 'profit': 0, 'win_rate': 0})
+            self._save_artifacts(trial, quarterly_stats={}, overall_stats={'trades': 0, 'profit': 0, 'win_rate': 0})
             return -50000.0
         
-        total_r = sum(getattr(t, 'rr', 0) for t in training_trades)
-        total_trades = len(training_trades)
-        wins = sum(1 for t in training_trades if getattr(t, 'rr', 0) > 0)
+        # Parse dates/rr once; everything below works on the frame's arrays
+        frame = TradeFrame.from_trades(training_trades)
+        total_r = frame.total_r
+        total_trades = len(frame)
+        wins = frame.wins
         overall_win_rate = (wins / total_trades * 100) if total_trades > 0 else 0
         
         if total_r <= 0:
-            trial.set_user_attr('quarterly_stats', {})
-            trial.set_user_attr('overall_stats', {'trades': total_trades, 'profit': total_r, 'win_rate': overall_win_rate})
+            self._save_artifacts(
+                trial,
+                quarterly_stats={},
+                overall_stats={'trades': total_trades, 'profit': total_r, 'win_rate': overall_win_rate},
+            )
             return -50000.0
         
-        quarterly_r = {q: 0.0 for q in TRAINING_QUARTERS.keys()}
-        quarterly_trades = {q: [] for q in TRAINING_QUARTERS.keys()}
-        
-        for t in training_trades:
-            entry = getattr(t, 'entry_date', None)
-            if entry:
-                if isinstance(entry, str):
-                    try:
-                        entry = datetime.fromisoformat(entry.replace("Z", "+00:00"))
-                    except:
-                        continue
-                if hasattr(entry, 'replace') and entry.tzinfo:
-                    entry = entry.replace(tzinfo=None)
-                
-                for q, (q_start, q_end) in TRAINING_QUARTERS.items():
-                    if q_start <= entry <= q_end:
-                        quarterly_r[q] += getattr(t, 'rr', 0)
-                        quarterly_trades[q].append(t)
-                        break
+        quarter_buckets = frame.period_stats(self.quarters)
+        quarterly_r = {q: b['r_total'] for q, b in quarter_buckets.items()}
         
         risk_usd = ACCOUNT_SIZE * (params['risk_per_trade_pct'] / 100)
-        compliance_report = compute_ftmo_compliance(training_trades, risk_usd)
+        compliance_report = compute_ftmo_compliance(frame, risk_usd)
         
         quarterly_stats = {}
-        for q in TRAINING_QUARTERS.keys():
-            q_trades = quarterly_trades[q]
-            q_total = len(q_trades)
-            q_wins = sum(1 for t in q_trades if getattr(t, 'rr', 0) > 0)
+        for q in self.quarters.keys():
+            q_total = quarter_buckets[q]['trades']
+            q_wins = quarter_buckets[q]['wins']
             q_r = quarterly_r[q]
             q_profit = q_r * risk_usd
             q_wr = (q_wins / q_total * 100) if q_total > 0 else 0
@@ -1716,14 +1989,13 @@ class OptunaOptimizer:
                 'win_rate': round(q_wr, 1)
             }
         
-        trial.set_user_attr('quarterly_stats', quarterly_stats)
-        trial.set_user_attr('overall_stats', {
+        overall_stats = {
             'trades': total_trades,
             'wins': wins,
             'r_total': round(total_r, 2),
             'profit': round(total_r * risk_usd, 2),
             'win_rate': round(overall_win_rate, 1)
-        })
+        }
         
         # ============================================================================
         # PROFESSIONAL SCORING FORMULA V3
@@ -1738,24 +2010,22 @@ class OptunaOptimizer:
         quarterly_trade_counts = {}  # Q -> number of trades
         quarterly_winning_trades = {}  # Q -> number of winning trades
         
-        for q in TRAINING_QUARTERS.keys():
+        for q in self.quarters.keys():
             q_r = quarterly_r.get(q, 0.0)
             q_profit = q_r * risk_usd
-            q_count = len(quarterly_trades.get(q, []))
-            q_wins = sum(1 for t in quarterly_trades.get(q, []) if getattr(t, 'rr', 0) > 0)
+            q_count = quarter_buckets[q]['trades']
+            q_wins = quarter_buckets[q]['wins']
             quarterly_profits[q] = q_profit
             quarterly_trade_counts[q] = q_count
             quarterly_winning_trades[q] = q_wins
         
-        trades_list = training_trades  # Alias for consistency
-        
         # ============================================================================
         # COMPONENT 1: PROFIT FACTOR (most important for profitability)
         # Profit Factor = Gross Profit / Gross Loss
         # Target: > 1.5 is good, > 2.0 is excellent
         # ============================================================================
-        gross_profit = sum(getattr(t, 'rr', 0) for t in trades_list if getattr(t, 'rr', 0) > 0)
-        gross_loss = abs(sum(getattr(t, 'rr', 0) for t in trades_list if getattr(t, 'rr', 0) < 0))
+        gross_profit = float(frame.rr[frame.rr > 0].sum())
+        gross_loss = abs(float(frame.rr[frame.rr < 0].sum()))
         profit_factor = (gross_profit / gross_loss) if gross_loss > 0 else gross_profit
         
         # ============================================================================
@@ -1763,8 +2033,9 @@ class OptunaOptimizer:
         # Using professional_quant_suite for institutional-grade calculation
         # Target: > 0.5 is acceptable, > 1.0 is good, > 2.0 is excellent
         # ============================================================================
-        risk_metrics = calculate_risk_metrics(
-            trades=trades_list,
+        risk_metrics = calculate_risk_metrics_from_arrays(
+            frame.rr,
+            frame.entry_epochs,
             risk_per_trade_pct=risk_pct,
             account_size=ACCOUNT_SIZE,
             trading_days_per_year=252.0
@@ -1787,16 +2058,9 @@ class OptunaOptimizer:
         # Max DD in R terms, scaled to account percentage
         # Target: < 10% of account
         # ============================================================================
-        max_dd_r = 0.0
-        equity = 0.0
-        peak = 0.0
-        for t in trades_list:
-            equity += getattr(t, 'rr', 0)
-            if equity > peak:
-                peak = equity
-            dd = peak - equity
-            if dd > max_dd_r:
-                max_dd_r = dd
+        equity = np.cumsum(frame.rr)
+        peak = np.maximum.accumulate(np.maximum(equity, 0.0))
+        max_dd_r = max(0.0, float((peak - equity).max()))
         
         max_drawdown_pct = (max_dd_r * risk_usd) / ACCOUNT_SIZE if ACCOUNT_SIZE > 0 else 0
         
@@ -1946,20 +2210,27 @@ class OptunaOptimizer:
         trial.set_user_attr('win_rate', round(overall_win_rate, 2))
         trial.set_user_attr('max_ftmo_dd_pct', round(max_ftmo_dd, 2))
         trial.set_user_attr('ftmo_challenge_passed', compliance_report.get('challenge_passed', False))
-        trial.set_user_attr('compliance_report', compliance_report)
-        trial.set_user_attr('score_breakdown', {
-            'base_r_component': round(r_component, 2),
-            'base_profit_component': round(profit_component, 2),
-            'base_score_total': round(base_score, 2),
-            'sharpe_bonus': round(sharpe_bonus, 2),
-            'pf_bonus': round(pf_bonus, 2),
-            'wr_bonus': round(wr_bonus, 2),
-            'trade_bonus': round(trade_bonus, 2),
-            'ftmo_pass_bonus': round(ftmo_pass_bonus, 2),
-            'dd_penalty': round(dd_penalty, 2),
-            'ftmo_dd_penalty': round(ftmo_dd_penalty, 2),
-            'consistency_penalty': round(consistency_penalty, 2),
-        })
+        
+        # Nested reports go to the artifact side store, not the Optuna DB
+        self._save_artifacts(
+            trial,
+            quarterly_stats=quarterly_stats,
+            overall_stats=overall_stats,
+            compliance_report=compliance_report,
+            score_breakdown={
+                'base_r_component': round(r_component, 2),
+                'base_profit_component': round(profit_component, 2),
+                'base_score_total': round(base_score, 2),
+                'sharpe_bonus': round(sharpe_bonus, 2),
+                'pf_bonus': round(pf_bonus, 2),
+                'wr_bonus': round(wr_bonus, 2),
+                'trade_bonus': round(trade_bonus, 2),
+                'ftmo_pass_bonus': round(ftmo_pass_bonus, 2),
+                'dd_penalty': round(dd_penalty, 2),
+                'ftmo_dd_penalty': round(ftmo_dd_penalty, 2),
+                'consistency_penalty': round(consistency_penalty, 2),
+            },
+        )
         
         return final_score
     
@@ -1989,6 +2260,9 @@ class OptunaOptimizer:
             sampler=sampler,
             pruner=MedianPruner()
         )
+        ensure_value_index(OPTUNA_DB_PATH)
+        if self.artifact_store is None:
+            self.artifact_store = TrialArtifactStore.for_study(OPTUNA_STUDY_NAME)
         
         existing_trials = len(study.trials)
         previous_best_value = None  # Track previous best to detect real improvements
@@ -2050,8 +2324,9 @@ class OptunaOptimizer:
             except (ValueError, AttributeError):
                 pass
             
-            quarterly_stats = trial.user_attrs.get('quarterly_stats', {})
-            overall_stats = trial.user_attrs.get('overall_stats', {})
+            artifacts = load_trial_artifacts(trial, self.artifact_store)
+            quarterly_stats = artifacts.get('quarterly_stats', {})
+            overall_stats = artifacts.get('overall_stats', {})
             
             # Display current best value
             try:
@@ -2101,6 +2376,7 @@ class OptunaOptimizer:
                     max_drawdown_pct=trial.user_attrs.get('max_drawdown_pct', 0),
                     ftmo_dd_pct=max_ftmo_dd,
                     ftmo_challenge_passed=challenge_passed,
+                    params=trial.params,
                 )
             
             print(f"{'─'*70}\n")
@@ -2660,18 +2936,18 @@ def generate_summary_txt(
     if full_end is None:
         full_end = VALIDATION_END
     
-    def calc_stats(trades):
-        if not trades:
+    def calc_stats(frame: TradeFrame):
+        if len(frame) == 0:
             return {"count": 0, "total_r": 0, "win_rate": 0, "avg_r": 0}
-        total_r = sum(getattr(t, 'rr', 0) for t in trades)
-        wins = sum(1 for t in trades if getattr(t, 'rr', 0) > 0)
-        win_rate = (wins / len(trades) * 100) if trades else 0
-        avg_r = total_r / len(trades) if trades else 0
-        return {"count": len(trades), "total_r": total_r, "win_rate": win_rate, "avg_r": avg_r}
+        total_r = frame.total_r
+        win_rate = frame.wins / len(frame) * 100
+        avg_r = total_r / len(frame)
+        return {"count": len(frame), "total_r": total_r, "win_rate": win_rate, "avg_r": avg_r}
     
-    training_stats = calc_stats(training_trades)
-    validation_stats = calc_stats(validation_trades)
-    full_stats = calc_stats(full_year_trades)
+    full_frame = TradeFrame.from_trades(full_year_trades)
+    training_stats = calc_stats(TradeFrame.from_trades(training_trades))
+    validation_stats = calc_stats(TradeFrame.from_trades(validation_trades))
+    full_stats = calc_stats(full_frame)
     
     lines = [
         "=" * 80,
@@ -2731,6 +3007,28 @@ def generate_summary_txt(
         f"  Win Rate: {full_stats['win_rate']:.1f}%",
         f"  Avg R per Trade: {full_stats['avg_r']:+.3f}",
         "",
+    ])
+    
+    pass_mc = results.get('ftmo_pass_probability')
+    if pass_mc and 'error' not in pass_mc:
+        expected_days = pass_mc.get('expected_days_to_target')
+        lines.extend([
+            f"CHALLENGE PASS PROBABILITY ({pass_mc['num_simulations']} paths, {pass_mc['method']} resampling)",
+            "-" * 40,
+            f"  Pass: {pass_mc['pass_probability'] * 100:.1f}%",
+            f"  Fail (daily loss): {pass_mc['fail_daily_loss_probability'] * 100:.1f}%",
+            f"  Fail (total DD): {pass_mc['fail_total_dd_probability'] * 100:.1f}%",
+            f"  Target not reached: {pass_mc['timeout_probability'] * 100:.1f}%",
+        ])
+        if expected_days is not None:
+            lines.append(f"  Expected days to target: {expected_days:.1f}")
+        lines.extend([
+            f"  Max daily loss (95th): {pass_mc['max_daily_loss_pct']['p95']:.2f}%",
+            f"  Max total DD (95th): {pass_mc['max_total_dd_pct']['p95']:.2f}%",
+            "",
+        ])
+    
+    lines.extend([
         "QUARTERLY BREAKDOWN",
         "-" * 40,
     ])
@@ -2741,6 +3039,7 @@ def generate_summary_txt(
     year_start = full_start.year
     year_end = full_end.year
     
+    quarters: Dict[str, Tuple[datetime, datetime]] = {}
     for year in range(year_start, year_end + 1):
         for quarter in range(1, 5):
             # Define quarter months
@@ -2764,31 +3063,17 @@ def generate_summary_txt(
             if q_end < full_start or q_start > full_end:
                 continue
             
-            q_name = f"{year}_Q{quarter}"
-            
-            q_filtered = []
-            for t in full_year_trades:
-                entry = getattr(t, 'entry_date', None)
-                if entry:
-                    if isinstance(entry, str):
-                        try:
-                            entry = datetime.fromisoformat(entry.replace("Z", "+00:00"))
-                        except:
-                            continue
-                    if hasattr(entry, 'replace') and entry.tzinfo:
-                        entry = entry.replace(tzinfo=None)
-                    if q_start <= entry <= q_end:
-                        q_filtered.append(t)
-            
-            q_r = sum(getattr(t, 'rr', 0) for t in q_filtered)
-            q_wins = sum(1 for t in q_filtered if getattr(t, 'rr', 0) > 0)
-            q_wr = (q_wins / len(q_filtered) * 100) if q_filtered else 0
-            
-            # Calculate USD profit for this quarter
-            q_profit_usd = q_r * risk_per_trade_decimal * account_size
-            total_full_period_profit_usd += q_profit_usd
-            
-            lines.append(f"  {q_name}: {len(q_filtered)} trades, {q_r:+.1f}R, {q_wr:.0f}% win rate, ${q_profit_usd:+,.2f}")
+            quarters[f"{year}_Q{quarter}"] = (q_start, q_end)
+    
+    for q_name, q in full_frame.period_stats(quarters).items():
+        q_r = q['r_total']
+        q_wr = (q['wins'] / q['trades'] * 100) if q['trades'] else 0
+        
+        # Calculate USD profit for this quarter
+        q_profit_usd = q_r * risk_per_trade_decimal * account_size
+        total_full_period_profit_usd += q_profit_usd
+        
+        lines.append(f"  {q_name}: {q['trades']} trades, {q_r:+.1f}R, {q_wr:.0f}% win rate, ${q_profit_usd:+,.2f}")
     
     lines.extend([
         "",
@@ -2994,6 +3279,7 @@ def run_multi_objective_optimization(n_trials: int = 50) -> Dict:
         load_if_exists=True,
         sampler=NSGAIISampler(seed=42)
     )
+    ensure_value_index(MULTI_OBJECTIVE_DB)
     
     existing_trials = len(study.trials)
     if existing_trials > 0:
@@ -3436,6 +3722,520 @@ def run_validation_mode(start_date_str: str, end_date_str: str, params_file: str
     print(f"{'='*80}\n")
 
 
+# ============================================================================
+# WALK-FORWARD RE-OPTIMIZATION
+# Re-runs the Optuna search on every training window and scores the best
+# parameters on the following out-of-sample window
+# ============================================================================
+
+def backtest_kwargs_from_params(params: Dict) -> Dict[str, Any]:
+    """Map an Optuna trial/best_params dict to run_full_period_backtest() keyword arguments."""
+    return {
+        'min_confluence': params.get('min_confluence_score', params.get('min_confluence', 3)),
+        'min_quality_factors': params.get('min_quality_factors', 2),
+        'risk_per_trade_pct': params.get('risk_per_trade_pct', 0.5),
+        'atr_min_percentile': params.get('atr_min_percentile', 60.0),
+        'trail_activation_r': params.get('trail_activation_r', 2.2),
+        'december_atr_multiplier': params.get('december_atr_multiplier', 1.5),
+        'volatile_asset_boost': params.get('volatile_asset_boost', 1.5),
+        'ml_min_prob': None,
+        'require_adx_filter': True,
+        'use_adx_regime_filter': False,
+        'adx_trend_threshold': params.get('adx_trend_threshold', 25.0),
+        'adx_range_threshold': params.get('adx_range_threshold', 20.0),
+        'trend_min_confluence': params.get('trend_min_confluence', 6),
+        'range_min_confluence': params.get('range_min_confluence', 5),
+        'atr_volatility_ratio': params.get('atr_vol_ratio_range', params.get('atr_volatility_ratio', 0.8)),
+        'atr_vol_ratio_range': params.get('atr_vol_ratio_range', params.get('atr_volatility_ratio', 0.8)),
+        'atr_trail_multiplier': params.get('atr_trail_multiplier', 1.5),
+        'partial_exit_at_1r': params.get('partial_exit_at_1r', True),
+        'partial_exit_pct': params.get('partial_exit_pct', 0.5),
+        'tp1_r_multiple': params.get('tp1_r_multiple', 1.0),
+        'tp2_r_multiple': params.get('tp2_r_multiple', 2.0),
+        'tp3_r_multiple': params.get('tp3_r_multiple', 3.0),
+        'tp1_close_pct': params.get('tp1_close_pct', 0.20),
+        'tp2_close_pct': params.get('tp2_close_pct', 0.20),
+        'tp3_close_pct': params.get('tp3_close_pct', 0.20),
+        'use_htf_filter': params.get('use_htf_filter', False),
+        'use_structure_filter': params.get('use_structure_filter', False),
+        'use_confirmation_filter': params.get('use_confirmation_filter', False),
+        'use_fib_filter': params.get('use_fib_filter', False),
+        'use_displacement_filter': params.get('use_displacement_filter', False),
+        'use_candle_rejection': params.get('use_candle_rejection', False),
+        'daily_loss_halt_pct': params.get('daily_loss_halt_pct', 4.0),
+        'max_total_dd_warning': params.get('max_total_dd_warning', 8.0),
+        'consecutive_loss_halt': params.get('consecutive_loss_halt', 999),
+    }
+
+
+def _run_walk_forward_window(task: Dict) -> Dict:
+    """
+    Optimize one training window and score its best params out-of-sample.
+
+    Runs in a worker process. Candle data is inherited from the parent's
+    _DATA_CACHE when the pool uses fork, so workers never re-read the CSVs.
+    """
+    import optuna
+    optuna.logging.set_verbosity(optuna.logging.WARNING)
+
+    optimizer = OptunaOptimizer(train_start=task['train_start'], train_end=task['train_end'])
+    sampler = optuna.samplers.TPESampler(seed=task['seed'], n_startup_trials=min(5, task['n_trials']))
+    # In-memory storage: windows are independent and must not contend on SQLite
+    study = optuna.create_study(direction='maximize', sampler=sampler)
+    study.optimize(optimizer._objective, n_trials=task['n_trials'], show_progress_bar=False)
+
+    best_trial = study.best_trial
+    best_params = dict(best_trial.params)
+    risk_pct = best_params.get('risk_per_trade_pct', 0.5)
+
+    oos_trades = run_full_period_backtest(
+        start_date=task['val_start'],
+        end_date=task['val_end'],
+        **backtest_kwargs_from_params(best_params),
+    )
+    oos_metrics = calculate_risk_metrics(oos_trades, risk_pct, ACCOUNT_SIZE)
+    oos_compliance = compute_ftmo_compliance(oos_trades, ACCOUNT_SIZE * (risk_pct / 100))
+
+    is_r = best_trial.user_attrs.get('total_r', 0.0)
+    oos_r = sum(getattr(t, 'rr', 0) for t in oos_trades)
+    is_days = max((task['train_end'] - task['train_start']).days, 1)
+    oos_days = max((task['val_end'] - task['val_start']).days, 1)
+    # Walk-forward efficiency: annualized OOS R relative to annualized IS R
+    wfe = ((oos_r / oos_days) / (is_r / is_days)) if is_r > 0 else 0.0
+
+    return {
+        'window': task['window'],
+        'train_start': task['train_start'].strftime('%Y-%m-%d'),
+        'train_end': task['train_end'].strftime('%Y-%m-%d'),
+        'val_start': task['val_start'].strftime('%Y-%m-%d'),
+        'val_end': task['val_end'].strftime('%Y-%m-%d'),
+        'best_params': best_params,
+        'risk_pct': risk_pct,
+        'is_score': best_trial.value,
+        'is_total_r': is_r,
+        'is_trades': best_trial.user_attrs.get('total_trades', 0),
+        'oos_total_r': oos_r,
+        'oos_trades': len(oos_trades),
+        'oos_metrics': oos_metrics.to_dict(),
+        'oos_max_ftmo_dd_pct': oos_compliance.get('max_ftmo_dd_pct', 0.0),
+        'walk_forward_efficiency': wfe,
+        'oos_trade_objects': oos_trades,
+    }
+
+
+class WalkForwardOptimizer:
+    """
+    Walk-forward re-optimization driver on top of WalkForwardTester.
+
+    WalkForwardTester only slices an existing trade list. This driver runs a
+    fresh Optuna study on each training window, backtests the winning params
+    on the following (non-overlapping) OOS window and stitches the OOS trades
+    into one equity curve. Windows run in parallel worker processes that share
+    the candle cache loaded once by the parent.
+    """
+
+    def __init__(
+        self,
+        start_date: datetime,
+        end_date: datetime,
+        train_months: int = 12,
+        validate_months: int = 3,
+        rolling: bool = True,
+        n_trials: int = 30,
+        max_workers: Optional[int] = None,
+        seed: int = 42,
+    ):
+        self.start_date = start_date
+        self.end_date = end_date
+        self.train_months = train_months
+        self.validate_months = validate_months
+        self.rolling = rolling
+        self.n_trials = n_trials
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.seed = seed
+
+    def get_windows(self) -> List[Tuple[datetime, datetime, datetime, datetime]]:
+        """Training/OOS windows stepped by one OOS length so OOS periods don't overlap."""
+        tester = WalkForwardTester(
+            all_trades=[],
+            start_date=self.start_date,
+            end_date=self.end_date,
+            train_months=self.train_months,
+            validate_months=self.validate_months,
+            rolling=self.rolling,
+            step_days=self.validate_months * 30 + 1,
+        )
+        return tester.get_date_windows()
+
+    def preload_data(self) -> None:
+        """Fill _DATA_CACHE for every asset/timeframe before workers are forked."""
+        tf_config = TIMEFRAME_CONFIG['TPE']
+        timeframes = {tf_config['entry_tf'], tf_config['confirmation_tf'], tf_config['bias_tf'], tf_config['sr_tf']}
+        for symbol in get_all_trading_assets():
+            for tf in timeframes:
+                load_ohlcv_data(symbol, tf, self.start_date, self.start_date)
+
+    def run(self) -> Tuple[Dict, List[Trade]]:
+        """Run every window and return (summary, stitched OOS trades)."""
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+
+        windows = self.get_windows()
+        if not windows:
+            print("No walk-forward windows fit in the requested period")
+            return {'total_windows': 0, 'window_results': []}, []
+
+        print(f"\n{'='*70}")
+        print(f"WALK-FORWARD RE-OPTIMIZATION ({'rolling' if self.rolling else 'anchored'})")
+        print(f"{'='*70}")
+        print(f"Windows: {len(windows)} | Train: {self.train_months}m | OOS: {self.validate_months}m")
+        print(f"Trials per window: {self.n_trials} | Workers: {self.max_workers}")
+
+        self.preload_data()
+
+        tasks = [
+            {
+                'window': i + 1,
+                'train_start': train_start,
+                'train_end': train_end,
+                'val_start': val_start,
+                'val_end': val_end,
+                'n_trials': self.n_trials,
+                'seed': self.seed + i,
+            }
+            for i, (train_start, train_end, val_start, val_end) in enumerate(windows)
+        ]
+
+        mp_context = None
+        if 'fork' in multiprocessing.get_all_start_methods():
+            mp_context = multiprocessing.get_context('fork')
+
+        window_results = []
+        with ProcessPoolExecutor(max_workers=min(self.max_workers, len(tasks)), mp_context=mp_context) as pool:
+            futures = [pool.submit(_run_walk_forward_window, task) for task in tasks]
+            for future in as_completed(futures):
+                result = future.result()
+                window_results.append(result)
+                print(
+                    f"  Window {result['window']:>3}: IS {result['is_total_r']:+.1f}R -> "
+                    f"OOS {result['oos_total_r']:+.1f}R ({result['oos_trades']} trades, "
+                    f"{result['val_start']} to {result['val_end']})"
+                )
+
+        window_results.sort(key=lambda r: r['window'])
+
+        oos_trades = []
+        # Each window trades at its own optimized risk: scale R by that
+        # window's risk % so the stitched curve at 1% per unit is its USD P/L
+        stitched_rr = []
+        stitched_epochs = []
+        for result in window_results:
+            window_trades = result.pop('oos_trade_objects')
+            oos_trades.extend(window_trades)
+            stitched_rr.append(trade_rr_array(window_trades) * result['risk_pct'])
+            stitched_epochs.append(trade_entry_epochs(window_trades))
+
+        oos_r_values = [r['oos_total_r'] for r in window_results]
+        efficiencies = [r['walk_forward_efficiency'] for r in window_results]
+        stitched_metrics = calculate_risk_metrics_from_arrays(
+            np.concatenate(stitched_rr),
+            np.concatenate(stitched_epochs),
+            risk_per_trade_pct=1.0,
+            account_size=ACCOUNT_SIZE,
+        )
+
+        summary = {
+            'total_windows': len(window_results),
+            'rolling': self.rolling,
+            'train_months': self.train_months,
+            'validate_months': self.validate_months,
+            'trials_per_window': self.n_trials,
+            'oos_total_r': sum(oos_r_values),
+            'oos_total_trades': len(oos_trades),
+            'profitable_oos_windows_pct': (sum(1 for r in oos_r_values if r > 0) / len(oos_r_values) * 100),
+            'avg_walk_forward_efficiency': (sum(efficiencies) / len(efficiencies)) if efficiencies else 0.0,
+            'stitched_oos_metrics': stitched_metrics.to_dict(),
+            'window_results': window_results,
+        }
+        return summary, oos_trades
+
+
+def run_walk_forward_mode(
+    start_date_str: Optional[str],
+    end_date_str: Optional[str],
+    train_months: int = 12,
+    validate_months: int = 3,
+    rolling: bool = True,
+    n_trials: int = 30,
+    max_workers: Optional[int] = None,
+) -> Dict:
+    """
+    Run walk-forward re-optimization and save the results.
+
+    Usage:
+        python ftmo_challenge_analyzer.py --walk-forward --start 2005-01-01 --end 2025-12-26 --trials 50
+    """
+    start = datetime.strptime(start_date_str, "%Y-%m-%d") if start_date_str else FULL_PERIOD_START
+    end = datetime.strptime(end_date_str, "%Y-%m-%d") if end_date_str else FULL_PERIOD_END
+
+    wfo = WalkForwardOptimizer(
+        start_date=start,
+        end_date=end,
+        train_months=train_months,
+        validate_months=validate_months,
+        rolling=rolling,
+        n_trials=n_trials,
+        max_workers=max_workers,
+    )
+    summary, oos_trades = wfo.run()
+    if not summary.get('total_windows'):
+        return summary
+
+    print(f"\n{'='*70}")
+    print("WALK-FORWARD SUMMARY")
+    print(f"{'='*70}")
+    print(f"  Windows: {summary['total_windows']}")
+    print(f"  OOS Total R: {summary['oos_total_r']:+.1f}R ({summary['oos_total_trades']} trades)")
+    print(f"  Profitable OOS windows: {summary['profitable_oos_windows_pct']:.0f}%")
+    print(f"  Avg walk-forward efficiency: {summary['avg_walk_forward_efficiency']:.2f}")
+    print(f"  Stitched OOS Sharpe: {summary['stitched_oos_metrics']['sharpe_ratio']:+.2f}")
+
+    wf_dir = OUTPUT_DIR / "WALK_FORWARD"
+    wf_dir.mkdir(exist_ok=True)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    results_file = wf_dir / f"walk_forward_{timestamp}.json"
+    results_file.write_text(json.dumps(summary, indent=2, default=str))
+    export_trades_to_csv(oos_trades, f"WALK_FORWARD/walk_forward_oos_trades_{timestamp}.csv")
+    print(f"\n✓ Walk-forward results saved to: {results_file}")
+
+    return summary
+
+
+# ============================================================================
+# PARAMETER SENSITIVITY SWEEP
+# One-at-a-time perturbation of best_params.json, feeding
+# ParameterSensitivityAnalyzer.tornado_analysis()
+# ============================================================================
+
+# Params that only change how simulate_trades() manages/filters entries or
+# that run_full_period_backtest() ignores. Varying them never changes
+# detect_regime()/generate_signals() output, so their sweep runs share signals.
+EXIT_ONLY_PARAMS = {
+    'risk_per_trade_pct',
+    'trail_activation_r',
+    'tp1_close_pct',
+    'tp2_close_pct',
+    'tp3_close_pct',
+    'tp1_r_multiple',
+    'tp2_r_multiple',
+    'tp3_r_multiple',
+    'atr_trail_multiplier',
+    'partial_exit_at_1r',
+    'partial_exit_pct',
+    'atr_min_percentile',
+    'december_atr_multiplier',
+    'daily_loss_halt_pct',
+    'max_total_dd_warning',
+    'consecutive_loss_halt',
+}
+
+# Keys in best_params.json that are aliases of another key
+SENSITIVITY_ALIASES = {
+    'min_confluence': 'min_confluence_score',
+    'atr_volatility_ratio': 'atr_vol_ratio_range',
+}
+
+
+def build_sensitivity_grid(
+    base_params: Dict,
+    steps: Tuple[float, ...] = (-0.2, -0.1, 0.1, 0.2),
+    include: Optional[List[str]] = None,
+) -> Dict[str, List[Any]]:
+    """
+    Build a one-at-a-time perturbation grid around base_params.
+
+    Floats are scaled by (1 + step), ints are rounded (at least +/-1 step),
+    bools are flipped. Unchanged and duplicate values are dropped.
+
+    Returns:
+        Dict of {param_name: [perturbed values]}
+    """
+    grid = {}
+    for name, base in base_params.items():
+        if name in SENSITIVITY_ALIASES or (include and name not in include):
+            continue
+        values = []
+        if isinstance(base, bool):
+            values = [not base]
+        elif isinstance(base, int):
+            for step in steps:
+                delta = int(round(base * step)) or (1 if step > 0 else -1)
+                values.append(max(0, base + delta))
+        elif isinstance(base, float):
+            values = [round(base * (1 + step), 4) for step in steps]
+        values = sorted({v for v in values if v != base}, key=float)
+        if values:
+            grid[name] = values
+    return grid
+
+
+def _apply_sensitivity_value(base_params: Dict, name: str, value: Any) -> Dict:
+    """Copy base_params with one parameter (and its aliases) replaced."""
+    params = dict(base_params)
+    params[name] = value
+    for alias, target in SENSITIVITY_ALIASES.items():
+        if target == name and alias in params:
+            params[alias] = value
+    return params
+
+
+def _run_sensitivity_group(task: Dict) -> List[Tuple[Optional[str], Any, Dict]]:
+    """
+    Backtest a group of (param, value) variants sharing one signal cache.
+
+    Runs in a worker process. Groups are built so every variant differs from
+    the base params only in EXIT_ONLY_PARAMS, or the group has a single variant.
+    """
+    signal_cache: Dict = {}
+    results = []
+    for name, value in task['variants']:
+        params = task['base_params'] if name is None else _apply_sensitivity_value(task['base_params'], name, value)
+        risk_pct = params.get('risk_per_trade_pct', 0.5)
+        trades = run_full_period_backtest(
+            start_date=task['start_date'],
+            end_date=task['end_date'],
+            signal_cache=signal_cache,
+            **backtest_kwargs_from_params(params),
+        )
+        metrics = calculate_risk_metrics(trades, risk_pct, ACCOUNT_SIZE).to_dict()
+        metrics['total_r'] = sum(getattr(t, 'rr', 0) for t in trades)
+        metrics['trades'] = len(trades)
+        results.append((name, value, metrics))
+    return results
+
+
+def run_parameter_sensitivity(
+    params_file: str = "best_params.json",
+    start_date_str: Optional[str] = None,
+    end_date_str: Optional[str] = None,
+    steps: Tuple[float, ...] = (-0.2, -0.1, 0.1, 0.2),
+    max_workers: Optional[int] = None,
+) -> Dict:
+    """
+    Perturb each parameter of params_file and rank them by Sharpe impact.
+
+    Exit-only variants are batched so each worker generates signals once and
+    replays exits for its whole batch; entry variants each run on their own.
+
+    Usage:
+        python ftmo_challenge_analyzer.py --sensitivity --params-file best_params.json --workers 8
+
+    Returns:
+        Dict with baseline metrics, raw sensitivity_results and tornado data
+    """
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    with open(params_file, 'r') as f:
+        base_params = json.load(f)
+    base_params = base_params.get('best_params', base_params)
+
+    start = datetime.strptime(start_date_str, "%Y-%m-%d") if start_date_str else TRAINING_START
+    end = datetime.strptime(end_date_str, "%Y-%m-%d") if end_date_str else TRAINING_END
+    max_workers = max_workers or os.cpu_count() or 1
+
+    grid = build_sensitivity_grid(base_params, steps=steps)
+    exit_variants = [(None, None)] + [
+        (name, value) for name, values in grid.items() if name in EXIT_ONLY_PARAMS for value in values
+    ]
+    entry_variants = [
+        (name, value) for name, values in grid.items() if name not in EXIT_ONLY_PARAMS for value in values
+    ]
+
+    # Split exit variants into one chunk per worker so signals are built once per worker
+    n_exit_chunks = max(1, min(max_workers, len(exit_variants)))
+    chunk_size = -(-len(exit_variants) // n_exit_chunks)
+    groups = [exit_variants[i:i + chunk_size] for i in range(0, len(exit_variants), chunk_size)]
+    groups += [[variant] for variant in entry_variants]
+
+    total_runs = len(exit_variants) + len(entry_variants)
+    print(f"\n{'='*70}")
+    print("PARAMETER SENSITIVITY SWEEP")
+    print(f"{'='*70}")
+    print(f"Params file: {params_file}")
+    print(f"Period: {start.strftime('%Y-%m-%d')} to {end.strftime('%Y-%m-%d')}")
+    print(f"Parameters: {len(grid)} | Runs: {total_runs} ({len(exit_variants) - 1} exit-only share signals) | Workers: {max_workers}")
+
+    # Load candles once so forked workers inherit _DATA_CACHE
+    tf_config = TIMEFRAME_CONFIG['TPE']
+    for symbol in get_all_trading_assets():
+        for tf in {tf_config['entry_tf'], tf_config['confirmation_tf'], tf_config['bias_tf'], tf_config['sr_tf']}:
+            load_ohlcv_data(symbol, tf, start, start)
+
+    mp_context = None
+    if 'fork' in multiprocessing.get_all_start_methods():
+        mp_context = multiprocessing.get_context('fork')
+
+    baseline_metrics: Dict = {}
+    sensitivity_results: Dict[str, List[Tuple[Any, Dict]]] = {}
+    completed = 0
+    with ProcessPoolExecutor(max_workers=min(max_workers, len(groups)), mp_context=mp_context) as pool:
+        futures = [
+            pool.submit(_run_sensitivity_group, {
+                'base_params': base_params,
+                'variants': group,
+                'start_date': start,
+                'end_date': end,
+            })
+            for group in groups
+        ]
+        for future in as_completed(futures):
+            for name, value, metrics in future.result():
+                completed += 1
+                if name is None:
+                    baseline_metrics = metrics
+                else:
+                    sensitivity_results.setdefault(name, []).append((value, metrics))
+            print(f"  Completed {completed}/{total_runs} runs", end="\r", flush=True)
+    print()
+
+    for name in sensitivity_results:
+        sensitivity_results[name].sort(key=lambda item: float(item[0]))
+
+    tornado = ParameterSensitivityAnalyzer.tornado_analysis(baseline_metrics, sensitivity_results)
+
+    print(f"\nBaseline: {baseline_metrics.get('total_r', 0):+.1f}R, "
+          f"{baseline_metrics.get('trades', 0)} trades, Sharpe {baseline_metrics.get('sharpe_ratio', 0):+.2f}")
+    print(f"\n{'Parameter':<28} {'Best':>10} {'dSharpe':>9} {'Worst':>10} {'dSharpe':>9} {'Range':>8}")
+    print("-" * 78)
+    for row in tornado:
+        print(f"{row['parameter']:<28} {str(row['best_value']):>10} {row['best_impact']:>+9.2f} "
+              f"{str(row['worst_value']):>10} {row['worst_impact']:>+9.2f} {row['range']:>8.2f}")
+
+    summary = {
+        'params_file': params_file,
+        'start_date': start.strftime('%Y-%m-%d'),
+        'end_date': end.strftime('%Y-%m-%d'),
+        'steps': list(steps),
+        'base_params': base_params,
+        'baseline_metrics': baseline_metrics,
+        'sensitivity_results': {
+            name: [{'value': value, 'metrics': metrics} for value, metrics in results]
+            for name, results in sensitivity_results.items()
+        },
+        'tornado': tornado,
+    }
+
+    sens_dir = OUTPUT_DIR / "SENSITIVITY"
+    sens_dir.mkdir(exist_ok=True)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    results_file = sens_dir / f"sensitivity_{timestamp}.json"
+    results_file.write_text(json.dumps(summary, indent=2, default=str))
+    print(f"\n✓ Sensitivity results saved to: {results_file}")
+
+    return summary
+
+
 def main():
     """
     Professional FTMO Optimization Workflow with CLI support.
@@ -3460,6 +4260,12 @@ def main():
       # Validation mode (test existing params on different periods)
       python ftmo_challenge_analyzer.py --validate --start 2020-01-01 --end 2022-12-31
       python ftmo_challenge_analyzer.py --validate --start 2018-01-01 --end 2019-12-31 --params-file best_params.json
+
+      # Walk-forward re-optimization (fresh study per training window, --trials per window)
+      python ftmo_challenge_analyzer.py --walk-forward --start 2015-01-01 --end 2025-12-26 --trials 50 --workers 8
+
+      # Parameter sensitivity sweep around best_params.json (tornado ranking)
+      python ftmo_challenge_analyzer.py --sensitivity --params-file best_params.json --workers 8
     """
     global OPTUNA_DB_PATH, OPTUNA_STUDY_NAME, PROGRESS_LOG_FILE
     parser = argparse.ArgumentParser(
@@ -3533,6 +4339,40 @@ def main():
         action="store_true",
         help="Finalize incomplete run: validate top 5 trials and archive to history"
     )
+    # === WALK-FORWARD MODE ===
+    parser.add_argument(
+        "--walk-forward",
+        action="store_true",
+        help="Re-optimize on each rolling training window and score the next OOS window (uses --start/--end, --trials per window)"
+    )
+    parser.add_argument(
+        "--wf-train-months",
+        type=int,
+        default=12,
+        help="Walk-forward training window length in months (default: 12)"
+    )
+    parser.add_argument(
+        "--wf-val-months",
+        type=int,
+        default=3,
+        help="Walk-forward out-of-sample window length in months (default: 3)"
+    )
+    parser.add_argument(
+        "--wf-anchored",
+        action="store_true",
+        help="Use anchored (expanding) training windows instead of rolling"
+    )
+    parser.add_argument(
+        "--sensitivity",
+        action="store_true",
+        help="Sweep each parameter of --params-file one at a time and rank by Sharpe impact (uses --start/--end, default training period)"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes for --walk-forward / --sensitivity (default: CPU count)"
+    )
     args = parser.parse_args()
 
     global DEFAULT_EXCLUDED_ASSETS
@@ -3551,6 +4391,29 @@ def main():
         finalize_incomplete_run(optimization_mode=optimization_mode, top_n=5)
         return
 
+    # === WALK-FORWARD MODE ===
+    if args.walk_forward:
+        run_walk_forward_mode(
+            start_date_str=args.start,
+            end_date_str=args.end,
+            train_months=args.wf_train_months,
+            validate_months=args.wf_val_months,
+            rolling=not args.wf_anchored,
+            n_trials=args.trials,
+            max_workers=args.workers,
+        )
+        return
+
+    # === SENSITIVITY MODE ===
+    if args.sensitivity:
+        run_parameter_sensitivity(
+            params_file=args.params_file,
+            start_date_str=args.start,
+            end_date_str=args.end,
+            max_workers=args.workers,
+        )
+        return
+
     # === VALIDATION MODE ===
     if args.validate:
         if not args.start or not args.end:
@@ -3759,7 +4622,12 @@ def main():
         print("MONTE CARLO SIMULATION (1000 iterations)")
         print(f"{'='*80}")
         mc_results = run_monte_carlo_analysis(full_year_trades, num_simulations=1000)
-    
+        results['ftmo_pass_probability'] = run_ftmo_pass_probability_analysis(
+            full_year_trades,
+            risk_pct=best_params.get('risk_per_trade_pct', 0.6),
+            num_simulations=5000,
+        )
+
     print(f"\n{'='*80}")
     print("QUARTERLY PERFORMANCE BREAKDOWN (Full Year)")
     print(f"{'='*80}")
@@ -3869,6 +4737,7 @@ def main():
     print(f"  - monthly_stats.csv")
     print(f"  - symbol_performance.csv")
     print(f"  - optimization.log")
+    print(f"  - trials.journal / trials.params.jsonl (append-only trial journal)")
     print(f"  - optimization_report.csv")
     print(f"\nAlso created:")
     print(f"  - params/current_params.json (optimized parameters)")
@@ -6,6 +6,8 @@ Trading parameters optimized for 5ers 60K High Stakes challenge with maximum saf
 from dataclasses import dataclass, field
 from typing import List, Tuple, Dict
 
+from symbol_registry import canonical_key, lookup_symbol
+
 
 @dataclass
 class Fiveers60KConfig:
@@ -184,6 +186,7 @@ class Fiveers60KConfig:
             raise ValueError("Max total drawdown cannot exceed 10% for 5ers")
         if self.max_concurrent_trades > 10:
             raise ValueError("Max concurrent trades should not exceed 10 for safety")
+        self._whitelist_keys = frozenset(canonical_key(a) for a in self.whitelist_assets)
 
     def get_risk_pct(self, daily_loss_pct: float, total_dd_pct: float) -> float:
         """
@@ -236,7 +239,11 @@ class Fiveers60KConfig:
         Check if asset is in the whitelist.
         Only trade proven top performers.
         """
-        # Normalize symbol (remove any suffix like .a or _m)
+        info = lookup_symbol(symbol)
+        if info is not None:
+            return info.key in self._whitelist_keys
+
+        # Unknown to the symbol registry: normalize symbol (remove any suffix like .a or _m)
         base_symbol = symbol.replace('.a', '').replace('_m', '').upper()
 
         # Check exact match
@@ -255,6 +262,10 @@ class Fiveers60KConfig:
         Get maximum allowed spread for a symbol.
         Returns the configured max spread or DEFAULT if not found.
         """
+        info = lookup_symbol(symbol)
+        if info is not None:
+            return self.max_spread_pips.get(info.key, self.max_spread_pips.get("DEFAULT", 5.0))
+
         base_symbol = symbol.replace('.a', '').replace('_m', '').replace('_', '').upper()
         
         if base_symbol in self.max_spread_pips:
@@ -527,6 +538,14 @@ def get_pip_size(symbol: str) -> float:
     Get pip size for a symbol.
     Returns the point value (0.00001 for 5-digit EUR/USD, 0.001 for 3-digit JPY pairs).
     """
+    info = lookup_symbol(symbol)
+    if info is not None:
+        return info.pip_size
+    return lookup_pip_size(symbol)
+
+
+def lookup_pip_size(symbol: str) -> float:
+    """Pip size from PIP_SIZES and asset-type rules (uncached; used to build the symbol registry)."""
     # Normalize symbol - remove underscores, suffixes, convert to uppercase
     base_symbol = symbol.replace('.a', '').replace('_m', '').replace('_', '').upper()
 
@@ -16,7 +16,11 @@ Configuration:
     - MT5_SERVER: Broker server name (e.g., "FTMO-Demo")
     - MT5_LOGIN: Account login number
     - MT5_PASSWORD: Account password
-    - SCAN_INTERVAL_HOURS: How often to scan (default: 4)
+    - MT5_BACKEND: "mt5" (default) or "sim" for the offline simulator that
+      replays data/ohlcv (SIM_START, SIM_SPEED, SIM_BALANCE)
+    - SCAN_TRIGGER: "bar_close" (default) rescans symbols when their D1/H4
+      bar closes; "timer" rescans everything every SCAN_INTERVAL_HOURS
+    - SCAN_INTERVAL_HOURS: How often to scan in timer mode (default: 1)
 """
 
 import os
@@ -24,6 +28,8 @@ import sys
 import time
 import json
 import signal as sig_module
+import threading
+from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
 from typing import List, Dict, Optional
@@ -52,8 +58,15 @@ except ImportError:
         return {'monthly': [], 'weekly': []}
 
 from tradr.mt5.client import MT5Client, PendingOrder
+from tradr.live.scan_worker import MIN_CONFLUENCE, evaluate_symbol_confluence
+from tradr.mt5.candle_cache import CandleCache
+from tradr.mt5.bar_scheduler import BarCloseScheduler
+from tradr.mt5.snapshot import BrokerSnapshot
+from tradr.utils.scheduler import LoopScheduler, PriorityLock
 from tradr.risk.manager import RiskManager
+from tradr.risk.equity_monitor import StreamingEquityMonitor
 from tradr.utils.logger import setup_logger
+from tradr.utils.state_store import state_store_for
 from challenge_risk_manager import ChallengeRiskManager, ChallengeConfig, RiskMode, ActionType, create_challenge_manager
 
 CHALLENGE_MODE = True
@@ -102,18 +115,36 @@ from ftmo_config import FIVEERS_CONFIG
 MT5_SERVER = os.getenv("MT5_SERVER", "")
 MT5_LOGIN = int(os.getenv("MT5_LOGIN", "0"))
 MT5_PASSWORD = os.getenv("MT5_PASSWORD", "")
+MT5_BACKEND = os.getenv("MT5_BACKEND", "mt5").lower()
+
+# Offline simulator settings (MT5_BACKEND=sim)
+SIM_START = os.getenv("SIM_START", "2024-01-02")
+SIM_SPEED = float(os.getenv("SIM_SPEED", "60"))
+SIM_BALANCE = float(os.getenv("SIM_BALANCE", "60000"))
 SCAN_INTERVAL_HOURS = int(os.getenv("SCAN_INTERVAL_HOURS", "1"))
+SCAN_TRIGGER = os.getenv("SCAN_TRIGGER", "bar_close").lower()
 
-# Load MIN_CONFLUENCE from params loader (single source of truth)
-try:
-    from params.params_loader import get_min_confluence
-    MIN_CONFLUENCE = get_min_confluence()
-except Exception:
-    MIN_CONFLUENCE = 5  # Fallback if params not available
+# Timeframes whose bar close triggers a rescan: entry (D1) and confirmation (H4)
+SCAN_TRIGGER_TIMEFRAMES = ("D1", "H4")
 
 # Use EXACT same assets as Discord /backtest command (34 assets)
 TRADABLE_SYMBOLS = FOREX_PAIRS + METALS + INDICES + CRYPTO_ASSETS  # 28 forex + 2 metals + 2 indices + 2 crypto = 34 assets
 
+# Scan pipeline: minimum spacing between per-symbol MT5 fetches and
+# number of worker processes for confluence evaluation (0 = inline)
+SCAN_FETCH_MIN_INTERVAL_SECONDS = float(os.getenv("SCAN_FETCH_MIN_INTERVAL_SECONDS", "0.05"))
+SCAN_WORKERS = int(os.getenv("SCAN_WORKERS", str(min(4, os.cpu_count() or 1))))
+
+# How often the live loop logs per-task lag metrics
+LOOP_METRICS_INTERVAL_MINUTES = int(os.getenv("LOOP_METRICS_INTERVAL_MINUTES", "15"))
+
+# Streaming P/L monitor: tick poll interval for open-position symbols, the
+# tick-to-decision latency budget, and the equity drop (% since last broker
+# sync) that forces an immediate protection pass
+TICK_MONITOR_INTERVAL_MS = int(os.getenv("TICK_MONITOR_INTERVAL_MS", "250"))
+TICK_MONITOR_LATENCY_BUDGET_MS = float(os.getenv("TICK_MONITOR_LATENCY_BUDGET_MS", "1000"))
+TICK_MONITOR_TRIGGER_MOVE_PCT = float(os.getenv("TICK_MONITOR_TRIGGER_MOVE_PCT", "0.5"))
+
 log = setup_logger("tradr", log_file="logs/tradr_live.log")
 running = True
 
@@ -160,13 +191,48 @@ class LiveTradingBot:
     VALIDATE_INTERVAL_MINUTES = 10
     MAIN_LOOP_INTERVAL_SECONDS = 10
     
-    def __init__(self):
-        self.mt5 = MT5Client(
-            server=MT5_SERVER,
-            login=MT5_LOGIN,
-            password=MT5_PASSWORD,
+    def __init__(self, mt5_client: Optional[MT5Client] = None):
+        if mt5_client is not None:
+            self.mt5 = mt5_client
+        elif MT5_BACKEND == "sim":
+            # Offline only: keeps the simulator (and pandas) out of live starts
+            from tradr.mt5.simulator import SimulatedMT5Client
+            self.mt5 = SimulatedMT5Client(
+                start=datetime.fromisoformat(SIM_START).replace(tzinfo=timezone.utc),
+                speed=SIM_SPEED,
+                balance=SIM_BALANCE,
+            )
+        else:
+            self.mt5 = MT5Client(
+                server=MT5_SERVER,
+                login=MT5_LOGIN,
+                password=MT5_PASSWORD,
+            )
+        self.candle_cache = CandleCache(self.mt5)
+        # Positions/orders/account/ticks fetched once per loop iteration and
+        # shared by all subsystems; order actions go through it to invalidate
+        self.broker = BrokerSnapshot(self.mt5)
+        # Guards MT5 access and bot state across scheduler lanes; protection
+        # acquires it with priority. Set _halted to stop all trading tasks.
+        self._lock = PriorityLock()
+        self._halted = threading.Event()
+        self._scan_targets: Dict[str, str] = {}
+        self.scheduler: Optional[LoopScheduler] = None
+        self.bar_scheduler = BarCloseScheduler(
+            self.mt5,
+            timeframes=SCAN_TRIGGER_TIMEFRAMES,
+            always_open=CRYPTO_ASSETS,
+            # The simulator supplies its own clock; real brokers use the wall clock
+            clock=getattr(self.mt5, "now", None),
         )
+        self._scan_pool: Optional[ProcessPoolExecutor] = None
         self.risk_manager = RiskManager(state_file="challenge_state.json")
+        self.equity_monitor = StreamingEquityMonitor(
+            self.risk_manager,
+            latency_budget_ms=TICK_MONITOR_LATENCY_BUDGET_MS,
+            trigger_move_pct=TICK_MONITOR_TRIGGER_MOVE_PCT,
+            resync_seconds=self.MAIN_LOOP_INTERVAL_SECONDS,
+        )
         
         # Load best params from optimizer (if available), otherwise use defaults
         best_params_dict = load_best_params_from_file()
@@ -188,38 +254,37 @@ class LiveTradingBot:
         self.challenge_start_date: Optional[datetime] = None
         self.challenge_end_date: Optional[datetime] = None
         
+        # pending_setups.json / trading_days.json are documents in the state store
+        self.state_store = state_store_for(self.PENDING_SETUPS_FILE)
         self._load_pending_setups()
         self._load_trading_days()
         self._auto_start_challenge()
     
     def _load_pending_setups(self):
-        """Load pending setups from file."""
+        """Load pending setups from the state store."""
         try:
-            if Path(self.PENDING_SETUPS_FILE).exists():
-                with open(self.PENDING_SETUPS_FILE, 'r') as f:
-                    data = json.load(f)
+            data = self.state_store.get(self.PENDING_SETUPS_FILE, legacy_file=Path(self.PENDING_SETUPS_FILE))
+            if data is not None:
                 for symbol, setup_dict in data.items():
                     self.pending_setups[symbol] = PendingSetup.from_dict(setup_dict)
-                log.info(f"Loaded {len(self.pending_setups)} pending setups from file")
+                log.info(f"Loaded {len(self.pending_setups)} pending setups from state store")
         except Exception as e:
             log.error(f"Error loading pending setups: {e}")
             self.pending_setups = {}
     
     def _save_pending_setups(self):
-        """Save pending setups to file."""
+        """Queue pending setups for the state store's next batched commit."""
         try:
             data = {symbol: setup.to_dict() for symbol, setup in self.pending_setups.items()}
-            with open(self.PENDING_SETUPS_FILE, 'w') as f:
-                json.dump(data, f, indent=2, default=str)
+            self.state_store.put(self.PENDING_SETUPS_FILE, data)
         except Exception as e:
             log.error(f"Error saving pending setups: {e}")
     
     def _load_trading_days(self):
-        """Load trading days from file for FTMO minimum trading days tracking."""
+        """Load trading days from the state store for FTMO minimum trading days tracking."""
         try:
-            if Path(self.TRADING_DAYS_FILE).exists():
-                with open(self.TRADING_DAYS_FILE, 'r') as f:
-                    data = json.load(f)
+            data = self.state_store.get(self.TRADING_DAYS_FILE, legacy_file=Path(self.TRADING_DAYS_FILE))
+            if data is not None:
                 self.trading_days = set(data.get("trading_days", []))
                 start_date_str = data.get("challenge_start_date")
                 end_date_str = data.get("challenge_end_date")
@@ -229,7 +294,7 @@ class LiveTradingBot:
                 if end_date_str:
                     normalized = end_date_str.replace("Z", "+00:00")
                     self.challenge_end_date = datetime.fromisoformat(normalized)
-                log.info(f"Loaded {len(self.trading_days)} trading days from file")
+                log.info(f"Loaded {len(self.trading_days)} trading days from state store")
         except Exception as e:
             log.error(f"Error loading trading days: {e}")
             self.trading_days = set()
@@ -246,15 +311,14 @@ class LiveTradingBot:
         log.info(f"New challenge started: {self.challenge_start_date.date()} to {self.challenge_end_date.date()} ({duration_days} days)")
     
     def _save_trading_days(self):
-        """Save trading days to file."""
+        """Queue trading days for the state store's next batched commit."""
         try:
             data = {
                 "trading_days": list(self.trading_days),
                 "challenge_start_date": self.challenge_start_date.isoformat() if self.challenge_start_date else None,
                 "challenge_end_date": self.challenge_end_date.isoformat() if self.challenge_end_date else None,
             }
-            with open(self.TRADING_DAYS_FILE, 'w') as f:
-                json.dump(data, f, indent=2)
+            self.state_store.put(self.TRADING_DAYS_FILE, data)
         except Exception as e:
             log.error(f"Error saving trading days: {e}")
     
@@ -268,7 +332,7 @@ class LiveTradingBot:
         if today not in self.trading_days:
             self.trading_days.add(today)
             self._save_trading_days()
-            log.info(f"Recorded trading day: {today} (Total: {len(self.trading_days)}/{FIVEERS_CONFIG.min_trading_days} required)")
+            log.info(f"Recorded trading day: {today} (Total: {len(self.trading_days)}/{FIVEERS_CONFIG.min_profitable_days} required)")
     
     def check_trading_days_warning(self) -> bool:
         """
@@ -283,13 +347,13 @@ class LiveTradingBot:
         now = datetime.now(timezone.utc)
         days_remaining = (self.challenge_end_date - now).days
         trading_days_count = len(self.trading_days)
-        days_needed = FIVEERS_CONFIG.min_trading_days - trading_days_count
+        days_needed = FIVEERS_CONFIG.min_profitable_days - trading_days_count
         
         if days_needed <= 0:
             return False
         
         if days_remaining <= days_needed + 2:
-            log.warning(f"TRADING DAYS WARNING: {trading_days_count}/{FIVEERS_CONFIG.min_trading_days} days traded, "
+            log.warning(f"TRADING DAYS WARNING: {trading_days_count}/{FIVEERS_CONFIG.min_profitable_days} days traded, "
                        f"{days_remaining} days remaining in challenge. Need {days_needed} more trading days!")
             return True
         
@@ -300,14 +364,14 @@ class LiveTradingBot:
         from ftmo_config import FIVEERS_CONFIG
         
         trading_days_count = len(self.trading_days)
-        days_needed = max(0, FIVEERS_CONFIG.min_trading_days - trading_days_count)
+        days_needed = max(0, FIVEERS_CONFIG.min_profitable_days - trading_days_count)
         
         status = {
             "trading_days_count": trading_days_count,
-            "min_required": FIVEERS_CONFIG.min_trading_days,
+            "min_required": FIVEERS_CONFIG.min_profitable_days,
             "days_needed": days_needed,
             "trading_days": sorted(list(self.trading_days)),
-            "requirement_met": trading_days_count >= FIVEERS_CONFIG.min_trading_days,
+            "requirement_met": trading_days_count >= FIVEERS_CONFIG.min_profitable_days,
         }
         
         if self.challenge_end_date:
@@ -446,15 +510,18 @@ class LiveTradingBot:
         """
         Get multi-timeframe candle data for a symbol.
         Same timeframes used in backtests for parity.
+        
+        Served from the incremental candle cache: after the first call only
+        bars from the last cached bar onwards are fetched from MT5.
         """
         # Use broker symbol format
         broker_symbol = self.symbol_map.get(symbol, symbol)
         
         data = {
-            "monthly": self.mt5.get_ohlcv(broker_symbol, "MN1", 24),
-            "weekly": self.mt5.get_ohlcv(broker_symbol, "W1", 104),
-            "daily": self.mt5.get_ohlcv(broker_symbol, "D1", 500),
-            "h4": self.mt5.get_ohlcv(broker_symbol, "H4", 500),
+            "monthly": self.candle_cache.get(broker_symbol, "MN1", 24),
+            "weekly": self.candle_cache.get(broker_symbol, "W1", 104),
+            "daily": self.candle_cache.get(broker_symbol, "D1", 500),
+            "h4": self.candle_cache.get(broker_symbol, "H4", 500),
         }
         return data
     
@@ -462,7 +529,7 @@ class LiveTradingBot:
         """Check if we already have a position on this symbol."""
         # symbol is in OANDA format, convert to broker format for checking
         broker_symbol = self.symbol_map.get(symbol, symbol)
-        positions = self.mt5.get_my_positions()
+        positions = self.broker.get_my_positions()
         for pos in positions:
             if pos.symbol == broker_symbol:
                 return True
@@ -520,8 +587,19 @@ class LiveTradingBot:
         
         Returns trade setup dict if signal is active AND tradeable, None otherwise.
         """
-        from ftmo_config import FIVEERS_CONFIG, get_pip_size, get_sl_limits
+        broker_symbol = self._scan_precheck(symbol)
+        if broker_symbol is None:
+            return None
+        
+        data = self._fetch_scan_data(symbol)
+        if data is None:
+            return None
         
+        evaluation = evaluate_symbol_confluence(symbol, data, self.params)
+        return self._build_setup(symbol, broker_symbol, evaluation, data["daily"])
+    
+    def _scan_precheck(self, symbol: str) -> Optional[str]:
+        """Skip symbols that are unavailable, already in a position or already pending."""
         if symbol not in self.symbol_map:
             log.debug(f"[{symbol}] Not available on this broker, skipping")
             return None
@@ -539,6 +617,10 @@ class LiveTradingBot:
                 log.info(f"[{symbol}] Already have pending setup, skipping")
                 return None
         
+        return broker_symbol
+    
+    def _fetch_scan_data(self, symbol: str) -> Optional[Dict[str, List[Dict]]]:
+        """Fetch candles for a scan; None if there is not enough history."""
         data = self.get_candle_data(symbol)
         
         if not data["daily"] or len(data["daily"]) < 50:
@@ -549,52 +631,30 @@ class LiveTradingBot:
             log.warning(f"[{symbol}] Insufficient weekly data")
             return None
         
-        monthly_candles = data["monthly"] if data["monthly"] else []
-        weekly_candles = data["weekly"]
-        daily_candles = data["daily"]
-        h4_candles = data["h4"] if data["h4"] else daily_candles[-20:]
-        
-        mn_trend = _infer_trend(monthly_candles) if monthly_candles else "mixed"
-        wk_trend = _infer_trend(weekly_candles) if weekly_candles else "mixed"
-        d_trend = _infer_trend(daily_candles) if daily_candles else "mixed"
-        
-        direction, _, _ = _pick_direction_from_bias(mn_trend, wk_trend, d_trend)
-        
-        historical_sr = get_all_htf_sr_levels(symbol) if HISTORICAL_SR_AVAILABLE else None
-        
-        flags, notes, trade_levels = compute_confluence(
-            monthly_candles,
-            weekly_candles,
-            daily_candles,
-            h4_candles,
-            direction,
-            self.params,
-            historical_sr,
-        )
-        
-        entry, sl, tp1, tp2, tp3, tp4, tp5 = trade_levels
+        return data
+    
+    def _build_setup(
+        self,
+        symbol: str,
+        broker_symbol: str,
+        evaluation: Dict,
+        daily_candles: List[Dict],
+    ) -> Optional[Dict]:
+        """
+        Turn a confluence evaluation into a validated setup dict.
         
-        confluence_score = sum(1 for v in flags.values() if v)
+        Checks entry proximity against the live tick and adjusts SL/TPs with
+        the same rules as the backtest.
+        """
+        from ftmo_config import FIVEERS_CONFIG, get_pip_size, get_sl_limits
         
-        has_confirmation = flags.get("confirmation", False)
-        has_rr = flags.get("rr", False)
-        has_location = flags.get("location", False)
-        has_fib = flags.get("fib", False)
-        has_liquidity = flags.get("liquidity", False)
-        has_structure = flags.get("structure", False)
-        has_htf_bias = flags.get("htf_bias", False)
-        
-        # EXACT same quality factor calculation as backtest_live_bot.py
-        quality_factors = sum([has_location, has_fib, has_liquidity, has_structure, has_htf_bias])
-        
-        # BUGFIX: Removed has_rr gate - it was preventing all trades from being active
-        # If confluence and quality are sufficient, R:R is implicitly validated
-        if confluence_score >= MIN_CONFLUENCE and quality_factors >= FIVEERS_CONFIG.min_quality_factors:
-            status = "active"
-        elif confluence_score >= MIN_CONFLUENCE:
-            status = "watching"
-        else:
-            status = "scan_only"
+        direction = evaluation["direction"]
+        flags = evaluation["flags"]
+        notes = evaluation["notes"]
+        confluence_score = evaluation["confluence_score"]
+        quality_factors = evaluation["quality_factors"]
+        status = evaluation["status"]
+        entry, sl, tp1, tp2, tp3, tp4, tp5 = evaluation["trade_levels"]
         
         log.info(f"[{symbol}] {direction.upper()} | Conf: {confluence_score}/7 | Quality: {quality_factors} | Status: {status}")
         
@@ -776,7 +836,7 @@ class LiveTradingBot:
             
             if worst_setup and worst_setup.order_ticket:
                 try:
-                    self.mt5.cancel_pending_order(worst_setup.order_ticket)
+                    self.broker.cancel_pending_order(worst_setup.order_ticket)
                     log.info(f"[{worst_symbol}] Cancelled pending order (ticket: {worst_setup.order_ticket})")
                 except Exception as e:
                     log.warning(f"[{worst_symbol}] Failed to cancel order: {e}")
@@ -974,7 +1034,7 @@ class LiveTradingBot:
             order_type = "MARKET"
             log.info(f"[{symbol}] Price at entry ({entry_distance_r:.2f}R) - using MARKET ORDER")
             
-            result = self.mt5.place_market_order(
+            result = self.broker.place_market_order(
                 symbol=broker_symbol,
                 direction=direction,
                 volume=lot_size,
@@ -1032,7 +1092,7 @@ class LiveTradingBot:
             log.info(f"  Lot Size: {lot_size}")
             log.info(f"  Expiration: {FIVEERS_CONFIG.pending_order_expiry_hours} hours")
             
-            result = self.mt5.place_pending_order(
+            result = self.broker.place_pending_order(
                 symbol=broker_symbol,
                 direction=direction,
                 volume=lot_size,
@@ -1085,7 +1145,7 @@ class LiveTradingBot:
         
         This syncs our internal state with actual MT5 positions.
         """
-        my_positions = self.mt5.get_my_positions()
+        my_positions = self.broker.get_my_positions()
         open_tickets = {p.ticket for p in my_positions}
         
         state_positions = self.risk_manager.state.open_positions.copy()
@@ -1116,10 +1176,10 @@ class LiveTradingBot:
         if not self.pending_setups:
             return
         
-        my_positions = self.mt5.get_my_positions()
+        my_positions = self.broker.get_my_positions()
         position_symbols = {p.symbol for p in my_positions}
         
-        my_pending_orders = self.mt5.get_my_pending_orders()
+        my_pending_orders = self.broker.get_my_pending_orders()
         pending_order_tickets = {o.ticket for o in my_pending_orders}
         
         setups_to_remove = []
@@ -1138,7 +1198,7 @@ class LiveTradingBot:
                     if age_hours >= expiry_hours:
                         log.info(f"[{symbol}] Pending order EXPIRED after {age_hours:.1f} hours (max {expiry_hours}h) - deleting")
                         if setup.order_ticket:
-                            self.mt5.cancel_pending_order(setup.order_ticket)
+                            self.broker.cancel_pending_order(setup.order_ticket)
                         setup.status = "expired"
                         setups_to_remove.append(symbol)
                         continue
@@ -1169,18 +1229,18 @@ class LiveTradingBot:
                 setups_to_remove.append(symbol)
                 continue
             
-            tick = self.mt5.get_tick(broker_symbol)
+            tick = self.broker.get_tick(broker_symbol)
             if tick:
                 if setup.direction == "bullish" and tick.bid <= setup.stop_loss:
                     log.warning(f"[{symbol}] Price ({tick.bid:.5f}) breached SL ({setup.stop_loss:.5f}) - cancelling pending order")
                     if setup.order_ticket:
-                        self.mt5.cancel_pending_order(setup.order_ticket)
+                        self.broker.cancel_pending_order(setup.order_ticket)
                     setup.status = "cancelled"
                     setups_to_remove.append(symbol)
                 elif setup.direction == "bearish" and tick.ask >= setup.stop_loss:
                     log.warning(f"[{symbol}] Price ({tick.ask:.5f}) breached SL ({setup.stop_loss:.5f}) - cancelling pending order")
                     if setup.order_ticket:
-                        self.mt5.cancel_pending_order(setup.order_ticket)
+                        self.broker.cancel_pending_order(setup.order_ticket)
                     setup.status = "cancelled"
                     setups_to_remove.append(symbol)
         
@@ -1225,7 +1285,7 @@ class LiveTradingBot:
         if direction != setup.direction:
             log.warning(f"[{symbol}] Direction changed from {setup.direction} to {direction} - cancelling setup")
             if setup.order_ticket:
-                self.mt5.cancel_pending_order(setup.order_ticket)
+                self.broker.cancel_pending_order(setup.order_ticket)
             del self.pending_setups[symbol]
             self._save_pending_setups()
             return False
@@ -1256,7 +1316,7 @@ class LiveTradingBot:
         if not (confluence_score >= MIN_CONFLUENCE and quality_factors >= 1):
             log.warning(f"[{symbol}] Setup no longer valid (conf: {confluence_score}/7, quality: {quality_factors}) - cancelling")
             if setup.order_ticket:
-                self.mt5.cancel_pending_order(setup.order_ticket)
+                self.broker.cancel_pending_order(setup.order_ticket)
             del self.pending_setups[symbol]
             self._save_pending_setups()
             return False
@@ -1294,7 +1354,7 @@ class LiveTradingBot:
         Returns:
             True if emergency close was triggered, False otherwise
         """
-        account = self.mt5.get_account_info()
+        account = self.broker.get_account_info()
         if not account:
             log.warning("Could not get account info for P/L monitoring")
             return False
@@ -1319,17 +1379,17 @@ class LiveTradingBot:
         
         # Cancel pending orders if approaching limits (above 3.5% daily or 7% total)
         if daily_loss_pct >= 3.5 or total_dd_pct >= 7.0:
-            pending_orders = self.mt5.get_my_pending_orders()
+            pending_orders = self.broker.get_my_pending_orders()
             if pending_orders:
                 log.warning(f"Approaching limits (Daily: {daily_loss_pct:.1f}%, DD: {total_dd_pct:.1f}%) - cancelling {len(pending_orders)} pending orders")
                 for order in pending_orders:
-                    self.mt5.cancel_pending_order(order.ticket)
+                    self.broker.cancel_pending_order(order.ticket)
                 self.pending_setups.clear()
                 self._save_pending_setups()
         
         # Start closing positions if above 4.0% daily or 8.0% total
         if daily_loss_pct >= 4.0 or total_dd_pct >= 8.0:
-            positions = self.mt5.get_my_positions()
+            positions = self.broker.get_my_positions()
             if not positions:
                 return False
             
@@ -1344,7 +1404,7 @@ class LiveTradingBot:
             
             for pos in positions_sorted:
                 log.warning(f"Closing {pos.symbol} (P/L: ${pos.profit:.2f}, Volume: {pos.volume})")
-                result = self.mt5.close_position(pos.ticket)
+                result = self.broker.close_position(pos.ticket)
                 
                 if result.success:
                     log.info(f"  ✓ Closed at {result.price}, P/L: ${pos.profit:.2f}")
@@ -1355,7 +1415,7 @@ class LiveTradingBot:
                     )
                     
                     # Re-check after closing
-                    account = self.mt5.get_account_info()
+                    account = self.broker.get_account_info()
                     if account:
                         new_equity = account.get('equity', 0)
                         new_daily_loss = 0.0
@@ -1381,7 +1441,7 @@ class LiveTradingBot:
                     log.error(f"  ✗ Failed to close: {result.error}")
             
             # Check final state
-            account = self.mt5.get_account_info()
+            account = self.broker.get_account_info()
             if account:
                 final_equity = account.get('equity', 0)
                 final_daily = 0.0
@@ -1420,7 +1480,7 @@ class LiveTradingBot:
         
         Tracks partial close state in pending_setups.
         """
-        positions = self.mt5.get_my_positions()
+        positions = self.broker.get_my_positions()
         if not positions:
             return
         
@@ -1434,7 +1494,7 @@ class LiveTradingBot:
             if setup.status != "filled":
                 continue
             
-            tick = self.mt5.get_tick(symbol)
+            tick = self.broker.get_tick(symbol)
             if not tick:
                 continue
             
@@ -1481,7 +1541,7 @@ class LiveTradingBot:
                 if close_volume >= 0.01:
                     pct_display = int((tp1_vol / original_volume) * 100) if original_volume > 0 else 0
                     log.info(f"[{symbol}] TP1 HIT! Closing {pct_display}% ({close_volume} lots) of position")
-                    result = self.mt5.partial_close(pos.ticket, close_volume)
+                    result = self.broker.partial_close(pos.ticket, close_volume)
                     if result.success:
                         log.info(f"[{symbol}] Partial close successful at {result.price}")
                         setup.partial_closes = 1
@@ -1493,7 +1553,7 @@ class LiveTradingBot:
                         else:
                             new_sl = setup.entry_price - be_buffer
                         
-                        self.mt5.modify_sl_tp(pos.ticket, sl=new_sl, tp=tp2 if tp2 else tp1)
+                        self.broker.modify_sl_tp(pos.ticket, sl=new_sl, tp=tp2 if tp2 else tp1)
                         log.info(f"[{symbol}] SL moved to BE+buffer ({new_sl:.5f}), TP updated to TP2: {tp2 if tp2 else 'N/A'}")
                     else:
                         log.error(f"[{symbol}] Partial close failed: {result.error}")
@@ -1504,21 +1564,21 @@ class LiveTradingBot:
                 if close_volume >= 0.01:
                     pct_display = int((tp2_vol / original_volume) * 100) if original_volume > 0 else 0
                     log.info(f"[{symbol}] TP2 HIT! Closing {pct_display}% ({close_volume} lots)")
-                    result = self.mt5.partial_close(pos.ticket, close_volume)
+                    result = self.broker.partial_close(pos.ticket, close_volume)
                     if result.success:
                         log.info(f"[{symbol}] Partial close successful at {result.price}")
                         setup.partial_closes = 2
                         self._save_pending_setups()
                         
                         if tp3:
-                            self.mt5.modify_sl_tp(pos.ticket, tp=tp3)
+                            self.broker.modify_sl_tp(pos.ticket, tp=tp3)
                             log.info(f"[{symbol}] TP updated to TP3: {tp3}")
                     else:
                         log.error(f"[{symbol}] Partial close failed: {result.error}")
             
             elif tp3_hit and partial_state == 2:
                 log.info(f"[{symbol}] TP3 HIT! Closing remainder of position")
-                result = self.mt5.close_position(pos.ticket)
+                result = self.broker.close_position(pos.ticket)
                 if result.success:
                     log.info(f"[{symbol}] Position fully closed at {result.price}")
                     setup.status = "closed"
@@ -1562,9 +1622,9 @@ class LiveTradingBot:
                     log.error(f"Reason: {action.reason}")
                     log.error("=" * 70)
                     
-                    positions = self.mt5.get_my_positions()
+                    positions = self.broker.get_my_positions()
                     for pos in positions:
-                        result = self.mt5.close_position(pos.ticket)
+                        result = self.broker.close_position(pos.ticket)
                         if result.success:
                             log.info(f"  ✓ Closed {pos.symbol} at {result.price}")
                             self.risk_manager.record_trade_close(
@@ -1575,9 +1635,9 @@ class LiveTradingBot:
                         else:
                             log.error(f"  ✗ Failed to close {pos.symbol}: {result.error}")
                     
-                    pending_orders = self.mt5.get_my_pending_orders()
+                    pending_orders = self.broker.get_my_pending_orders()
                     for order in pending_orders:
-                        self.mt5.cancel_pending_order(order.ticket)
+                        self.broker.cancel_pending_order(order.ticket)
                         log.info(f"  ✓ Cancelled pending order {order.ticket}")
                     
                     self.pending_setups.clear()
@@ -1588,7 +1648,7 @@ class LiveTradingBot:
                     
                 elif action.action == ActionType.CANCEL_PENDING:
                     for ticket in action.positions_affected:
-                        result = self.mt5.cancel_pending_order(ticket)
+                        result = self.broker.cancel_pending_order(ticket)
                         if result:
                             log.info(f"  ✓ Cancelled pending order {ticket}")
                         else:
@@ -1597,10 +1657,10 @@ class LiveTradingBot:
                     
                 elif action.action == ActionType.MOVE_SL_BREAKEVEN:
                     for ticket in action.positions_affected:
-                        positions = self.mt5.get_my_positions()
+                        positions = self.broker.get_my_positions()
                         pos = next((p for p in positions if p.ticket == ticket), None)
                         if pos:
-                            result = self.mt5.modify_sl_tp(ticket, sl=pos.price_open)
+                            result = self.broker.modify_sl_tp(ticket, sl=pos.price_open)
                             if result:
                                 log.info(f"  ✓ Moved SL to breakeven for {pos.symbol} ({pos.price_open:.5f})")
                             else:
@@ -1611,7 +1671,7 @@ class LiveTradingBot:
                     
                 elif action.action == ActionType.CLOSE_WORST:
                     for ticket in action.positions_affected:
-                        result = self.mt5.close_position(ticket)
+                        result = self.broker.close_position(ticket)
                         if result.success:
                             log.info(f"  ✓ Closed worst position {ticket} at {result.price}")
                             self.risk_manager.record_trade_close(
@@ -1633,13 +1693,42 @@ class LiveTradingBot:
         
         return emergency_triggered
     
-    def scan_all_symbols(self):
+    def _get_scan_pool(self) -> Optional[ProcessPoolExecutor]:
+        """Lazily start the confluence worker pool (None = evaluate inline)."""
+        if SCAN_WORKERS <= 0:
+            return None
+        if self._scan_pool is None:
+            try:
+                self._scan_pool = ProcessPoolExecutor(max_workers=SCAN_WORKERS)
+            except Exception as e:
+                log.warning(f"Could not start scan worker pool, scanning inline: {e}")
+                return None
+        return self._scan_pool
+    
+    def _shutdown_scan_pool(self):
+        """Stop the confluence worker pool if it was started."""
+        if self._scan_pool is not None:
+            self._scan_pool.shutdown(wait=False, cancel_futures=True)
+            self._scan_pool = None
+    
+    def scan_all_symbols(self, symbols: Optional[List[str]] = None):
         """
-        Scan all tradable symbols and place pending orders.
+        Scan tradable symbols and place pending orders.
+        
+        Args:
+            symbols: Subset to re-evaluate (e.g. symbols whose D1/H4 bar just
+                closed). Defaults to every tradable symbol.
         
         Uses the same logic as the backtest walk-forward loop.
         Now places pending limit orders instead of market orders
         to match backtest entry behavior exactly.
+        
+        Fetching, confluence evaluation (SCAN_WORKERS processes) and order
+        placement overlap, so a scan takes roughly as long as its slowest
+        stage instead of the sum over all symbols.
+        
+        Runs off the critical path: the broker/state lock is only held per
+        fetch and per placement, so protection tasks can run in between.
         """
         log.info("=" * 70)
         log.info(f"MARKET SCAN - {datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M UTC')}")
@@ -1648,43 +1737,93 @@ class LiveTradingBot:
         log.info("=" * 70)
         
         self.scan_count += 1
+        scan_started = time.monotonic()
         signals_found = 0
         orders_placed = 0
         
         # Only scan symbols that are available on broker
-        available_symbols = [s for s in TRADABLE_SYMBOLS if s in self.symbol_map]
+        available_symbols = [s for s in (symbols or TRADABLE_SYMBOLS) if s in self.symbol_map]
+        
+        # Staged pipeline, all MT5 access stays on this thread (under the lock):
+        #   1. fetch candles (rate-limited, one symbol at a time)
+        #   2. evaluate confluence in worker processes while fetching continues
+        #   3. validate against the live tick and place orders one by one
+        #      as evaluations complete
+        pool = self._get_scan_pool()
+        in_flight = {}
+        last_fetch = 0.0
+        
+        def place(symbol: str, broker_symbol: str, evaluation: Dict, daily_candles: List[Dict]):
+            nonlocal signals_found, orders_placed
+            try:
+                with self._lock.normal():
+                    setup = self._build_setup(symbol, broker_symbol, evaluation, daily_candles)
+                    if setup:
+                        signals_found += 1
+                        if self.place_setup_order(setup):
+                            orders_placed += 1
+            except Exception as e:
+                log.error(f"[{symbol}] Error during scan: {e}")
+        
+        def drain(block: bool):
+            done = [f for f in in_flight if f.done()]
+            if block and not done and in_flight:
+                done, _ = wait(list(in_flight), return_when=FIRST_COMPLETED)
+            for future in done:
+                symbol, broker_symbol, daily_candles = in_flight.pop(future)
+                try:
+                    evaluation = future.result()
+                except Exception as e:
+                    log.error(f"[{symbol}] Error during scan: {e}")
+                    continue
+                place(symbol, broker_symbol, evaluation, daily_candles)
         
         for symbol in available_symbols:
+            if not running:
+                log.info("Scan interrupted by shutdown")
+                break
             try:
+                wait_for = SCAN_FETCH_MIN_INTERVAL_SECONDS - (time.monotonic() - last_fetch)
+                if wait_for > 0:
+                    time.sleep(wait_for)
+                last_fetch = time.monotonic()
                 
-                setup = self.scan_symbol(symbol)
-                
-                if setup:
-                    signals_found += 1
-                    
-                    if self.place_setup_order(setup):
-                        orders_placed += 1
-                
-                time.sleep(0.5)
+                with self._lock.normal():
+                    broker_symbol = self._scan_precheck(symbol)
+                    if broker_symbol is None:
+                        continue
+                    data = self._fetch_scan_data(symbol)
+                if data is None:
+                    continue
                 
+                if pool is None:
+                    place(symbol, broker_symbol, evaluate_symbol_confluence(symbol, data, self.params), data["daily"])
+                else:
+                    future = pool.submit(evaluate_symbol_confluence, symbol, data, self.params)
+                    in_flight[future] = (symbol, broker_symbol, data["daily"])
             except Exception as e:
                 log.error(f"[{symbol}] Error during scan: {e}")
                 continue
-            time.sleep(0.1)
+            
+            drain(block=False)
+        
+        while in_flight:
+            drain(block=True)
         
         log.info("=" * 70)
-        log.info("SCAN COMPLETE")
+        log.info(f"SCAN COMPLETE ({time.monotonic() - scan_started:.1f}s)")
         log.info(f"  Symbols scanned: {len(available_symbols)}/{len(TRADABLE_SYMBOLS)}")
         log.info(f"  Active signals: {signals_found}")
         log.info(f"  Pending orders placed: {orders_placed}")
         
-        positions = self.mt5.get_my_positions()
-        pending_orders = self.mt5.get_my_pending_orders()
+        with self._lock.normal():
+            positions = self.broker.get_my_positions()
+            pending_orders = self.broker.get_my_pending_orders()
+            status = self.risk_manager.get_status()
         log.info(f"  Open positions: {len(positions)}")
         log.info(f"  Pending orders: {len(pending_orders)}")
         log.info(f"  Tracked setups: {len(self.pending_setups)}")
         
-        status = self.risk_manager.get_status()
         log.info(f"  Challenge Phase: {status['phase']}")
         log.info(f"  Balance: ${status['balance']:,.2f}")
         log.info(f"  Profit: {status['profit_pct']:+.2f}% (Target: {status['target_pct']}%)")
@@ -1699,12 +1838,20 @@ class LiveTradingBot:
         """
         Main trading loop - runs 24/7.
         
-        Schedule:
-        - Every 30 seconds: execute_protection_actions() (challenge mode) or monitor_live_pnl()
-        - Every 30 seconds: manage_partial_takes() for partial TP management
-        - Every minute: check_pending_orders() and check_position_updates()
-        - Every 15 min: validate_all_setups() to ensure pending orders are still valid
-        - Every 4 hours: scan_all_symbols() for new setups
+        Schedule (independent cadences, see LoopScheduler):
+        - critical lane, every MAIN_LOOP_INTERVAL_SECONDS: execute_protection_actions()
+          (challenge mode) or monitor_live_pnl(), then manage_partial_takes().
+          Takes priority on the broker/state lock.
+        - critical lane, every TICK_MONITOR_INTERVAL_MS: re-price open positions
+          from ticks (StreamingEquityMonitor) and run protection immediately
+          when the local equity estimate crosses the thresholds
+        - normal lane, every MAIN_LOOP_INTERVAL_SECONDS: reconnect if needed,
+          check_pending_orders() and check_position_updates()
+        - normal lane, every VALIDATE_INTERVAL_MINUTES: validate_all_setups()
+        - background lane: on each D1/H4 bar close, scan_all_symbols() for the
+          symbols whose bar closed (SCAN_TRIGGER=timer: everything every
+          SCAN_INTERVAL_HOURS). Scans never delay the protection checks.
+        - every LOOP_METRICS_INTERVAL_MINUTES: log per-task loop-lag metrics
         
         CHALLENGE MODE ELITE PROTECTION:
         - Global Risk Controller: Real-time P/L tracking every 30s via execute_protection_actions()
@@ -1728,9 +1875,12 @@ class LiveTradingBot:
         log.info(f"  - Partial TPs: 45% TP1, 30% TP2, 25% TP3 (Challenge Mode)")
         log.info(f"Server: {MT5_SERVER}")
         log.info(f"Login: {MT5_LOGIN}")
-        log.info(f"Scan Interval: {SCAN_INTERVAL_HOURS} hours")
+        if SCAN_TRIGGER == "timer":
+            log.info(f"Scan Interval: {SCAN_INTERVAL_HOURS} hours")
+        else:
+            log.info(f"Scan Trigger: bar close ({'/'.join(SCAN_TRIGGER_TIMEFRAMES)})")
         log.info(f"Validate Interval: {self.VALIDATE_INTERVAL_MINUTES} minutes")
-        log.info(f"P/L Monitor Interval: {self.MAIN_LOOP_INTERVAL_SECONDS} seconds (elite protection)")
+        log.info(f"P/L Monitor Interval: {self.MAIN_LOOP_INTERVAL_SECONDS} seconds (elite protection, own thread)")
         log.info(f"Strategy Mode: {SIGNAL_MODE}")
         log.info(f"Min Confluence: {MIN_CONFLUENCE}/7")
         log.info(f"Symbols: {len(TRADABLE_SYMBOLS)}")
@@ -1743,87 +1893,169 @@ class LiveTradingBot:
         log.info("Starting trading loop...")
         log.info("Press Ctrl+C to stop")
         
-        global running
-        
         self.scan_all_symbols()
+        self._scan_targets = {s: self.symbol_map[s] for s in TRADABLE_SYMBOLS if s in self.symbol_map}
+        if SCAN_TRIGGER != "timer":
+            self.bar_scheduler.prime(self._scan_targets)
+            next_due = self.bar_scheduler.next_due()
+            if next_due:
+                log.info(f"Next bar close check: {next_due.strftime('%Y-%m-%d %H:%M UTC')}")
         self.last_validate_time = datetime.now(timezone.utc)
-        last_protection_check = datetime.now(timezone.utc)
-        emergency_triggered = False
         
-        while running:
-            try:
-                now = datetime.now(timezone.utc)
-                
-                if CHALLENGE_MODE and self.challenge_manager and self.challenge_manager.halted:
-                    if not emergency_triggered:
-                        emergency_triggered = True
-                        log.error(f"Challenge Manager halted trading: {self.challenge_manager.halt_reason}")
-                
-                if not emergency_triggered:
-                    time_since_protection_check = (now - last_protection_check).total_seconds()
-                    if time_since_protection_check >= self.MAIN_LOOP_INTERVAL_SECONDS:
-                        if CHALLENGE_MODE and self.challenge_manager:
-                            if self.execute_protection_actions():
-                                emergency_triggered = True
-                                log.error("Challenge protection triggered emergency - halting all trading")
-                                continue
-                        else:
-                            if self.monitor_live_pnl():
-                                emergency_triggered = True
-                                log.error("Emergency close triggered - halting all trading")
-                                continue
-                        
-                        self.manage_partial_takes()
-                        last_protection_check = now
-                
-                if emergency_triggered:
-                    time.sleep(60)
-                    continue
-                
-                self.check_pending_orders()
-                self.check_position_updates()
-                
-                if self.last_validate_time:
-                    next_validate = self.last_validate_time + timedelta(minutes=self.VALIDATE_INTERVAL_MINUTES)
-                    if now >= next_validate:
-                        self.validate_all_setups()
-                
-                if self.last_scan_time:
-                    next_scan = self.last_scan_time + timedelta(hours=SCAN_INTERVAL_HOURS)
-                    if now >= next_scan:
-                        self.scan_all_symbols()
-                
-                if not self.mt5.connected:
-                    log.warning("MT5 connection lost, attempting reconnect...")
-                    if self.connect():
-                        log.info("Reconnected successfully")
-                    else:
-                        log.error("Reconnect failed, waiting 60s...")
-                        time.sleep(60)
-                        continue
-                
-                time.sleep(self.MAIN_LOOP_INTERVAL_SECONDS)
-                
-            except KeyboardInterrupt:
-                break
-            except Exception as e:
-                log.error(f"Error in main loop: {e}")
-                import traceback
-                log.error(traceback.format_exc())
-                time.sleep(60)
+        scheduler = LoopScheduler(self._lock)
+        scheduler.add_task("protection", self.MAIN_LOOP_INTERVAL_SECONDS, self._protection_tick,
+                           lane="critical", critical=True)
+        scheduler.add_task("tick_monitor", TICK_MONITOR_INTERVAL_MS / 1000, self._tick_monitor_tick,
+                           lane="critical", critical=True)
+        scheduler.add_task("order_sync", self.MAIN_LOOP_INTERVAL_SECONDS, self._order_sync_tick)
+        scheduler.add_task("validate", self.VALIDATE_INTERVAL_MINUTES * 60, self._validate_tick,
+                           run_immediately=False)
+        scheduler.add_task("scan", self.MAIN_LOOP_INTERVAL_SECONDS, self._scan_tick,
+                           lane="background", locked=False, run_immediately=False)
+        scheduler.add_task("loop_metrics", LOOP_METRICS_INTERVAL_MINUTES * 60,
+                           lambda: self._log_loop_metrics(scheduler),
+                           lane="background", locked=False, run_immediately=False)
+        self.scheduler = scheduler
+        scheduler.start()
+        
+        global running
+        try:
+            while running:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            running = False
         
         log.info("Shutting down...")
         
-        self._save_pending_setups()
-        self.disconnect()
+        scheduler.stop()
+        self._log_loop_metrics(scheduler)
+        
+        with self._lock.normal():
+            self._save_pending_setups()
+            self._shutdown_scan_pool()
+            self.disconnect()
+        self.state_store.flush()
         log.info("Bot stopped")
+    
+    # =========================================================================
+    # SCHEDULED TASKS
+    # =========================================================================
+    
+    def _protection_tick(self):
+        """Critical lane: drawdown protection and partial take profits."""
+        if self._halted.is_set():
+            return
+        
+        if CHALLENGE_MODE and self.challenge_manager and self.challenge_manager.halted:
+            log.error(f"Challenge Manager halted trading: {self.challenge_manager.halt_reason}")
+            self._halted.set()
+            return
+        
+        self.broker.begin()
+        if CHALLENGE_MODE and self.challenge_manager:
+            if self.execute_protection_actions():
+                log.error("Challenge protection triggered emergency - halting all trading")
+                self._halted.set()
+                return
+        else:
+            if self.monitor_live_pnl():
+                log.error("Emergency close triggered - halting all trading")
+                self._halted.set()
+                return
+        
+        self.manage_partial_takes()
+        self.equity_monitor.sync(
+            self.broker.get_my_positions(), self.broker.get_account_info(), self.mt5.get_tick
+        )
+    
+    def _tick_monitor_tick(self):
+        """
+        Critical lane, sub-second: re-price open positions from ticks and run
+        the protection pass immediately if equity moves through the thresholds.
+        """
+        if self._halted.is_set() or not self.mt5.connected:
+            return
+        
+        if self.equity_monitor.needs_sync():
+            self.broker.begin()
+            self.equity_monitor.sync(
+                self.broker.get_my_positions(), self.broker.get_account_info(), self.mt5.get_tick
+            )
+        if not self.equity_monitor.symbols:
+            return
+        
+        check = self.equity_monitor.poll(self.mt5.get_tick)
+        if check is None:
+            return
+        if check.latency_ms > self.equity_monitor.latency_budget_ms:
+            log.warning(f"[TICK MONITOR] Latency {check.latency_ms:.0f}ms over budget ({self.equity_monitor.latency_budget_ms:.0f}ms)")
+        if check.triggered:
+            log.warning(
+                f"[TICK MONITOR] {check.reason} | est. equity ${check.equity:,.2f} "
+                f"(Daily: {check.daily_loss_pct:.2f}%, DD: {check.total_dd_pct:.2f}%) - running protection now"
+            )
+            self.equity_monitor.invalidate()
+            self._protection_tick()
+    
+    def _order_sync_tick(self):
+        """Normal lane: reconnect if needed, then sync pending orders and positions."""
+        if self._halted.is_set():
+            return
+        
+        if not self.mt5.connected:
+            log.warning("MT5 connection lost, attempting reconnect...")
+            if not self.connect():
+                log.error(f"Reconnect failed, retrying in {self.MAIN_LOOP_INTERVAL_SECONDS}s...")
+                return
+            log.info("Reconnected successfully")
+            self.candle_cache.invalidate()
+        
+        self.broker.begin()
+        self.check_pending_orders()
+        self.check_position_updates()
+    
+    def _validate_tick(self):
+        """Normal lane: re-validate tracked setups."""
+        if self._halted.is_set() or not self.mt5.connected:
+            return
+        self.validate_all_setups()
+    
+    def _scan_tick(self):
+        """Background lane: run a scan when bars closed (or the timer elapsed)."""
+        if self._halted.is_set() or not self.mt5.connected:
+            return
+        
+        if SCAN_TRIGGER == "timer":
+            if self.last_scan_time:
+                next_scan = self.last_scan_time + timedelta(hours=SCAN_INTERVAL_HOURS)
+                if datetime.now(timezone.utc) >= next_scan:
+                    self.scan_all_symbols()
+            return
+        
+        with self._lock.normal():
+            due_symbols = self.bar_scheduler.poll(self._scan_targets)
+        if due_symbols:
+            log.info(f"Bar close: rescanning {len(due_symbols)} symbol(s): {', '.join(due_symbols)}")
+            self.scan_all_symbols(due_symbols)
+    
+    def _log_loop_metrics(self, scheduler: LoopScheduler):
+        """Log per-task loop lag (how late each task started vs. its schedule)."""
+        log.info(f"Tick monitor: {self.equity_monitor.stats.to_dict()}")
+        log.info("Loop metrics (lag = start delay vs schedule):")
+        for name, m in scheduler.metrics().items():
+            log.info(
+                f"  {name:<13} [{m['lane']}] runs={m['runs']} errors={m['errors']} "
+                f"lag avg/max={m['avg_lag']:.2f}/{m['max_lag']:.2f}s "
+                f"duration last/max={m['last_duration']:.2f}/{m['max_duration']:.2f}s "
+                f"overruns={m['overruns']}"
+            )
 
 
 def main():
     """Entry point."""
     Path("logs").mkdir(exist_ok=True)
     
-    if not MT5_LOGIN or not MT5_PASSWORD:
+    if MT5_BACKEND != "sim" and (not MT5_LOGIN or not MT5_PASSWORD):
         print("=" * 70)
         print("TRADR BOT - CONFIGURATION REQUIRED")
         print("=" * 70)
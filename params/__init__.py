@@ -7,6 +7,8 @@ Provides centralized parameter loading from optimized JSON config.
 from params.params_loader import (
     load_strategy_params,
     load_params_dict,
+    get_params_snapshot,
+    reload_params,
     get_min_confluence,
     get_max_concurrent_trades,
     get_risk_per_trade_pct,
@@ -18,6 +20,8 @@ from params.params_loader import (
 __all__ = [
     "load_strategy_params",
     "load_params_dict",
+    "get_params_snapshot",
+    "reload_params",
     "get_min_confluence",
     "get_max_concurrent_trades",
     "get_risk_per_trade_pct",
@@ -9,9 +9,16 @@ Usage:
     
     params = load_strategy_params()  # Returns StrategyParams object
     costs = get_transaction_costs("EURUSD")  # Returns spread, slippage, commission
+
+The file is parsed once per process into a ParamsSnapshot and only re-read
+when its mtime/size changes (or reload_params() is called), so hot paths
+can call these getters freely.
 """
 
+import copy
 import json
+import os
+import threading
 from pathlib import Path
 from typing import Dict, Optional, Any, Tuple
 from dataclasses import dataclass
@@ -25,24 +32,87 @@ class ParamsNotFoundError(Exception):
     pass
 
 
+class ParamsSnapshot:
+    """
+    Process-wide parsed copy of a params file.
+    
+    get() costs one os.stat(); the JSON is re-parsed only when the file's
+    mtime or size changed. `version` increments on every (re)load so
+    dependents (e.g. the symbol registry's cost table) can rebuild lazily.
+    The returned dict is shared - treat it as read-only.
+    """
+    
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.version = 0
+        self._data: Optional[Dict[str, Any]] = None
+        self._stamp: Optional[Tuple[float, int]] = None
+        self._lock = threading.Lock()
+    
+    def _stat(self) -> Tuple[float, int]:
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            with self._lock:
+                self._data = None
+                self._stamp = None
+            raise ParamsNotFoundError(
+                f"Parameters file not found: {self.path}\n"
+                "Run the optimizer first: python ftmo_challenge_analyzer.py"
+            )
+        return (st.st_mtime, st.st_size)
+    
+    def get(self) -> Dict[str, Any]:
+        stamp = self._stat()
+        data = self._data
+        if data is not None and stamp == self._stamp:
+            return data
+        return self.reload(stamp)
+    
+    def reload(self, stamp: Optional[Tuple[float, int]] = None) -> Dict[str, Any]:
+        """Re-read the file now, regardless of mtime."""
+        if stamp is None:
+            stamp = self._stat()
+        with self._lock:
+            with open(self.path, 'r') as f:
+                self._data = json.load(f)
+            self._stamp = stamp
+            self.version += 1
+            return self._data
+
+
+_SNAPSHOTS: Dict[Path, ParamsSnapshot] = {}
+_SNAPSHOTS_LOCK = threading.Lock()
+
+
+def get_params_snapshot() -> ParamsSnapshot:
+    """Snapshot for the current PARAMS_FILE."""
+    snapshot = _SNAPSHOTS.get(PARAMS_FILE)
+    if snapshot is None:
+        with _SNAPSHOTS_LOCK:
+            snapshot = _SNAPSHOTS.setdefault(PARAMS_FILE, ParamsSnapshot(PARAMS_FILE))
+    return snapshot
+
+
+def reload_params() -> Dict[str, Any]:
+    """Force a re-read of the params file (e.g. after writing it)."""
+    return get_params_snapshot().reload()
+
+
 def load_params_dict() -> Dict[str, Any]:
     """
     Load raw parameters dictionary from JSON file.
     
+    Served from the process-wide snapshot; the returned dict is a private
+    copy the caller may modify.
+    
     Returns:
         Dict with all parameters
         
     Raises:
         ParamsNotFoundError: If params file doesn't exist
     """
-    if not PARAMS_FILE.exists():
-        raise ParamsNotFoundError(
-            f"Parameters file not found: {PARAMS_FILE}\n"
-            "Run the optimizer first: python ftmo_challenge_analyzer.py"
-        )
-    
-    with open(PARAMS_FILE, 'r') as f:
-        return json.load(f)
+    return copy.deepcopy(get_params_snapshot().get())
 
 
 def load_strategy_params():
@@ -57,7 +127,7 @@ def load_strategy_params():
     """
     from strategy_core import StrategyParams
     
-    data = load_params_dict()
+    data = get_params_snapshot().get()
     
     return StrategyParams(
         min_confluence=data.get("min_confluence", 5),
@@ -118,19 +188,19 @@ def load_strategy_params():
 
 def get_min_confluence() -> int:
     """Get minimum confluence score from params."""
-    data = load_params_dict()
+    data = get_params_snapshot().get()
     return data.get("min_confluence", 5)
 
 
 def get_max_concurrent_trades() -> int:
     """Get maximum concurrent trades from params."""
-    data = load_params_dict()
+    data = get_params_snapshot().get()
     return data.get("max_concurrent_trades", 7)
 
 
 def get_risk_per_trade_pct() -> float:
     """Get risk per trade percentage from params."""
-    data = load_params_dict()
+    data = get_params_snapshot().get()
     return data.get("risk_per_trade_pct", 0.5)
 
 
@@ -144,17 +214,11 @@ def get_transaction_costs(symbol: str) -> Tuple[float, float, float]:
     Returns:
         Tuple of (spread_pips, slippage_pips, commission_per_lot)
     """
-    data = load_params_dict()
-    costs = data.get("transaction_costs", {})
-    
-    normalized = symbol.replace("_", "").replace(".", "").replace("/", "").upper()
-    
-    spread_config = costs.get("spread_pips", {})
-    spread = spread_config.get(normalized, spread_config.get("default", 2.5))
-    slippage = costs.get("slippage_pips", 5.0)  # OPTIMIZED: Increased from 1.0 to 5.0 pips for realistic execution
-    commission = costs.get("commission_per_lot", 7.0)
+    from symbol_registry import get_registry
     
-    return spread, slippage, commission
+    # Registry re-reads transaction_costs when the params file changes;
+    # defaults: spread 2.5, slippage 5.0 (realistic execution), commission 7.0
+    return get_registry().get_costs(symbol)
 
 
 def save_optimized_params(
@@ -190,4 +254,5 @@ def save_optimized_params(
         with open(backup_path, 'w') as f:
             json.dump(params_dict, f, indent=2)
     
+    reload_params()
     return PARAMS_FILE
@@ -23,6 +23,48 @@ from typing import List, Dict, Tuple, Optional, Any
 import json
 from statistics import mean, stdev
 
+_EPOCH = datetime(1970, 1, 1)
+
+
+def _to_epoch_seconds(value: Any) -> float:
+    """
+    Convert an entry/exit date to epoch seconds (NaN if unparseable).
+
+    Timezone info is dropped rather than converted, matching the naive UTC
+    comparisons used throughout the backtest code.
+    """
+    if value is None or value is pd.NaT or value == "":
+        return float('nan')
+    if isinstance(value, pd.Timestamp):
+        # Fast path for the common case (tz-aware UTC Timestamps from the backtest)
+        seconds = value.value / 1e9
+        if value.tzinfo is not None:
+            seconds += value.utcoffset().total_seconds()
+        return seconds
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return float('nan')
+    if not isinstance(value, datetime):
+        if hasattr(value, 'year') and hasattr(value, 'month') and hasattr(value, 'day'):
+            value = datetime(value.year, value.month, value.day)
+        else:
+            return float('nan')
+    if value.tzinfo is not None:
+        value = value.replace(tzinfo=None)
+    return (value - _EPOCH).total_seconds()
+
+
+def trade_entry_epochs(trades: List[Any]) -> np.ndarray:
+    """Extract entry_date of every trade as a float64 array of epoch seconds."""
+    return np.fromiter(
+        (_to_epoch_seconds(getattr(t, 'entry_date', None)) for t in trades),
+        dtype=np.float64,
+        count=len(trades),
+    )
+
+
 # ============================================================================
 # PROFESSIONAL RISK METRICS
 # ============================================================================
@@ -62,15 +104,50 @@ class RiskMetrics:
         }
 
 
-def calculate_risk_metrics(trades: List[Any], 
-                          risk_per_trade_pct: float = 0.5,
-                          account_size: float = 200000.0,
-                          trading_days_per_year: float = 252.0) -> RiskMetrics:
+def trade_rr_array(trades: List[Any]) -> np.ndarray:
+    """Extract the rr (R-multiple) of every trade as a float64 array."""
+    return np.fromiter(
+        (getattr(t, 'rr', 0) or 0.0 for t in trades),
+        dtype=np.float64,
+        count=len(trades),
+    )
+
+
+def _max_streaks(returns: np.ndarray) -> Tuple[int, int]:
+    """Longest winning and losing runs; flat (zero) returns don't break a run."""
+    signs = np.sign(returns[returns != 0])
+    if len(signs) == 0:
+        return 0, 0
+    starts = np.concatenate(([0], np.flatnonzero(np.diff(signs)) + 1))
+    lengths = np.diff(np.append(starts, len(signs)))
+    run_signs = signs[starts]
+    wins = lengths[run_signs > 0]
+    losses = lengths[run_signs < 0]
+    return (int(wins.max()) if len(wins) else 0,
+            int(losses.max()) if len(losses) else 0)
+
+
+def _annual_return(total_return_pct: float, first_epoch: float, last_epoch: float) -> float:
+    """Annualize a percentage return over the span between first and last entry."""
+    if np.isnan(first_epoch):
+        return total_return_pct
+    trading_period_days = int((last_epoch - first_epoch) // 86400) + 1
+    years = trading_period_days / 365.0
+    return (total_return_pct / years) if years > 0 else 0
+
+
+def calculate_risk_metrics_from_arrays(rr: np.ndarray,
+                                       entry_epochs: Optional[np.ndarray] = None,
+                                       risk_per_trade_pct: float = 0.5,
+                                       account_size: float = 200000.0,
+                                       trading_days_per_year: float = 252.0) -> RiskMetrics:
     """
-    Calculate professional risk metrics for a trade sequence.
+    Array kernel behind calculate_risk_metrics().
     
     Args:
-        trades: List of Trade objects with rr (risk-reward) and entry_date
+        rr: R-multiple per trade, in trade order
+        entry_epochs: Entry time per trade in epoch seconds (NaN = unknown),
+            see trade_entry_epochs(). Only the min/max are used.
         risk_per_trade_pct: Risk per trade as percentage
         account_size: Starting account size
         trading_days_per_year: Trading days (default 252 for forex)
@@ -78,130 +155,76 @@ def calculate_risk_metrics(trades: List[Any],
     Returns:
         RiskMetrics object with all risk calculations
     """
-    if not trades:
+    rr = np.asarray(rr, dtype=np.float64)
+    n = len(rr)
+    if n == 0:
         return RiskMetrics()
     
-    # Convert R-multiples to account returns
     risk_amount = account_size * (risk_per_trade_pct / 100.0)
-    returns = [getattr(t, 'rr', 0) * risk_amount for t in trades]
+    returns = rr * risk_amount
     
-    # Total return
-    total_return = sum(returns)
+    total_return = float(returns.sum())
     total_return_pct = (total_return / account_size) * 100
     
-    # Time period calculation
-    entry_dates = []
-    for t in trades:
-        entry = getattr(t, 'entry_date', None)
-        if entry:
-            if isinstance(entry, str):
-                try:
-                    entry = datetime.fromisoformat(entry.replace("Z", "+00:00"))
-                except:
-                    continue
-            if hasattr(entry, 'replace') and entry.tzinfo:
-                entry = entry.replace(tzinfo=None)
-            entry_dates.append(entry)
-    
-    if entry_dates:
-        trading_period_days = (max(entry_dates) - min(entry_dates)).days + 1
-        years = trading_period_days / 365.0
-        annual_return = (total_return_pct / years) if years > 0 else 0
-    else:
-        annual_return = total_return_pct
+    first_epoch = last_epoch = float('nan')
+    if entry_epochs is not None and len(entry_epochs):
+        valid = entry_epochs[~np.isnan(entry_epochs)]
+        if len(valid):
+            first_epoch, last_epoch = float(valid.min()), float(valid.max())
+    annual_return = _annual_return(total_return_pct, first_epoch, last_epoch)
     
     # Win rate and profit factor
-    wins = [r for r in returns if r > 0]
-    losses = [r for r in returns if r < 0]
-    win_rate = (len(wins) / len(returns) * 100) if returns else 0
-    
-    gross_profit = sum(wins) if wins else 0
-    gross_loss = abs(sum(losses)) if losses else 0
+    win_mask = returns > 0
+    loss_mask = returns < 0
+    win_rate = win_mask.sum() / n * 100
+    gross_profit = float(returns[win_mask].sum())
+    gross_loss = float(-returns[loss_mask].sum())
     profit_factor = (gross_profit / gross_loss) if gross_loss > 0 else float('inf')
     
     # Drawdown analysis
     cumulative_returns = np.cumsum(returns)
-    running_max = np.maximum.accumulate(cumulative_returns)
-    drawdown = running_max - cumulative_returns
-    max_drawdown = np.max(drawdown) if len(drawdown) > 0 else 0
+    drawdown = np.maximum.accumulate(cumulative_returns) - cumulative_returns
+    max_dd_idx = int(np.argmax(drawdown))
+    max_drawdown = float(drawdown[max_dd_idx])
     
-    # Drawdown duration
-    max_dd_idx = np.argmax(drawdown)
+    # Drawdown duration (trades since the last equity high before the max DD)
     max_drawdown_duration = 0
     if max_dd_idx > 0:
-        dd_region = drawdown[:max_dd_idx + 1]
-        recovery_idx = np.where(dd_region == 0)[0]
+        recovery_idx = np.flatnonzero(drawdown[:max_dd_idx + 1] == 0)
         if len(recovery_idx) > 0:
-            last_recovery = recovery_idx[-1]
-            max_drawdown_duration = max_dd_idx - last_recovery
-    
-    # Risk-adjusted returns (Sharpe ratio)
-    if len(returns) > 1:
-        return_std = np.std(returns)
-        sharpe = (mean(returns) / return_std * np.sqrt(252)) if return_std > 0 else 0
-    else:
-        sharpe = 0
-    
-    # Sortino ratio (penalizes downside volatility only)
-    if len(returns) > 1:
-        downside_returns = [r for r in returns if r < 0]
-        if downside_returns:
-            downside_std = np.std(downside_returns)
-            sortino = (mean(returns) / downside_std * np.sqrt(252)) if downside_std > 0 else 0
+            max_drawdown_duration = max_dd_idx - int(recovery_idx[-1])
+    
+    # Sharpe / Sortino (per-trade, annualized with sqrt(252))
+    sharpe = 0
+    sortino = 0
+    if n > 1:
+        mean_return = total_return / n
+        return_std = float(returns.std())
+        sharpe = (mean_return / return_std * np.sqrt(252)) if return_std > 0 else 0
+        if loss_mask.any():
+            downside_std = float(returns[loss_mask].std())
+            sortino = (mean_return / downside_std * np.sqrt(252)) if downside_std > 0 else 0
         else:
             sortino = sharpe  # No losses, same as Sharpe
-    else:
-        sortino = 0
     
-    # Calmar ratio (return / max drawdown) - FIXED: Convert drawdown to percentage
-    # max_drawdown is in USD, we need it as percentage of account for correct Calmar
+    # Calmar ratio (annual return % / max drawdown %)
     max_drawdown_pct = (max_drawdown / account_size) * 100 if account_size > 0 else 0
     calmar = (annual_return / max_drawdown_pct) if max_drawdown_pct > 0 else 0
     
     # Recovery factor (total return / max drawdown in same units - USD)
     recovery_factor = (total_return / max_drawdown) if max_drawdown > 0 else 0
     
-    # Consecutive winners/losers
-    consecutive_wins = []
-    consecutive_losses = []
-    current_streak = 0
-    current_type = None
-    
-    for ret in returns:
-        if ret > 0:
-            if current_type == 'win':
-                current_streak += 1
-            else:
-                if current_type == 'loss':
-                    consecutive_losses.append(current_streak)
-                current_streak = 1
-                current_type = 'win'
-        elif ret < 0:
-            if current_type == 'loss':
-                current_streak += 1
-            else:
-                if current_type == 'win':
-                    consecutive_wins.append(current_streak)
-                current_streak = 1
-                current_type = 'loss'
-    
-    if current_type == 'win':
-        consecutive_wins.append(current_streak)
-    elif current_type == 'loss':
-        consecutive_losses.append(current_streak)
-    
-    max_consecutive_wins = max(consecutive_wins) if consecutive_wins else 0
-    max_consecutive_losses = max(consecutive_losses) if consecutive_losses else 0
+    max_consecutive_wins, max_consecutive_losses = _max_streaks(returns)
     
     return RiskMetrics(
-        total_return=total_return,  # FIXED: Return USD value, not percentage
+        total_return=total_return,
         annual_return=annual_return,
         sharpe_ratio=sharpe,
         sortino_ratio=sortino,
         calmar_ratio=calmar,
         max_drawdown=max_drawdown,
         max_drawdown_duration=max_drawdown_duration,
-        win_rate=win_rate,
+        win_rate=float(win_rate),
         profit_factor=profit_factor,
         recovery_factor=recovery_factor,
         consecutive_winners=max_consecutive_wins,
@@ -209,6 +232,286 @@ def calculate_risk_metrics(trades: List[Any],
     )
 
 
+def calculate_risk_metrics(trades: List[Any], 
+                          risk_per_trade_pct: float = 0.5,
+                          account_size: float = 200000.0,
+                          trading_days_per_year: float = 252.0) -> RiskMetrics:
+    """
+    Calculate professional risk metrics for a trade sequence.
+    
+    Args:
+        trades: List of Trade objects with rr (risk-reward) and entry_date
+        risk_per_trade_pct: Risk per trade as percentage
+        account_size: Starting account size
+        trading_days_per_year: Trading days (default 252 for forex)
+    
+    Returns:
+        RiskMetrics object with all risk calculations
+    """
+    if not trades:
+        return RiskMetrics()
+    return calculate_risk_metrics_from_arrays(
+        trade_rr_array(trades),
+        trade_entry_epochs(trades),
+        risk_per_trade_pct=risk_per_trade_pct,
+        account_size=account_size,
+        trading_days_per_year=trading_days_per_year,
+    )
+
+
+class RiskMetricsAccumulator:
+    """
+    Online version of calculate_risk_metrics() for trades appended one at a time.
+    
+    Keeps O(1) running state (Welford mean/variance, equity peak, streaks),
+    so metrics can be read after every trade during a simulation without
+    re-scanning the trade list. metrics() matches calculate_risk_metrics()
+    on the same trade sequence.
+    """
+    
+    def __init__(self,
+                 risk_per_trade_pct: float = 0.5,
+                 account_size: float = 200000.0,
+                 trading_days_per_year: float = 252.0):
+        self.risk_amount = account_size * (risk_per_trade_pct / 100.0)
+        self.account_size = account_size
+        self.trading_days_per_year = trading_days_per_year
+        
+        self.n = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self.n_losses = 0
+        self._loss_mean = 0.0
+        self._loss_m2 = 0.0
+        self.n_wins = 0
+        self.gross_profit = 0.0
+        self.gross_loss = 0.0
+        
+        self.equity = 0.0
+        self.peak = 0.0
+        self.max_drawdown = 0.0
+        self.max_drawdown_duration = 0
+        self._last_peak_idx = 0
+        
+        self._streak = 0
+        self._streak_sign = 0
+        self.max_win_streak = 0
+        self.max_loss_streak = 0
+        
+        self.first_epoch = float('nan')
+        self.last_epoch = float('nan')
+    
+    def add(self, rr: float, entry_epoch: float = float('nan')) -> None:
+        """Append one trade by R-multiple and entry time (epoch seconds)."""
+        ret = (rr or 0.0) * self.risk_amount
+        idx = self.n
+        self.n += 1
+        
+        delta = ret - self._mean
+        self._mean += delta / self.n
+        self._m2 += delta * (ret - self._mean)
+        
+        if ret > 0:
+            self.n_wins += 1
+            self.gross_profit += ret
+        elif ret < 0:
+            self.n_losses += 1
+            self.gross_loss -= ret
+            loss_delta = ret - self._loss_mean
+            self._loss_mean += loss_delta / self.n_losses
+            self._loss_m2 += loss_delta * (ret - self._loss_mean)
+        
+        # Equity and drawdown; the first trade always sets the peak
+        self.equity += ret
+        if idx == 0 or self.equity >= self.peak:
+            self.peak = self.equity
+            self._last_peak_idx = idx
+        else:
+            drawdown = self.peak - self.equity
+            if drawdown > self.max_drawdown:
+                self.max_drawdown = drawdown
+                self.max_drawdown_duration = idx - self._last_peak_idx
+        
+        # Streaks (flat trades neither extend nor break a run)
+        sign = 1 if ret > 0 else (-1 if ret < 0 else 0)
+        if sign != 0:
+            self._streak = self._streak + 1 if sign == self._streak_sign else 1
+            self._streak_sign = sign
+            if sign > 0:
+                self.max_win_streak = max(self.max_win_streak, self._streak)
+            else:
+                self.max_loss_streak = max(self.max_loss_streak, self._streak)
+        
+        if not np.isnan(entry_epoch):
+            if np.isnan(self.first_epoch) or entry_epoch < self.first_epoch:
+                self.first_epoch = entry_epoch
+            if np.isnan(self.last_epoch) or entry_epoch > self.last_epoch:
+                self.last_epoch = entry_epoch
+    
+    def add_trade(self, trade: Any) -> None:
+        """Append a Trade-like object (uses rr and entry_date)."""
+        self.add(getattr(trade, 'rr', 0), _to_epoch_seconds(getattr(trade, 'entry_date', None)))
+    
+    def metrics(self) -> RiskMetrics:
+        """Current metrics for all trades added so far."""
+        if self.n == 0:
+            return RiskMetrics()
+        
+        total_return = self._mean * self.n
+        total_return_pct = (total_return / self.account_size) * 100
+        annual_return = _annual_return(total_return_pct, self.first_epoch, self.last_epoch)
+        
+        sharpe = 0
+        sortino = 0
+        if self.n > 1:
+            return_std = np.sqrt(self._m2 / self.n)
+            sharpe = (self._mean / return_std * np.sqrt(252)) if return_std > 0 else 0
+            if self.n_losses:
+                downside_std = np.sqrt(self._loss_m2 / self.n_losses)
+                sortino = (self._mean / downside_std * np.sqrt(252)) if downside_std > 0 else 0
+            else:
+                sortino = sharpe
+        
+        max_drawdown_pct = (self.max_drawdown / self.account_size) * 100 if self.account_size > 0 else 0
+        
+        return RiskMetrics(
+            total_return=total_return,
+            annual_return=annual_return,
+            sharpe_ratio=sharpe,
+            sortino_ratio=sortino,
+            calmar_ratio=(annual_return / max_drawdown_pct) if max_drawdown_pct > 0 else 0,
+            max_drawdown=self.max_drawdown,
+            max_drawdown_duration=self.max_drawdown_duration,
+            win_rate=self.n_wins / self.n * 100,
+            profit_factor=(self.gross_profit / self.gross_loss) if self.gross_loss > 0 else float('inf'),
+            recovery_factor=(total_return / self.max_drawdown) if self.max_drawdown > 0 else 0,
+            consecutive_winners=self.max_win_streak,
+            consecutive_losers=self.max_loss_streak,
+        )
+
+
+# ============================================================================
+# TRADE FRAME
+# Column arrays built once per backtest result and shared by scoring/reporting
+# ============================================================================
+
+@dataclass
+class TradeFrame:
+    """
+    Columnar view of a trade list.
+    
+    Dates are parsed once into epoch seconds (NaN = unknown, tz dropped like
+    the rest of the backtest code), so period/day/month bucketing is a
+    searchsorted or bincount instead of a per-trade parse and scan.
+    Arrays are aligned with `trades` (original order).
+    """
+    
+    trades: List[Any]
+    entry_epochs: np.ndarray
+    rr: np.ndarray
+    risk: np.ndarray
+    symbol_codes: np.ndarray
+    symbols: List[str]
+    
+    @classmethod
+    def from_trades(cls, trades: List[Any]) -> "TradeFrame":
+        """Build a frame from Trade-like objects (rr falls back to r_multiple)."""
+        if isinstance(trades, TradeFrame):
+            return trades
+        trades = list(trades or [])
+        n = len(trades)
+        rr = np.fromiter(
+            (getattr(t, 'rr', getattr(t, 'r_multiple', 0)) or 0.0 for t in trades),
+            dtype=np.float64,
+            count=n,
+        )
+        risk = np.fromiter(
+            (getattr(t, 'risk', None) or float('nan') for t in trades),
+            dtype=np.float64,
+            count=n,
+        )
+        symbol_to_code: Dict[str, int] = {}
+        symbol_codes = np.fromiter(
+            (symbol_to_code.setdefault(getattr(t, 'symbol', ''), len(symbol_to_code)) for t in trades),
+            dtype=np.int32,
+            count=n,
+        )
+        return cls(
+            trades=trades,
+            entry_epochs=trade_entry_epochs(trades),
+            rr=rr,
+            risk=risk,
+            symbol_codes=symbol_codes,
+            symbols=list(symbol_to_code),
+        )
+    
+    def __len__(self) -> int:
+        return len(self.trades)
+    
+    @property
+    def total_r(self) -> float:
+        return float(self.rr.sum())
+    
+    @property
+    def wins(self) -> int:
+        return int((self.rr > 0).sum())
+    
+    def entry_order(self) -> np.ndarray:
+        """Indices that sort trades by entry time (stable, unknown dates last)."""
+        return np.argsort(self.entry_epochs, kind='stable')
+    
+    def day_index(self) -> np.ndarray:
+        """Calendar day of each entry as days since 1970-01-01 (-1 = unknown)."""
+        valid = ~np.isnan(self.entry_epochs)
+        days = np.full(len(self), -1, dtype=np.int64)
+        days[valid] = np.floor(self.entry_epochs[valid] / 86400.0).astype(np.int64)
+        return days
+    
+    def month_index(self) -> np.ndarray:
+        """Calendar month of each entry as months since 1970-01 (-1 = unknown)."""
+        valid = ~np.isnan(self.entry_epochs)
+        months = np.full(len(self), -1, dtype=np.int64)
+        months[valid] = (
+            self.entry_epochs[valid].astype('datetime64[s]').astype('datetime64[M]').astype(np.int64)
+        )
+        return months
+    
+    def period_mask(self, start: datetime, end: datetime) -> np.ndarray:
+        """Boolean mask of trades entered within [start, end] (inclusive)."""
+        return (self.entry_epochs >= _to_epoch_seconds(start)) & (self.entry_epochs <= _to_epoch_seconds(end))
+    
+    def period_codes(self, periods: Dict[str, Tuple[datetime, datetime]]) -> np.ndarray:
+        """
+        Index into `periods` (in insertion order) for each trade, -1 if none.
+        
+        Periods must not overlap; boundaries are inclusive on both ends.
+        """
+        names = list(periods)
+        starts = np.array([_to_epoch_seconds(periods[n][0]) for n in names], dtype=np.float64)
+        ends = np.array([_to_epoch_seconds(periods[n][1]) for n in names], dtype=np.float64)
+        order = np.argsort(starts, kind='stable')
+        
+        pos = np.searchsorted(starts[order], self.entry_epochs, side='right') - 1
+        codes = np.full(len(self), -1, dtype=np.int64)
+        hit = pos >= 0
+        hit[hit] = self.entry_epochs[hit] <= ends[order][pos[hit]]
+        codes[hit] = order[pos[hit]]
+        return codes
+    
+    def period_stats(self, periods: Dict[str, Tuple[datetime, datetime]]) -> Dict[str, Dict[str, float]]:
+        """Trade count, wins and total R per period (see period_codes)."""
+        codes = self.period_codes(periods)
+        hit = codes >= 0
+        k = len(periods)
+        counts = np.bincount(codes[hit], minlength=k)
+        wins = np.bincount(codes[hit], weights=(self.rr[hit] > 0).astype(np.float64), minlength=k)
+        r_total = np.bincount(codes[hit], weights=self.rr[hit], minlength=k)
+        return {
+            name: {'trades': int(counts[i]), 'wins': int(wins[i]), 'r_total': float(r_total[i])}
+            for i, name in enumerate(periods)
+        }
+
+
 # ============================================================================
 # WALK-FORWARD TESTING
 # ============================================================================
@@ -227,7 +530,8 @@ class WalkForwardTester:
                  end_date: datetime,
                  train_months: int = 12,
                  validate_months: int = 3,
-                 rolling: bool = True):
+                 rolling: bool = True,
+                 step_days: int = 30):
         """
         Initialize walk-forward tester.
         
@@ -238,6 +542,7 @@ class WalkForwardTester:
             train_months: Training window size in months
             validate_months: Validation window size in months
             rolling: True for rolling windows, False for anchored
+            step_days: How far each successive window moves forward
         """
         self.all_trades = all_trades
         self.start_date = start_date
@@ -245,6 +550,15 @@ class WalkForwardTester:
         self.train_months = train_months
         self.validate_months = validate_months
         self.rolling = rolling
+        self.step_days = step_days
+        
+        # Sort once by entry time so each window is two searchsorted lookups
+        epochs = trade_entry_epochs(all_trades)
+        valid_idx = np.flatnonzero(~np.isnan(epochs))
+        order = np.argsort(epochs[valid_idx], kind='stable')
+        self._sorted_idx = valid_idx[order]
+        self._sorted_epochs = epochs[self._sorted_idx]
+        self._sorted_rr = trade_rr_array(all_trades)[self._sorted_idx]
     
     def get_date_windows(self) -> List[Tuple[datetime, datetime, datetime, datetime]]:
         """
@@ -269,14 +583,14 @@ class WalkForwardTester:
                 
                 windows.append((current_start, train_end, val_start, val_end))
                 
-                # Roll forward by 1 month
-                current_start = current_start + timedelta(days=30)
+                # Roll forward by step_days (default 1 month)
+                current_start = current_start + timedelta(days=self.step_days)
         else:
             # Anchored window: training grows, validation fixed size
             train_start = self.start_date
+            train_end = train_start + timedelta(days=self.train_months * 30)
             
             while True:
-                train_end = train_start + timedelta(days=self.train_months * 30)
                 val_start = train_end + timedelta(days=1)
                 val_end = val_start + timedelta(days=self.validate_months * 30)
                 
@@ -285,30 +599,30 @@ class WalkForwardTester:
                 
                 windows.append((train_start, train_end, val_start, val_end))
                 
-                # Extend training by 1 month
-                train_start = train_start + timedelta(days=30)
+                # Extend training by step_days (default 1 month)
+                train_end = train_end + timedelta(days=self.step_days)
         
         return windows
     
+    def _period_slice(self, start: datetime, end: datetime) -> slice:
+        """Slice of the entry-sorted arrays covering [start, end]."""
+        lo = np.searchsorted(self._sorted_epochs, _to_epoch_seconds(start), side='left')
+        hi = np.searchsorted(self._sorted_epochs, _to_epoch_seconds(end), side='right')
+        return slice(int(lo), int(hi))
+    
     def get_trades_for_period(self, start: datetime, end: datetime) -> List[Any]:
-        """Get all trades within a date range."""
-        period_trades = []
-        
-        for trade in self.all_trades:
-            entry = getattr(trade, 'entry_date', None)
-            if entry:
-                if isinstance(entry, str):
-                    try:
-                        entry = datetime.fromisoformat(entry.replace("Z", "+00:00"))
-                    except:
-                        continue
-                if hasattr(entry, 'replace') and entry.tzinfo:
-                    entry = entry.replace(tzinfo=None)
-                
-                if start <= entry <= end:
-                    period_trades.append(trade)
-        
-        return period_trades
+        """Get all trades within a date range (inclusive), in entry order."""
+        return [self.all_trades[i] for i in self._sorted_idx[self._period_slice(start, end)]]
+    
+    def _period_metrics(self, start: datetime, end: datetime, risk_per_trade_pct: float) -> Tuple[RiskMetrics, int]:
+        """Risk metrics and trade count for a period straight from the sorted arrays."""
+        window = self._period_slice(start, end)
+        metrics = calculate_risk_metrics_from_arrays(
+            self._sorted_rr[window],
+            self._sorted_epochs[window],
+            risk_per_trade_pct=risk_per_trade_pct,
+        )
+        return metrics, window.stop - window.start
     
     def analyze_all_windows(self, risk_per_trade_pct: float = 0.5) -> Dict:
         """
@@ -321,11 +635,8 @@ class WalkForwardTester:
         window_results = []
         
         for i, (train_start, train_end, val_start, val_end) in enumerate(windows):
-            train_trades = self.get_trades_for_period(train_start, train_end)
-            val_trades = self.get_trades_for_period(val_start, val_end)
-            
-            train_metrics = calculate_risk_metrics(train_trades, risk_per_trade_pct)
-            val_metrics = calculate_risk_metrics(val_trades, risk_per_trade_pct)
+            train_metrics, n_train = self._period_metrics(train_start, train_end, risk_per_trade_pct)
+            val_metrics, n_val = self._period_metrics(val_start, val_end, risk_per_trade_pct)
             
             # Calculate degradation (IS-OOS spread)
             sharpe_degradation = train_metrics.sharpe_ratio - val_metrics.sharpe_ratio
@@ -341,8 +652,8 @@ class WalkForwardTester:
                 'val_metrics': val_metrics.to_dict(),
                 'sharpe_degradation': sharpe_degradation,
                 'return_degradation': return_degradation,
-                'train_trades': len(train_trades),
-                'val_trades': len(val_trades),
+                'train_trades': n_train,
+                'val_trades': n_val,
             })
         
         # Calculate summary statistics
@@ -507,4 +818,5 @@ if __name__ == "__main__":
     print("  - ParameterSensitivityAnalyzer: Parameter sensitivity analysis")
     print("\nAvailable Functions:")
     print("  - calculate_risk_metrics()")
+    print("  - calculate_risk_metrics_from_arrays() / RiskMetricsAccumulator")
     print("  - generate_professional_report()")
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Benchmark the live trading loop against the offline MT5 simulator.
+
+Runs LiveTradingBot on SimulatedMT5Client (replaying data/ohlcv) and reports
+scan latency, per-task durations and MT5 API call counts, so regressions
+in the live path can be measured on Linux without a broker.
+
+Usage:
+    python scripts/benchmark_live_loop.py                      # all simulator symbols
+    python scripts/benchmark_live_loop.py --symbols 40 --hours 48
+    python scripts/benchmark_live_loop.py --latency-ms 2 --json bench.json
+    python scripts/benchmark_live_loop.py --threaded --seconds 30 --speed 600
+
+The default mode steps the simulated clock deterministically and calls the
+scheduled tasks in order. --threaded runs the real LoopScheduler for
+--seconds of wall time and also reports its loop-lag metrics.
+
+State files (challenge_state.json etc.) are written to a temporary working
+directory so a live installation is never touched.
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from collections import Counter
+from datetime import datetime, timezone
+
+# Add project root to path (parent of scripts/)
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+import main_live_bot as live
+from tradr.mt5.simulator import SimulatedMT5Client
+from tradr.utils.scheduler import LoopScheduler
+
+
+def _timed(durations: dict, name: str, func) -> None:
+    started = time.perf_counter()
+    func()
+    durations.setdefault(name, []).append(time.perf_counter() - started)
+
+
+def _summary(values: list) -> dict:
+    if not values:
+        return {"runs": 0}
+    ordered = sorted(values)
+    return {
+        "runs": len(values),
+        "avg_ms": round(sum(values) / len(values) * 1000, 2),
+        "p95_ms": round(ordered[int(0.95 * (len(ordered) - 1))] * 1000, 2),
+        "max_ms": round(ordered[-1] * 1000, 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the live loop on the MT5 simulator")
+    parser.add_argument("--symbols", type=int, default=0, help="Number of symbols (0 = all available)")
+    parser.add_argument("--start", default="2024-01-02", help="Simulated start date (UTC)")
+    parser.add_argument("--hours", type=float, default=24.0, help="Simulated hours to step through")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Artificial latency per MT5 call")
+    parser.add_argument("--balance", type=float, default=60000.0)
+    parser.add_argument("--threaded", action="store_true", help="Run the real threaded scheduler")
+    parser.add_argument("--seconds", type=float, default=30.0, help="Wall seconds for --threaded")
+    parser.add_argument("--speed", type=float, default=600.0, help="Simulated seconds per wall second (--threaded)")
+    parser.add_argument("--json", help="Write the report to this file")
+    args = parser.parse_args()
+
+    sim = SimulatedMT5Client(
+        data_dir=os.path.join(PROJECT_ROOT, "data", "ohlcv"),
+        start=datetime.fromisoformat(args.start).replace(tzinfo=timezone.utc),
+        speed=args.speed if args.threaded else 0.0,
+        balance=args.balance,
+        call_latency_ms=args.latency_ms,
+    )
+    symbols = sim.get_available_symbols()
+    if args.symbols:
+        symbols = symbols[:args.symbols]
+    live.TRADABLE_SYMBOLS = symbols
+
+    workdir = tempfile.mkdtemp(prefix="tradr_bench_")
+    os.chdir(workdir)
+    os.makedirs("logs", exist_ok=True)
+
+    bot = live.LiveTradingBot(mt5_client=sim)
+    if not bot.connect():
+        print("Simulator connection failed")
+        sys.exit(1)
+
+    report = {
+        "symbols": len(bot.symbol_map),
+        "start": args.start,
+        "latency_ms": args.latency_ms,
+        "workdir": workdir,
+    }
+
+    sim.call_counts.clear()
+    started = time.perf_counter()
+    bot.scan_all_symbols()
+    report["full_scan"] = {
+        "seconds": round(time.perf_counter() - started, 3),
+        "api_calls": dict(sim.call_counts),
+    }
+    bot._scan_targets = {s: bot.symbol_map[s] for s in symbols if s in bot.symbol_map}
+    bot.bar_scheduler.prime(bot._scan_targets)
+
+    sim.call_counts.clear()
+    if args.threaded:
+        scheduler = LoopScheduler(bot._lock)
+        scheduler.add_task("protection", bot.MAIN_LOOP_INTERVAL_SECONDS, bot._protection_tick,
+                           lane="critical", critical=True)
+        scheduler.add_task("tick_monitor", live.TICK_MONITOR_INTERVAL_MS / 1000, bot._tick_monitor_tick,
+                           lane="critical", critical=True)
+        scheduler.add_task("order_sync", bot.MAIN_LOOP_INTERVAL_SECONDS, bot._order_sync_tick)
+        scheduler.add_task("scan", bot.MAIN_LOOP_INTERVAL_SECONDS, bot._scan_tick,
+                           lane="background", locked=False, run_immediately=False)
+        scheduler.start()
+        time.sleep(args.seconds)
+        scheduler.stop()
+        report["loop_metrics"] = scheduler.metrics()
+        report["wall_seconds"] = args.seconds
+    else:
+        durations: dict = {}
+        step = bot.MAIN_LOOP_INTERVAL_SECONDS
+        steps = int(args.hours * 3600 / step)
+        for _ in range(steps):
+            sim.advance(step)
+            _timed(durations, "protection", bot._protection_tick)
+            _timed(durations, "order_sync", bot._order_sync_tick)
+            _timed(durations, "scan", bot._scan_tick)
+        report["tasks"] = {name: _summary(values) for name, values in durations.items()}
+        report["simulated_hours"] = args.hours
+        report["api_calls_per_iteration"] = round(sum(sim.call_counts.values()) / max(steps, 1), 2)
+
+    report["api_calls"] = dict(Counter(sim.call_counts).most_common())
+    report["deals"] = len(sim.deals)
+    report["final_balance"] = round(sim.balance, 2)
+    bot._shutdown_scan_pool()
+
+    print(json.dumps(report, indent=2, default=str))
+    if args.json:
+        with open(os.path.join(PROJECT_ROOT, args.json) if not os.path.isabs(args.json) else args.json, "w") as f:
+            json.dump(report, f, indent=2, default=str)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,11 @@
 #!/usr/bin/env python3
-"""Quick script to check Optuna study status and extract best trials."""
+"""
+Quick script to check Optuna study status and extract best trials.
+
+Reads the trial journals in ftmo_analysis_output/*/trials.journal when they
+exist (memory-mapped, instant on large studies); pass --optuna to query the
+Optuna SQLite storage instead (indexed column queries, not optuna.load_study).
+"""
 
 import sys
 import os
@@ -9,91 +15,145 @@ PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, PROJECT_ROOT)
 os.chdir(PROJECT_ROOT)  # Change to project root for database paths
 
-import optuna
 import json
 from pathlib import Path
 
+from tradr.utils.study_status import StudyStatusReader
+from tradr.utils.trial_journal import TrialJournalReader, find_journals
+
 OPTUNA_DB_PATH = "sqlite:///regime_adaptive_v2_clean.db"
 OPTUNA_STUDY_NAME = "regime_adaptive_v2_clean"
 
-def main():
+
+def build_params_to_save(best_params):
+    """Subset of the best parameters written to best_params.json."""
+    return {
+        'min_confluence_score': best_params.get('min_confluence_score', 3),
+        'min_quality_factors': best_params.get('min_quality_factors', 2),
+        'risk_per_trade_pct': best_params.get('risk_per_trade_pct', 0.5),
+        'atr_min_percentile': best_params.get('atr_min_percentile', 60.0),
+        'trail_activation_r': best_params.get('trail_activation_r', 2.2),
+        'volatile_asset_boost': best_params.get('volatile_asset_boost', 1.0),
+        'adx_trend_threshold': best_params.get('adx_trend_threshold', 25),
+        'adx_range_threshold': best_params.get('adx_range_threshold', 20),
+        'trend_min_confluence': best_params.get('trend_min_confluence', 6),
+        'range_min_confluence': best_params.get('range_min_confluence', 5),
+        'atr_vol_ratio_range': best_params.get('atr_vol_ratio_range', 1.0),
+        'atr_trail_multiplier': best_params.get('atr_trail_multiplier', 1.5),
+        'partial_exit_at_1r': best_params.get('partial_exit_at_1r', True),
+        'partial_exit_pct': best_params.get('partial_exit_pct', 0.5),
+    }
+
+
+def save_best_params(best_params):
+    print(f"\n{'='*60}")
+    print("BEST PARAMETERS (saved to best_params.json)")
+    print(f"{'='*60}")
+
+    params_to_save = build_params_to_save(best_params)
+    for k, v in sorted(params_to_save.items()):
+        if isinstance(v, float):
+            print(f"  {k}: {v:.3f}")
+        else:
+            print(f"  {k}: {v}")
+
+    # Save to file
+    Path("best_params.json").write_text(json.dumps(params_to_save, indent=2))
+    print(f"\n✅ Best parameters saved to best_params.json")
+
+
+def journal_status(journal_path):
+    reader = TrialJournalReader(journal_path)
+    summary = reader.summary()
+
+    print(f"\n{'='*60}")
+    print(f"TRIAL JOURNAL STATUS: {journal_path}")
+    print(f"{'='*60}")
+    print(f"Logged Trials: {summary['trials']}")
+    print(f"FTMO Challenge Passed: {summary['ftmo_passed']}")
+    print(f"Last Update: {summary['last_logged']}")
+
+    best = summary['best']
+    if best is None:
+        print("No completed trials found")
+        return None
+
+    print(f"\nBest Score: {best['score']:.2f}")
+    print(f"Best Trial: #{best['trial_number']}")
+
+    print(f"\n{'='*60}")
+    print("TOP 5 TRIALS")
+    print(f"{'='*60}")
+
+    for i, row in enumerate(reader.top(5)):
+        print(f"\n#{i+1} - Trial {row['trial_number']}")
+        print(f"   Score: {row['score']:.2f}")
+        print(f"   Sharpe: {row['sharpe_ratio']}")
+        print(f"   Win Rate: {row['win_rate']}%")
+        print(f"   Total R: {row['total_r']}")
+        print(f"   Max DD: {row['max_drawdown_pct']}%")
+
+    latest = reader.latest_params()
+    return latest.get('params') if latest else None
+
+
+def optuna_status():
+    """Status from indexed queries on the Optuna storage DB (no study.trials load)."""
     try:
-        study = optuna.load_study(
-            study_name=OPTUNA_STUDY_NAME,
-            storage=OPTUNA_DB_PATH
-        )
+        status = StudyStatusReader(OPTUNA_DB_PATH, OPTUNA_STUDY_NAME)
     except Exception as e:
         print(f"Error loading study: {e}")
-        return
-    
-    completed = [t for t in study.trials if t.state == optuna.trial.TrialState.COMPLETE]
-    
+        return None
+
+    with status:
+        counts = status.state_counts()
+        top = status.top(5)
+        top_params = [status.params(row['trial_id']) for row in top]
+
     print(f"\n{'='*60}")
     print("OPTUNA STUDY STATUS")
     print(f"{'='*60}")
-    print(f"Total Trials: {len(study.trials)}")
-    print(f"Completed Trials: {len(completed)}")
-    
-    if completed:
-        # Sort by value (descending)
-        sorted_trials = sorted(completed, key=lambda t: t.value if t.value else 0, reverse=True)
-        
-        print(f"\nBest Score: {study.best_value:.2f}")
-        print(f"Best Trial: #{study.best_trial.number}")
-        
-        print(f"\n{'='*60}")
-        print("TOP 5 TRIALS")
-        print(f"{'='*60}")
-        
-        for i, trial in enumerate(sorted_trials[:5]):
-            print(f"\n#{i+1} - Trial {trial.number}")
-            print(f"   Score: {trial.value:.2f}")
-            print(f"   Sharpe: {trial.user_attrs.get('sharpe_ratio', 'N/A')}")
-            print(f"   Win Rate: {trial.user_attrs.get('win_rate', 'N/A')}%")
-            print(f"   Total R: {trial.user_attrs.get('total_r', 'N/A')}")
-            print(f"   Max DD: {trial.user_attrs.get('max_drawdown_pct', 'N/A')}%")
-            print("   Parameters:")
-            for k, v in sorted(trial.params.items()):
-                if isinstance(v, float):
-                    print(f"     {k}: {v:.3f}")
-                else:
-                    print(f"     {k}: {v}")
-        
-        # Save best params
-        best_params = study.best_params
-        print(f"\n{'='*60}")
-        print("BEST PARAMETERS (saved to best_params.json)")
-        print(f"{'='*60}")
-        
-        params_to_save = {
-            'min_confluence_score': best_params.get('min_confluence_score', 3),
-            'min_quality_factors': best_params.get('min_quality_factors', 2),
-            'risk_per_trade_pct': best_params.get('risk_per_trade_pct', 0.5),
-            'atr_min_percentile': best_params.get('atr_min_percentile', 60.0),
-            'trail_activation_r': best_params.get('trail_activation_r', 2.2),
-            'volatile_asset_boost': best_params.get('volatile_asset_boost', 1.0),
-            'adx_trend_threshold': best_params.get('adx_trend_threshold', 25),
-            'adx_range_threshold': best_params.get('adx_range_threshold', 20),
-            'trend_min_confluence': best_params.get('trend_min_confluence', 6),
-            'range_min_confluence': best_params.get('range_min_confluence', 5),
-            'atr_vol_ratio_range': best_params.get('atr_vol_ratio_range', 1.0),
-            'atr_trail_multiplier': best_params.get('atr_trail_multiplier', 1.5),
-            'partial_exit_at_1r': best_params.get('partial_exit_at_1r', True),
-            'partial_exit_pct': best_params.get('partial_exit_pct', 0.5),
-        }
-        
-        for k, v in sorted(params_to_save.items()):
+    print(f"Total Trials: {sum(counts.values())}")
+    print(f"Completed Trials: {counts.get('COMPLETE', 0)}")
+
+    if not top:
+        print("No completed trials found")
+        return None
+
+    print(f"\nBest Score: {top[0]['value']:.2f}")
+    print(f"Best Trial: #{top[0]['number']}")
+
+    print(f"\n{'='*60}")
+    print("TOP 5 TRIALS")
+    print(f"{'='*60}")
+
+    for i, (row, params) in enumerate(zip(top, top_params)):
+        attrs = row['user_attrs']
+        print(f"\n#{i+1} - Trial {row['number']}")
+        print(f"   Score: {row['value']:.2f}")
+        print(f"   Sharpe: {attrs.get('sharpe_ratio', 'N/A')}")
+        print(f"   Win Rate: {attrs.get('win_rate', 'N/A')}%")
+        print(f"   Total R: {attrs.get('total_r', 'N/A')}")
+        print(f"   Max DD: {attrs.get('max_drawdown_pct', 'N/A')}%")
+        print("   Parameters:")
+        for k, v in sorted(params.items()):
             if isinstance(v, float):
-                print(f"  {k}: {v:.3f}")
+                print(f"     {k}: {v:.3f}")
             else:
-                print(f"  {k}: {v}")
-        
-        # Save to file
-        Path("best_params.json").write_text(json.dumps(params_to_save, indent=2))
-        print(f"\n✅ Best parameters saved to best_params.json")
-        
+                print(f"     {k}: {v}")
+
+    return top_params[0]
+
+
+def main():
+    journals = [] if "--optuna" in sys.argv else find_journals()
+    if journals:
+        best_params = journal_status(journals[0])
     else:
-        print("No completed trials found")
+        best_params = optuna_status()
+
+    if best_params:
+        save_best_params(best_params)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Dukascopy Tick Data -> OHLCV CSV
+
+Downloads Dukascopy ticks for a symbol (resumable, cached as raw .bi5) and
+aggregates them into candles for several timeframes in one pass over the
+tick arrays.
+
+Usage:
+    python scripts/download_dukascopy_data.py EURUSD --start 2024-01-01 --end 2024-12-31
+    python scripts/download_dukascopy_data.py XAUUSD --timeframes H4 D1 W1 MN --output data/dukascopy
+"""
+
+import argparse
+import sys
+import time
+from datetime import date
+from pathlib import Path
+
+import pandas as pd
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from tradr.data.dukascopy import DukascopyDownloader
+from tradr.data.ticks import aggregate_ticks
+
+
+def save_candles(candles: dict, symbol: str, timeframe: str, output_dir: Path, start: date, end: date) -> Path:
+    """Save aggregate_ticks() output in the data/ohlcv CSV layout."""
+    output_dir.mkdir(parents=True, exist_ok=True)
+    path = output_dir / f"{symbol}_{timeframe}_{start.year}_{end.year}.csv"
+    df = pd.DataFrame({
+        "timestamp": pd.to_datetime(candles["time_ms"], unit="ms"),
+        "open": candles["open"],
+        "high": candles["high"],
+        "low": candles["low"],
+        "close": candles["close"],
+        "volume": candles["volume"],
+    })
+    df.to_csv(path, index=False)
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Download Dukascopy ticks and build OHLCV CSVs")
+    parser.add_argument("symbol", help="Dukascopy symbol, e.g. EURUSD")
+    parser.add_argument("--start", required=True, help="Start date (YYYY-MM-DD)")
+    parser.add_argument("--end", required=True, help="End date (YYYY-MM-DD)")
+    parser.add_argument("--timeframes", nargs="+", default=["M1", "M5", "M15", "H1", "H4", "D1", "W1"])
+    parser.add_argument("--output", default="data/dukascopy", help="CSV output directory")
+    parser.add_argument("--cache-dir", default=None, help="Raw .bi5 cache directory")
+    parser.add_argument("--workers", type=int, default=8, help="Concurrent hour downloads")
+    args = parser.parse_args()
+
+    start = date.fromisoformat(args.start)
+    end = date.fromisoformat(args.end)
+    downloader = DukascopyDownloader(cache_dir=args.cache_dir, max_workers=args.workers)
+
+    started = time.perf_counter()
+    stats = downloader.download_range(args.symbol, start, end)
+    print(f"Download: {stats['downloaded']} hours fetched, {stats['cached']} cached, "
+          f"{stats['failed']} failed ({time.perf_counter() - started:.1f}s)")
+
+    started = time.perf_counter()
+    ticks = downloader.load_ticks(args.symbol, start, end)
+    print(f"Decoded {len(ticks['time_ms']):,} ticks ({time.perf_counter() - started:.1f}s)")
+
+    for tf in args.timeframes:
+        started = time.perf_counter()
+        candles = aggregate_ticks(ticks["time_ms"], ticks["mid"], tf)
+        path = save_candles(candles, args.symbol.upper(), tf, Path(args.output), start, end)
+        print(f"  {tf:4s} {len(candles['time_ms']):>8,} candles -> {path} ({time.perf_counter() - started:.2f}s)")
+
+    if stats["failed"]:
+        print("Some hours failed; re-run the same command to resume.")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
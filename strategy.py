@@ -18,9 +18,15 @@ from strategy_core import (
     get_default_params,
     Signal,
 )
+from tradr.data.oanda import OandaClient
 
 MAX_SIGNAL_AGE_DAYS = 5
 
+# (timeframe, count) fetched per symbol for a scan
+SCAN_TIMEFRAMES = (("M", 24), ("W", 104), ("D", 500), ("H4", 500))
+
+_oanda_client: Optional[OandaClient] = None
+
 
 @dataclass
 class ScanResult:
@@ -121,13 +127,54 @@ def _signal_to_scan_result(signal: Signal) -> ScanResult:
     )
 
 
-def scan_single_asset(symbol: str) -> Optional[ScanResult]:
-    """Full Blueprint scan using unified strategy_core engine."""
+def _get_oanda_client() -> OandaClient:
+    global _oanda_client
+    if _oanda_client is None:
+        _oanda_client = OandaClient()
+    return _oanda_client
+
+
+def prefetch_candles(symbols: List[str]) -> Dict[str, Dict[str, List[Dict]]]:
+    """
+    Fetch every scan timeframe for `symbols` concurrently from OANDA.
+
+    Uses the shared client's incremental cache, so repeated scans only pull
+    new candles. Returns {} when no OANDA key is configured.
+    """
+    client = _get_oanda_client()
+    if not client.api_key or not symbols:
+        return {}
+
+    fetched = client.get_candles_bulk(
+        [(sym, tf, count) for sym in symbols for tf, count in SCAN_TIMEFRAMES]
+    )
+    candles: Dict[str, Dict[str, List[Dict]]] = {}
+    for (sym, tf), series in fetched.items():
+        candles.setdefault(sym, {})[tf] = series
+    return candles
+
+
+def scan_single_asset(
+    symbol: str,
+    candles: Optional[Dict[str, List[Dict]]] = None,
+) -> Optional[ScanResult]:
+    """
+    Full Blueprint scan using unified strategy_core engine.
+
+    `candles` maps timeframe -> prefetched candles (see prefetch_candles);
+    without it each timeframe is fetched with get_ohlcv.
+    """
     try:
-        monthly = get_ohlcv(symbol, timeframe="M", count=24) or []
-        weekly = get_ohlcv(symbol, timeframe="W", count=104) or []
-        daily = get_ohlcv(symbol, timeframe="D", count=500) or []
-        h4 = get_ohlcv(symbol, timeframe="H4", count=500) or []
+        if candles is not None:
+            monthly = candles.get("M") or []
+            weekly = candles.get("W") or []
+            daily = candles.get("D") or []
+            h4 = candles.get("H4") or []
+        else:
+            monthly = get_ohlcv(symbol, timeframe="M", count=24) or []
+            weekly = get_ohlcv(symbol, timeframe="W", count=104) or []
+            daily = get_ohlcv(symbol, timeframe="D", count=500) or []
+            h4 = get_ohlcv(symbol, timeframe="H4", count=500) or []
         
         if not daily or not weekly:
             return None
@@ -156,10 +203,11 @@ def scan_group(symbols: List[str]) -> Tuple[List[ScanResult], List[ScanResult]]:
     results: List[ScanResult] = []
     trade_ideas: List[ScanResult] = []
     total = len(symbols)
+    prefetched = prefetch_candles(symbols)
 
     for i, sym in enumerate(symbols, 1):
         print(f"  [{i}/{total}] Scanning {sym}...")
-        res = scan_single_asset(sym)
+        res = scan_single_asset(sym, prefetched.get(sym))
         if not res:
             continue
         results.append(res)
@@ -14,6 +14,8 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional, List, Dict, Tuple, Any
 
+import numpy as np
+
 from indicators import calculate_adx_with_slope, check_di_crossover
 
 try:
@@ -381,6 +383,68 @@ class Trade:
         }
 
 
+class TradeBuffer:
+    """
+    Columnar, append-only store of completed trades.
+    
+    Holds one list per Trade field instead of one object per trade.
+    Backtest trade lists are converted once with from_trades() (a single
+    pass per column), and exports (tradr/utils/trade_export.py) read whole
+    columns from it.
+    """
+    
+    FIELDS = tuple(Trade.__dataclass_fields__)
+    NUMERIC_FIELDS = (
+        "entry_price", "exit_price", "stop_loss", "tp1", "tp2", "tp3", "tp4", "tp5",
+        "risk", "reward", "rr",
+    )
+    
+    def __init__(self):
+        self.columns: Dict[str, List[Any]] = {name: [] for name in self.FIELDS}
+    
+    def __len__(self) -> int:
+        return len(self.columns["symbol"])
+    
+    def append(self, trade: Any):
+        """Append a Trade (or Trade-like object; rr falls back to result_r/r_multiple)."""
+        columns = self.columns
+        for name in self.FIELDS:
+            columns[name].append(getattr(trade, name, None))
+        if columns["rr"][-1] is None:
+            columns["rr"][-1] = getattr(trade, "result_r", getattr(trade, "r_multiple", 0.0)) or 0.0
+    
+    def extend(self, trades: List[Any]):
+        trades = list(trades)
+        start = len(self)
+        for name in self.FIELDS:
+            self.columns[name].extend([getattr(t, name, None) for t in trades])
+        rr = self.columns["rr"]
+        for i, trade in enumerate(trades, start):
+            if rr[i] is None:
+                rr[i] = getattr(trade, "result_r", getattr(trade, "r_multiple", 0.0)) or 0.0
+    
+    @classmethod
+    def from_trades(cls, trades: Any) -> "TradeBuffer":
+        if isinstance(trades, TradeBuffer):
+            return trades
+        buffer = cls()
+        buffer.extend(trades or [])
+        return buffer
+    
+    def column(self, name: str, start: int = 0, stop: Optional[int] = None) -> np.ndarray:
+        """Field values as an array (float with NaN for numeric fields, object otherwise)."""
+        values = self.columns[name][start:stop]
+        if name in self.NUMERIC_FIELDS or name == "confluence_score":
+            return np.array(values, dtype=np.float64)
+        return np.array(values, dtype=object)
+    
+    def to_trades(self) -> List[Trade]:
+        return [
+            Trade(**dict(zip(self.FIELDS, row)))
+            for row in zip(*(self.columns[name] for name in self.FIELDS))
+        ]
+
+
 def _atr(candles: List[Dict], period: int = 14) -> float:
     """
     Calculate Average True Range (ATR).
@@ -2462,6 +2526,8 @@ def simulate_trades(
     weekly_candles: Optional[List[Dict]] = None,
     h4_candles: Optional[List[Dict]] = None,
     include_transaction_costs: bool = True,
+    signals: Optional[List[Signal]] = None,
+    transaction_costs: Optional[Tuple[float, float, float]] = None,
 ) -> List[Trade]:
     """
     Simulate trades through historical candles using the Blueprint strategy.
@@ -2485,6 +2551,12 @@ def simulate_trades(
         weekly_candles: Optional weekly data
         h4_candles: Optional 4H data
         include_transaction_costs: Whether to include spread/slippage costs (default True)
+        signals: Optional precomputed generate_signals() output for the same
+            candles. Exit-only parameters (TP close %, trail activation) don't
+            change signals, so parameter sweeps can reuse them.
+        transaction_costs: Optional (spread_pips, slippage_pips, commission)
+            for this symbol, resolved once by the caller; looked up from the
+            params file when omitted.
     
     Returns:
         List of completed Trade objects
@@ -2500,7 +2572,9 @@ def simulate_trades(
             from params.params_loader import get_transaction_costs
             from tradr.risk.position_sizing import get_contract_specs
             
-            spread_pips, slippage_pips, _ = get_transaction_costs(symbol)
+            if transaction_costs is None:
+                transaction_costs = get_transaction_costs(symbol)
+            spread_pips, slippage_pips, _ = transaction_costs
             transaction_cost_pips = spread_pips + slippage_pips
             
             specs = get_contract_specs(symbol)
@@ -2511,10 +2585,11 @@ def simulate_trades(
     
     transaction_cost_price = transaction_cost_pips * pip_value
     
-    signals = generate_signals(
-        candles, symbol, params,
-        monthly_candles, weekly_candles, h4_candles
-    )
+    if signals is None:
+        signals = generate_signals(
+            candles, symbol, params,
+            monthly_candles, weekly_candles, h4_candles
+        )
     
     active_signals = [s for s in signals if s.is_active]
     
@@ -3020,7 +3095,9 @@ def check_volatility_filter(
     return (passes_filter, atr_percentile)
 
 
-VOLATILE_ASSETS = ["XAU_USD", "XAUUSD", "NAS100_USD", "NAS100USD", "GBP_JPY", "GBPJPY", "BTC_USD", "BTCUSD"]
+from symbol_registry import VOLATILE_ASSETS, canonical_key, lookup_symbol
+
+_VOLATILE_KEYS = frozenset(canonical_key(v) for v in VOLATILE_ASSETS)
 
 def apply_volatile_asset_boost(
     symbol: str,
@@ -3032,8 +3109,11 @@ def apply_volatile_asset_boost(
     Apply boost to confluence/quality scores for volatile assets.
     These assets (XAUUSD, NAS100USD, GBPJPY, BTCUSD) have potential for bigger R trades.
     """
-    normalized_symbol = symbol.replace("_", "").upper()
-    is_volatile = any(v.replace("_", "").upper() == normalized_symbol for v in VOLATILE_ASSETS)
+    info = lookup_symbol(symbol)
+    if info is not None:
+        is_volatile = info.is_volatile
+    else:
+        is_volatile = symbol.replace("_", "").upper() in _VOLATILE_KEYS
     
     if is_volatile and volatile_asset_boost > 1.0:
         boosted_confluence = int(confluence_score * volatile_asset_boost)
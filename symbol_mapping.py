@@ -7,6 +7,8 @@ This module provides bidirectional mapping between the two naming conventions.
 
 from typing import Dict, List, Tuple
 
+from symbol_registry import lookup_symbol
+
 OANDA_TO_FTMO: Dict[str, str] = {
     # ============ FOREX MAJORS (7) ============
     "EUR_USD": "EURUSD",
@@ -94,7 +96,12 @@ ALL_TRADABLE_FTMO: List[str] = (
 
 def oanda_to_ftmo(symbol: str) -> str:
     """Convert OANDA symbol name to FTMO MT5 symbol name."""
-    return OANDA_TO_FTMO.get(symbol, symbol.replace("_", ""))
+    if symbol in OANDA_TO_FTMO:
+        return OANDA_TO_FTMO[symbol]
+    info = lookup_symbol(symbol)
+    if info is not None and info.oanda == symbol:
+        return info.broker
+    return symbol.replace("_", "")
 
 
 def ftmo_to_oanda(symbol: str) -> str:
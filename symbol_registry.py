@@ -0,0 +1,228 @@
+"""
+Symbol Registry - one interned record per instrument.
+
+Every alias of an instrument (EUR_USD, EURUSD, eurusd, EURUSD.a, EUR/USD,
+broker names like US500.cash) resolves to the same integer id and a
+SymbolInfo with everything the hot paths need precomputed:
+
+- OANDA and broker names (symbol_mapping.py)
+- asset class (config.py instrument groups)
+- contract specs (tradr/risk/position_sizing.py)
+- MT5 point size, spread limit and whitelist flag (ftmo_config.py)
+- volatility class (VOLATILE_ASSETS below)
+- transaction costs (params/current_params.json via the params snapshot)
+
+The registry is built on first lookup rather than at import, because
+ftmo_config and position_sizing import this module themselves. Unknown
+aliases are normalized once and then cached (including misses), so every
+later lookup is a single dict hit.
+
+Usage:
+    from symbol_registry import lookup_symbol
+
+    info = lookup_symbol("EURUSD.a")
+    info.id, info.oanda, info.broker, info.pip_size
+"""
+
+import threading
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+
+# Assets whose confluence/quality scores get the volatile_asset_boost
+VOLATILE_ASSETS = ["XAU_USD", "XAUUSD", "NAS100_USD", "NAS100USD", "GBP_JPY", "GBPJPY", "BTC_USD", "BTCUSD"]
+
+DEFAULT_CONTRACT_SPECS = {"pip_value": 0.0001, "contract_size": 100000, "pip_location": 4}
+
+# Broker suffixes stripped when resolving unknown aliases (EURUSD.a, EURUSD_m)
+_SUFFIXES = (".A", "_M", ".PRO", ".RAW", ".ECN", ".CASH")
+
+
+def canonical_key(symbol: str) -> str:
+    """Compact upper-case form used as the registry key (EUR_USD -> EURUSD)."""
+    return symbol.replace("_", "").replace(".", "").replace("/", "").upper()
+
+
+@dataclass(frozen=True)
+class SymbolInfo:
+    """Precomputed per-instrument data. `id` indexes SymbolRegistry.infos."""
+    id: int
+    key: str
+    oanda: str
+    broker: str
+    asset_class: str
+    pip_size: float
+    contract_specs: Dict
+    max_spread_pips: float
+    whitelisted: bool
+    volatility_class: str
+
+    @property
+    def is_volatile(self) -> bool:
+        return self.volatility_class == "high"
+
+
+class SymbolRegistry:
+    """Alias -> id map plus the per-id SymbolInfo table."""
+
+    def __init__(self, infos: List[SymbolInfo], aliases: Dict[str, int]):
+        self.infos: Tuple[SymbolInfo, ...] = tuple(infos)
+        self._aliases: Dict[str, Optional[SymbolInfo]] = {
+            alias: self.infos[sid] for alias, sid in aliases.items()
+        }
+        self._lock = threading.Lock()
+        self._costs: Tuple[Tuple[float, float, float], ...] = ()
+        self._default_costs: Tuple[float, float, float] = (2.5, 5.0, 7.0)
+        self._costs_version: Optional[Tuple[int, int]] = None
+        self._spread_config: Dict[str, float] = {}
+
+    def __len__(self) -> int:
+        return len(self.infos)
+
+    def resolve(self, symbol: str) -> Optional[SymbolInfo]:
+        """SymbolInfo for any alias, or None for instruments the registry doesn't know."""
+        try:
+            return self._aliases[symbol]
+        except KeyError:
+            pass
+
+        info = None
+        upper = symbol.upper()
+        candidates = [upper]
+        for suffix in _SUFFIXES:
+            if upper.endswith(suffix):
+                candidates.append(upper[:-len(suffix)])
+        candidates += [canonical_key(c) for c in candidates]
+        for candidate in candidates:
+            info = self._aliases.get(candidate)
+            if info is not None:
+                break
+
+        with self._lock:
+            self._aliases[symbol] = info
+        return info
+
+    def id_of(self, symbol: str) -> int:
+        """Integer id for an alias, -1 if unknown."""
+        info = self.resolve(symbol)
+        return info.id if info is not None else -1
+
+    def get_costs(self, symbol: str) -> Tuple[float, float, float]:
+        """(spread_pips, slippage_pips, commission_per_lot) from the params file."""
+        self._refresh_costs()
+        info = self.resolve(symbol)
+        if info is None:
+            return self._miss_costs(symbol)
+        return self._costs[info.id]
+
+    def _refresh_costs(self):
+        """Rebuild the per-id cost table when the params snapshot was reloaded."""
+        from params.params_loader import get_params_snapshot
+
+        snapshot = get_params_snapshot()
+        # Raises ParamsNotFoundError when the file is missing, like before
+        data = snapshot.get()
+        version = (id(snapshot), snapshot.version)
+        if version == self._costs_version:
+            return
+
+        with self._lock:
+            if version == self._costs_version:
+                return
+            costs = data.get("transaction_costs", {})
+            self._spread_config = costs.get("spread_pips", {})
+            slippage = costs.get("slippage_pips", 5.0)
+            commission = costs.get("commission_per_lot", 7.0)
+            default_spread = self._spread_config.get("default", 2.5)
+            self._default_costs = (default_spread, slippage, commission)
+            self._costs = tuple(
+                (self._spread_config.get(info.key, default_spread), slippage, commission)
+                for info in self.infos
+            )
+            self._costs_version = version
+
+    def _miss_costs(self, symbol: str) -> Tuple[float, float, float]:
+        spread, slippage, commission = self._default_costs
+        return (self._spread_config.get(canonical_key(symbol), spread), slippage, commission)
+
+
+def _asset_class(oanda: str, key: str, groups: Dict[str, str]) -> str:
+    if oanda in groups:
+        return groups[oanda]
+    if key.startswith(("XAU", "XAG")):
+        return "metal"
+    if key.startswith(("BTC", "ETH", "XRP", "ADA")):
+        return "crypto"
+    if any(ch.isdigit() for ch in key):
+        return "index"
+    return "forex"
+
+
+def build_registry() -> SymbolRegistry:
+    """Collect every instrument from config, symbol_mapping, ftmo_config and position sizing."""
+    import config
+    import symbol_mapping
+    from ftmo_config import FIVEERS_CONFIG, PIP_SIZES, lookup_pip_size
+    from tradr.risk.position_sizing import CONTRACT_SPECS
+
+    groups: Dict[str, str] = {}
+    for name, members in (
+        ("forex", config.FOREX_PAIRS),
+        ("metal", config.METALS),
+        ("index", config.INDICES),
+        ("crypto", config.CRYPTO_ASSETS),
+    ):
+        for oanda in members:
+            groups.setdefault(oanda, name)
+
+    # canonical key -> OANDA name
+    instruments: Dict[str, str] = {}
+    for oanda in list(symbol_mapping.OANDA_TO_FTMO) + list(config.CONTRACT_SPECS) + list(groups):
+        instruments.setdefault(canonical_key(oanda), oanda)
+    for key in list(CONTRACT_SPECS) + list(PIP_SIZES):
+        instruments.setdefault(key, symbol_mapping.ftmo_to_oanda(key) if key.isalpha() else key)
+
+    whitelist = {canonical_key(a) for a in FIVEERS_CONFIG.whitelist_assets}
+    spread_limits = FIVEERS_CONFIG.max_spread_pips
+    volatile = {canonical_key(v) for v in VOLATILE_ASSETS}
+
+    infos: List[SymbolInfo] = []
+    aliases: Dict[str, int] = {}
+    for sid, key in enumerate(sorted(instruments)):
+        oanda = instruments[key]
+        broker = symbol_mapping.OANDA_TO_FTMO.get(oanda, key)
+        infos.append(SymbolInfo(
+            id=sid,
+            key=key,
+            oanda=oanda,
+            broker=broker,
+            asset_class=_asset_class(oanda, key, groups),
+            pip_size=lookup_pip_size(key),
+            contract_specs=CONTRACT_SPECS.get(key, DEFAULT_CONTRACT_SPECS),
+            max_spread_pips=spread_limits.get(key, spread_limits.get("DEFAULT", 5.0)),
+            whitelisted=key in whitelist,
+            volatility_class="high" if key in volatile else "normal",
+        ))
+        for alias in (key, oanda, broker, broker.upper(), canonical_key(broker)):
+            aliases.setdefault(alias, sid)
+
+    return SymbolRegistry(infos, aliases)
+
+
+_REGISTRY: Optional[SymbolRegistry] = None
+_REGISTRY_LOCK = threading.Lock()
+
+
+def get_registry() -> SymbolRegistry:
+    global _REGISTRY
+    if _REGISTRY is None:
+        with _REGISTRY_LOCK:
+            if _REGISTRY is None:
+                _REGISTRY = build_registry()
+    return _REGISTRY
+
+
+def lookup_symbol(symbol: str) -> Optional[SymbolInfo]:
+    """SymbolInfo for any alias (None if unknown)."""
+    registry = _REGISTRY if _REGISTRY is not None else get_registry()
+    return registry.resolve(symbol)
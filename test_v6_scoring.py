@@ -3,11 +3,14 @@
 
 import optuna
 
+from tradr.utils.trial_artifacts import TrialArtifactStore, load_trial_artifacts
+
 # Load study
 study = optuna.load_study(
     study_name='regime_adaptive_v2_clean',
     storage='sqlite:///regime_adaptive_v2_clean.db'
 )
+artifact_store = TrialArtifactStore.for_study('regime_adaptive_v2_clean')
 
 print("\n" + "="*80)
 print("V6 SCORING COMPARISON - Recalculating Old Trials")
@@ -24,10 +27,11 @@ for trial_num in test_trials:
     
     # Get metrics
     total_r = trial.user_attrs.get('total_r', 0)
+    artifacts = load_trial_artifacts(trial, artifact_store)
     
     # Estimate profit from quarterly data (since total_profit_usd not stored)
-    quarterly_stats = trial.user_attrs.get('quarterly_stats', {})
-    overall_stats = trial.user_attrs.get('overall_stats', {})
+    quarterly_stats = artifacts.get('quarterly_stats', {})
+    overall_stats = artifacts.get('overall_stats', {})
     total_profit = overall_stats.get('profit', 0) if overall_stats else 0
     
     old_score = trial.value if trial.value else 0
@@ -39,7 +43,7 @@ for trial_num in test_trials:
     
     # Estimate full V6 score (base + typical bonuses of ~70-100)
     # Old scores had bonuses, new V6 will have similar bonuses
-    score_breakdown = trial.user_attrs.get('score_breakdown', {})
+    score_breakdown = artifacts.get('score_breakdown', {})
     old_bonuses = sum([
         score_breakdown.get('sharpe_bonus', 0),
         score_breakdown.get('pf_bonus', 0),
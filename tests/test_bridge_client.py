@@ -0,0 +1,185 @@
+"""
+MT5BridgeClient against a local stub bridge server.
+
+The stub speaks the bridge's JSON endpoints over HTTP/1.1 keep-alive and
+records every request (path and client port), so the tests can check
+connection reuse, the batch endpoints, their 404 fallbacks and the latency
+histograms without a Windows VM.
+"""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from tradr.mt5.bridge_client import MT5BridgeClient
+
+
+TICKS = {
+    "EURUSD": {"symbol": "EURUSD", "bid": 1.1000, "ask": 1.1002},
+    "GBPJPY": {"symbol": "GBPJPY", "bid": 190.00, "ask": 190.03},
+}
+POSITIONS = [{"ticket": 1, "symbol": "EURUSD", "volume": 0.5}]
+ORDERS = [{"ticket": 2, "symbol": "GBPJPY", "volume": 0.1}]
+ACCOUNT = {"balance": 60000.0, "equity": 59950.0}
+
+
+class StubBridge(ThreadingHTTPServer):
+    """Bridge server stand-in; `batch=False` answers 404 on the batch endpoints."""
+
+    daemon_threads = True
+
+    def __init__(self, batch: bool = True):
+        super().__init__(("127.0.0.1", 0), _StubHandler)
+        self.batch = batch
+        self.requests = []
+        self.lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def paths(self):
+        with self.lock:
+            return [path for path, _ in self.requests]
+
+    def client_ports(self):
+        with self.lock:
+            return {port for _, port in self.requests}
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def _reply(self, status: int, body: dict):
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _record(self):
+        with self.server.lock:
+            self.server.requests.append((self.path, self.client_address[1]))
+
+    def do_GET(self):
+        self._record()
+        if self.path == "/health":
+            self._reply(200, {"status": "ok"})
+        elif self.path == "/positions":
+            self._reply(200, {"positions": POSITIONS})
+        elif self.path == "/state" and self.server.batch:
+            self._reply(200, {"positions": POSITIONS, "orders": ORDERS, "account": ACCOUNT})
+        else:
+            self._reply(404, {"error": "not found"})
+
+    def do_POST(self):
+        self._record()
+        length = int(self.headers.get("Content-Length", 0))
+        payload = json.loads(self.rfile.read(length) or b"{}")
+        if self.path == "/market_data":
+            tick = TICKS.get(payload.get("symbol"))
+            self._reply(200 if tick else 404, tick or {"error": "unknown symbol"})
+        elif self.path == "/market_data_batch" and self.server.batch:
+            self._reply(200, {"ticks": {s: TICKS.get(s) for s in payload.get("symbols", [])}})
+        else:
+            self._reply(404, {"error": "not found"})
+
+
+def _start(batch: bool):
+    server = StubBridge(batch=batch)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    client = MT5BridgeClient(bridge_url=server.url, timeout=5)
+    return server, client
+
+
+@pytest.fixture
+def bridge():
+    server, client = _start(batch=True)
+    yield server, client
+    client.close()
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def legacy_bridge():
+    server, client = _start(batch=False)
+    yield server, client
+    client.close()
+    server.shutdown()
+    server.server_close()
+
+
+def test_sequential_calls_reuse_one_connection(bridge):
+    server, client = bridge
+    for _ in range(10):
+        assert client.get_tick("EURUSD")["bid"] == 1.1000
+    assert client.health_check()
+    assert len(server.paths()) == 11
+    assert len(server.client_ports()) == 1
+
+
+def test_batch_endpoints(bridge):
+    server, client = bridge
+    ticks = client.get_ticks(["EURUSD", "GBPJPY", "XAUUSD"])
+    assert ticks["GBPJPY"]["ask"] == 190.03
+    assert ticks["XAUUSD"] is None
+
+    state = client.get_state()
+    assert state == {"positions": POSITIONS, "orders": ORDERS, "account": ACCOUNT}
+    assert client.get_account_info() == ACCOUNT
+    assert server.paths() == ["/market_data_batch", "/state"]
+
+
+def test_batch_fallback_on_404(legacy_bridge):
+    server, client = legacy_bridge
+    for _ in range(2):
+        ticks = client.get_ticks(["EURUSD", "GBPJPY"])
+        assert ticks["EURUSD"]["bid"] == 1.1000
+        assert ticks["GBPJPY"]["bid"] == 190.00
+    # The batch endpoint is only tried once
+    assert server.paths().count("/market_data_batch") == 1
+    assert server.paths().count("/market_data") == 4
+
+
+def test_state_fallback_reports_unfetched_fields_as_none(legacy_bridge):
+    server, client = legacy_bridge
+    client.account_info = {"balance": 1.0}  # stale cache must not be returned
+    for _ in range(2):
+        state = client.get_state()
+        assert state["positions"] == POSITIONS
+        assert state["orders"] is None
+        assert state["account"] is None
+    assert server.paths() == ["/state", "/positions", "/positions"]
+
+
+def test_state_fallback_when_bridge_is_down():
+    client = MT5BridgeClient(bridge_url="http://127.0.0.1:9", timeout=1)
+    client._batch_supported["/state"] = False
+    assert client.get_state() == {"positions": None, "orders": None, "account": None}
+
+
+def test_latency_histograms(bridge):
+    server, client = bridge
+    for _ in range(5):
+        client.get_tick("EURUSD")
+    client.get_ticks(["EURUSD", "GBPJPY"])
+
+    summary = client.timing_summary()
+    assert set(summary) == {"/market_data", "/market_data_batch"}
+    ticks = summary["/market_data"]
+    assert ticks["count"] == 5
+    assert ticks["errors"] == 0
+    assert sum(ticks["buckets"].values()) == 5
+    assert 0 < ticks["p50_ms"] <= ticks["p95_ms"]
+    assert summary["/market_data_batch"]["count"] == 1
+
+    client.reset_timings()
+    assert client.timing_summary() == {}
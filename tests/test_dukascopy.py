@@ -0,0 +1,165 @@
+"""
+DukascopyDownloader against a local fixture datafeed.
+
+The fixture serves LZMA-compressed .bi5 hours from a dict keyed by the
+datafeed path (zero-based months) and answers 404 for everything else,
+recording each request so the tests can check resume and re-fetch
+behaviour.
+"""
+
+import json
+import lzma
+import threading
+from datetime import date, datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import numpy as np
+import pytest
+
+from tradr.data import dukascopy
+from tradr.data.dukascopy import DukascopyDownloader
+from tradr.data.ticks import BI5_DTYPE
+
+
+DAY = date(2024, 1, 2)
+
+
+def bi5(ticks):
+    """.bi5 bytes for (ms-in-hour, bid, ask) ticks in EURUSD points."""
+    records = np.array([(ms, ask, bid, 1.0, 1.5) for ms, bid, ask in ticks], dtype=BI5_DTYPE)
+    return lzma.compress(records.tobytes())
+
+
+def hour_path(day: date, hour: int) -> str:
+    return f"/EURUSD/{day.year}/{day.month - 1:02d}/{day.day:02d}/{hour:02d}h_ticks.bi5"
+
+
+class FixtureFeed(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _FeedHandler)
+        self.files = {}
+        self.requests = []
+        self.lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def take_requests(self):
+        with self.lock:
+            requests, self.requests = self.requests, []
+        return sorted(requests)
+
+
+class _FeedHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        with self.server.lock:
+            self.server.requests.append(self.path)
+        body = self.server.files.get(self.path)
+        self.send_response(200 if body is not None else 404)
+        self.send_header("Content-Length", str(len(body or b"")))
+        self.end_headers()
+        self.wfile.write(body or b"")
+
+
+@pytest.fixture
+def feed():
+    server = FixtureFeed()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def downloader(feed, tmp_path):
+    return DukascopyDownloader(cache_dir=str(tmp_path / "cache"), base_url=feed.url, max_workers=4, max_retries=0)
+
+
+def _now(monkeypatch, value: datetime):
+    monkeypatch.setattr(dukascopy, "_utc_now", lambda: value)
+
+
+def test_download_decodes_and_resumes(feed, downloader, monkeypatch):
+    _now(monkeypatch, datetime(2024, 1, 10, tzinfo=timezone.utc))
+    feed.files[hour_path(DAY, 0)] = bi5([(0, 110000, 110002), (1500, 110010, 110014)])
+    feed.files[hour_path(DAY, 13)] = bi5([(60_000, 110100, 110104)])
+
+    stats = downloader.download_range("EURUSD", DAY, DAY)
+    assert stats == {"symbol": "EURUSD", "downloaded": 24, "cached": 0, "failed": 0}
+    assert len(feed.take_requests()) == 24
+    # 404 hours are cached as empty files
+    assert downloader._get_hour_path("EURUSD", DAY, 5).read_bytes() == b""
+
+    ticks = downloader.load_ticks("EURUSD", DAY, DAY)
+    day_ms = int(datetime(2024, 1, 2, tzinfo=timezone.utc).timestamp() * 1000)
+    assert ticks["time_ms"].tolist() == [day_ms, day_ms + 1500, day_ms + 13 * 3_600_000 + 60_000]
+    assert ticks["bid"].tolist() == pytest.approx([1.1, 1.1001, 1.101])
+    assert ticks["ask"][0] == pytest.approx(1.10002)
+    assert ticks["ask_volume"][0] == 1.0
+
+    # Complete day: nothing is requested again
+    assert downloader.download_range("EURUSD", DAY, DAY)["downloaded"] == 0
+    assert feed.take_requests() == []
+    manifest = json.loads((downloader.CACHE_DIR / "EURUSD" / "manifest.json").read_text())
+    assert manifest["complete_days"] == ["2024-01-02"]
+
+
+def test_resume_skips_cached_hours(feed, downloader, monkeypatch):
+    _now(monkeypatch, datetime(2024, 1, 10, tzinfo=timezone.utc))
+    path = downloader._get_hour_path("EURUSD", DAY, 7)
+    path.parent.mkdir(parents=True)
+    path.write_bytes(bi5([(0, 110000, 110002)]))
+
+    stats = downloader.download_range("EURUSD", DAY, DAY)
+    assert stats["cached"] == 1 and stats["downloaded"] == 23
+    assert hour_path(DAY, 7) not in feed.take_requests()
+
+
+def test_recent_hours_stay_provisional(feed, downloader, monkeypatch):
+    # 10:30 UTC: hours up to 06h are final, 07h-10h provisional, 11h+ not started
+    _now(monkeypatch, datetime(2024, 1, 2, 10, 30, tzinfo=timezone.utc))
+    feed.files[hour_path(DAY, 10)] = bi5([(0, 110000, 110002)])
+
+    stats = downloader.download_range("EURUSD", DAY, DAY)
+    assert stats["downloaded"] == 11
+    feed.take_requests()
+    for hour in (7, 8, 9, 10):
+        assert not downloader._get_hour_path("EURUSD", DAY, hour).exists()
+        assert downloader._get_hour_path("EURUSD", DAY, hour, provisional=True).exists()
+    assert len(downloader.load_ticks("EURUSD", DAY, DAY)["time_ms"]) == 1
+
+    # Provisional hours are fetched again; final ones are not
+    feed.take_requests()
+    downloader.download_range("EURUSD", DAY, DAY)
+    assert feed.take_requests() == sorted(hour_path(DAY, h) for h in (7, 8, 9, 10))
+
+    # Once the day is safely past, the late hours become final files
+    feed.files[hour_path(DAY, 10)] = bi5([(0, 110000, 110002), (2000, 110001, 110003)])
+    _now(monkeypatch, datetime(2024, 1, 3, 6, tzinfo=timezone.utc))
+    downloader.download_range("EURUSD", DAY, DAY)
+    assert len(feed.take_requests()) == 17
+    assert not downloader._get_hour_path("EURUSD", DAY, 10, provisional=True).exists()
+    assert len(downloader.load_ticks("EURUSD", DAY, DAY)["time_ms"]) == 2
+    downloader.download_range("EURUSD", DAY, DAY)
+    assert feed.take_requests() == []
+
+
+def test_legacy_json_days_are_not_downloaded(feed, downloader, monkeypatch):
+    _now(monkeypatch, datetime(2024, 1, 10, tzinfo=timezone.utc))
+    legacy = downloader._get_cache_path("EURUSD", 2024, 1, 2)
+    legacy.parent.mkdir(parents=True)
+    legacy.write_text(json.dumps([{"time": "2024-01-02T08:00:00+00:00", "bid": 1.1, "ask": 1.1002}]))
+
+    ticks = downloader.load_ticks("EURUSD", date(2024, 1, 1), date(2024, 1, 3))
+    requested_days = {path.split("/")[4] for path in feed.take_requests()}
+    assert requested_days == {"01", "03"}
+    assert ticks["bid"].tolist() == [1.1]
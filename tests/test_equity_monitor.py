@@ -0,0 +1,101 @@
+"""
+StreamingEquityMonitor driven by a TickReplayClient.
+
+The book is a GBPJPY long, so every estimate goes through the cross
+conversion (JPY P/L valued at the replayed USDJPY rate). The replay
+client prices its account equity independently from price_open, which
+makes it the reference the local estimate has to track.
+"""
+
+import pytest
+
+from tradr.mt5.tick_replay import TickReplayClient
+from tradr.risk.equity_monitor import StreamingEquityMonitor
+from tradr.risk.manager import RiskManager
+
+
+BALANCE = 100000.0
+VOLUME = 2.0
+# USD P/L of a 1.0 JPY move on VOLUME lots at USDJPY 150
+USD_PER_YEN = VOLUME * 100000 / 150.0
+
+TICKS = """time,symbol,bid,ask
+0,USDJPY,149.99,150.01
+0,GBPJPY,190.00,190.03
+60,GBPJPY,188.50,188.53
+120,GBPJPY,187.30,187.33
+180,GBPJPY,186.95,186.98
+240,GBPJPY,186.00,186.03
+"""
+
+
+@pytest.fixture
+def replay(tmp_path):
+    path = tmp_path / "ticks.csv"
+    path.write_text(TICKS)
+    client = TickReplayClient.from_csv(path, balance=BALANCE)
+    client.add_position(ticket=1, symbol="GBPJPY", direction="bullish", volume=VOLUME, price_open=190.00)
+    return client
+
+
+@pytest.fixture
+def risk_manager(tmp_path):
+    manager = RiskManager(state_file=str(tmp_path / "challenge_state.json"))
+    manager.sync_from_mt5(BALANCE, BALANCE)
+    return manager
+
+
+def _monitor(risk_manager, **kwargs):
+    return StreamingEquityMonitor(risk_manager, resync_seconds=3600, **kwargs)
+
+
+def test_triggers_at_the_daily_loss_buffer(replay, risk_manager):
+    # Isolate the RiskManager threshold from the move-since-sync trigger
+    monitor = _monitor(risk_manager, trigger_move_pct=100.0)
+    monitor.sync(replay.get_my_positions(), replay.get_account_info(), replay.get_tick)
+    assert monitor.symbols == ["GBPJPY", "USDJPY"]
+
+    checks = []
+    for t in (0, 60, 120, 180, 240):
+        replay.seek(t)
+        check = monitor.poll(replay.get_tick)
+        assert check.equity == pytest.approx(replay.get_account_info()["equity"])
+        checks.append(check)
+
+    assert [c.triggered for c in checks] == [False, False, False, True, True]
+    # 3.05 JPY down on 2 lots: $4,066.67, just past the 4.0% buffer
+    assert checks[3].equity == pytest.approx(BALANCE - 3.05 * USD_PER_YEN)
+    assert checks[3].daily_loss_pct == pytest.approx(4.0667, abs=1e-4)
+    assert "Daily loss" in checks[3].reason
+    assert monitor.stats.triggers == 2
+
+
+def test_move_since_sync_trigger(replay, risk_manager):
+    monitor = _monitor(risk_manager, trigger_move_pct=3.0)
+    monitor.sync(replay.get_my_positions(), replay.get_account_info(), replay.get_tick)
+
+    replay.seek(60)
+    assert not monitor.poll(replay.get_tick).triggered
+    replay.seek(120)
+    check = monitor.poll(replay.get_tick)
+    assert check.triggered
+    assert "since last sync" in check.reason
+
+
+def test_sync_prices_come_from_the_snapshot(replay, risk_manager):
+    monitor = _monitor(risk_manager, trigger_move_pct=100.0)
+    replay.seek(0)
+    monitor.sync(replay.get_my_positions(), replay.get_account_info(), replay.get_tick)
+    monitor.poll(replay.get_tick)
+
+    # Re-sync after the market moved without a poll in between: the sync
+    # price has to be the 188.50 tick behind this equity, not the stale
+    # 190.00 from the last poll
+    replay.seek(60)
+    monitor.sync(replay.get_my_positions(), replay.get_account_info(), replay.get_tick)
+    assert monitor.estimate_equity() == pytest.approx(replay.get_account_info()["equity"])
+
+    replay.seek(120)
+    check = monitor.poll(replay.get_tick)
+    assert check.equity == pytest.approx(replay.get_account_info()["equity"])
+    assert check.equity == pytest.approx(BALANCE - 2.70 * USD_PER_YEN)
@@ -0,0 +1,61 @@
+"""
+compute_ftmo_compliance against a trade-by-trade FTMOComplianceTracker replay.
+"""
+
+import warnings
+from datetime import datetime, timedelta
+
+import pytest
+
+import ftmo_challenge_analyzer as analyzer
+from ftmo_challenge_analyzer import FTMOComplianceTracker, compute_ftmo_compliance
+from strategy_core import Trade
+
+
+def _trades(rrs, start=datetime(2024, 3, 4, 8), per_day=3):
+    return [
+        Trade(
+            symbol="EURUSD", direction="bullish",
+            entry_date=start + timedelta(days=i // per_day, hours=i % per_day),
+            exit_date=start + timedelta(days=i // per_day, hours=i % per_day + 1),
+            entry_price=1.1, exit_price=1.1, stop_loss=1.09, rr=rr,
+        )
+        for i, rr in enumerate(rrs)
+    ]
+
+
+def _replay(trades, risk_usd, balance):
+    tracker = FTMOComplianceTracker(
+        account_size=balance, starting_balance=balance, current_balance=balance,
+        highest_balance=balance, lowest_balance=balance, day_start_balance=balance,
+    )
+    for trade in trades:
+        tracker.update_after_trade(trade.rr * risk_usd, trade.entry_date)
+    return tracker.get_report()
+
+
+@pytest.mark.parametrize("rrs", [
+    [1.0, -1.0, 2.5, -1.0, -1.0, 3.0, 0.5],
+    [-1.0] * 12,
+    # Balance falls through zero and below
+    [-40.0, -40.0, -40.0, 10.0],
+])
+def test_matches_tracker_replay(rrs):
+    trades = _trades(rrs)
+    risk_usd = analyzer.ACCOUNT_SIZE * 0.005
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        report = compute_ftmo_compliance(trades, risk_usd)
+    expected = _replay(trades, risk_usd, analyzer.ACCOUNT_SIZE)
+    assert report == pytest.approx(expected)
+
+
+@pytest.mark.parametrize("rrs", [[], [1.0, -2.0, -1.0]])
+def test_zero_starting_balance_reports_zero_percentages(monkeypatch, rrs):
+    monkeypatch.setattr(analyzer, "ACCOUNT_SIZE", 0.0)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        report = compute_ftmo_compliance(_trades(rrs), 100.0)
+    assert report["total_return_pct"] == 0.0
+    assert report["max_ftmo_dd_pct"] == 0.0
+    assert report["halted_reason"] is None
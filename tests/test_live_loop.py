@@ -0,0 +1,84 @@
+"""
+LiveTradingBot on the offline MT5 simulator.
+
+Steps the simulated clock through the protection/order-sync/scan tasks the
+way scripts/benchmark_live_loop.py does (inline evaluation, no worker
+pool) and checks the scan cadence and order placement. Runs in a temporary
+working directory so no live state or log files are touched.
+"""
+
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+
+DATA_DIR = Path(__file__).resolve().parent.parent / "data" / "ohlcv"
+SYMBOLS = ["EUR_USD", "GBP_USD", "USD_JPY"]
+START = datetime(2024, 1, 2, tzinfo=timezone.utc)
+HOURS = 12
+
+
+@pytest.fixture
+def live(tmp_path, monkeypatch):
+    # The bot opens logs/tradr_live.log relative to the cwd on import
+    monkeypatch.chdir(tmp_path)
+    pytest.importorskip("challenge_risk_manager")
+    module = pytest.importorskip("main_live_bot")
+    monkeypatch.setattr(module, "TRADABLE_SYMBOLS", SYMBOLS)
+    monkeypatch.setattr(module, "SCAN_WORKERS", 0)
+    monkeypatch.setattr(module, "SCAN_TRIGGER", "bar_close")
+    monkeypatch.setattr(module, "CHALLENGE_MODE", False)
+    return module
+
+
+@pytest.fixture
+def sim():
+    if not DATA_DIR.exists():
+        pytest.skip("data/ohlcv not available")
+    from tradr.mt5.simulator import SimulatedMT5Client
+    return SimulatedMT5Client(data_dir=str(DATA_DIR), start=START, speed=0.0)
+
+
+def test_live_loop_on_simulator(live, sim, monkeypatch):
+    bot = live.LiveTradingBot(mt5_client=sim)
+    assert bot.connect()
+    assert sorted(bot.symbol_map) == SYMBOLS
+
+    scans = []
+    full_scan = bot.scan_all_symbols
+
+    def recording_scan(symbols=None):
+        scans.append((sim.now(), symbols))
+        return full_scan(symbols)
+
+    monkeypatch.setattr(bot, "scan_all_symbols", recording_scan)
+
+    bot.scan_all_symbols()
+    placed = sim.call_counts["place_pending_order"] + sim.call_counts["place_market_order"]
+    # USD_JPY's entry is still more than 1R away at midnight
+    assert placed == 2
+    assert sorted(bot.pending_setups) == ["EUR_USD", "GBP_USD"]
+
+    bot._scan_targets = {s: bot.symbol_map[s] for s in SYMBOLS}
+    bot.bar_scheduler.prime(bot._scan_targets)
+    step = bot.MAIN_LOOP_INTERVAL_SECONDS
+    for _ in range(int(HOURS * 3600 / step)):
+        sim.advance(step)
+        bot._protection_tick()
+        bot._order_sync_tick()
+        bot._scan_tick()
+    bot._shutdown_scan_pool()
+
+    # One full scan, then every symbol once per H4 close (22:00 NY-close bars)
+    closes = [START + timedelta(hours=h) for h in (2, 6, 10)]
+    assert scans == [(START, None)] + [(when, SYMBOLS) for when in closes]
+    assert bot.scan_count == 1 + len(closes)
+    assert bot.bar_scheduler.next_due() == START + timedelta(hours=14)
+
+    # A rescan picks up USD_JPY; the others keep their setups instead of
+    # stacking new orders
+    placed_after = sim.call_counts["place_pending_order"] + sim.call_counts["place_market_order"]
+    assert placed_after == len(SYMBOLS)
+    assert sorted(bot.pending_setups) == SYMBOLS
+    assert len(sim.get_positions()) + len(sim.get_pending_orders()) == len(SYMBOLS)
@@ -0,0 +1,155 @@
+"""
+OandaClient paging and retries against a local mock of the candles endpoint.
+
+The mock serves an hourly series with OANDA's semantics: at most 5000
+candles per response, inclusive `from`/`to` bounds, `includeFirst`, and an
+incomplete last candle. Queued status codes are answered before the next
+real response to exercise the 429/5xx retry path.
+"""
+
+import json
+import threading
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from tradr.data.oanda import OandaClient
+
+
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+SERIES_LENGTH = 12000
+
+
+def _time(i: int) -> datetime:
+    return START + timedelta(hours=i)
+
+
+class MockOanda(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _OandaHandler)
+        self.requests = []
+        self.failures = []
+        self.lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class _OandaHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def _reply(self, status: int, body: dict, headers: dict = None):
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        query = {k: v[0] for k, v in parse_qs(urlparse(self.path).query).items()}
+        with self.server.lock:
+            self.server.requests.append(query)
+            status = self.server.failures.pop(0) if self.server.failures else None
+        if status is not None:
+            self._reply(status, {"errorMessage": "try again"}, {"Retry-After": "0"})
+            return
+
+        count = min(int(query.get("count", 500)), 5000)
+        if "from" in query:
+            lo = _index_at_or_after(datetime.fromisoformat(query["from"]))
+            if query.get("includeFirst") == "false" and lo < SERIES_LENGTH and _time(lo) == datetime.fromisoformat(query["from"]):
+                lo += 1
+            indexes = range(lo, min(lo + count, SERIES_LENGTH))
+        else:
+            hi = SERIES_LENGTH - 1
+            if "to" in query:
+                hi = min(hi, _index_at_or_before(datetime.fromisoformat(query["to"])))
+            indexes = range(max(0, hi - count + 1), hi + 1)
+
+        self._reply(200, {"candles": [
+            {
+                "time": _time(i).isoformat().replace("+00:00", "Z"),
+                "complete": i < SERIES_LENGTH - 1,
+                "volume": i,
+                "mid": {"o": "1.1", "h": "1.2", "l": "1.0", "c": "1.15"},
+            }
+            for i in indexes
+        ]})
+
+
+def _index_at_or_after(t: datetime) -> int:
+    seconds = (t - START).total_seconds()
+    return max(0, int(-(-seconds // 3600)))
+
+
+def _index_at_or_before(t: datetime) -> int:
+    return int((t - START).total_seconds() // 3600)
+
+
+@pytest.fixture
+def oanda():
+    server = MockOanda()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    client = OandaClient(api_key="test", account_id=f"mock-{id(server)}", base_url=server.url,
+                         requests_per_second=1000)
+    yield server, client
+    server.shutdown()
+    server.server_close()
+
+
+def _assert_contiguous(candles, last_index: int):
+    assert [c["volume"] for c in candles] == list(range(last_index - len(candles) + 1, last_index + 1))
+
+
+def test_backward_paging_returns_full_count(oanda):
+    server, client = oanda
+    candles = client.get_candles("EURUSD", "H1", count=7000)
+    assert len(candles) == 7000
+    # Ends at the last complete candle, no duplicates at the page boundary
+    _assert_contiguous(candles, SERIES_LENGTH - 2)
+    assert len(server.requests) == 2
+    assert [int(r["count"]) for r in server.requests] == [5000, 2002]
+
+
+def test_backward_paging_with_to_time(oanda):
+    server, client = oanda
+    candles = client.get_candles("EURUSD", "H1", count=6000, to_time=_time(9000))
+    assert len(candles) == 6000
+    # `to` is inclusive upstream; the candle at to_time is excluded
+    _assert_contiguous(candles, 8999)
+    assert len(server.requests) == 2
+
+
+def test_forward_paging_between_times(oanda):
+    server, client = oanda
+    candles = client.get_candles("EURUSD", "H1", from_time=_time(100), to_time=_time(7099))
+    assert len(candles) == 7000
+    _assert_contiguous(candles, 7099)
+    assert server.requests[1]["includeFirst"] == "false"
+
+
+def test_retries_429_and_5xx(oanda):
+    server, client = oanda
+    server.failures.extend([429, 503])
+    candles = client.get_candles("EURUSD", "H1", count=10)
+    assert len(candles) == 10
+    assert len(server.requests) == 3
+
+
+def test_gives_up_after_max_retries(oanda):
+    server, client = oanda
+    server.failures.extend([500] * (client.max_retries + 1))
+    assert client.get_candles("EURUSD", "H1", count=10) == []
+    assert len(server.requests) == client.max_retries + 1
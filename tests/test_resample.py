@@ -0,0 +1,85 @@
+"""
+Derived vs native higher timeframes on a slice of the EURUSD store.
+
+tests/fixtures/ohlcv holds EURUSD H4 for 2024-07..2025-06 and the native
+D1/W1/MN files for 2024-01..2025-06 (trailing bars whose bucket extends
+past the H4 slice removed), so D1/W1/MN are derived from H4 from July 2024
+and spliced onto native history before that.
+"""
+
+import shutil
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from tradr.data.resample import (
+    PARITY_TOLERANCE,
+    STORE_TIMEFRAMES,
+    build_symbol_timeframes,
+    find_ohlcv_csv,
+    load_quality_index,
+    load_symbol_timeframes,
+    read_ohlcv_csv,
+)
+
+
+FIXTURE_DIR = Path(__file__).parent / "fixtures" / "ohlcv"
+
+# Accepted largest OHLC deviation of a derived bar from its native bar.
+# D1/W1 are built from the same broker bars and must agree within
+# PARITY_TOLERANCE. Native FX MN files group D1 bars by the UTC date of
+# their open, so the first NY trading day of a month is counted in the
+# previous month; derived MN bars follow the trading date and differ by
+# up to ~0.6% on this slice (~2.5% worst case across the full store).
+ACCEPTED_MAX_DEV = {"D1": PARITY_TOLERANCE, "W1": PARITY_TOLERANCE, "MN": 0.01}
+
+
+def _paths():
+    paths = {tf: find_ohlcv_csv(FIXTURE_DIR, "EURUSD", tf) for tf in STORE_TIMEFRAMES}
+    assert all(paths.values())
+    return paths
+
+
+@pytest.fixture(scope="module")
+def derived():
+    return build_symbol_timeframes(_paths())
+
+
+@pytest.mark.parametrize("tf", ["D1", "W1", "MN"])
+def test_derived_bars_match_native_within_tolerance(derived, tf):
+    _, index = derived
+    report = index["timeframes"][tf]
+    assert report["labels"]["mismatched"] == 0
+    parity = report["parity"]
+    assert parity["compared"] >= {"D1": 250, "W1": 50, "MN": 10}[tf]
+    assert parity["max_dev"] <= ACCEPTED_MAX_DEV[tf]
+    if ACCEPTED_MAX_DEV[tf] == PARITY_TOLERANCE:
+        assert parity["off"] == 0
+
+
+def test_native_history_is_spliced_before_the_base(derived):
+    result, _ = derived
+    native = read_ohlcv_csv(_paths()["D1"])
+    head = native["time_ms"] < np.datetime64("2024-07-01", "ms").astype(np.int64)
+    np.testing.assert_array_equal(result["D1"]["time_ms"][:head.sum()], native["time_ms"][head])
+    np.testing.assert_array_equal(result["D1"]["close"][:head.sum()], native["close"][head])
+
+
+def test_derive_off_keeps_native_files(tmp_path):
+    data_dir = tmp_path / "ohlcv"
+    shutil.copytree(FIXTURE_DIR, data_dir)
+
+    series = load_symbol_timeframes("EUR_USD", data_dir, derive=False)
+    for tf, path in _paths().items():
+        native = read_ohlcv_csv(path)
+        for key in ("time_ms", "open", "high", "low", "close"):
+            np.testing.assert_array_equal(series[tf][key], native[key])
+
+    index = load_quality_index("EURUSD", data_dir, derive=False)
+    assert index["derived"] is False
+    assert "parity" not in index["timeframes"]["MN"]
+    # Derived and native caches live side by side
+    assert (data_dir / ".derived" / "EURUSD.native.npz").exists()
+    assert not (data_dir / ".derived" / "EURUSD.npz").exists()
+    assert load_quality_index("EURUSD", data_dir, derive=True) is None
@@ -0,0 +1,64 @@
+"""
+StateStore batching and the one-time legacy JSON import.
+"""
+
+import json
+
+import pytest
+
+from tradr.utils.state_store import LEGACY_SUFFIX, STATE_DB_NAME, StateStore
+
+
+@pytest.fixture
+def open_store(tmp_path):
+    stores = []
+
+    def _open():
+        store = StateStore(tmp_path / STATE_DB_NAME, flush_seconds=0.01)
+        stores.append(store)
+        return store
+
+    yield _open
+    for store in stores:
+        store.close()
+
+
+def test_put_is_visible_before_and_after_commit(open_store):
+    store = open_store()
+    store.put("trading_days.json", {"trading_days": ["2024-01-02"]})
+    assert store.get("trading_days.json") == {"trading_days": ["2024-01-02"]}
+    assert store.flush()
+    store.close()
+
+    assert open_store().get("trading_days.json") == {"trading_days": ["2024-01-02"]}
+
+
+def test_legacy_file_is_imported_once_and_retired(tmp_path, open_store):
+    legacy = tmp_path / "challenge_state.json"
+    legacy.write_text(json.dumps({"phase": 2}))
+
+    store = open_store()
+    assert store.get("challenge_state.json", legacy_file=legacy) == {"phase": 2}
+    assert not legacy.exists()
+    migrated = tmp_path / ("challenge_state.json" + LEGACY_SUFFIX)
+    assert json.loads(migrated.read_text()) == {"phase": 2}
+    store.close()
+
+    # The import was committed before the rename
+    store = open_store()
+    assert store.get("challenge_state.json", legacy_file=legacy) == {"phase": 2}
+    store.close()
+
+    # A deleted database starts fresh instead of re-importing stale JSON
+    for path in tmp_path.glob(STATE_DB_NAME + "*"):
+        path.unlink()
+    assert open_store().get("challenge_state.json", {}, legacy_file=legacy) == {}
+
+
+def test_unreadable_legacy_file_is_kept(tmp_path, open_store):
+    legacy = tmp_path / "pending_setups.json"
+    legacy.write_text("{not json")
+
+    assert open_store().get("pending_setups.json", {}, legacy_file=legacy) == {}
+    assert legacy.exists()
+    assert not (tmp_path / ("pending_setups.json" + LEGACY_SUFFIX)).exists()
@@ -0,0 +1,64 @@
+"""
+TrialJournal batching, the optimization.log mirror and the reader.
+"""
+
+from tradr.utils.trial_journal import TrialJournal, TrialJournalReader, format_trial, record_to_dict
+
+
+NAN = float("nan")
+
+
+def test_nan_metrics_are_journaled_and_logged(tmp_path):
+    journal_path = tmp_path / "trials.journal"
+    text_log = tmp_path / "optimization.log"
+    journal = TrialJournal(journal_path, flush_every=2, text_log=text_log)
+
+    for number in range(5):
+        journal.append(
+            trial_number=number, score=NAN, total_r=NAN, sharpe_ratio=NAN,
+            win_rate=NAN, profit_factor=NAN, profit_usd=NAN, max_drawdown_pct=NAN,
+            ftmo_dd_pct=NAN, ftmo_challenge_passed=False,
+            val_metrics={"total_r": 1.5, "win_rate": NAN, "profit_usd": 300.0},
+        )
+    journal.close()
+
+    reader = TrialJournalReader(journal_path)
+    assert [row["trial_number"] for row in reader.rows()] == [0, 1, 2, 3, 4]
+    assert reader.rows()[0]["score"] is None
+    assert reader.best() is None
+
+    log = text_log.read_text()
+    assert log.count("Trial #") == 5
+    assert "Score: None | R: None | Sharpe: None" in log
+    assert "[Validation] R: +1.5 | WR: None% | $300.00" in log
+
+
+def test_text_log_failure_does_not_wedge_the_journal(tmp_path):
+    journal_path = tmp_path / "trials.journal"
+    # A directory where the text log should be makes every text write fail
+    text_log = tmp_path / "optimization.log"
+    text_log.mkdir()
+    journal = TrialJournal(journal_path, flush_every=2, text_log=text_log)
+
+    for number in range(7):
+        journal.append(trial_number=number, score=float(number))
+    assert len(journal) == 7
+    journal.close()
+
+    reader = TrialJournalReader(journal_path)
+    assert len(reader) == 7
+    assert reader.best()["trial_number"] == 6
+
+
+def test_format_trial_matches_log_layout(tmp_path):
+    journal_path = tmp_path / "trials.journal"
+    journal = TrialJournal(journal_path, flush_every=1)
+    journal.append(trial_number=3, score=104.25, total_r=38.5, sharpe_ratio=1.2345,
+                   win_rate=52.0, profit_factor=1.8, total_trades=120,
+                   profit_usd=13860.0, max_drawdown_pct=4.5, is_best=True)
+    journal.close()
+
+    block = format_trial(record_to_dict(TrialJournalReader(journal_path).records[0]))
+    assert "NEW BEST - Trial #3" in block
+    assert "Score: 104.25 | R: +38.5 | Sharpe: 1.234" in block
+    assert "Profit: $13,860.00 | Max DD: 4.50%" in block
@@ -3,7 +3,8 @@
 Enhanced trade registry for Blueprint Trader AI.
 
 Tracks active trades with notification state to prevent duplicate Discord messages.
-Persists to trade_state.json for crash recovery.
+Persists to the trade_state.json document of the state store
+(tradr/utils/state_store.py) for crash recovery.
 
 Features:
 - Track active trade ideas (4/7+ confluence)
@@ -14,7 +15,6 @@ Features:
 
 from __future__ import annotations
 
-import json
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Any
@@ -22,6 +22,7 @@ from dataclasses import dataclass, field, asdict
 
 from strategy import ScanResult
 from data import get_ohlcv
+from tradr.utils.state_store import state_store_for
 
 
 TRADE_STATE_FILE = Path("trade_state.json")
@@ -237,8 +238,7 @@ def save_state() -> None:
         state["notifications"][key] = notif.to_dict()
     
     try:
-        with open(TRADE_STATE_FILE, 'w') as f:
-            json.dump(state, f, indent=2)
+        state_store_for(TRADE_STATE_FILE).put(TRADE_STATE_FILE.name, state)
     except Exception as e:
         print(f"[trade_state] Error saving state: {e}")
 
@@ -250,12 +250,10 @@ def load_state() -> int:
     Returns:
         Number of trades restored
     """
-    if not TRADE_STATE_FILE.exists():
-        return 0
-    
     try:
-        with open(TRADE_STATE_FILE, 'r') as f:
-            state = json.load(f)
+        state = state_store_for(TRADE_STATE_FILE).get(TRADE_STATE_FILE.name, legacy_file=TRADE_STATE_FILE)
+        if state is None:
+            return 0
         
         # Restore trades
         for key, trade_data in state.get("trades", {}).items():
@@ -9,8 +9,15 @@ Includes:
 
 from tradr.data.dukascopy import DukascopyDownloader
 from tradr.data.oanda import OandaClient
+from tradr.data.resample import load_symbol_timeframes, resample_ohlcv
+from tradr.data.ticks import aggregate_ticks, candles_to_dicts, decode_bi5
 
 __all__ = [
     "DukascopyDownloader",
     "OandaClient",
+    "aggregate_ticks",
+    "candles_to_dicts",
+    "decode_bi5",
+    "load_symbol_timeframes",
+    "resample_ohlcv",
 ]
@@ -3,16 +3,48 @@ Dukascopy Historical Data Downloader.
 
 Provides free historical tick/OHLCV data from 2003+.
 Essential for backtest parity with live trades.
+
+Hourly .bi5 files are downloaded concurrently over a pooled session with
+retry/backoff and cached as-is (LZMA-compressed, ~10x smaller than decoded
+JSON) under:
+
+    <cache_dir>/<SYMBOL>/<YYYY>/<MM>/<DD>/<HH>h_ticks.bi5
+
+Hour files are written atomically, and a per-symbol manifest.json records
+finished days and failed hours, so an interrupted download resumes where
+it stopped. Legacy per-day JSON caches are still read (and not downloaded
+again).
+
+An hour is final once it ended more than FINAL_AFTER_HOURS ago. Until then
+Dukascopy may serve a partial file or a 404 for data it hasn't published
+yet, so such hours are cached as `<HH>h_ticks.provisional.bi5`, read only
+while no final file exists, and fetched again on every download.
+
+Decoding and candle building are vectorized (see tradr.data.ticks);
+load_ticks() returns NumPy arrays for callers that don't need dicts.
 """
 
 import os
 import json
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, date, timedelta, timezone
 from pathlib import Path
-from typing import List, Dict, Optional, Tuple
-import struct
-import lzma
+from typing import List, Dict, Optional, Tuple, Union
+
+import numpy as np
+
+from tradr.data.ticks import (
+    aggregate_ticks,
+    candles_to_dicts,
+    concat_ticks,
+    decode_bi5,
+    ticks_from_dicts,
+)
+
 
+# Hours that ended less than this long ago may still be incomplete upstream
+FINAL_AFTER_HOURS = 3
 
 DUKASCOPY_SYMBOLS = {
     "EURUSD": "EURUSD",
@@ -29,6 +61,19 @@ DUKASCOPY_SYMBOLS = {
 }
 
 
+def _utc_now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _hour_start(day: date, hour: int) -> datetime:
+    return datetime(day.year, day.month, day.day, hour, tzinfo=timezone.utc)
+
+
+def _is_final(day: date, hour: int, now: datetime) -> bool:
+    """True once the hour ended at least FINAL_AFTER_HOURS before `now`."""
+    return _hour_start(day, hour) + timedelta(hours=1 + FINAL_AFTER_HOURS) <= now
+
+
 class DukascopyDownloader:
     """
     Download historical data from Dukascopy.
@@ -40,203 +85,373 @@ class DukascopyDownloader:
     BASE_URL = "https://datafeed.dukascopy.com/datafeed"
     CACHE_DIR = Path("data_cache/dukascopy")
     
-    def __init__(self, cache_dir: str = None):
+    def __init__(
+        self,
+        cache_dir: str = None,
+        base_url: str = None,
+        max_workers: int = 8,
+        max_retries: int = 4,
+        timeout: int = 30,
+    ):
         if cache_dir:
             self.CACHE_DIR = Path(cache_dir)
+        if base_url:
+            self.BASE_URL = base_url.rstrip("/")
         self.CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        self.max_workers = max_workers
+        self.max_retries = max_retries
+        self.timeout = timeout
+        self._session = None
+        self._session_lock = threading.Lock()
+    
+    @property
+    def session(self):
+        """Pooled requests session with retry/backoff on 429/5xx and connection errors."""
+        with self._session_lock:
+            if self._session is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+                from urllib3.util.retry import Retry
+                
+                retry = Retry(
+                    total=self.max_retries,
+                    backoff_factor=0.5,
+                    status_forcelist=(429, 500, 502, 503, 504),
+                    allowed_methods=("GET",),
+                    respect_retry_after_header=True,
+                )
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.max_workers, max_retries=retry)
+                self._session = requests.Session()
+                self._session.mount("http://", adapter)
+                self._session.mount("https://", adapter)
+            return self._session
     
     def _get_cache_path(self, symbol: str, year: int, month: int, day: int) -> Path:
-        """Get cache file path for a specific date."""
+        """Get legacy JSON cache file path for a specific date."""
         return self.CACHE_DIR / symbol / f"{year}" / f"{month:02d}" / f"{day:02d}.json"
     
-    def _parse_bi5(self, data: bytes, symbol: str) -> List[Dict]:
-        """Parse Dukascopy's bi5 format (LZMA compressed tick data)."""
+    def _get_hour_path(self, symbol: str, day: date, hour: int, provisional: bool = False) -> Path:
+        """Get raw .bi5 cache path for one hour (provisional: hour not final yet)."""
+        name = f"{hour:02d}h_ticks.provisional.bi5" if provisional else f"{hour:02d}h_ticks.bi5"
+        return self.CACHE_DIR / symbol / f"{day.year}" / f"{day.month:02d}" / f"{day.day:02d}" / name
+    
+    def _hour_url(self, symbol: str, day: date, hour: int) -> str:
+        # Dukascopy months are zero-based
+        return (
+            f"{self.BASE_URL}/{symbol}/"
+            f"{day.year}/{day.month - 1:02d}/{day.day:02d}/"
+            f"{hour:02d}h_ticks.bi5"
+        )
+    
+    def _manifest_path(self, symbol: str) -> Path:
+        return self.CACHE_DIR / symbol / "manifest.json"
+    
+    def _load_manifest(self, symbol: str) -> Dict:
+        path = self._manifest_path(symbol)
+        if path.exists():
+            try:
+                with open(path, 'r') as f:
+                    manifest = json.load(f)
+                manifest.setdefault("complete_days", [])
+                manifest.setdefault("failed", {})
+                return manifest
+            except Exception:
+                pass
+        return {"symbol": symbol, "complete_days": [], "failed": {}}
+    
+    def _save_manifest(self, symbol: str, manifest: Dict):
+        path = self._manifest_path(symbol)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        manifest["complete_days"] = sorted(set(manifest["complete_days"]))
+        manifest["updated"] = datetime.now(timezone.utc).isoformat()
+        tmp = path.with_suffix(".json.tmp")
+        with open(tmp, 'w') as f:
+            json.dump(manifest, f, indent=1)
+        os.replace(tmp, path)
+    
+    def _fetch_hour(self, symbol: str, day: date, hour: int, final: bool = True) -> bool:
+        """
+        Download one hour into the raw cache.
+        
+        A 404 or empty body means no ticks that hour and is cached as an
+        empty file. Hours that aren't final go to the provisional path.
+        Returns False if the hour could not be fetched.
+        """
+        path = self._get_hour_path(symbol, day, hour, provisional=not final)
         try:
-            decompressed = lzma.decompress(data)
-        except Exception:
-            return []
+            response = self.session.get(self._hour_url(symbol, day, hour), timeout=self.timeout)
+        except Exception as e:
+            print(f"[Dukascopy] Error downloading {symbol} {day} hour {hour}: {e}")
+            return False
         
-        ticks = []
-        record_size = 20
+        if response.status_code == 200:
+            content = response.content
+        elif response.status_code == 404:
+            content = b""
+        else:
+            print(f"[Dukascopy] HTTP {response.status_code} for {symbol} {day} hour {hour}")
+            return False
         
-        for i in range(0, len(decompressed), record_size):
-            if i + record_size > len(decompressed):
-                break
-            
-            record = decompressed[i:i+record_size]
-            
-            try:
-                timestamp_ms, ask, bid, ask_vol, bid_vol = struct.unpack('>IIIff', record)
-                
-                point = 0.00001 if "JPY" not in symbol else 0.001
-                
-                ticks.append({
-                    "timestamp_ms": timestamp_ms,
-                    "ask": ask * point,
-                    "bid": bid * point,
-                    "ask_volume": ask_vol,
-                    "bid_volume": bid_vol,
-                })
-            except Exception:
-                continue
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.name + ".part")
+        with open(tmp, 'wb') as f:
+            f.write(content)
+        os.replace(tmp, path)
+        if final:
+            self._get_hour_path(symbol, day, hour, provisional=True).unlink(missing_ok=True)
+        return True
+    
+    def download_range(
+        self,
+        symbol: str,
+        start_date: date,
+        end_date: date,
+    ) -> Dict:
+        """
+        Fill the raw .bi5 cache for a date range, resuming from the manifest.
+        
+        Missing hours of unfinished days are fetched concurrently; hours that
+        aren't final are fetched again on every call. Days whose 24 hours
+        are all final and cached are marked complete.
+        
+        Returns:
+            Dict with downloaded/cached/failed hour counts
+        """
+        duk_symbol = DUKASCOPY_SYMBOLS.get(symbol.upper().replace("_", ""), symbol)
+        manifest = self._load_manifest(duk_symbol)
+        complete = set(manifest["complete_days"])
+        now = _utc_now()
+        
+        pending: List[Tuple[date, int, bool]] = []
+        days: List[date] = []
+        cached = 0
+        current = start_date
+        while current <= end_date:
+            key = current.isoformat()
+            if key not in complete:
+                days.append(current)
+                for hour in range(24):
+                    if _hour_start(current, hour) > now:
+                        break
+                    final = _is_final(current, hour, now)
+                    if final and self._get_hour_path(duk_symbol, current, hour).exists():
+                        cached += 1
+                    else:
+                        pending.append((current, hour, final))
+            current += timedelta(days=1)
         
-        return ticks
+        failed: Dict[str, List[int]] = {}
+        downloaded = 0
+        if pending:
+            workers = max(1, min(self.max_workers, len(pending)))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="dukascopy") as pool:
+                futures = {
+                    pool.submit(self._fetch_hour, duk_symbol, day, hour, final): (day, hour)
+                    for day, hour, final in pending
+                }
+                for future in as_completed(futures):
+                    day, hour = futures[future]
+                    if future.result():
+                        downloaded += 1
+                    else:
+                        failed.setdefault(day.isoformat(), []).append(hour)
+        
+        for day in days:
+            key = day.isoformat()
+            if _is_final(day, 23, now) and key not in failed:
+                complete.add(key)
+                manifest["failed"].pop(key, None)
+        for key, hours in failed.items():
+            manifest["failed"][key] = sorted(hours)
+        manifest["complete_days"] = list(complete)
+        self._save_manifest(duk_symbol, manifest)
+        
+        return {
+            "symbol": duk_symbol,
+            "downloaded": downloaded,
+            "cached": cached,
+            "failed": sum(len(h) for h in failed.values()),
+        }
     
-    def download_ticks(
+    def _parse_bi5(self, data: bytes, symbol: str) -> List[Dict]:
+        """Parse Dukascopy's bi5 format (LZMA compressed tick data)."""
+        ticks = decode_bi5(data, symbol)
+        return [
+            {
+                "timestamp_ms": ms,
+                "ask": ask,
+                "bid": bid,
+                "ask_volume": ask_vol,
+                "bid_volume": bid_vol,
+            }
+            for ms, ask, bid, ask_vol, bid_vol in zip(
+                ticks["time_ms"].tolist(),
+                ticks["ask"].tolist(),
+                ticks["bid"].tolist(),
+                ticks["ask_volume"].tolist(),
+                ticks["bid_volume"].tolist(),
+            )
+        ]
+    
+    def load_ticks(
         self,
         symbol: str,
         start_date: date,
         end_date: date,
         use_cache: bool = True,
-    ) -> List[Dict]:
+    ) -> Dict[str, np.ndarray]:
         """
-        Download tick data for a date range.
+        Tick data for a date range as NumPy arrays (time_ms, bid, ask, mid, volumes).
         
         Args:
             symbol: Trading symbol (e.g., "EURUSD")
             start_date: Start date
             end_date: End date
-            use_cache: Use cached data if available
-            
-        Returns:
-            List of tick dictionaries
+            use_cache: Use cached data if available (False re-downloads)
         """
         duk_symbol = DUKASCOPY_SYMBOLS.get(symbol.upper().replace("_", ""), symbol)
-        all_ticks = []
         
+        if not use_cache:
+            self._clear_range(duk_symbol, start_date, end_date)
+        
+        legacy_days = set()
+        if use_cache:
+            current = start_date
+            while current <= end_date:
+                if self._get_cache_path(duk_symbol, current.year, current.month, current.day).exists():
+                    legacy_days.add(current)
+                current += timedelta(days=1)
+        
+        # Only fetch the days the legacy JSON cache doesn't already cover
+        run_start = None
+        current = start_date
+        while current <= end_date + timedelta(days=1):
+            if current <= end_date and current not in legacy_days:
+                run_start = run_start or current
+            elif run_start is not None:
+                self.download_range(duk_symbol, run_start, current - timedelta(days=1))
+                run_start = None
+            current += timedelta(days=1)
+        
+        chunks = []
         current = start_date
         while current <= end_date:
-            cache_path = self._get_cache_path(duk_symbol, current.year, current.month, current.day)
-            
-            if use_cache and cache_path.exists():
+            if current in legacy_days:
                 try:
-                    with open(cache_path, 'r') as f:
-                        day_ticks = json.load(f)
-                    all_ticks.extend(day_ticks)
+                    with open(self._get_cache_path(duk_symbol, current.year, current.month, current.day), 'r') as f:
+                        chunks.append(ticks_from_dicts(json.load(f)))
                     current += timedelta(days=1)
                     continue
                 except Exception:
                     pass
             
-            day_ticks = self._download_day(duk_symbol, current)
-            
-            if day_ticks:
-                cache_path.parent.mkdir(parents=True, exist_ok=True)
-                try:
-                    with open(cache_path, 'w') as f:
-                        json.dump(day_ticks, f)
-                except Exception:
-                    pass
-                
-                all_ticks.extend(day_ticks)
-            
+            chunks.append(self._load_day_arrays(duk_symbol, current))
             current += timedelta(days=1)
         
-        return all_ticks
+        return concat_ticks(chunks)
     
-    def _download_day(self, symbol: str, day: date) -> List[Dict]:
-        """Download tick data for a single day."""
-        import requests
+    def download_ticks(
+        self,
+        symbol: str,
+        start_date: date,
+        end_date: date,
+        use_cache: bool = True,
+    ) -> List[Dict]:
+        """
+        Download tick data for a date range.
         
-        all_ticks = []
+        Args:
+            symbol: Trading symbol (e.g., "EURUSD")
+            start_date: Start date
+            end_date: End date
+            use_cache: Use cached data if available (False re-downloads)
+            
+        Returns:
+            List of tick dictionaries
+        """
+        return self._ticks_to_dicts(self.load_ticks(symbol, start_date, end_date, use_cache))
+    
+    def _ticks_to_dicts(self, ticks: Dict[str, np.ndarray]) -> List[Dict]:
+        return [
+            {
+                "timestamp_ms": t % 3_600_000,
+                "ask": ask,
+                "bid": bid,
+                "ask_volume": ask_vol,
+                "bid_volume": bid_vol,
+                "time": datetime.fromtimestamp(t / 1000, tz=timezone.utc).isoformat(),
+                "mid": mid,
+            }
+            for t, ask, bid, ask_vol, bid_vol, mid in zip(
+                ticks["time_ms"].tolist(),
+                ticks["ask"].tolist(),
+                ticks["bid"].tolist(),
+                ticks["ask_volume"].tolist(),
+                ticks["bid_volume"].tolist(),
+                ticks["mid"].tolist(),
+            )
+        ]
+    
+    def _clear_range(self, symbol: str, start_date: date, end_date: date):
+        """Drop cached hours and manifest entries so the range is fetched again."""
+        manifest = self._load_manifest(symbol)
+        complete = set(manifest["complete_days"])
+        current = start_date
+        while current <= end_date:
+            complete.discard(current.isoformat())
+            manifest["failed"].pop(current.isoformat(), None)
+            for hour in range(24):
+                self._get_hour_path(symbol, current, hour).unlink(missing_ok=True)
+                self._get_hour_path(symbol, current, hour, provisional=True).unlink(missing_ok=True)
+            current += timedelta(days=1)
+        manifest["complete_days"] = list(complete)
+        self._save_manifest(symbol, manifest)
+    
+    def _load_day_arrays(self, symbol: str, day: date) -> Dict[str, np.ndarray]:
+        """Decode one day's cached .bi5 hours into tick arrays."""
+        day_start_ms = int(datetime(day.year, day.month, day.day, tzinfo=timezone.utc).timestamp() * 1000)
+        chunks = []
         
         for hour in range(24):
-            url = (
-                f"{self.BASE_URL}/{symbol}/"
-                f"{day.year}/{day.month - 1:02d}/{day.day:02d}/"
-                f"{hour:02d}h_ticks.bi5"
-            )
-            
-            try:
-                response = requests.get(url, timeout=30)
-                if response.status_code == 200:
-                    hour_ticks = self._parse_bi5(response.content, symbol)
-                    
-                    base_time = datetime(
-                        day.year, day.month, day.day, hour,
-                        tzinfo=timezone.utc
-                    )
-                    
-                    for tick in hour_ticks:
-                        tick_time = base_time + timedelta(milliseconds=tick["timestamp_ms"])
-                        tick["time"] = tick_time.isoformat()
-                        tick["mid"] = (tick["ask"] + tick["bid"]) / 2
-                    
-                    all_ticks.extend(hour_ticks)
-            except Exception as e:
-                print(f"[Dukascopy] Error downloading {symbol} {day} hour {hour}: {e}")
+            path = self._get_hour_path(symbol, day, hour)
+            if not path.exists():
+                path = self._get_hour_path(symbol, day, hour, provisional=True)
+            if not path.exists():
+                continue
+            chunks.append(decode_bi5(path.read_bytes(), symbol, day_start_ms + hour * 3_600_000))
         
-        return all_ticks
+        return concat_ticks(chunks)
+    
+    def _load_day(self, symbol: str, day: date) -> List[Dict]:
+        """Decode one day's cached .bi5 hours into tick dicts."""
+        return self._ticks_to_dicts(self._load_day_arrays(symbol, day))
+    
+    def _download_day(self, symbol: str, day: date) -> List[Dict]:
+        """Download (or reuse cached) tick data for a single day."""
+        self.download_range(symbol, day, day)
+        return self._load_day(symbol, day)
     
     def ticks_to_ohlcv(
         self,
-        ticks: List[Dict],
+        ticks: Union[List[Dict], Dict[str, np.ndarray]],
         timeframe: str = "D",
     ) -> List[Dict]:
         """
         Convert tick data to OHLCV candles.
         
         Args:
-            ticks: List of tick dictionaries
-            timeframe: Timeframe - "M1", "M5", "M15", "M30", "H1", "H4", "D", "W"
+            ticks: Tick dictionaries or load_ticks() arrays
+            timeframe: Timeframe - "M1", "M5", "M15", "M30", "H1", "H4", "D", "W", "MN"
             
         Returns:
-            List of OHLCV candle dictionaries
+            List of OHLCV candle dictionaries (volume = tick count)
         """
-        if not ticks:
+        if isinstance(ticks, list):
+            ticks = ticks_from_dicts(ticks)
+        if not len(ticks["time_ms"]):
             return []
         
-        tf_minutes = {
-            "M1": 1,
-            "M5": 5,
-            "M15": 15,
-            "M30": 30,
-            "H1": 60,
-            "H4": 240,
-            "D": 1440,
-            "W": 10080,
-        }
-        
-        minutes = tf_minutes.get(timeframe.upper(), 1440)
-        
-        candles = {}
-        
-        for tick in ticks:
-            tick_time = datetime.fromisoformat(tick["time"].replace("Z", "+00:00"))
-            
-            if minutes >= 1440:
-                candle_time = tick_time.replace(hour=0, minute=0, second=0, microsecond=0)
-                if minutes >= 10080:
-                    candle_time -= timedelta(days=candle_time.weekday())
-            else:
-                total_minutes = tick_time.hour * 60 + tick_time.minute
-                candle_minutes = (total_minutes // minutes) * minutes
-                candle_time = tick_time.replace(
-                    hour=candle_minutes // 60,
-                    minute=candle_minutes % 60,
-                    second=0,
-                    microsecond=0
-                )
-            
-            key = candle_time.isoformat()
-            price = tick["mid"]
-            
-            if key not in candles:
-                candles[key] = {
-                    "time": candle_time,
-                    "open": price,
-                    "high": price,
-                    "low": price,
-                    "close": price,
-                    "volume": 0,
-                }
-            else:
-                candles[key]["high"] = max(candles[key]["high"], price)
-                candles[key]["low"] = min(candles[key]["low"], price)
-                candles[key]["close"] = price
-                candles[key]["volume"] += 1
-        
-        return sorted(candles.values(), key=lambda x: x["time"])
+        return candles_to_dicts(aggregate_ticks(ticks["time_ms"], ticks["mid"], timeframe))
     
     def get_ohlcv(
         self,
@@ -259,5 +474,5 @@ class DukascopyDownloader:
         Returns:
             List of OHLCV candle dictionaries
         """
-        ticks = self.download_ticks(symbol, start_date, end_date, use_cache)
+        ticks = self.load_ticks(symbol, start_date, end_date, use_cache)
         return self.ticks_to_ohlcv(ticks, timeframe)
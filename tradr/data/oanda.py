@@ -2,12 +2,61 @@
 OANDA API Client for real-time and historical data.
 
 Used for live price feeds and as a backup data source.
+
+All requests share one pooled requests.Session and a per-account token
+bucket, so get_candles_bulk() can fetch many instrument/granularity pairs
+from a thread pool without tripping OANDA's rate limit. get_candles()
+pages transparently past the 5000-candle cap, and incremental fetches only
+ask for candles after the last one already cached.
 """
 
 import os
+import threading
+import time
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
 from datetime import datetime, timezone, timedelta
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
+
+
+MAX_CANDLES_PER_REQUEST = 5000
+
+
+class RateLimiter:
+    """Thread-safe token bucket: `rate` requests per second, bursts up to `burst`."""
+    
+    def __init__(self, rate: float, burst: Optional[int] = None):
+        self.rate = float(rate)
+        self.capacity = float(burst or max(1, int(rate)))
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+# One limiter per OANDA account, shared by every client using it
+_RATE_LIMITERS: Dict[str, RateLimiter] = {}
+_RATE_LIMITERS_LOCK = threading.Lock()
+
+
+def get_rate_limiter(account_key: str, rate: float) -> RateLimiter:
+    with _RATE_LIMITERS_LOCK:
+        limiter = _RATE_LIMITERS.get(account_key)
+        if limiter is None:
+            limiter = _RATE_LIMITERS[account_key] = RateLimiter(rate)
+        return limiter
 
 
 class OandaClient:
@@ -38,15 +87,47 @@ class OandaClient:
         api_key: str = None,
         account_id: str = None,
         practice: bool = True,
+        base_url: str = None,
+        max_workers: int = 8,
+        requests_per_second: float = None,
+        max_retries: int = 3,
     ):
         self.api_key = api_key or os.getenv("OANDA_API_KEY", "")
         self.account_id = account_id or os.getenv("OANDA_ACCOUNT_ID", "")
-        self.base_url = self.PRACTICE_URL if practice else self.LIVE_URL
+        self.base_url = (base_url or (self.PRACTICE_URL if practice else self.LIVE_URL)).rstrip("/")
         
         self.headers = {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json",
         }
+        
+        self.max_workers = max_workers
+        self.max_retries = max_retries
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max(max_workers, 1))
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        
+        rate = requests_per_second or float(os.getenv("OANDA_REQUESTS_PER_SECOND", "50"))
+        self.rate_limiter = get_rate_limiter(self.account_id or self.api_key, rate)
+        
+        # (instrument, granularity) -> complete candles, oldest first
+        self._cache: Dict[Tuple[str, str], List[Dict]] = {}
+        self._cache_lock = threading.Lock()
+    
+    def _get(self, url: str, params: Dict = None, timeout: int = 30) -> requests.Response:
+        """Rate-limited GET on the pooled session; retries 429/5xx with backoff."""
+        for attempt in range(self.max_retries + 1):
+            self.rate_limiter.acquire()
+            response = self.session.get(url, params=params, timeout=timeout)
+            if response.status_code != 429 and response.status_code < 500:
+                return response
+            if attempt == self.max_retries:
+                return response
+            retry_after = response.headers.get("Retry-After")
+            time.sleep(float(retry_after) if retry_after else 0.5 * 2 ** attempt)
+        return response
     
     def _normalize_symbol(self, symbol: str) -> str:
         """Convert symbol format to OANDA format (e.g., EURUSD -> EUR_USD)."""
@@ -60,6 +141,37 @@ class OandaClient:
         
         return symbol
     
+    def _parse_candles(self, data: Dict) -> List[Dict]:
+        candles = []
+        
+        for candle in data.get("candles", []):
+            if not candle.get("complete", True):
+                continue
+            
+            mid = candle.get("mid", {})
+            
+            candles.append({
+                "time": datetime.fromisoformat(candle["time"].replace("Z", "+00:00")),
+                "open": float(mid.get("o", 0)),
+                "high": float(mid.get("h", 0)),
+                "low": float(mid.get("l", 0)),
+                "close": float(mid.get("c", 0)),
+                "volume": int(candle.get("volume", 0)),
+            })
+        
+        return candles
+    
+    def _fetch_page(self, instrument: str, params: Dict) -> Optional[List[Dict]]:
+        """One candles request (at most 5000 candles). None on error."""
+        url = f"{self.base_url}/v3/instruments/{instrument}/candles"
+        response = self._get(url, params=params, timeout=30)
+        
+        if response.status_code != 200:
+            print(f"[OANDA] Error: {response.status_code} - {response.text}")
+            return None
+        
+        return self._parse_candles(response.json())
+    
     def get_candles(
         self,
         symbol: str,
@@ -71,10 +183,13 @@ class OandaClient:
         """
         Get OHLCV candle data from OANDA.
         
+        Requests larger than OANDA's 5000-candle cap are split into pages
+        and stitched together.
+        
         Args:
             symbol: Trading symbol
             granularity: Timeframe (M1, M5, M15, M30, H1, H4, D, W, M)
-            count: Number of candles (max 5000)
+            count: Number of candles (ignored when both from_time and to_time are given)
             from_time: Start time (optional)
             to_time: End time (optional)
             
@@ -87,54 +202,157 @@ class OandaClient:
         instrument = self._normalize_symbol(symbol)
         gran = self.GRANULARITY_MAP.get(granularity.upper(), "D")
         
-        params = {
-            "granularity": gran,
-        }
-        
-        if from_time and to_time:
-            params["from"] = from_time.isoformat()
-            params["to"] = to_time.isoformat()
-        elif from_time:
-            params["from"] = from_time.isoformat()
-            params["count"] = min(count, 5000)
-        elif to_time:
-            params["to"] = to_time.isoformat()
-            params["count"] = min(count, 5000)
-        else:
-            params["count"] = min(count, 5000)
-        
-        url = f"{self.base_url}/v3/instruments/{instrument}/candles"
-        
         try:
-            response = requests.get(url, headers=self.headers, params=params, timeout=30)
+            if from_time:
+                return self._page_forward(instrument, gran, from_time, to_time, None if to_time else count)
+            return self._page_backward(instrument, gran, count, to_time)
+        except Exception as e:
+            print(f"[OANDA] Error fetching candles: {e}")
+            return []
+    
+    def _page_forward(
+        self,
+        instrument: str,
+        gran: str,
+        from_time: datetime,
+        to_time: Optional[datetime],
+        count: Optional[int],
+        include_first: bool = True,
+    ) -> List[Dict]:
+        """Walk forward from from_time until to_time or count candles."""
+        candles: List[Dict] = []
+        cursor = from_time
+        
+        while True:
+            page_size = MAX_CANDLES_PER_REQUEST if count is None else min(count - len(candles), MAX_CANDLES_PER_REQUEST)
+            if page_size <= 0:
+                break
             
-            if response.status_code != 200:
-                print(f"[OANDA] Error: {response.status_code} - {response.text}")
-                return []
+            params = {
+                "granularity": gran,
+                "from": cursor.isoformat(),
+                "count": page_size,
+                "includeFirst": "true" if include_first else "false",
+            }
+            page = self._fetch_page(instrument, params)
+            if not page:
+                break
             
-            data = response.json()
-            candles = []
+            if to_time is not None:
+                page = [c for c in page if c["time"] <= to_time]
+            candles.extend(page)
             
-            for candle in data.get("candles", []):
-                if not candle.get("complete", True):
-                    continue
-                
-                mid = candle.get("mid", {})
-                
-                candles.append({
-                    "time": datetime.fromisoformat(candle["time"].replace("Z", "+00:00")),
-                    "open": float(mid.get("o", 0)),
-                    "high": float(mid.get("h", 0)),
-                    "low": float(mid.get("l", 0)),
-                    "close": float(mid.get("c", 0)),
-                    "volume": int(candle.get("volume", 0)),
-                })
+            if len(page) < page_size or (to_time is not None and page[-1]["time"] >= to_time):
+                break
+            # OANDA drops the incomplete candle, so a full page is always complete
+            cursor = page[-1]["time"]
+            include_first = False
+        
+        return candles
+    
+    def _page_backward(
+        self,
+        instrument: str,
+        gran: str,
+        count: int,
+        to_time: Optional[datetime],
+    ) -> List[Dict]:
+        """Latest `count` candles (ending at to_time), fetched newest page first."""
+        pages: List[List[Dict]] = []
+        remaining = count
+        cursor = to_time
+        
+        while remaining > 0:
+            # Ask for one extra: on the open end OANDA includes the incomplete candle, and
+            # with a cursor the inclusive `to` returns the boundary candle again; both are dropped
+            page_size = min(remaining + 1, MAX_CANDLES_PER_REQUEST)
+            params = {"granularity": gran, "count": page_size}
+            if cursor is not None:
+                params["to"] = cursor.isoformat()
             
-            return candles
+            page = self._fetch_page(instrument, params)
+            if page and cursor is not None:
+                page = [c for c in page if c["time"] < cursor]
+            if not page:
+                break
             
+            pages.append(page)
+            remaining -= len(page)
+            if len(page) < page_size - 1:
+                break
+            cursor = page[0]["time"]
+        
+        candles = [c for page in reversed(pages) for c in page]
+        return candles[-count:] if count else candles
+    
+    def get_candles_incremental(
+        self,
+        symbol: str,
+        granularity: str = "D",
+        count: int = 500,
+    ) -> List[Dict]:
+        """
+        Latest `count` candles, reusing the client's cache.
+        
+        The first call fetches the full window; later calls only request
+        candles after the last cached time and append them.
+        """
+        if not self.api_key:
+            return []
+        
+        instrument = self._normalize_symbol(symbol)
+        gran = self.GRANULARITY_MAP.get(granularity.upper(), "D")
+        key = (instrument, gran)
+        
+        with self._cache_lock:
+            cached = list(self._cache.get(key, []))
+        
+        try:
+            if len(cached) >= count:
+                fresh = self._page_forward(instrument, gran, cached[-1]["time"], None, None, include_first=False)
+                candles = cached + [c for c in fresh if c["time"] > cached[-1]["time"]]
+            else:
+                candles = self._page_backward(instrument, gran, count, None)
         except Exception as e:
             print(f"[OANDA] Error fetching candles: {e}")
-            return []
+            return cached[-count:]
+        
+        candles = candles[-count:]
+        with self._cache_lock:
+            self._cache[key] = candles
+        return list(candles)
+    
+    def get_candles_bulk(
+        self,
+        requests_spec: List[Tuple[str, str, int]],
+        incremental: bool = True,
+        max_workers: int = None,
+    ) -> Dict[Tuple[str, str], List[Dict]]:
+        """
+        Fetch many (symbol, granularity, count) series concurrently.
+        
+        Requests run on a thread pool over the shared session and are
+        throttled by the account's rate limiter.
+        
+        Returns:
+            Dict mapping (symbol, granularity) to candle lists (empty on error)
+        """
+        if not requests_spec:
+            return {}
+        
+        fetch = self.get_candles_incremental if incremental else self.get_candles
+        workers = max(1, min(max_workers or self.max_workers, len(requests_spec)))
+        
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="oanda") as pool:
+            futures = {
+                (symbol, gran): pool.submit(fetch, symbol, gran, count)
+                for symbol, gran, count in requests_spec
+            }
+            return {key: future.result() for key, future in futures.items()}
+    
+    def clear_cache(self):
+        with self._cache_lock:
+            self._cache.clear()
     
     def get_current_price(self, symbol: str) -> Optional[Dict]:
         """
@@ -152,7 +370,7 @@ class OandaClient:
         params = {"instruments": instrument}
         
         try:
-            response = requests.get(url, headers=self.headers, params=params, timeout=10)
+            response = self._get(url, params=params, timeout=10)
             
             if response.status_code != 200:
                 return None
@@ -196,7 +414,7 @@ class OandaClient:
         params = {"instruments": instruments}
         
         try:
-            response = requests.get(url, headers=self.headers, params=params, timeout=10)
+            response = self._get(url, params=params, timeout=10)
             
             if response.status_code != 200:
                 return {}
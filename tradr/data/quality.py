@@ -0,0 +1,115 @@
+"""
+Data-quality checks for OHLCV series, run once when the resample cache is built.
+
+One vectorized pass over a series flags:
+
+    duplicates     repeated timestamps in the source CSV (last row kept)
+    out_of_order   rows whose timestamp is earlier than the previous row
+    flat bars      high == low (zero true range, e.g. placeholder history)
+    invalid bars   high/low not enclosing open/close, or non-positive prices
+    gaps           spacing larger than GAP_THRESHOLD_MS for the timeframe
+
+Per-bar results are kept as two boolean arrays next to the OHLCV arrays:
+
+    bad       the bar is flat or invalid
+    bad_run   the bar is part of a run of at least BAD_RUN_MIN bad bars,
+              i.e. a degenerate stretch rather than a quiet holiday bar
+
+and the summary (counts, gap and bad-range timestamps) is written to a JSON
+sidecar next to the cache, so nothing is re-checked per trial.
+"""
+
+from datetime import datetime, timezone
+from typing import Dict, List
+
+import numpy as np
+
+from tradr.data.ticks import DAY_MS
+
+
+# Largest spacing between consecutive bars that is not reported as a gap
+GAP_THRESHOLD_MS = {
+    "H4": 3 * DAY_MS,
+    "D1": 4 * DAY_MS,
+    "W1": 10 * DAY_MS,
+    "MN": 40 * DAY_MS,
+}
+
+# Consecutive bad bars that form a range to skip
+BAD_RUN_MIN = 3
+
+
+def _iso(time_ms: int) -> str:
+    return datetime.fromtimestamp(time_ms / 1000, tz=timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def raw_time_stats(time_ms: np.ndarray) -> Dict[str, int]:
+    """Row count, duplicate timestamps and out-of-order rows of an unsorted time column."""
+    if time_ms.size == 0:
+        return {"rows": 0, "duplicates": 0, "out_of_order": 0}
+    return {
+        "rows": int(time_ms.size),
+        "duplicates": int(time_ms.size - np.unique(time_ms).size),
+        "out_of_order": int(np.count_nonzero(time_ms[1:] < time_ms[:-1])),
+    }
+
+
+def run_ranges(mask: np.ndarray, min_run: int = 1) -> np.ndarray:
+    """(start, stop) index pairs of True runs at least `min_run` long."""
+    if not mask.any():
+        return np.empty((0, 2), dtype=np.int64)
+    edges = np.diff(np.concatenate(([0], mask.astype(np.int8), [0])))
+    starts = np.flatnonzero(edges == 1)
+    stops = np.flatnonzero(edges == -1)
+    keep = stops - starts >= min_run
+    return np.column_stack((starts[keep], stops[keep]))
+
+
+def flag_bad_bars(series: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+    """`bad` and `bad_run` masks for a sorted OHLCV series."""
+    o, h, l, c = series["open"], series["high"], series["low"], series["close"]
+    with np.errstate(invalid="ignore"):
+        invalid = (
+            (h < np.maximum(o, c))
+            | (l > np.minimum(o, c))
+            | ~(l > 0)
+            | np.isnan(o) | np.isnan(c)
+        )
+    bad = (h == l) | invalid
+
+    bad_run = np.zeros_like(bad)
+    for start, stop in run_ranges(bad, BAD_RUN_MIN):
+        bad_run[start:stop] = True
+    return {"bad": bad, "bad_run": bad_run}
+
+
+def quality_report(series: Dict[str, np.ndarray], timeframe: str) -> Dict:
+    """
+    Summary of a flagged series for the sidecar index.
+
+    Expects the `bad` mask from flag_bad_bars() in `series`.
+    """
+    time_ms = series["time_ms"]
+    report: Dict = {
+        "bars": int(time_ms.size),
+        "flat_bars": int(np.count_nonzero(series["high"] == series["low"])),
+        "bad_bars": int(np.count_nonzero(series["bad"])),
+        "gaps": [],
+        "bad_ranges": [],
+    }
+    if time_ms.size == 0:
+        return report
+
+    report["first_bar"] = _iso(time_ms[0])
+    report["last_bar"] = _iso(time_ms[-1])
+
+    threshold = GAP_THRESHOLD_MS.get(timeframe)
+    if threshold is not None:
+        gap_idx = np.flatnonzero(np.diff(time_ms) > threshold)
+        report["gaps"] = [[_iso(time_ms[i]), _iso(time_ms[i + 1])] for i in gap_idx.tolist()]
+
+    ranges: List = []
+    for start, stop in run_ranges(series["bad"], BAD_RUN_MIN).tolist():
+        ranges.append([_iso(time_ms[start]), _iso(time_ms[stop - 1]), stop - start])
+    report["bad_ranges"] = ranges
+    return report
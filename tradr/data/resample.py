@@ -0,0 +1,605 @@
+"""
+Derived-timeframe resampling for the local OHLCV store (data/ohlcv).
+
+data/ohlcv keeps one CSV per symbol and timeframe (H4, D1, W1, MN), some
+under two naming schemes (AUDCAD_H4_... and AUD_CAD_H4_...). Instead of
+reading all of them, load_symbol_timeframes() reads the finest series
+available for a symbol and derives the higher timeframes from it with a
+vectorized group-by on epoch buckets, so every timeframe is built from the
+same bars.
+
+Buckets follow the session alignment of the base series:
+
+    "ny"   FX/metals broker feed: the trading day starts at 17:00
+           New York time (22:00 UTC in winter, 21:00 UTC in summer,
+           DST-aware). Weeks are Saturday..Friday trading dates (labelled
+           at the Friday 17:00 NY open, like the broker's W1 bars) and
+           months follow the trading date.
+    "utc"  Feeds stamped at UTC midnight that trade every day (crypto):
+           calendar days, Monday weeks and calendar months in UTC.
+    "exchange"
+           UTC-midnight feeds with no Saturday trading (index/metal
+           series): as "utc", but the Sunday evening open is rolled into
+           Monday's bar, as the exchange dates it, and weeks run
+           Saturday..Friday like their W1 files.
+
+Derived bars are labelled at the same point as the native file of their
+timeframe: the bucket open for D1/W1, and for MN either the month open or,
+in most broker files, the last trading date of the month at 00:00 UTC.
+This matters beyond splicing: strategy code slices higher timeframes with
+`bar time <= current time`, so labelling a month-end-dated series at the
+month open would expose the whole month's high/low/close from its first
+day. The label is picked per file by matching the native bars
+(label_mismatches(); BAR_LABELS when there is no native file) and the
+result of the check is stored in the quality sidecar.
+
+Early history in the base file is often sparse (one placeholder bar per
+day). Buckets up to the end of the last sparse stretch, and any span the
+base doesn't cover, are taken from the native CSV for that timeframe.
+
+Derived bars do not match every native file: some native D1/W1 files of
+metals and indices come from a different feed, and native FX MN files
+group D1 bars by the UTC date of their open, so the first NY trading day
+of a month lands in the previous month. parity_report() compares derived
+and native bars at shared timestamps; the result (share of bars off by
+more than PARITY_TOLERANCE) goes to the quality sidecar and is printed
+when it exceeds PARITY_WARN. Set OHLCV_DERIVE_TIMEFRAMES=0 (or pass
+derive=False) to use the native file of every timeframe instead.
+
+The merged arrays for all timeframes of a symbol are cached in one .npz
+next to the CSVs (data/ohlcv/.derived/<SYMBOL>.npz, <SYMBOL>.native.npz
+with derivation off), keyed by the size and mtime of the source files, so
+later runs read a single file per symbol.
+Data-quality checks (tradr.data.quality) run while the cache is built: the
+per-bar `bad`/`bad_run` masks are stored with the arrays and the summary
+goes to a <SYMBOL>.quality.json sidecar.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from tradr.data.quality import flag_bad_bars, quality_report, raw_time_stats
+from tradr.data.ticks import DAY_MS, TIMEFRAME_MS, bucket_start_ms
+
+
+# Finest first; the first timeframe with a CSV becomes the base series
+STORE_TIMEFRAMES = ("H4", "D1", "W1", "MN")
+
+SESSION_TZ = "America/New_York"
+SESSION_OPEN_HOUR = 17
+
+# Bump when bucketing or splicing changes so stale caches are rebuilt
+RESAMPLE_VERSION = 4
+
+# Where a bar is labelled: "open" = bucket open, "end" = last trading date
+# of the bucket at 00:00 UTC (2025-12-31 for December)
+LABEL_POINTS = ("open", "end")
+
+# (session, timeframe) -> label used when there is no native file to match
+BAR_LABELS = {("ny", "MN"): "end"}
+
+# Share of native bars off the derived label grid that gets reported
+LABEL_MISMATCH_WARN = 0.05
+
+# Relative OHLC difference at which a derived bar counts as off its native bar
+PARITY_TOLERANCE = 0.001
+
+# Share of derived bars off their native bar that gets reported
+PARITY_WARN = 0.05
+
+# "0"/"false"/"no" reads every timeframe from its native CSV
+DERIVE_TIMEFRAMES = os.getenv("OHLCV_DERIVE_TIMEFRAMES", "1").strip().lower() not in ("0", "false", "no")
+
+DERIVED_DIRNAME = ".derived"
+
+# Consecutive under-filled buckets that mark a sparse stretch of the base
+SPARSE_RUN = 4
+
+OHLCV_FIELDS = ("open", "high", "low", "close", "volume")
+
+_DATE_COLUMNS = ("time", "timestamp", "date", "Date", "Time")
+
+# 1970-01-03 was a Saturday (origin of the NY-session trading week)
+_SATURDAY_ORIGIN_DAYS = 2
+
+
+def empty_series() -> Dict[str, np.ndarray]:
+    series = {"time_ms": np.empty(0, dtype=np.int64)}
+    series.update({field: np.empty(0) for field in OHLCV_FIELDS})
+    return series
+
+
+def find_ohlcv_csv(data_dir: Path, symbol: str, timeframe: str) -> Optional[Path]:
+    """CSV for a symbol/timeframe, preferring EURUSD_H4_* over EUR_USD_H4_*."""
+    compact = symbol.replace("_", "").replace("/", "").upper()
+    names = [compact]
+    if len(compact) == 6 and compact.isalpha():
+        names.append(f"{compact[:3]}_{compact[3:]}")
+    for name in names:
+        matches = sorted(data_dir.glob(f"{name}_{timeframe}_*.csv"))
+        if matches:
+            return matches[0]
+    return None
+
+
+def read_ohlcv_csv(path: Path, stats: Optional[Dict] = None) -> Dict[str, np.ndarray]:
+    """
+    Read one data/ohlcv CSV into sorted, de-duplicated arrays.
+
+    Accepts the header variants in the store (time/timestamp/date,
+    Open/open, ...). Missing volume becomes zeros. If `stats` is given it
+    receives the row, duplicate and out-of-order counts of the raw file.
+    """
+    df = pd.read_csv(path)
+    date_col = next((c for c in _DATE_COLUMNS if c in df.columns), None)
+    if date_col is None or df.empty:
+        return empty_series()
+
+    times = pd.to_datetime(df[date_col], utc=True).dt.tz_localize(None)
+    series = {"time_ms": times.to_numpy().astype("datetime64[ms]").astype(np.int64)}
+    if stats is not None:
+        stats.update(raw_time_stats(series["time_ms"]))
+    for field in OHLCV_FIELDS:
+        column = next((c for c in (field, field.capitalize()) if c in df.columns), None)
+        if column is None:
+            series[field] = np.zeros(len(df))
+        else:
+            series[field] = df[column].to_numpy(dtype=np.float64)
+
+    order = np.argsort(series["time_ms"], kind="stable")
+    if np.any(order != np.arange(order.size)):
+        series = {key: values[order] for key, values in series.items()}
+    # Keep the last bar for duplicated timestamps
+    keep = np.append(series["time_ms"][1:] != series["time_ms"][:-1], True)
+    if not keep.all():
+        series = {key: values[keep] for key, values in series.items()}
+    return series
+
+
+def detect_session(time_ms: np.ndarray) -> str:
+    """
+    Session alignment of a bar series: "ny", "utc" or "exchange".
+
+    H4 bars of a NY-close feed open at 17, 21, 01, ... New York time; a
+    UTC-midnight feed opens at 00, 04, ... UTC, which never lands there.
+    """
+    if time_ms.size == 0:
+        return "utc"
+    local = pd.to_datetime(time_ms, unit="ms", utc=True).tz_convert(SESSION_TZ)
+    hours = np.asarray(local.hour)
+    on_session_grid = (hours - SESSION_OPEN_HOUR) % 4 == 0
+    if on_session_grid.mean() > 0.5:
+        return "ny"
+    saturdays = (time_ms // DAY_MS + 3) % 7 == 5
+    return "utc" if saturdays.mean() > 0.01 else "exchange"
+
+
+def _day_ms(days: np.ndarray) -> np.ndarray:
+    return days.astype("datetime64[D]").astype("datetime64[ms]").astype(np.int64)
+
+
+def _session_buckets(time_ms: np.ndarray, timeframe: str, label: str = "open") -> Tuple[np.ndarray, np.ndarray]:
+    """(bucket key, bar label in epoch ms) on the NY 17:00 session grid."""
+    local = (
+        pd.to_datetime(time_ms, unit="ms", utc=True)
+        .tz_convert(SESSION_TZ)
+        .tz_localize(None)
+        .to_numpy()
+        .astype("datetime64[ms]")
+    )
+    shift = np.timedelta64(24 - SESSION_OPEN_HOUR, "h")
+    trading_day = (local + shift).astype("datetime64[D]")
+
+    if timeframe == "D1":
+        first_day = trading_day
+        next_day = trading_day + 1
+        keys = trading_day.astype(np.int64)
+    elif timeframe == "W1":
+        days = trading_day.astype(np.int64)
+        keys = (days - _SATURDAY_ORIGIN_DAYS) // 7
+        first_day = (keys * 7 + _SATURDAY_ORIGIN_DAYS).astype("datetime64[D]")
+        next_day = first_day + 7
+    elif timeframe == "MN":
+        months = trading_day.astype("datetime64[M]")
+        first_day = months.astype("datetime64[D]")
+        next_day = (months + 1).astype("datetime64[D]")
+        keys = months.astype(np.int64)
+    else:
+        raise ValueError(f"Unsupported session timeframe: {timeframe}")
+
+    if label == "end":
+        # Last trading date of the bucket at 00:00 UTC (2025-12-31 for December)
+        return keys, _day_ms(next_day - 1)
+
+    open_local = first_day.astype("datetime64[ms]") - shift
+    opens = (
+        pd.DatetimeIndex(open_local)
+        .tz_localize(SESSION_TZ)
+        .tz_convert(None)
+        .to_numpy()
+        .astype("datetime64[ms]")
+        .astype(np.int64)
+    )
+    return keys, opens
+
+
+def bucket_keys(
+    time_ms: np.ndarray,
+    timeframe: str,
+    session: str = "ny",
+    label: Optional[str] = None,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Bucket key and bar label (epoch ms) for each bar.
+
+    Keys are monotonic in time; bars with equal keys form one candle.
+    `label` is one of LABEL_POINTS, defaulting to BAR_LABELS.
+    """
+    timeframe = {"D": "D1", "W": "W1", "M": "MN"}.get(timeframe, timeframe)
+    if label is None:
+        label = BAR_LABELS.get((session, timeframe), "open")
+    if session == "ny" and timeframe in ("D1", "W1", "MN"):
+        return _session_buckets(time_ms, timeframe, label)
+    if session == "exchange":
+        days = time_ms // DAY_MS
+        # 1970-01-01 was a Thursday: (days + 3) % 7 == 6 is Sunday
+        days = days + ((days + 3) % 7 == 6)
+        if timeframe == "W1":
+            starts = ((days - _SATURDAY_ORIGIN_DAYS) // 7 * 7 + _SATURDAY_ORIGIN_DAYS) * DAY_MS
+            return starts, (starts + 6 * DAY_MS if label == "end" else starts)
+        time_ms = days * DAY_MS
+    opens = bucket_start_ms(time_ms, timeframe)
+    if label == "end":
+        # Day before the next bucket opens
+        width = 32 * DAY_MS if timeframe == "MN" else TIMEFRAME_MS[timeframe]
+        return opens, bucket_start_ms(opens + width, timeframe) - DAY_MS
+    return opens, opens
+
+
+def resample_ohlcv(
+    series: Dict[str, np.ndarray],
+    timeframe: str,
+    session: str = "ny",
+    label: Optional[str] = None,
+) -> Tuple[Dict[str, np.ndarray], np.ndarray]:
+    """
+    Aggregate sorted OHLCV arrays into a higher timeframe.
+
+    Returns:
+        (candles, bars_per_candle) - candles as arrays keyed like the
+        input, time_ms being each bucket's label (see bucket_keys)
+    """
+    time_ms = series["time_ms"]
+    if time_ms.size == 0:
+        return empty_series(), np.empty(0, dtype=np.int64)
+
+    keys, labels = bucket_keys(time_ms, timeframe, session, label)
+    starts = np.flatnonzero(np.concatenate(([True], keys[1:] != keys[:-1])))
+    ends = np.append(starts[1:], time_ms.size)
+
+    candles = {
+        "time_ms": labels[starts],
+        "open": series["open"][starts],
+        "high": np.maximum.reduceat(series["high"], starts),
+        "low": np.minimum.reduceat(series["low"], starts),
+        "close": series["close"][ends - 1],
+        "volume": np.add.reduceat(series["volume"], starts),
+    }
+    return candles, ends - starts
+
+
+def dense_start(bars_per_candle: np.ndarray) -> int:
+    """
+    Index of the first candle after the base series' last sparse stretch.
+
+    A candle is under-filled when it holds less than half the median bar
+    count; SPARSE_RUN of them in a row (not a holiday) mark the base as
+    unusable up to that point. Leading under-filled candles after it
+    (a partial first week/month) are skipped too.
+    """
+    if bars_per_candle.size == 0:
+        return 0
+    sparse = bars_per_candle < 0.5 * np.median(bars_per_candle)
+    start = 0
+    run = 0
+    for i, flag in enumerate(sparse):
+        run = run + 1 if flag else 0
+        if run >= SPARSE_RUN:
+            start = i + 1
+    while start < sparse.size and sparse[start]:
+        start += 1
+    return start
+
+
+def label_mismatches(native: Dict[str, np.ndarray], derived: Dict[str, np.ndarray]) -> Dict:
+    """
+    Native bars inside the derived span whose timestamp is not a derived label.
+
+    Non-zero means derived and native bars of a timeframe are labelled at
+    different points of the bucket (e.g. month open vs. month end), which
+    both breaks the splice and shifts what strategy slicing can see.
+    """
+    native_ms, derived_ms = native["time_ms"], derived["time_ms"]
+    if native_ms.size == 0 or derived_ms.size == 0:
+        return {"checked": 0, "mismatched": 0}
+    inside = native_ms[(native_ms >= derived_ms[0]) & (native_ms <= derived_ms[-1])]
+    mismatched = inside[~np.isin(inside, derived_ms)]
+    report = {"checked": int(inside.size), "mismatched": int(mismatched.size)}
+    if mismatched.size:
+        report["first_mismatch"] = str(np.datetime64(int(mismatched[0]), "ms"))
+    return report
+
+
+def parity_report(native: Dict[str, np.ndarray], derived: Dict[str, np.ndarray]) -> Dict:
+    """
+    OHLC agreement of derived and native bars at their shared timestamps.
+
+    The deviation of a bar is the largest relative difference over
+    open/high/low/close.
+    """
+    common, native_idx, derived_idx = np.intersect1d(
+        native["time_ms"], derived["time_ms"], assume_unique=True, return_indices=True
+    )
+    if common.size == 0:
+        return {"compared": 0, "off": 0}
+    deviation = np.max([
+        np.abs(derived[key][derived_idx] - native[key][native_idx])
+        / np.maximum(np.abs(native[key][native_idx]), 1e-12)
+        for key in ("open", "high", "low", "close")
+    ], axis=0)
+    off = deviation > PARITY_TOLERANCE
+    report = {
+        "compared": int(common.size),
+        "off": int(off.sum()),
+        "median_dev": float(np.median(deviation)),
+        "p95_dev": float(np.percentile(deviation, 95)),
+        "max_dev": float(deviation.max()),
+    }
+    if off.any():
+        report["first_off"] = str(np.datetime64(int(common[off][0]), "ms"))
+    return report
+
+
+def _resample_like_native(
+    base: Dict[str, np.ndarray],
+    native: Dict[str, np.ndarray],
+    timeframe: str,
+    session: str,
+) -> Tuple[Dict[str, np.ndarray], np.ndarray, Dict]:
+    """
+    Derive a timeframe labelled at the same point as its native file.
+
+    The native files of one timeframe don't agree (most broker MN files
+    are dated at the month end, a few at the month open), so each LABEL_POINTS
+    candidate is tried and the one matching most native bars is kept.
+
+    Returns:
+        (candles, bars_per_candle, label check incl. the chosen label)
+    """
+    default = BAR_LABELS.get((session, timeframe), "open")
+    derived, counts = resample_ohlcv(base, timeframe, session, default)
+    check = label_mismatches(native, derived)
+    check["label"] = default
+    for label in LABEL_POINTS:
+        if not check["mismatched"]:
+            break
+        if label == default:
+            continue
+        candles, bars = resample_ohlcv(base, timeframe, session, label)
+        other = label_mismatches(native, candles)
+        if other["mismatched"] < check["mismatched"]:
+            derived, counts, check = candles, bars, {**other, "label": label}
+    return derived, counts, check
+
+
+def splice(native: Dict[str, np.ndarray], derived: Dict[str, np.ndarray], start: int) -> Dict[str, np.ndarray]:
+    """
+    Native bars before derived[start], derived bars from there on.
+
+    The first dense candle is replaced by native data too, since the base
+    may only cover part of it. Without earlier native history the derived
+    series is kept whole.
+    """
+    size = derived["time_ms"].size
+    if size == 0:
+        return native
+    if native["time_ms"].size == 0:
+        return derived
+    if start < size and native["time_ms"][0] >= derived["time_ms"][start]:
+        return derived
+    start += 1
+    if start >= size:
+        return native
+    head = native["time_ms"] < derived["time_ms"][start]
+    return {key: np.concatenate((native[key][head], derived[key][start:])) for key in derived}
+
+
+def _source_stamp(paths: Dict[str, Path]) -> str:
+    stamp = {"version": RESAMPLE_VERSION}
+    for tf, path in sorted(paths.items()):
+        stat = path.stat()
+        stamp[tf] = [path.name, stat.st_size, stat.st_mtime_ns]
+    return json.dumps(stamp, sort_keys=True)
+
+
+def _cache_path(data_dir: Path, symbol: str, derive: bool = True) -> Path:
+    return data_dir / DERIVED_DIRNAME / (f"{symbol}.npz" if derive else f"{symbol}.native.npz")
+
+
+def _index_path(data_dir: Path, symbol: str, derive: bool = True) -> Path:
+    return data_dir / DERIVED_DIRNAME / (f"{symbol}.quality.json" if derive else f"{symbol}.native.quality.json")
+
+
+def _read_cache(path: Path, stamp: str) -> Optional[Dict[str, Dict[str, np.ndarray]]]:
+    if not path.exists():
+        return None
+    try:
+        with np.load(path, allow_pickle=False) as data:
+            if str(data["stamp"]) != stamp:
+                return None
+            result: Dict[str, Dict[str, np.ndarray]] = {}
+            for name in data.files:
+                if name == "stamp":
+                    continue
+                tf, key = name.split("__", 1)
+                result.setdefault(tf, {})[key] = data[name]
+            return result
+    except Exception:
+        return None
+
+
+def _write_cache(path: Path, index_path: Path, stamp: str, result: Dict[str, Dict[str, np.ndarray]], index: Dict):
+    arrays = {f"{tf}__{key}": values for tf, series in result.items() for key, values in series.items()}
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Sidecar first: a cache hit implies its index is current
+        tmp = index_path.with_name(index_path.name + ".part")
+        with open(tmp, "w") as f:
+            json.dump({"stamp": json.loads(stamp), **index}, f, indent=2)
+        os.replace(tmp, index_path)
+
+        tmp = path.with_name(path.name + ".part")
+        with open(tmp, "wb") as f:
+            np.savez(f, stamp=np.array(stamp), **arrays)
+        os.replace(tmp, path)
+    except OSError as e:
+        print(f"[resample] Could not write {path}: {e}")
+
+
+def build_symbol_timeframes(
+    paths: Dict[str, Path],
+    timeframes: Tuple[str, ...] = STORE_TIMEFRAMES,
+    derive: bool = True,
+) -> Tuple[Dict[str, Dict[str, np.ndarray]], Dict]:
+    """
+    Derive every timeframe from the finest CSV in `paths`, splicing native history.
+
+    With derive=False every timeframe is read from its own CSV.
+
+    Returns:
+        (series per timeframe with `bad`/`bad_run` masks, quality index)
+    """
+    base_tf = next((tf for tf in STORE_TIMEFRAMES if tf in paths), None)
+    if base_tf is None:
+        return {}, {}
+
+    files: Dict[str, Dict] = {}
+
+    def read(tf: str) -> Dict[str, np.ndarray]:
+        stats: Dict = {}
+        series = read_ohlcv_csv(paths[tf], stats)
+        files[paths[tf].name] = stats
+        return series
+
+    base = read(base_tf)
+    session = detect_session(base["time_ms"])
+    result = {base_tf: base}
+    sources = {base_tf: [paths[base_tf].name]}
+    labels: Dict[str, Dict] = {}
+    parity: Dict[str, Dict] = {}
+    base_rank = STORE_TIMEFRAMES.index(base_tf)
+
+    for tf in timeframes:
+        if tf == base_tf:
+            continue
+        if not derive or tf not in STORE_TIMEFRAMES or STORE_TIMEFRAMES.index(tf) < base_rank:
+            if tf in paths:
+                result[tf] = read(tf)
+                sources[tf] = [paths[tf].name]
+            continue
+        native = read(tf) if tf in paths else empty_series()
+        derived, counts, labels[tf] = _resample_like_native(base, native, tf, session)
+        check = labels[tf]
+        if check["mismatched"] > LABEL_MISMATCH_WARN * check["checked"]:
+            print(
+                f"[resample] {paths[tf].name}: {check['mismatched']}/{check['checked']} bars "
+                f"off the derived {check['label']}-labelled grid (first {check['first_mismatch']})"
+            )
+        start = dense_start(counts)
+        if tf in paths:
+            # Only the derived part of the spliced series (see splice())
+            parity[tf] = parity_report(native, {key: values[start + 1:] for key, values in derived.items()})
+            if parity[tf]["off"] > PARITY_WARN * parity[tf]["compared"]:
+                print(
+                    f"[resample] {paths[tf].name}: {parity[tf]['off']}/{parity[tf]['compared']} derived bars "
+                    f"differ from native by more than {PARITY_TOLERANCE:.1%} "
+                    f"(max {parity[tf]['max_dev']:.2%}, first {parity[tf]['first_off']})"
+                )
+        result[tf] = splice(native, derived, start)
+        sources[tf] = [paths[base_tf].name] + ([paths[tf].name] if tf in paths else [])
+
+    reports = {}
+    for tf, series in result.items():
+        series.update(flag_bad_bars(series))
+        reports[tf] = {"sources": sources[tf], **quality_report(series, tf)}
+        if tf in labels:
+            reports[tf]["labels"] = labels[tf]
+        if tf in parity:
+            reports[tf]["parity"] = parity[tf]
+
+    index = {"session": session, "base": base_tf, "derived": derive, "files": files, "timeframes": reports}
+    return result, index
+
+
+def load_symbol_timeframes(
+    symbol: str,
+    data_dir: Path = Path("data/ohlcv"),
+    timeframes: Tuple[str, ...] = STORE_TIMEFRAMES,
+    use_cache: bool = True,
+    derive: Optional[bool] = None,
+) -> Dict[str, Dict[str, np.ndarray]]:
+    """
+    All timeframes for a symbol as arrays (time_ms, open, high, low, close, volume).
+
+    Args:
+        symbol: Any alias (EUR_USD, EURUSD)
+        data_dir: Directory holding the OHLCV CSVs
+        timeframes: Timeframes to return
+        use_cache: Read/write data_dir/.derived/<SYMBOL>.npz
+        derive: Build higher timeframes from the finest CSV (default
+            DERIVE_TIMEFRAMES); False reads each timeframe's native CSV
+
+    Returns:
+        Dict timeframe -> arrays, including the `bad`/`bad_run` quality
+        masks; timeframes with no data are left out
+    """
+    data_dir = Path(data_dir)
+    compact = symbol.replace("_", "").replace("/", "").upper()
+    paths = {}
+    for tf in STORE_TIMEFRAMES:
+        path = find_ohlcv_csv(data_dir, compact, tf)
+        if path is not None:
+            paths[tf] = path
+    if not paths:
+        return {}
+
+    if derive is None:
+        derive = DERIVE_TIMEFRAMES
+    stamp = _source_stamp(paths)
+    cache_path = _cache_path(data_dir, compact, derive)
+    result = _read_cache(cache_path, stamp) if use_cache else None
+    if result is None:
+        result, index = build_symbol_timeframes(paths, derive=derive)
+        if use_cache:
+            _write_cache(cache_path, _index_path(data_dir, compact, derive), stamp, result, index)
+
+    return {tf: result[tf] for tf in timeframes if tf in result and result[tf]["time_ms"].size}
+
+
+def load_quality_index(
+    symbol: str,
+    data_dir: Path = Path("data/ohlcv"),
+    derive: Optional[bool] = None,
+) -> Optional[Dict]:
+    """Quality sidecar written with the symbol's cache (None if not built yet)."""
+    compact = symbol.replace("_", "").replace("/", "").upper()
+    path = _index_path(Path(data_dir), compact, DERIVE_TIMEFRAMES if derive is None else derive)
+    if not path.exists():
+        return None
+    with open(path) as f:
+        return json.load(f)
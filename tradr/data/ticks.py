@@ -0,0 +1,208 @@
+"""
+Vectorized tick decoding and tick -> OHLCV aggregation.
+
+Ticks are held as parallel NumPy arrays keyed by field name:
+
+    time_ms   int64 epoch milliseconds (UTC)
+    bid, ask  float64 prices
+    mid       (bid + ask) / 2
+
+decode_bi5() turns one Dukascopy hour file into such arrays with a single
+np.frombuffer over a big-endian record dtype, and aggregate_ticks() buckets
+any timeframe on integer epoch-ms and builds OHLC with ufunc.reduceat, so a
+year of ticks becomes candles without a Python-level loop.
+
+Shared by DukascopyDownloader and scripts/download_dukascopy_data.py.
+"""
+
+import lzma
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+import numpy as np
+
+
+# Dukascopy .bi5 record: ms-in-hour, ask, bid (integer points), ask/bid volume
+BI5_DTYPE = np.dtype([
+    ("ms", ">u4"),
+    ("ask", ">u4"),
+    ("bid", ">u4"),
+    ("ask_volume", ">f4"),
+    ("bid_volume", ">f4"),
+])
+
+MINUTE_MS = 60_000
+DAY_MS = 1440 * MINUTE_MS
+
+# Fixed-width timeframes in milliseconds (MN is calendar-based)
+TIMEFRAME_MS = {
+    "M1": MINUTE_MS,
+    "M5": 5 * MINUTE_MS,
+    "M15": 15 * MINUTE_MS,
+    "M30": 30 * MINUTE_MS,
+    "H1": 60 * MINUTE_MS,
+    "H4": 240 * MINUTE_MS,
+    "D": DAY_MS,
+    "D1": DAY_MS,
+    "W": 7 * DAY_MS,
+    "W1": 7 * DAY_MS,
+}
+
+# 1970-01-01 was a Thursday; weeks start on Monday 1970-01-05
+_WEEK_ORIGIN_MS = 4 * DAY_MS
+
+
+def point_size(symbol: str) -> float:
+    """Dukascopy integer price scale."""
+    return 0.001 if "JPY" in symbol.upper() else 0.00001
+
+
+def empty_ticks() -> Dict[str, np.ndarray]:
+    return {
+        "time_ms": np.empty(0, dtype=np.int64),
+        "bid": np.empty(0),
+        "ask": np.empty(0),
+        "mid": np.empty(0),
+        "ask_volume": np.empty(0, dtype=np.float32),
+        "bid_volume": np.empty(0, dtype=np.float32),
+    }
+
+
+def decode_bi5(data: bytes, symbol: str, hour_start_ms: int = 0) -> Dict[str, np.ndarray]:
+    """
+    Decode an LZMA-compressed .bi5 hour file into tick arrays.
+
+    Args:
+        data: Raw .bi5 bytes
+        symbol: Symbol (selects the price scale)
+        hour_start_ms: Epoch ms of the hour start, added to the record offsets
+
+    Returns:
+        Dict of tick arrays (empty arrays on undecodable input)
+    """
+    if not data:
+        return empty_ticks()
+    try:
+        raw = lzma.decompress(data)
+    except Exception:
+        return empty_ticks()
+
+    usable = len(raw) - len(raw) % BI5_DTYPE.itemsize
+    records = np.frombuffer(raw, dtype=BI5_DTYPE, count=usable // BI5_DTYPE.itemsize)
+    point = point_size(symbol)
+    bid = records["bid"].astype(np.float64) * point
+    ask = records["ask"].astype(np.float64) * point
+    return {
+        "time_ms": records["ms"].astype(np.int64) + hour_start_ms,
+        "bid": bid,
+        "ask": ask,
+        "mid": (bid + ask) / 2,
+        "ask_volume": records["ask_volume"].astype(np.float32),
+        "bid_volume": records["bid_volume"].astype(np.float32),
+    }
+
+
+def concat_ticks(chunks: List[Dict[str, np.ndarray]]) -> Dict[str, np.ndarray]:
+    chunks = [c for c in chunks if len(c["time_ms"])]
+    if not chunks:
+        return empty_ticks()
+    return {key: np.concatenate([c[key] for c in chunks]) for key in chunks[0]}
+
+
+def ticks_from_dicts(ticks: List[Dict]) -> Dict[str, np.ndarray]:
+    """Convert legacy tick dicts (ISO `time`, `bid`, `ask`, `mid`) to arrays."""
+    if not ticks:
+        return empty_ticks()
+    times = np.array(
+        [t["time"].replace("Z", "").replace("+00:00", "") for t in ticks],
+        dtype="datetime64[ms]",
+    ).astype(np.int64)
+    bid = np.fromiter((t.get("bid", 0.0) for t in ticks), dtype=np.float64, count=len(ticks))
+    ask = np.fromiter((t.get("ask", 0.0) for t in ticks), dtype=np.float64, count=len(ticks))
+    mid = np.fromiter((t.get("mid", (t.get("bid", 0.0) + t.get("ask", 0.0)) / 2) for t in ticks),
+                      dtype=np.float64, count=len(ticks))
+    return {
+        "time_ms": times,
+        "bid": bid,
+        "ask": ask,
+        "mid": mid,
+        "ask_volume": np.fromiter((t.get("ask_volume", 0.0) for t in ticks), dtype=np.float32, count=len(ticks)),
+        "bid_volume": np.fromiter((t.get("bid_volume", 0.0) for t in ticks), dtype=np.float32, count=len(ticks)),
+    }
+
+
+def bucket_start_ms(time_ms: np.ndarray, timeframe: str) -> np.ndarray:
+    """Start (epoch ms) of the candle each timestamp falls in."""
+    tf = timeframe.upper()
+    if tf in ("MN", "M"):
+        months = time_ms.astype("datetime64[ms]").astype("datetime64[M]")
+        return months.astype("datetime64[ms]").astype(np.int64)
+    if tf not in TIMEFRAME_MS:
+        raise ValueError(f"Unsupported timeframe: {timeframe}")
+    width = TIMEFRAME_MS[tf]
+    if tf in ("W", "W1"):
+        return (time_ms - _WEEK_ORIGIN_MS) // width * width + _WEEK_ORIGIN_MS
+    return time_ms // width * width
+
+
+def aggregate_ticks(
+    time_ms: np.ndarray,
+    price: np.ndarray,
+    timeframe: str = "D",
+) -> Dict[str, np.ndarray]:
+    """
+    Aggregate a tick price series into OHLCV candles.
+
+    Args:
+        time_ms: Tick times in epoch ms (sorted or not)
+        price: Tick prices (usually mid)
+        timeframe: M1, M5, M15, M30, H1, H4, D/D1, W/W1 or MN
+
+    Returns:
+        Dict of arrays: time_ms (candle start), open, high, low, close,
+        volume (tick count)
+    """
+    time_ms = np.asarray(time_ms, dtype=np.int64)
+    price = np.asarray(price, dtype=np.float64)
+    if time_ms.size == 0:
+        return {
+            "time_ms": np.empty(0, dtype=np.int64),
+            "open": np.empty(0), "high": np.empty(0), "low": np.empty(0), "close": np.empty(0),
+            "volume": np.empty(0, dtype=np.int64),
+        }
+
+    if np.any(time_ms[1:] < time_ms[:-1]):
+        order = np.argsort(time_ms, kind="stable")
+        time_ms, price = time_ms[order], price[order]
+
+    buckets = bucket_start_ms(time_ms, timeframe)
+    starts = np.flatnonzero(np.concatenate(([True], buckets[1:] != buckets[:-1])))
+    ends = np.append(starts[1:], time_ms.size)
+
+    return {
+        "time_ms": buckets[starts],
+        "open": price[starts],
+        "high": np.maximum.reduceat(price, starts),
+        "low": np.minimum.reduceat(price, starts),
+        "close": price[ends - 1],
+        "volume": ends - starts,
+    }
+
+
+def candles_to_dicts(candles: Dict[str, np.ndarray], tz: Optional[timezone] = timezone.utc) -> List[Dict]:
+    """Convert aggregate_ticks() output to the repo's candle dicts."""
+    times = candles["time_ms"].tolist()
+    opens, highs = candles["open"].tolist(), candles["high"].tolist()
+    lows, closes = candles["low"].tolist(), candles["close"].tolist()
+    volumes = candles["volume"].tolist()
+    return [
+        {
+            "time": datetime.fromtimestamp(t / 1000, tz=tz),
+            "open": o,
+            "high": h,
+            "low": l,
+            "close": c,
+            "volume": v,
+        }
+        for t, o, h, l, c, v in zip(times, opens, highs, lows, closes, volumes)
+    ]
@@ -0,0 +1,12 @@
+"""
+Live-bot helpers that run outside the bot process.
+
+Contains:
+- Scan worker: confluence evaluation run in the scan pool's worker processes
+"""
+
+from tradr.live.scan_worker import evaluate_symbol_confluence
+
+__all__ = [
+    "evaluate_symbol_confluence",
+]
@@ -0,0 +1,95 @@
+"""
+Confluence evaluation for the live bot's scan worker pool.
+
+main_live_bot submits evaluate_symbol_confluence() to a ProcessPoolExecutor.
+On Windows (the only platform MT5 runs on) workers start with spawn and
+import the module that defines the submitted function, so it lives here
+rather than in main_live_bot: a worker only imports the strategy code and
+config, never MetaTrader5, the simulator or the bot's file logging (several
+processes rotating logs/tradr_live.log fails on Windows).
+"""
+
+from typing import Dict, List
+
+from strategy_core import (
+    StrategyParams,
+    compute_confluence,
+    _infer_trend,
+    _pick_direction_from_bias,
+)
+from ftmo_config import FIVEERS_CONFIG
+
+try:
+    from historical_sr import get_all_htf_sr_levels
+    HISTORICAL_SR_AVAILABLE = True
+except ImportError:
+    HISTORICAL_SR_AVAILABLE = False
+    def get_all_htf_sr_levels(symbol):
+        return {'monthly': [], 'weekly': []}
+
+# Load MIN_CONFLUENCE from params loader (single source of truth)
+try:
+    from params.params_loader import get_min_confluence
+    MIN_CONFLUENCE = get_min_confluence()
+except Exception:
+    MIN_CONFLUENCE = 5  # Fallback if params not available
+
+
+def evaluate_symbol_confluence(symbol: str, data: Dict[str, List[Dict]], params: StrategyParams) -> Dict:
+    """
+    CPU-only part of a symbol scan: HTF trends, direction and confluence.
+    
+    Free of MT5/bot state so the scan pipeline can run it in a worker process.
+    """
+    monthly_candles = data["monthly"] if data["monthly"] else []
+    weekly_candles = data["weekly"]
+    daily_candles = data["daily"]
+    h4_candles = data["h4"] if data["h4"] else daily_candles[-20:]
+    
+    mn_trend = _infer_trend(monthly_candles) if monthly_candles else "mixed"
+    wk_trend = _infer_trend(weekly_candles) if weekly_candles else "mixed"
+    d_trend = _infer_trend(daily_candles) if daily_candles else "mixed"
+    
+    direction, _, _ = _pick_direction_from_bias(mn_trend, wk_trend, d_trend)
+    
+    historical_sr = get_all_htf_sr_levels(symbol) if HISTORICAL_SR_AVAILABLE else None
+    
+    flags, notes, trade_levels = compute_confluence(
+        monthly_candles,
+        weekly_candles,
+        daily_candles,
+        h4_candles,
+        direction,
+        params,
+        historical_sr,
+    )
+    
+    confluence_score = sum(1 for v in flags.values() if v)
+    
+    has_location = flags.get("location", False)
+    has_fib = flags.get("fib", False)
+    has_liquidity = flags.get("liquidity", False)
+    has_structure = flags.get("structure", False)
+    has_htf_bias = flags.get("htf_bias", False)
+    
+    # EXACT same quality factor calculation as backtest_live_bot.py
+    quality_factors = sum([has_location, has_fib, has_liquidity, has_structure, has_htf_bias])
+    
+    # BUGFIX: Removed has_rr gate - it was preventing all trades from being active
+    # If confluence and quality are sufficient, R:R is implicitly validated
+    if confluence_score >= MIN_CONFLUENCE and quality_factors >= FIVEERS_CONFIG.min_quality_factors:
+        status = "active"
+    elif confluence_score >= MIN_CONFLUENCE:
+        status = "watching"
+    else:
+        status = "scan_only"
+    
+    return {
+        "direction": direction,
+        "flags": flags,
+        "notes": notes,
+        "trade_levels": trade_levels,
+        "confluence_score": confluence_score,
+        "quality_factors": quality_factors,
+        "status": status,
+    }
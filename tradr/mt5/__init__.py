@@ -4,12 +4,34 @@ MT5 Integration module.
 Contains:
 - MT5 Bridge client (for connecting from Replit to Windows VM)
 - MT5 Direct client (for running directly on Windows VM with MT5)
+- Incremental candle cache used by the live bot
+- Bar-close scan scheduler used by the live bot
+- Per-iteration broker state snapshot used by the live bot
+- Tick-file replay stand-in for offline testing
+- Offline MT5 simulator replaying the bundled OHLCV data
 """
 
 from tradr.mt5.client import MT5Client
 from tradr.mt5.bridge_client import MT5BridgeClient
+from tradr.mt5.candle_cache import CandleCache
+from tradr.mt5.bar_scheduler import BarCloseScheduler
+from tradr.mt5.snapshot import BrokerSnapshot
+from tradr.mt5.tick_replay import TickReplayClient
 
 __all__ = [
     "MT5Client",
     "MT5BridgeClient",
+    "CandleCache",
+    "BarCloseScheduler",
+    "BrokerSnapshot",
+    "TickReplayClient",
+    "SimulatedMT5Client",
 ]
+
+
+def __getattr__(name):
+    # The simulator pulls in pandas; only load it when it is asked for
+    if name == "SimulatedMT5Client":
+        from tradr.mt5.simulator import SimulatedMT5Client
+        return SimulatedMT5Client
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,171 @@
+"""
+Bar-close scan scheduler for the live bot.
+
+Instead of rescanning every symbol on a fixed timer, the scheduler tracks
+the open time of the latest bar per (symbol, timeframe) and only asks MT5
+for fresh bars once the current bar is due to close. Symbols whose entry
+or confirmation timeframe produced a new closed bar are reported back so
+the bot can re-evaluate just those.
+
+MT5 stamps bars in broker server time. The server offset is learned from
+tick times so due times can be compared against the local UTC clock.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+
+TIMEFRAME_PERIODS = {
+    "M15": timedelta(minutes=15),
+    "M30": timedelta(minutes=30),
+    "H1": timedelta(hours=1),
+    "H4": timedelta(hours=4),
+    "D1": timedelta(days=1),
+}
+
+
+@dataclass
+class _BarState:
+    last_open: datetime
+    next_check: datetime
+
+
+class BarCloseScheduler:
+    """
+    Watches for newly closed bars on a set of timeframes.
+
+    Between bar closes poll() makes no MT5 calls. When a bar is due, one
+    small get_ohlcv(symbol, tf, 2) request confirms whether a new bar has
+    opened; if not (quiet market, holiday, feed lag) the check is retried
+    after `retry_seconds`. Symbols in `always_open` trade 24/7; all others
+    are not polled over the weekend (broker server time). `clock` supplies
+    the current UTC time (defaults to the wall clock; the offline simulator
+    passes its own).
+    """
+
+    def __init__(
+        self,
+        client,
+        timeframes: Iterable[str] = ("D1", "H4"),
+        always_open: Optional[Iterable[str]] = None,
+        retry_seconds: int = 60,
+        offset_refresh_hours: int = 6,
+        clock: Optional[Callable[[], datetime]] = None,
+    ):
+        self.client = client
+        self._clock = clock or (lambda: datetime.now(timezone.utc))
+        self.timeframes = [tf.upper() for tf in timeframes]
+        for tf in self.timeframes:
+            if tf not in TIMEFRAME_PERIODS:
+                raise ValueError(f"Unsupported scheduler timeframe: {tf}")
+        self.always_open: Set[str] = set(always_open or [])
+        self.retry = timedelta(seconds=retry_seconds)
+        self.offset_refresh = timedelta(hours=offset_refresh_hours)
+        self.server_offset = timedelta(0)
+        self._offset_learned_at: Optional[datetime] = None
+        self._state: Dict[Tuple[str, str], _BarState] = {}
+
+    def server_now(self, now: Optional[datetime] = None) -> datetime:
+        """Current time on the broker's clock (tz-aware, labelled UTC like bar times)."""
+        return (now or self._clock()) + self.server_offset
+
+    def learn_server_offset(self, broker_symbol: str, now: Optional[datetime] = None) -> None:
+        """Estimate the server-time offset from a live tick, rounded to 15 minutes."""
+        now = now or self._clock()
+        tick = self.client.get_tick(broker_symbol)
+        self._offset_learned_at = now
+        if tick is None or tick.time is None:
+            return
+        quarter = 15 * 60
+        seconds = (tick.time - now).total_seconds()
+        if abs(seconds) > 14 * 3600:
+            # Stale tick (market closed); keep the previous estimate
+            return
+        self.server_offset = timedelta(seconds=round(seconds / quarter) * quarter)
+
+    def is_market_open(self, symbol: str, server_time: datetime) -> bool:
+        """Weekend check in server time; 24/7 symbols are always open."""
+        if symbol in self.always_open:
+            return True
+        return server_time.weekday() < 5
+
+    def prime(self, symbols: Dict[str, str], now: Optional[datetime] = None) -> None:
+        """
+        Record the current bar for every symbol without reporting it.
+
+        Args:
+            symbols: Mapping of our symbol -> broker symbol
+        """
+        now = now or self._clock()
+        if symbols and self._offset_learned_at is None:
+            self.learn_server_offset(next(iter(symbols.values())), now)
+        for symbol, broker_symbol in symbols.items():
+            for tf in self.timeframes:
+                last_open = self._latest_open(broker_symbol, tf)
+                if last_open is not None:
+                    self._track(symbol, tf, last_open)
+
+    def poll(self, symbols: Dict[str, str], now: Optional[datetime] = None) -> List[str]:
+        """
+        Return the symbols that have a newly closed bar on any watched timeframe.
+
+        Args:
+            symbols: Mapping of our symbol -> broker symbol
+            now: Current UTC time (defaults to the wall clock)
+        """
+        now = now or self._clock()
+        if symbols and (
+            self._offset_learned_at is None
+            or now - self._offset_learned_at >= self.offset_refresh
+        ):
+            self.learn_server_offset(next(iter(symbols.values())), now)
+        server_time = self.server_now(now)
+
+        due: List[str] = []
+        for symbol, broker_symbol in symbols.items():
+            closed = False
+            for tf in self.timeframes:
+                state = self._state.get((symbol, tf))
+                if state is not None and server_time < state.next_check:
+                    continue
+                if not self.is_market_open(symbol, server_time):
+                    if state is not None:
+                        state.next_check = server_time + self.retry
+                    continue
+
+                last_open = self._latest_open(broker_symbol, tf)
+                if last_open is None:
+                    if state is not None:
+                        state.next_check = server_time + self.retry
+                    continue
+                if state is None:
+                    # Newly added symbol: start tracking and evaluate it once
+                    self._track(symbol, tf, last_open)
+                    closed = True
+                elif last_open > state.last_open:
+                    self._track(symbol, tf, last_open)
+                    closed = True
+                else:
+                    state.next_check = server_time + self.retry
+            if closed:
+                due.append(symbol)
+        return due
+
+    def next_due(self) -> Optional[datetime]:
+        """Earliest pending check, in UTC (None when nothing is tracked)."""
+        if not self._state:
+            return None
+        return min(s.next_check for s in self._state.values()) - self.server_offset
+
+    def _track(self, symbol: str, tf: str, last_open: datetime) -> None:
+        self._state[(symbol, tf)] = _BarState(
+            last_open=last_open,
+            next_check=last_open + TIMEFRAME_PERIODS[tf],
+        )
+
+    def _latest_open(self, broker_symbol: str, tf: str) -> Optional[datetime]:
+        candles = self.client.get_ohlcv(broker_symbol, tf, 2)
+        if not candles:
+            return None
+        return candles[-1]["time"]
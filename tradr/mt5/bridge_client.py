@@ -3,13 +3,79 @@ MT5 Bridge Client - For connecting to MT5 via HTTP bridge.
 
 Use this when running from Replit or remote server.
 The MT5 Bridge Server must be running on the Windows VM.
+
+All calls go through one pooled requests.Session (keep-alive), so repeated
+calls reuse TCP connections instead of paying a handshake each time.
+Batch endpoints cut round trips further when the bridge supports them:
+
+    POST /market_data_batch  {"symbols": [...]}  -> {"ticks": {symbol: tick}}
+    GET  /state                                  -> {"positions": [...], "orders": [...], "account": {...}}
+
+If the bridge answers 404 the client falls back to the single-call
+endpoints over the same session (get_state() then reports orders and
+account as None rather than guessing). Per-endpoint latency histograms are kept
+in `timings`.
 """
 
+import bisect
+import threading
+import time
 import requests
+from requests.adapters import HTTPAdapter
 from typing import Dict, List, Optional, Any
 from datetime import datetime, timezone
 
 
+# Histogram bucket upper bounds in milliseconds (last bucket is open-ended)
+LATENCY_BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram (milliseconds)."""
+    
+    def __init__(self):
+        self.counts = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.count = 0
+        self.errors = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+    
+    def record(self, elapsed_ms: float, ok: bool = True):
+        self.counts[bisect.bisect_left(LATENCY_BUCKETS_MS, elapsed_ms)] += 1
+        self.count += 1
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+        if not ok:
+            self.errors += 1
+    
+    def percentile(self, pct: float) -> float:
+        """Upper bound of the bucket containing the pct-th percentile."""
+        if not self.count:
+            return 0.0
+        target = self.count * pct / 100.0
+        seen = 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if seen >= target:
+                return float(LATENCY_BUCKETS_MS[i]) if i < len(LATENCY_BUCKETS_MS) else self.max_ms
+        return self.max_ms
+    
+    def to_dict(self) -> Dict:
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "avg_ms": round(self.total_ms / self.count, 2) if self.count else 0.0,
+            "p50_ms": self.percentile(50),
+            "p95_ms": self.percentile(95),
+            "max_ms": round(self.max_ms, 2),
+            "buckets": {
+                (f"<={b}ms" if i < len(LATENCY_BUCKETS_MS) else f">{LATENCY_BUCKETS_MS[-1]}ms"): n
+                for i, (b, n) in enumerate(zip(LATENCY_BUCKETS_MS + (None,), self.counts))
+                if n
+            },
+        }
+
+
 class MT5BridgeClient:
     """
     HTTP client for connecting to MT5 via bridge server.
@@ -25,6 +91,7 @@ class MT5BridgeClient:
         login: int = 0,
         password: str = "",
         timeout: int = 30,
+        pool_size: int = 8,
     ):
         self.bridge_url = bridge_url.rstrip('/')
         self.server = server
@@ -34,12 +101,48 @@ class MT5BridgeClient:
         self.connected = False
         self.account_info: Dict = {}
         self.symbol_map: Dict[str, str] = {}
+        
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.timings: Dict[str, LatencyHistogram] = {}
+        self._timings_lock = threading.Lock()
+        self._batch_supported: Dict[str, bool] = {}
+    
+    def _request(self, method: str, path: str, **kwargs) -> requests.Response:
+        """Send a request on the pooled session and record its latency under `path`."""
+        kwargs.setdefault("timeout", self.timeout)
+        started = time.perf_counter()
+        ok = False
+        try:
+            response = self.session.request(method, f"{self.bridge_url}{path}", **kwargs)
+            ok = response.status_code < 500
+            return response
+        finally:
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            with self._timings_lock:
+                self.timings.setdefault(path, LatencyHistogram()).record(elapsed_ms, ok)
+    
+    def timing_summary(self) -> Dict[str, Dict]:
+        """Latency histogram per endpoint."""
+        with self._timings_lock:
+            return {path: hist.to_dict() for path, hist in self.timings.items()}
+    
+    def reset_timings(self):
+        with self._timings_lock:
+            self.timings.clear()
+    
+    def close(self):
+        """Close pooled connections."""
+        self.session.close()
     
     def health_check(self) -> bool:
         """Check if bridge server is online."""
         try:
-            response = requests.get(
-                f"{self.bridge_url}/health",
+            response = self._request(
+                "GET",
+                "/health",
                 timeout=5
             )
             return response.status_code == 200
@@ -49,8 +152,9 @@ class MT5BridgeClient:
     def connect(self) -> bool:
         """Connect to MT5 via bridge."""
         try:
-            response = requests.post(
-                f"{self.bridge_url}/connect",
+            response = self._request(
+                "POST",
+                "/connect",
                 json={
                     'server': self.server,
                     'login': self.login,
@@ -75,8 +179,9 @@ class MT5BridgeClient:
     def disconnect(self) -> bool:
         """Disconnect from MT5."""
         try:
-            response = requests.post(
-                f"{self.bridge_url}/disconnect",
+            response = self._request(
+                "POST",
+                "/disconnect",
                 timeout=5
             )
             self.connected = False
@@ -92,8 +197,9 @@ class MT5BridgeClient:
     def map_symbols(self, symbols: List[str]) -> Dict[str, str]:
         """Map our symbol format to broker format."""
         try:
-            response = requests.post(
-                f"{self.bridge_url}/symbols",
+            response = self._request(
+                "POST",
+                "/symbols",
                 json={'symbols': symbols},
                 timeout=self.timeout
             )
@@ -114,8 +220,9 @@ class MT5BridgeClient:
         broker_symbol = self.symbol_map.get(symbol, symbol)
         
         try:
-            response = requests.post(
-                f"{self.bridge_url}/market_data",
+            response = self._request(
+                "POST",
+                "/market_data",
                 json={'symbol': broker_symbol},
                 timeout=self.timeout
             )
@@ -129,6 +236,69 @@ class MT5BridgeClient:
             print(f"[MT5Bridge] Tick error: {e}")
             return None
     
+    def get_ticks(self, symbols: List[str]) -> Dict[str, Optional[Dict]]:
+        """
+        Get ticks for several symbols in one round trip.
+        
+        Uses /market_data_batch when the bridge has it, otherwise one
+        /market_data call per symbol over the pooled session.
+        """
+        if not symbols:
+            return {}
+        
+        if self._batch_supported.get("/market_data_batch", True):
+            broker_symbols = {self.symbol_map.get(s, s): s for s in symbols}
+            try:
+                response = self._request(
+                    "POST",
+                    "/market_data_batch",
+                    json={'symbols': list(broker_symbols)},
+                )
+                if response.status_code == 404:
+                    self._batch_supported["/market_data_batch"] = False
+                elif response.status_code == 200:
+                    ticks = response.json().get('ticks', {})
+                    return {broker_symbols[b]: ticks.get(b) for b in broker_symbols}
+                else:
+                    return {s: None for s in symbols}
+            except Exception as e:
+                print(f"[MT5Bridge] Batch tick error: {e}")
+                return {s: None for s in symbols}
+        
+        return {s: self.get_tick(s) for s in symbols}
+    
+    def get_state(self) -> Dict:
+        """
+        Positions, pending orders and account info in one round trip.
+        
+        Without a /state endpoint, positions come from /positions. The
+        bridge has no single-call endpoints for orders or a fresh account
+        snapshot, so those are None. Any field that could not be fetched is
+        None, never an empty list or cached data.
+        """
+        if self._batch_supported.get("/state", True):
+            try:
+                response = self._request("GET", "/state")
+                if response.status_code == 404:
+                    self._batch_supported["/state"] = False
+                elif response.status_code == 200:
+                    data = response.json()
+                    if data.get('account'):
+                        self.account_info = data['account']
+                    return {
+                        'positions': data.get('positions'),
+                        'orders': data.get('orders'),
+                        'account': data.get('account'),
+                    }
+            except Exception as e:
+                print(f"[MT5Bridge] State error: {e}")
+        
+        return {
+            'positions': self._fetch_positions(),
+            'orders': None,
+            'account': None,
+        }
+    
     def execute_trade(
         self,
         symbol: str,
@@ -153,8 +323,9 @@ class MT5BridgeClient:
         broker_symbol = self.symbol_map.get(symbol, symbol)
         
         try:
-            response = requests.post(
-                f"{self.bridge_url}/execute_trade",
+            response = self._request(
+                "POST",
+                "/execute_trade",
                 json={
                     'symbol': broker_symbol,
                     'direction': direction,
@@ -186,8 +357,9 @@ class MT5BridgeClient:
         broker_symbol = self.symbol_map.get(symbol, symbol)
         
         try:
-            response = requests.post(
-                f"{self.bridge_url}/close_position",
+            response = self._request(
+                "POST",
+                "/close_position",
                 json={
                     'symbol': broker_symbol,
                     'volume': volume,
@@ -207,25 +379,32 @@ class MT5BridgeClient:
     
     def get_positions(self) -> List[Dict]:
         """Get all open positions."""
+        positions = self._fetch_positions()
+        return positions if positions is not None else []
+    
+    def _fetch_positions(self) -> Optional[List[Dict]]:
+        """Open positions from /positions, or None if the call failed."""
         try:
-            response = requests.get(
-                f"{self.bridge_url}/positions",
+            response = self._request(
+                "GET",
+                "/positions",
                 timeout=self.timeout
             )
             
             if response.status_code != 200:
-                return []
+                return None
             
             return response.json().get('positions', [])
             
         except Exception:
-            return []
+            return None
     
     def get_history(self, days: int = 30) -> List[Dict]:
         """Get trade history."""
         try:
-            response = requests.get(
-                f"{self.bridge_url}/history",
+            response = self._request(
+                "GET",
+                "/history",
                 params={'days': days},
                 timeout=self.timeout
             )
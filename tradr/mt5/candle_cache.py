@@ -0,0 +1,120 @@
+"""
+Incremental candle cache for the live bot.
+
+Keeps a fixed-size ring buffer of candles per (symbol, timeframe). The first
+request does a full copy_rates_from_pos fetch; later requests only pull bars
+from the last cached bar's open time onwards (that bar may still have been
+forming) and splice them onto the buffer. Closed bars are served from memory.
+"""
+
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Deque, Dict, List, Optional, Tuple
+
+
+@dataclass
+class CandleCacheStats:
+    """Counters for cache effectiveness."""
+    full_fetches: int = 0
+    incremental_fetches: int = 0
+    bars_fetched: int = 0
+    bars_served: int = 0
+
+    def to_dict(self) -> Dict:
+        return {
+            "full_fetches": self.full_fetches,
+            "incremental_fetches": self.incremental_fetches,
+            "bars_fetched": self.bars_fetched,
+            "bars_served": self.bars_served,
+        }
+
+
+@dataclass
+class _CacheEntry:
+    candles: Deque[Dict]
+    last_refresh: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+
+
+class CandleCache:
+    """
+    Per-(symbol, timeframe) ring-buffer cache in front of an MT5 client.
+
+    The client needs get_ohlcv(symbol, timeframe, count). If it also has
+    get_ohlcv_since(symbol, timeframe, since), refreshes are incremental;
+    otherwise every call falls back to a full fetch.
+    """
+
+    def __init__(self, client):
+        self.client = client
+        self.stats = CandleCacheStats()
+        self._entries: Dict[Tuple[str, str], _CacheEntry] = {}
+        self._lock = threading.Lock()
+
+    def get(self, symbol: str, timeframe: str, count: int) -> List[Dict]:
+        """Return the latest `count` candles (oldest first)."""
+        key = (symbol, timeframe.upper())
+        with self._lock:
+            entry = self._entries.get(key)
+
+        if entry is None or entry.candles.maxlen != count or not entry.candles:
+            entry = self._full_fetch(symbol, timeframe, count)
+        elif not self._refresh(entry, symbol, timeframe):
+            entry = self._full_fetch(symbol, timeframe, count)
+
+        if entry is None:
+            return []
+
+        with self._lock:
+            self._entries[key] = entry
+            self.stats.bars_served += len(entry.candles)
+            return list(entry.candles)
+
+    def invalidate(self, symbol: Optional[str] = None) -> None:
+        """Drop cached candles for one symbol, or everything."""
+        with self._lock:
+            if symbol is None:
+                self._entries.clear()
+            else:
+                for key in [k for k in self._entries if k[0] == symbol]:
+                    del self._entries[key]
+
+    def _full_fetch(self, symbol: str, timeframe: str, count: int) -> Optional[_CacheEntry]:
+        candles = self.client.get_ohlcv(symbol, timeframe, count)
+        with self._lock:
+            self.stats.full_fetches += 1
+            self.stats.bars_fetched += len(candles)
+        if not candles:
+            return None
+        return _CacheEntry(candles=deque(candles, maxlen=count))
+
+    def _refresh(self, entry: _CacheEntry, symbol: str, timeframe: str) -> bool:
+        """
+        Splice bars newer than the cache onto the buffer.
+
+        Returns False when an incremental refresh is not possible (client
+        lacks get_ohlcv_since, or the fetch came back empty/inconsistent).
+        """
+        get_since = getattr(self.client, "get_ohlcv_since", None)
+        if get_since is None:
+            return False
+
+        last_time = entry.candles[-1]["time"]
+        new_candles = get_since(symbol, timeframe, last_time)
+        with self._lock:
+            self.stats.incremental_fetches += 1
+            self.stats.bars_fetched += len(new_candles)
+
+        if not new_candles or new_candles[0]["time"] > last_time:
+            # The last cached bar must come back; otherwise history shifted
+            return False
+
+        # Replace the (possibly still forming) tail, then append newer bars
+        first_time = new_candles[0]["time"]
+        with self._lock:
+            while entry.candles and entry.candles[-1]["time"] >= first_time:
+                entry.candles.pop()
+            entry.candles.extend(new_candles)
+            entry.last_refresh = datetime.now(timezone.utc)
+        return True
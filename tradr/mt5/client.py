@@ -281,16 +281,8 @@ class MT5Client:
             spread=tick.ask - tick.bid,
         )
     
-    def get_ohlcv(
-        self,
-        symbol: str,
-        timeframe: str = "D1",
-        count: int = 100,
-    ) -> List[Dict]:
-        """Get OHLCV candle data."""
-        if not self.connected:
-            return []
-        
+    def _timeframe(self, timeframe: str) -> int:
+        """Map a timeframe string (D1, H4, W1, MN1, ...) to the MT5 constant."""
         mt5 = self._import_mt5()
         
         timeframe_map = {
@@ -308,10 +300,11 @@ class MT5Client:
             "M": mt5.TIMEFRAME_MN1,
         }
         
-        tf = timeframe_map.get(timeframe.upper(), mt5.TIMEFRAME_D1)
-        
-        rates = mt5.copy_rates_from_pos(symbol, tf, 0, count)
-        
+        return timeframe_map.get(timeframe.upper(), mt5.TIMEFRAME_D1)
+    
+    @staticmethod
+    def _rates_to_candles(rates) -> List[Dict]:
+        """Convert an MT5 rates array to candle dicts (oldest first)."""
         if rates is None:
             return []
         
@@ -328,6 +321,41 @@ class MT5Client:
         
         return candles
     
+    def get_ohlcv(
+        self,
+        symbol: str,
+        timeframe: str = "D1",
+        count: int = 100,
+    ) -> List[Dict]:
+        """Get OHLCV candle data."""
+        if not self.connected:
+            return []
+        
+        mt5 = self._import_mt5()
+        rates = mt5.copy_rates_from_pos(symbol, self._timeframe(timeframe), 0, count)
+        return self._rates_to_candles(rates)
+    
+    def get_ohlcv_since(
+        self,
+        symbol: str,
+        timeframe: str,
+        since: datetime,
+    ) -> List[Dict]:
+        """
+        Get candles whose open time is >= since, up to the current bar.
+        
+        Used for incremental refreshes: passing the open time of the last
+        cached bar returns that (possibly still forming) bar plus any newer ones.
+        """
+        if not self.connected:
+            return []
+        
+        mt5 = self._import_mt5()
+        # Broker server time usually runs ahead of UTC; pad the upper bound
+        date_to = datetime.now(timezone.utc) + timedelta(days=2)
+        rates = mt5.copy_rates_range(symbol, self._timeframe(timeframe), since, date_to)
+        return self._rates_to_candles(rates)
+    
     def execute_trade(
         self,
         symbol: str,
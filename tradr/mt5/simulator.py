@@ -0,0 +1,633 @@
+"""
+Offline MT5 simulator - drop-in MT5Client backed by the bundled OHLCV CSVs.
+
+Lets the whole live path (LiveTradingBot, RiskManager, partial takes,
+protection) run on Linux without the MetaTrader5 package, for load and
+latency testing and regression runs.
+
+- Market data: data/ohlcv/{SYMBOL}_{TF}_2003_2025.csv (D1/H4/W1/MN)
+- Clock: starts at `start` and runs `speed` simulated seconds per wall
+  second (speed=0 keeps it frozen; move it with advance()/set_time())
+- Prices: inside each bar of the finest series (H4, else D1) price moves
+  along O -> L -> H -> C (bullish bar) or O -> H -> L -> C (bearish bar)
+- Orders: pending orders fill when the path touches their price; SL/TP are
+  checked on the price range covered since the last call (SL wins ties,
+  like the backtest); expired orders are removed
+- Every public call is counted (call_counts) and can add an artificial
+  per-call latency to mimic terminal IPC
+"""
+
+import os
+import time
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from tradr.mt5.client import MT5Client, PendingOrder, Position, TickData, TradeResult
+from tradr.risk.equity_monitor import position_pnl_usd
+from tradr.risk.position_sizing import get_contract_specs
+
+
+ORDER_TYPE_BUY = 0
+ORDER_TYPE_SELL = 1
+ORDER_TYPE_BUY_LIMIT = 2
+ORDER_TYPE_SELL_LIMIT = 3
+ORDER_TYPE_BUY_STOP = 4
+ORDER_TYPE_SELL_STOP = 5
+
+# Timeframe -> (CSV suffix, nominal bar length in seconds)
+SIM_TIMEFRAMES = {
+    "H4": ("H4", 4 * 3600),
+    "D1": ("D1", 86400),
+    "W1": ("W1", 7 * 86400),
+    "MN1": ("MN", 31 * 86400),
+    "MN": ("MN", 31 * 86400),
+}
+
+# Finest first: used for the intra-bar price path
+PATH_TIMEFRAMES = ("H4", "D1")
+
+
+@dataclass
+class _Series:
+    times: np.ndarray
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+    period: int
+
+
+class SimulatedMT5Client(MT5Client):
+    """
+    Simulated broker implementing the MT5Client surface used by the live bot.
+
+    Args:
+        data_dir: Directory with {SYMBOL}_{TF}_2003_2025.csv files
+        start: Initial simulated time (UTC); defaults to 2024-01-02
+        speed: Simulated seconds per wall-clock second (0 = manual clock)
+        balance: Starting account balance (USD)
+        spread_pips: Spread applied to every symbol, in pips
+        call_latency_ms: Artificial latency added to every API call
+    """
+
+    def __init__(
+        self,
+        data_dir: str = "data/ohlcv",
+        start: Optional[datetime] = None,
+        speed: float = 0.0,
+        balance: float = 100000.0,
+        spread_pips: float = 0.2,
+        call_latency_ms: float = 0.0,
+    ):
+        super().__init__(server="simulator", login=0, password="")
+        self.data_dir = Path(data_dir)
+        start = start or datetime(2024, 1, 2, tzinfo=timezone.utc)
+        if start.tzinfo is None:
+            start = start.replace(tzinfo=timezone.utc)
+        self.speed = speed
+        self.balance = balance
+        self.spread_pips = spread_pips
+        self.call_latency = call_latency_ms / 1000.0
+        self.call_counts: Counter = Counter()
+        self.deals: List[Dict] = []
+
+        self._start_ts = start.timestamp()
+        self._wall0 = time.monotonic()
+        self._offset = 0.0
+        self._last_match_ts = self._start_ts
+        self._series: Dict[Tuple[str, str], Optional[_Series]] = {}
+        self._files = self._index_files()
+        self._positions: Dict[int, Position] = {}
+        self._orders: Dict[int, PendingOrder] = {}
+        self._next_ticket = 1000
+
+    # =========================================================================
+    # Clock
+    # =========================================================================
+
+    def now_ts(self) -> float:
+        ts = self._start_ts + self._offset
+        if self.speed:
+            ts += (time.monotonic() - self._wall0) * self.speed
+        return ts
+
+    def now(self) -> datetime:
+        return datetime.fromtimestamp(self.now_ts(), tz=timezone.utc)
+
+    def advance(self, seconds: float) -> None:
+        """Move the simulated clock forward (orders are matched on the next call)."""
+        self._offset += seconds
+
+    def set_time(self, when: datetime) -> None:
+        if when.tzinfo is None:
+            when = when.replace(tzinfo=timezone.utc)
+        self._offset += when.timestamp() - self.now_ts()
+
+    # =========================================================================
+    # Connection
+    # =========================================================================
+
+    def connect(self) -> bool:
+        self._call("connect")
+        self.connected = True
+        return True
+
+    def disconnect(self):
+        self.connected = False
+
+    def connect_with_retry(self, max_attempts: int = None) -> bool:
+        return self.connect()
+
+    def is_connected(self) -> bool:
+        return self.connected
+
+    def check_heartbeat(self) -> bool:
+        return self.connected
+
+    def ensure_connected(self) -> bool:
+        return self.connected or self.connect()
+
+    # =========================================================================
+    # Account / symbols / market data
+    # =========================================================================
+
+    def get_account_info(self) -> Dict:
+        self._call("get_account_info")
+        open_pnl = sum(self._position_profit(p) for p in self._positions.values())
+        equity = self.balance + open_pnl
+        return {
+            "login": 0,
+            "server": "simulator",
+            "balance": self.balance,
+            "equity": equity,
+            "margin": 0.0,
+            "free_margin": equity,
+            "leverage": 100,
+            "currency": "USD",
+        }
+
+    def get_available_symbols(self) -> List[str]:
+        self._call("get_available_symbols")
+        return sorted({name.replace("_", "") for name in self._files})
+
+    def find_symbol_match(self, desired_symbol: str) -> Optional[str]:
+        self._call("find_symbol_match")
+        base = desired_symbol.replace("_", "").replace("/", "").replace(".", "")
+        if base in self._files or self._data_symbol(base):
+            return base
+        return None
+
+    def get_symbol_info(self, symbol: str) -> Optional[Dict]:
+        self._call("get_symbol_info")
+        matched = self.find_symbol_match(symbol)
+        if matched is None:
+            return None
+        specs = get_contract_specs(matched)
+        digits = specs.get("pip_location", 4) + 1
+        return {
+            "name": matched,
+            "digits": digits,
+            "point": 10 ** -digits,
+            "spread": int(round(self.spread_pips * 10)),
+            "min_lot": 0.01,
+            "max_lot": 100.0,
+            "lot_step": 0.01,
+            "contract_size": specs.get("contract_size", 100000),
+        }
+
+    def get_tick(self, symbol: str) -> Optional[TickData]:
+        self._call("get_tick")
+        if not self.connected:
+            return None
+        now = self.now_ts()
+        bid = self._price_at(symbol, now)
+        if bid is None:
+            return None
+        spread = self._spread(symbol)
+        return TickData(
+            symbol=symbol,
+            bid=bid,
+            ask=bid + spread,
+            time=datetime.fromtimestamp(now, tz=timezone.utc),
+            spread=spread,
+        )
+
+    def get_ohlcv(self, symbol: str, timeframe: str = "D1", count: int = 100) -> List[Dict]:
+        self._call("get_ohlcv")
+        if not self.connected:
+            return []
+        series = self._load(symbol, timeframe)
+        if series is None:
+            return []
+        end = int(np.searchsorted(series.times, self.now_ts(), side="right"))
+        return self._candles(symbol, series, max(0, end - count), end)
+
+    def get_ohlcv_since(self, symbol: str, timeframe: str, since: datetime) -> List[Dict]:
+        self._call("get_ohlcv_since")
+        if not self.connected:
+            return []
+        series = self._load(symbol, timeframe)
+        if series is None:
+            return []
+        start = int(np.searchsorted(series.times, since.timestamp(), side="left"))
+        end = int(np.searchsorted(series.times, self.now_ts(), side="right"))
+        return self._candles(symbol, series, start, end)
+
+    # =========================================================================
+    # Orders and positions
+    # =========================================================================
+
+    def execute_trade(self, symbol: str, direction: str, volume: float, sl: float, tp: float,
+                      deviation: int = 20) -> TradeResult:
+        return self.place_market_order(symbol, direction, volume, sl, tp, deviation)
+
+    def place_market_order(self, symbol: str, direction: str, volume: float, sl: float, tp: float,
+                           deviation: int = 20) -> TradeResult:
+        self._call("place_market_order")
+        tick = self._tick_quiet(symbol)
+        if tick is None:
+            return TradeResult(success=False, error=f"Cannot get tick for {symbol}")
+        bullish = direction.lower() == "bullish"
+        price = tick.ask if bullish else tick.bid
+        ticket = self._open_position(symbol, ORDER_TYPE_BUY if bullish else ORDER_TYPE_SELL,
+                                     round(volume, 2), price, sl, tp or 0.0)
+        return TradeResult(success=True, order_id=ticket, deal_id=ticket, price=price, volume=round(volume, 2))
+
+    def place_pending_order(self, symbol: str, direction: str, volume: float, entry_price: float,
+                            sl: float, tp: float, expiration_hours: int = 24) -> TradeResult:
+        self._call("place_pending_order")
+        tick = self._tick_quiet(symbol)
+        if tick is None:
+            return TradeResult(success=False, error=f"Cannot get tick for {symbol}")
+        if direction.lower() == "bullish":
+            order_type = ORDER_TYPE_BUY_LIMIT if entry_price < tick.ask else ORDER_TYPE_BUY_STOP
+        else:
+            order_type = ORDER_TYPE_SELL_LIMIT if entry_price > tick.bid else ORDER_TYPE_SELL_STOP
+
+        now = self.now()
+        ticket = self._ticket()
+        self._orders[ticket] = PendingOrder(
+            ticket=ticket,
+            symbol=symbol,
+            type=order_type,
+            volume=round(volume, 2),
+            price=entry_price,
+            sl=sl,
+            tp=tp if tp and tp > 0 else 0.0,
+            time_setup=now,
+            expiration=now + timedelta(hours=expiration_hours),
+            magic=self.MAGIC_NUMBER,
+            comment=self.COMMENT,
+        )
+        return TradeResult(success=True, order_id=ticket, price=entry_price, volume=round(volume, 2))
+
+    def cancel_pending_order(self, ticket: int) -> bool:
+        self._call("cancel_pending_order")
+        return self._orders.pop(ticket, None) is not None
+
+    def close_position(self, ticket: int) -> TradeResult:
+        self._call("close_position")
+        pos = self._positions.get(ticket)
+        if pos is None:
+            return TradeResult(success=False, error=f"Position {ticket} not found")
+        price = self._exit_price(pos)
+        if price is None:
+            return TradeResult(success=False, error=f"Cannot get tick for {pos.symbol}")
+        self._close(pos, pos.volume, price, "close")
+        return TradeResult(success=True, order_id=ticket, deal_id=ticket, price=price, volume=pos.volume)
+
+    def partial_close(self, ticket: int, volume: float) -> TradeResult:
+        self._call("partial_close")
+        pos = self._positions.get(ticket)
+        if pos is None:
+            return TradeResult(success=False, error=f"Position {ticket} not found")
+        if volume > pos.volume:
+            return TradeResult(
+                success=False,
+                error=f"Requested volume {volume} exceeds position volume {pos.volume}"
+            )
+        close_volume = max(0.01, round(volume, 2))
+        price = self._exit_price(pos)
+        if price is None:
+            return TradeResult(success=False, error=f"Cannot get tick for {pos.symbol}")
+        self._close(pos, close_volume, price, "partial")
+        return TradeResult(success=True, order_id=ticket, deal_id=ticket, price=price, volume=close_volume)
+
+    def modify_sl_tp(self, ticket: int, sl: float = None, tp: float = None) -> bool:
+        self._call("modify_sl_tp")
+        pos = self._positions.get(ticket)
+        if pos is None:
+            return False
+        if sl is not None:
+            pos.sl = sl
+        if tp is not None:
+            pos.tp = tp
+        return True
+
+    def positions_get(self, symbol: str = None, ticket: int = None) -> List[Position]:
+        """Raw-API style position query (MetaTrader5.positions_get)."""
+        self._call("positions_get")
+        positions = list(self._positions.values())
+        if symbol:
+            positions = [p for p in positions if p.symbol == symbol]
+        if ticket is not None:
+            positions = [p for p in positions if p.ticket == ticket]
+        for pos in positions:
+            pos.profit = self._position_profit(pos)
+        return positions
+
+    def get_positions(self, symbol: str = None) -> List[Position]:
+        if not self.connected:
+            return []
+        return self.positions_get(symbol=symbol)
+
+    def get_pending_orders(self, symbol: str = None) -> List[PendingOrder]:
+        self._call("get_pending_orders")
+        if not self.connected:
+            return []
+        orders = list(self._orders.values())
+        if symbol:
+            orders = [o for o in orders if o.symbol == symbol]
+        return orders
+
+    # =========================================================================
+    # Internals
+    # =========================================================================
+
+    def _call(self, name: str) -> None:
+        self.call_counts[name] += 1
+        if self.call_latency:
+            time.sleep(self.call_latency)
+        self._match()
+
+    def _ticket(self) -> int:
+        self._next_ticket += 1
+        return self._next_ticket
+
+    def _index_files(self) -> Dict[str, Dict[str, Path]]:
+        files: Dict[str, Dict[str, Path]] = {}
+        if not self.data_dir.exists():
+            return files
+        for name in os.listdir(self.data_dir):
+            parts = name[:-4].rsplit("_", 3) if name.endswith(".csv") else []
+            if len(parts) != 4:
+                continue
+            symbol, tf = parts[0], parts[1]
+            files.setdefault(symbol, {})[tf] = self.data_dir / name
+        return files
+
+    def _data_symbol(self, symbol: str) -> Optional[str]:
+        base = symbol.replace("_", "")
+        for candidate in (symbol, base, f"{base[:3]}_{base[3:]}"):
+            if candidate in self._files:
+                return candidate
+        return None
+
+    def _load(self, symbol: str, timeframe: str) -> Optional[_Series]:
+        tf = timeframe.upper()
+        key = (symbol, tf)
+        if key in self._series:
+            return self._series[key]
+        series = None
+        data_symbol = self._data_symbol(symbol)
+        suffix, period = SIM_TIMEFRAMES.get(tf, (tf, 86400))
+        path = self._files.get(data_symbol, {}).get(suffix) if data_symbol else None
+        if path is not None:
+            # Bundled files use either time/Open/... or timestamp/open/...
+            df = pd.read_csv(path)
+            df.columns = [c.lower() for c in df.columns]
+            time_col = "time" if "time" in df.columns else "timestamp"
+            times = (
+                pd.to_datetime(df[time_col], utc=True).dt.tz_localize(None)
+                .to_numpy().astype("datetime64[s]").astype(np.int64)
+            )
+            series = _Series(
+                times=times.astype(np.float64),
+                open=df["open"].to_numpy(dtype=np.float64),
+                high=df["high"].to_numpy(dtype=np.float64),
+                low=df["low"].to_numpy(dtype=np.float64),
+                close=df["close"].to_numpy(dtype=np.float64),
+                volume=df["volume"].to_numpy(dtype=np.float64) if "volume" in df else np.zeros(len(df)),
+                period=period,
+            )
+        self._series[key] = series
+        return series
+
+    def _path_series(self, symbol: str) -> Optional[_Series]:
+        for tf in PATH_TIMEFRAMES:
+            series = self._load(symbol, tf)
+            if series is not None and len(series.times):
+                return series
+        return None
+
+    @staticmethod
+    def _bar_end(series: _Series, i: int) -> float:
+        end = series.times[i] + series.period
+        if i + 1 < len(series.times):
+            end = min(end, series.times[i + 1])
+        return end
+
+    def _bar_path(self, series: _Series, i: int) -> List[Tuple[float, float]]:
+        start = series.times[i]
+        length = self._bar_end(series, i) - start
+        o, h, l, c = series.open[i], series.high[i], series.low[i], series.close[i]
+        first, second = (l, h) if c >= o else (h, l)
+        return [
+            (start, o),
+            (start + length / 3, first),
+            (start + 2 * length / 3, second),
+            (start + length, c),
+        ]
+
+    def _price_at(self, symbol: str, ts: float) -> Optional[float]:
+        series = self._path_series(symbol)
+        if series is None:
+            return None
+        i = int(np.searchsorted(series.times, ts, side="right")) - 1
+        if i < 0:
+            return None
+        path = self._bar_path(series, i)
+        if ts >= path[-1][0]:
+            return float(series.close[i])
+        for (t0, p0), (t1, p1) in zip(path, path[1:]):
+            if t0 <= ts <= t1:
+                return float(p0 + (p1 - p0) * ((ts - t0) / (t1 - t0) if t1 > t0 else 1.0))
+        return float(series.close[i])
+
+    def _price_range(self, symbol: str, t0: float, t1: float) -> Optional[Tuple[float, float]]:
+        """Lowest and highest price along the path between t0 and t1."""
+        series = self._path_series(symbol)
+        end_price = self._price_at(symbol, t1)
+        if series is None or end_price is None:
+            return None
+        prices = [end_price]
+        start_price = self._price_at(symbol, t0)
+        if start_price is not None:
+            prices.append(start_price)
+        i0 = max(int(np.searchsorted(series.times, t0, side="right")) - 1, 0)
+        i1 = int(np.searchsorted(series.times, t1, side="right")) - 1
+        for i in {i0, i1}:
+            for t, p in self._bar_path(series, i):
+                if t0 < t < t1:
+                    prices.append(float(p))
+        if i1 - i0 > 1:
+            prices.append(float(series.low[i0 + 1:i1].min()))
+            prices.append(float(series.high[i0 + 1:i1].max()))
+        return min(prices), max(prices)
+
+    def _candles(self, symbol: str, series: _Series, start: int, end: int) -> List[Dict]:
+        candles = [
+            {
+                "time": datetime.fromtimestamp(series.times[i], tz=timezone.utc),
+                "open": float(series.open[i]),
+                "high": float(series.high[i]),
+                "low": float(series.low[i]),
+                "close": float(series.close[i]),
+                "volume": float(series.volume[i]),
+            }
+            for i in range(start, end)
+        ]
+        # The last bar is still forming: cut it at the current price
+        now = self.now_ts()
+        if candles and now < self._bar_end(series, end - 1):
+            bar_open = series.times[end - 1]
+            price = self._price_at(symbol, now)
+            low_high = self._price_range(symbol, bar_open, now)
+            if price is not None and low_high is not None:
+                last = candles[-1]
+                last["close"] = price
+                last["low"] = min(last["open"], low_high[0])
+                last["high"] = max(last["open"], low_high[1])
+        return candles
+
+    def _spread(self, symbol: str) -> float:
+        return get_contract_specs(symbol).get("pip_value", 0.0001) * self.spread_pips
+
+    def _tick_quiet(self, symbol: str) -> Optional[TickData]:
+        bid = self._price_at(symbol, self.now_ts())
+        if bid is None:
+            return None
+        spread = self._spread(symbol)
+        return TickData(symbol=symbol, bid=bid, ask=bid + spread, time=self.now(), spread=spread)
+
+    def _rate(self, symbol: str) -> Optional[float]:
+        """Conversion-pair price for position_pnl_usd."""
+        return self._price_at(symbol, self.now_ts())
+
+    def _exit_price(self, pos: Position) -> Optional[float]:
+        tick = self._tick_quiet(pos.symbol)
+        if tick is None:
+            return None
+        return tick.bid if pos.type == ORDER_TYPE_BUY else tick.ask
+
+    def _position_profit(self, pos: Position) -> float:
+        price = self._exit_price(pos)
+        if price is None:
+            return 0.0
+        direction = 1 if pos.type == ORDER_TYPE_BUY else -1
+        return position_pnl_usd(pos.symbol, direction, pos.volume, pos.price_open, price, self._rate) or 0.0
+
+    def _open_position(self, symbol: str, side: int, volume: float, price: float, sl: float, tp: float) -> int:
+        ticket = self._ticket()
+        self._positions[ticket] = Position(
+            ticket=ticket,
+            symbol=symbol,
+            type=side,
+            volume=volume,
+            price_open=price,
+            sl=sl or 0.0,
+            tp=tp or 0.0,
+            profit=0.0,
+            time=self.now(),
+            magic=self.MAGIC_NUMBER,
+            comment=self.COMMENT,
+        )
+        return ticket
+
+    def _close(self, pos: Position, volume: float, price: float, reason: str) -> None:
+        direction = 1 if pos.type == ORDER_TYPE_BUY else -1
+        pnl = position_pnl_usd(pos.symbol, direction, volume, pos.price_open, price, self._rate) or 0.0
+        self.balance += pnl
+        self.deals.append({
+            "ticket": pos.ticket,
+            "symbol": pos.symbol,
+            "volume": volume,
+            "price": price,
+            "pnl": pnl,
+            "reason": reason,
+            "time": self.now(),
+        })
+        pos.volume = round(pos.volume - volume, 2)
+        if pos.volume < 0.01:
+            del self._positions[pos.ticket]
+
+    def _match(self) -> None:
+        """Fill pending orders and trigger SL/TP over the path since the last call."""
+        now = self.now_ts()
+        t0 = self._last_match_ts
+        if now <= t0:
+            return
+        self._last_match_ts = now
+        if not self._orders and not self._positions:
+            return
+
+        ranges: Dict[str, Optional[Tuple[float, float]]] = {}
+
+        def price_range(symbol: str):
+            if symbol not in ranges:
+                ranges[symbol] = self._price_range(symbol, t0, now)
+            return ranges[symbol]
+
+        for ticket, order in list(self._orders.items()):
+            if order.expiration.timestamp() <= now:
+                del self._orders[ticket]
+                continue
+            low_high = price_range(order.symbol)
+            if low_high is None:
+                continue
+            low, high = low_high
+            filled = (
+                (order.type == ORDER_TYPE_BUY_LIMIT and low <= order.price)
+                or (order.type == ORDER_TYPE_BUY_STOP and high >= order.price)
+                or (order.type == ORDER_TYPE_SELL_LIMIT and high >= order.price)
+                or (order.type == ORDER_TYPE_SELL_STOP and low <= order.price)
+            )
+            if filled:
+                del self._orders[ticket]
+                side = ORDER_TYPE_BUY if order.type in (ORDER_TYPE_BUY_LIMIT, ORDER_TYPE_BUY_STOP) else ORDER_TYPE_SELL
+                self._positions[ticket] = Position(
+                    ticket=ticket,
+                    symbol=order.symbol,
+                    type=side,
+                    volume=order.volume,
+                    price_open=order.price,
+                    sl=order.sl,
+                    tp=order.tp,
+                    profit=0.0,
+                    time=datetime.fromtimestamp(now, tz=timezone.utc),
+                    magic=order.magic,
+                    comment=order.comment,
+                )
+
+        for pos in list(self._positions.values()):
+            low_high = price_range(pos.symbol)
+            if low_high is None:
+                continue
+            low, high = low_high
+            if pos.type == ORDER_TYPE_BUY:
+                if pos.sl and low <= pos.sl:
+                    self._close(pos, pos.volume, pos.sl, "sl")
+                elif pos.tp and high >= pos.tp:
+                    self._close(pos, pos.volume, pos.tp, "tp")
+            else:
+                if pos.sl and high >= pos.sl:
+                    self._close(pos, pos.volume, pos.sl, "sl")
+                elif pos.tp and low <= pos.tp:
+                    self._close(pos, pos.volume, pos.tp, "tp")
@@ -0,0 +1,146 @@
+"""
+Per-iteration broker state snapshot for the live bot.
+
+One main-loop iteration touches positions, pending orders, account info and
+ticks from several subsystems (pending-order checks, position sync, partial
+takes, P/L protection, scan summary). BrokerSnapshot fetches each of these
+once per iteration and serves every later read from memory, so all
+subsystems see the same state and MT5 sees a fraction of the calls.
+
+Order actions go through the snapshot too: each one drops the cached
+positions/orders/account so the next read reflects the change.
+"""
+
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from tradr.mt5.client import PendingOrder, Position, TickData
+
+
+@dataclass
+class BrokerSnapshotStats:
+    """Counters for snapshot effectiveness."""
+    fetches: int = 0
+    hits: int = 0
+    invalidations: int = 0
+
+    def to_dict(self) -> Dict:
+        return {
+            "fetches": self.fetches,
+            "hits": self.hits,
+            "invalidations": self.invalidations,
+        }
+
+
+class BrokerSnapshot:
+    """
+    Memoizing view over an MT5 client, reset once per main-loop iteration.
+
+    Reads: get_my_positions, get_my_pending_orders, get_account_info, get_tick.
+    Order actions: place_pending_order, place_market_order, cancel_pending_order,
+    close_position, partial_close, modify_sl_tp (each invalidates account state).
+
+    Cached values also expire after `max_age_seconds`, so a long iteration
+    (e.g. a full scan) never works from a minutes-old view.
+    """
+
+    def __init__(self, client, max_age_seconds: float = 5.0):
+        self.client = client
+        self.max_age_seconds = max_age_seconds
+        self.stats = BrokerSnapshotStats()
+        self._values: Dict[str, Tuple[float, object]] = {}
+        self._ticks: Dict[str, Tuple[float, Optional[TickData]]] = {}
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def begin(self) -> None:
+        """Start a new iteration: forget everything fetched so far."""
+        self._values.clear()
+        self._ticks.clear()
+
+    def invalidate(self) -> None:
+        """Drop positions, orders and account info (ticks are kept)."""
+        self._values.clear()
+        self.stats.invalidations += 1
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def get_my_positions(self) -> List[Position]:
+        return self._cached("positions", self.client.get_my_positions)
+
+    def get_my_pending_orders(self) -> List[PendingOrder]:
+        return self._cached("orders", self.client.get_my_pending_orders)
+
+    def get_account_info(self) -> Dict:
+        return self._cached("account", self.client.get_account_info)
+
+    def get_tick(self, symbol: str) -> Optional[TickData]:
+        """
+        Tick for `symbol`. The first tick request of an iteration also
+        prefetches ticks for every symbol with a position or pending order.
+        """
+        if not self._ticks:
+            held = {p.symbol for p in self.get_my_positions()}
+            held.update(o.symbol for o in self.get_my_pending_orders())
+            held.add(symbol)
+            now = time.monotonic()
+            for held_symbol in held:
+                self._ticks[held_symbol] = (now, self.client.get_tick(held_symbol))
+                self.stats.fetches += 1
+            return self._ticks[symbol][1]
+
+        cached = self._ticks.get(symbol)
+        if cached is not None and time.monotonic() - cached[0] <= self.max_age_seconds:
+            self.stats.hits += 1
+            return cached[1]
+        tick = self.client.get_tick(symbol)
+        self.stats.fetches += 1
+        self._ticks[symbol] = (time.monotonic(), tick)
+        return tick
+
+    # ------------------------------------------------------------------
+    # Order actions (invalidate after each call)
+    # ------------------------------------------------------------------
+
+    def place_pending_order(self, *args, **kwargs):
+        return self._action(self.client.place_pending_order, *args, **kwargs)
+
+    def place_market_order(self, *args, **kwargs):
+        return self._action(self.client.place_market_order, *args, **kwargs)
+
+    def cancel_pending_order(self, *args, **kwargs):
+        return self._action(self.client.cancel_pending_order, *args, **kwargs)
+
+    def close_position(self, *args, **kwargs):
+        return self._action(self.client.close_position, *args, **kwargs)
+
+    def partial_close(self, *args, **kwargs):
+        return self._action(self.client.partial_close, *args, **kwargs)
+
+    def modify_sl_tp(self, *args, **kwargs):
+        return self._action(self.client.modify_sl_tp, *args, **kwargs)
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _cached(self, key: str, fetch):
+        cached = self._values.get(key)
+        if cached is not None and time.monotonic() - cached[0] <= self.max_age_seconds:
+            self.stats.hits += 1
+            return cached[1]
+        value = fetch()
+        self.stats.fetches += 1
+        self._values[key] = (time.monotonic(), value)
+        return value
+
+    def _action(self, call, *args, **kwargs):
+        try:
+            return call(*args, **kwargs)
+        finally:
+            self.invalidate()
@@ -0,0 +1,158 @@
+"""
+Replayable tick-file stand-in for MT5.
+
+Lets the streaming equity monitor (and anything else that only needs
+ticks, positions and account info) run offline. Ticks come from a CSV with
+columns:
+
+    time,symbol,bid,ask
+
+`time` is epoch seconds (int or float) or an ISO-8601 timestamp. The replay
+clock only moves when advance()/seek() are called, so tests are
+deterministic. Positions are supplied by the caller. Account equity is
+balance plus open P/L at the current replay prices, valued with the same
+contract specs as the live monitor; crosses are converted to USD with the
+replayed ticks of their conversion pair (USDJPY for GBPJPY), so the file
+should include them.
+"""
+
+import bisect
+import csv
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from tradr.mt5.client import Position, TickData
+from tradr.risk.equity_monitor import position_pnl_usd
+
+
+def _parse_time(value: str) -> float:
+    try:
+        return float(value)
+    except ValueError:
+        dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=timezone.utc)
+        return dt.timestamp()
+
+
+class TickReplayClient:
+    """
+    Minimal MT5Client surface backed by a recorded tick file.
+
+    Implements get_tick, get_my_positions, get_positions and get_account_info;
+    `connected` is always True.
+    """
+
+    connected = True
+
+    def __init__(self, ticks: Dict[str, List[Tuple[float, float, float]]], balance: float = 10000.0):
+        self._times: Dict[str, List[float]] = {}
+        self._quotes: Dict[str, List[Tuple[float, float]]] = {}
+        for symbol, rows in ticks.items():
+            rows = sorted(rows)
+            self._times[symbol] = [r[0] for r in rows]
+            self._quotes[symbol] = [(r[1], r[2]) for r in rows]
+        starts = [times[0] for times in self._times.values() if times]
+        self.clock: float = min(starts) if starts else 0.0
+        self.balance = balance
+        self.positions: List[Position] = []
+
+    @classmethod
+    def from_csv(cls, path, balance: float = 10000.0) -> "TickReplayClient":
+        ticks: Dict[str, List[Tuple[float, float, float]]] = {}
+        with Path(path).open(newline="") as f:
+            for row in csv.DictReader(f):
+                ticks.setdefault(row["symbol"], []).append(
+                    (_parse_time(row["time"]), float(row["bid"]), float(row["ask"]))
+                )
+        return cls(ticks, balance=balance)
+
+    @property
+    def end_time(self) -> float:
+        ends = [times[-1] for times in self._times.values() if times]
+        return max(ends) if ends else self.clock
+
+    def seek(self, timestamp: float) -> None:
+        self.clock = timestamp
+
+    def advance(self, seconds: float) -> None:
+        self.clock += seconds
+
+    def add_position(
+        self,
+        ticket: int,
+        symbol: str,
+        direction: str,
+        volume: float,
+        price_open: float,
+        magic: int = 0,
+    ) -> Position:
+        position = Position(
+            ticket=ticket,
+            symbol=symbol,
+            type=0 if direction == "bullish" else 1,
+            volume=volume,
+            price_open=price_open,
+            sl=0.0,
+            tp=0.0,
+            profit=0.0,
+            time=datetime.fromtimestamp(self.clock, tz=timezone.utc),
+            magic=magic,
+            comment="replay",
+        )
+        self.positions.append(position)
+        return position
+
+    def get_tick(self, symbol: str) -> Optional[TickData]:
+        """Latest tick at or before the replay clock."""
+        times = self._times.get(symbol)
+        if not times:
+            return None
+        i = bisect.bisect_right(times, self.clock) - 1
+        if i < 0:
+            return None
+        bid, ask = self._quotes[symbol][i]
+        return TickData(
+            symbol=symbol,
+            bid=bid,
+            ask=ask,
+            time=datetime.fromtimestamp(times[i], tz=timezone.utc),
+            spread=ask - bid,
+        )
+
+    def get_positions(self, symbol: str = None) -> List[Position]:
+        for pos in self.positions:
+            pos.profit = self._position_profit(pos)
+        if symbol:
+            return [p for p in self.positions if p.symbol == symbol]
+        return list(self.positions)
+
+    def get_my_positions(self) -> List[Position]:
+        return self.get_positions()
+
+    def get_account_info(self) -> Dict:
+        open_pnl = sum(self._position_profit(p) for p in self.positions)
+        return {
+            "login": 0,
+            "server": "tick-replay",
+            "balance": self.balance,
+            "equity": self.balance + open_pnl,
+            "margin": 0.0,
+            "free_margin": self.balance + open_pnl,
+            "leverage": 100,
+            "currency": "USD",
+        }
+
+    def _position_profit(self, pos: Position) -> float:
+        tick = self.get_tick(pos.symbol)
+        if tick is None:
+            return 0.0
+        direction = 1 if pos.type == 0 else -1
+        price = tick.bid if direction > 0 else tick.ask
+        return position_pnl_usd(pos.symbol, direction, pos.volume, pos.price_open, price, self._mid) or 0.0
+
+    def _mid(self, symbol: str) -> Optional[float]:
+        """Mid price at the replay clock (conversion rates for crosses)."""
+        tick = self.get_tick(symbol)
+        return (tick.bid + tick.ask) / 2 if tick is not None else None
@@ -15,10 +15,17 @@ from tradr.risk.position_sizing import (
     get_pip_value,
 )
 
+from tradr.risk.equity_monitor import (
+    StreamingEquityMonitor,
+    EquityCheck,
+)
+
 __all__ = [
     "RiskManager",
     "RiskCheckResult",
     "ChallengeState",
     "calculate_lot_size",
     "get_pip_value",
+    "StreamingEquityMonitor",
+    "EquityCheck",
 ]
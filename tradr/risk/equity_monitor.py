@@ -0,0 +1,307 @@
+"""
+Streaming equity monitor for the live bot.
+
+monitor_live_pnl / execute_protection_actions look at broker equity every
+protection interval. Between those checks a fast move can carry equity
+through the emergency thresholds. This monitor polls ticks for the symbols
+with open positions at a much higher rate and re-prices the book locally:
+
+    equity = broker equity at last sync
+           + sum((price_now - price_at_sync) * direction * volume * usd_per_unit)
+
+where usd_per_unit is contract size times the USD value of the quote
+currency: 1 for USD-quoted symbols, 1/price for USD-based ones, and the
+live rate of the conversion pair for crosses (USDJPY for GBPJPY, GBPUSD
+for EURGBP), whose ticks are polled along with the positions. No account
+call is needed per tick.
+
+When the local estimate crosses RiskManager.should_emergency_close, or
+drops by more than `trigger_move_pct` since the last sync, the caller runs
+the existing protection actions immediately.
+"""
+
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+from symbol_registry import lookup_symbol
+from tradr.risk.position_sizing import get_contract_specs
+
+# rate(symbol) -> current mid price, or None if unknown
+RateLookup = Callable[[str], Optional[float]]
+
+
+def symbol_currencies(symbol: str) -> Tuple[str, str]:
+    """(base, quote) currency of a symbol; indices and unknown symbols are USD-quoted."""
+    info = lookup_symbol(symbol)
+    name = info.oanda if info is not None else symbol.replace(".", "").replace("/", "_").upper()
+    if "_" in name:
+        base, quote = name.rsplit("_", 1)
+        return base, quote
+    if len(name) == 6 and name.isalpha():
+        return name[:3], name[3:]
+    return name, "USD"
+
+
+def conversion_symbol(symbol: str) -> Optional[str]:
+    """Broker symbol whose price converts the quote currency to USD (None if not needed)."""
+    base, quote = symbol_currencies(symbol)
+    if quote == "USD" or base == "USD":
+        return None
+    for pair in (f"{quote}USD", f"USD{quote}"):
+        info = lookup_symbol(pair)
+        if info is not None:
+            return info.broker
+    return f"USD{quote}"
+
+
+def quote_to_usd(symbol: str, price: float, rate: Optional[RateLookup] = None) -> Optional[float]:
+    """
+    USD value of one unit of the symbol's quote currency.
+
+    None for a cross when `rate` can't price its conversion symbol.
+    """
+    base, quote = symbol_currencies(symbol)
+    if quote == "USD":
+        return 1.0
+    if base == "USD":
+        return 1.0 / price if price > 0 else None
+    pair = conversion_symbol(symbol)
+    conversion = rate(pair) if rate is not None else None
+    if not conversion or conversion <= 0:
+        return None
+    return conversion if symbol_currencies(pair)[1] == "USD" else 1.0 / conversion
+
+
+def usd_per_price_unit(symbol: str, price: float, rate: Optional[RateLookup] = None) -> Optional[float]:
+    """USD P/L of a 1.0 price move on one lot of `symbol` (None if the quote can't be converted)."""
+    quote_usd = quote_to_usd(symbol, price, rate)
+    if quote_usd is None:
+        return None
+    return get_contract_specs(symbol).get("contract_size", 100000) * quote_usd
+
+
+def position_pnl_usd(
+    symbol: str,
+    direction: int,
+    volume: float,
+    from_price: float,
+    to_price: float,
+    rate: Optional[RateLookup] = None,
+) -> Optional[float]:
+    """
+    USD P/L of moving `volume` lots from from_price to to_price (direction +1 long, -1 short).
+
+    Crosses need `rate` for their conversion symbol; None when it can't price it.
+    """
+    usd_per_unit = usd_per_price_unit(symbol, to_price, rate)
+    if usd_per_unit is None:
+        return None
+    return (to_price - from_price) * direction * volume * usd_per_unit
+
+
+@dataclass
+class _MonitoredPosition:
+    ticket: int
+    symbol: str
+    direction: int
+    volume: float
+    sync_price: Optional[float]
+
+
+@dataclass
+class EquityMonitorStats:
+    """Counters and latency (ms) of the streaming monitor."""
+    evaluations: int = 0
+    syncs: int = 0
+    triggers: int = 0
+    budget_breaches: int = 0
+    last_latency_ms: float = 0.0
+    max_latency_ms: float = 0.0
+
+    def to_dict(self) -> Dict:
+        return {
+            "evaluations": self.evaluations,
+            "syncs": self.syncs,
+            "triggers": self.triggers,
+            "budget_breaches": self.budget_breaches,
+            "last_latency_ms": round(self.last_latency_ms, 1),
+            "max_latency_ms": round(self.max_latency_ms, 1),
+        }
+
+
+@dataclass
+class EquityCheck:
+    """Result of one streaming evaluation."""
+    equity: float
+    daily_loss_pct: float
+    total_dd_pct: float
+    triggered: bool = False
+    reason: str = ""
+    latency_ms: float = 0.0
+
+
+class StreamingEquityMonitor:
+    """
+    Local, tick-driven equity estimate between broker syncs.
+
+    Usage per fast tick:
+        if monitor.needs_sync():
+            monitor.sync(client.get_my_positions(), client.get_account_info(), client.get_tick)
+        check = monitor.poll(client.get_tick)
+        if check and check.triggered:
+            run the emergency/protection actions, then monitor.sync(...)
+    """
+
+    def __init__(
+        self,
+        risk_manager,
+        latency_budget_ms: float = 1000.0,
+        trigger_move_pct: float = 0.5,
+        resync_seconds: float = 10.0,
+    ):
+        self.risk_manager = risk_manager
+        self.latency_budget_ms = latency_budget_ms
+        self.trigger_move_pct = trigger_move_pct
+        self.resync_seconds = resync_seconds
+        self.stats = EquityMonitorStats()
+        self._positions: List[_MonitoredPosition] = []
+        self._sync_equity: Optional[float] = None
+        self._synced_at: Optional[float] = None
+        self._prices: Dict[str, Tuple[float, float]] = {}
+
+    @property
+    def symbols(self) -> List[str]:
+        """Symbols polled per tick: open positions plus the conversion pairs of crosses."""
+        symbols = {p.symbol for p in self._positions}
+        symbols.update(filter(None, (conversion_symbol(s) for s in list(symbols))))
+        return sorted(symbols)
+
+    def needs_sync(self) -> bool:
+        return self._synced_at is None or time.monotonic() - self._synced_at >= self.resync_seconds
+
+    def invalidate(self) -> None:
+        """Force a broker sync before the next evaluation (e.g. after order actions)."""
+        self._synced_at = None
+
+    def sync(self, positions: List, account: Dict, get_tick=None) -> None:
+        """
+        Re-anchor on broker truth: equity from account info, volumes from positions.
+
+        Position objects need ticket, symbol, type (0 buy / 1 sell) and volume.
+        With `get_tick`, the prices of the position and conversion symbols are
+        fetched right after the account snapshot so the sync price matches the
+        equity it is anchored to. A symbol without a tick then (or without
+        `get_tick`) falls back to the last polled price, or the first tick
+        after the sync.
+        """
+        equity = account.get("equity") if account else None
+        if not equity:
+            return
+        self._sync_equity = float(equity)
+        if get_tick is not None:
+            symbols = {p.symbol for p in positions}
+            symbols.update(filter(None, (conversion_symbol(s) for s in list(symbols))))
+            for symbol in symbols:
+                tick = get_tick(symbol)
+                if tick is not None:
+                    self._prices[symbol] = (tick.bid, tick.ask)
+        self._positions = [
+            _MonitoredPosition(
+                ticket=p.ticket,
+                symbol=p.symbol,
+                direction=1 if p.type == 0 else -1,
+                volume=float(p.volume),
+                sync_price=self._exit_price(p.symbol, 1 if p.type == 0 else -1),
+            )
+            for p in positions
+        ]
+        self._synced_at = time.monotonic()
+        self.stats.syncs += 1
+
+    def update_tick(self, symbol: str, bid: float, ask: float) -> None:
+        self._prices[symbol] = (bid, ask)
+        for pos in self._positions:
+            if pos.symbol == symbol and pos.sync_price is None:
+                pos.sync_price = self._exit_price(symbol, pos.direction)
+
+    def estimate_equity(self) -> Optional[float]:
+        """Broker equity at sync plus locally re-priced open P/L since then."""
+        if self._sync_equity is None:
+            return None
+        equity = self._sync_equity
+        for pos in self._positions:
+            price = self._exit_price(pos.symbol, pos.direction)
+            if price is None or pos.sync_price is None:
+                continue
+            pnl = position_pnl_usd(pos.symbol, pos.direction, pos.volume, pos.sync_price, price, self._mid)
+            if pnl is not None:
+                equity += pnl
+        return equity
+
+    def evaluate(self, started: Optional[float] = None) -> Optional[EquityCheck]:
+        """Check the local estimate against the RiskManager thresholds."""
+        equity = self.estimate_equity()
+        if equity is None:
+            return None
+
+        state = self.risk_manager.state
+        daily_loss_pct = 0.0
+        if equity < state.day_start_balance:
+            daily_loss_pct = (state.day_start_balance - equity) / state.day_start_balance * 100
+        total_dd_pct = 0.0
+        if equity < state.initial_balance:
+            total_dd_pct = (state.initial_balance - equity) / state.initial_balance * 100
+
+        triggered, reason = self.risk_manager.should_emergency_close(equity)
+        if not triggered and self._sync_equity:
+            move_pct = (self._sync_equity - equity) / self._sync_equity * 100
+            if move_pct >= self.trigger_move_pct:
+                triggered = True
+                reason = f"Equity down {move_pct:.2f}% since last sync (trigger: {self.trigger_move_pct}%)"
+
+        latency_ms = (time.monotonic() - started) * 1000 if started is not None else 0.0
+        self.stats.evaluations += 1
+        self.stats.last_latency_ms = latency_ms
+        self.stats.max_latency_ms = max(self.stats.max_latency_ms, latency_ms)
+        if latency_ms > self.latency_budget_ms:
+            self.stats.budget_breaches += 1
+        if triggered:
+            self.stats.triggers += 1
+
+        return EquityCheck(
+            equity=equity,
+            daily_loss_pct=daily_loss_pct,
+            total_dd_pct=total_dd_pct,
+            triggered=triggered,
+            reason=reason,
+            latency_ms=latency_ms,
+        )
+
+    def poll(self, get_tick) -> Optional[EquityCheck]:
+        """
+        Pull one tick per monitored symbol via get_tick(symbol) and evaluate.
+
+        Latency covers the tick fetches plus the evaluation.
+        """
+        started = time.monotonic()
+        for symbol in self.symbols:
+            tick = get_tick(symbol)
+            if tick is not None:
+                self.update_tick(symbol, tick.bid, tick.ask)
+        return self.evaluate(started)
+
+    def _mid(self, symbol: str) -> Optional[float]:
+        prices = self._prices.get(symbol)
+        if prices is None:
+            return None
+        return (prices[0] + prices[1]) / 2
+
+    def _exit_price(self, symbol: str, direction: int) -> Optional[float]:
+        """Longs are valued at the bid, shorts at the ask."""
+        prices = self._prices.get(symbol)
+        if prices is None:
+            return None
+        return prices[0] if direction > 0 else prices[1]
@@ -7,13 +7,13 @@ All risk checks happen BEFORE a trade is placed.
 
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass, field, asdict
 from datetime import datetime, date, timezone
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Any
 
 from tradr.risk.position_sizing import calculate_lot_size, get_pip_value, get_contract_specs
+from tradr.utils.state_store import state_store_for
 
 
 @dataclass
@@ -175,24 +175,23 @@ class RiskManager:
     
     def __init__(self, state_file: str = "challenge_state.json"):
         self.state_file = Path(state_file)
+        self._store = state_store_for(self.state_file)
         self.state = self._load_state()
     
     def _load_state(self) -> ChallengeState:
-        """Load state from file or create new."""
-        if self.state_file.exists():
-            try:
-                with open(self.state_file, 'r') as f:
-                    data = json.load(f)
+        """Load state from the state store (imports the legacy JSON file once) or create new."""
+        try:
+            data = self._store.get(self.state_file.name, legacy_file=self.state_file)
+            if data is not None:
                 return ChallengeState.from_dict(data)
-            except Exception as e:
-                print(f"[RiskManager] Error loading state: {e}")
+        except Exception as e:
+            print(f"[RiskManager] Error loading state: {e}")
         return ChallengeState()
     
     def save_state(self):
-        """Save state to file."""
+        """Queue the state for the state store's next atomic commit."""
         try:
-            with open(self.state_file, 'w') as f:
-                json.dump(self.state.to_dict(), f, indent=2, default=str)
+            self._store.put(self.state_file.name, self.state.to_dict())
         except Exception as e:
             print(f"[RiskManager] Error saving state: {e}")
     
@@ -6,6 +6,10 @@ Calculates lot sizes based on risk parameters and contract specifications.
 
 from typing import Dict, Optional
 
+import numpy as np
+
+from symbol_registry import lookup_symbol
+
 
 CONTRACT_SPECS = {
     "EURUSD": {"pip_value": 0.0001, "contract_size": 100000, "pip_location": 4},
@@ -50,11 +54,17 @@ CONTRACT_SPECS = {
 
 def normalize_symbol(symbol: str) -> str:
     """Normalize symbol format (remove underscores, dots, etc)."""
+    info = lookup_symbol(symbol)
+    if info is not None:
+        return info.key
     return symbol.replace("_", "").replace(".", "").replace("/", "").upper()
 
 
 def get_contract_specs(symbol: str) -> Dict:
     """Get contract specifications for a symbol."""
+    info = lookup_symbol(symbol)
+    if info is not None:
+        return info.contract_specs
     normalized = normalize_symbol(symbol)
     return CONTRACT_SPECS.get(normalized, {
         "pip_value": 0.0001,
@@ -179,3 +189,49 @@ def calculate_lot_size(
         "stop_pips": round(stop_pips, 1),
         "actual_risk_pct": round(actual_risk_pct, 4),
     }
+
+
+def calculate_lot_sizes(
+    symbol: str,
+    entry_prices: np.ndarray,
+    stop_loss_prices: np.ndarray,
+    account_balance: float,
+    risk_percent: float,
+    max_lot: float = 10.0,
+    min_lot: float = 0.01,
+) -> np.ndarray:
+    """
+    Vectorized calculate_lot_size() for many trades on one symbol.
+    
+    Specs and pip value rules are resolved once for the symbol; the per-trade
+    math runs on arrays. Missing prices or a zero stop give 0.0 lots, like
+    the scalar version.
+    
+    Returns:
+        Array of lot sizes aligned with the inputs
+    """
+    entry = np.asarray(entry_prices, dtype=np.float64)
+    stop = np.asarray(stop_loss_prices, dtype=np.float64)
+    
+    specs = get_contract_specs(symbol)
+    pip_size = specs.get("pip_value", 0.0001)
+    contract_size = specs.get("contract_size", 100000)
+    pip_location = specs.get("pip_location", 4)
+    normalized = normalize_symbol(symbol)
+    
+    stop_distance = np.abs(entry - stop)
+    stop_pips = stop_distance if pip_location == 0 else stop_distance / pip_size
+    
+    if normalized.endswith("USD") or not normalized.startswith("USD"):
+        pip_value_per_lot = np.full(entry.shape, pip_size * contract_size)
+    else:
+        fallback = 150.0 if "JPY" in normalized else 1.0
+        with np.errstate(divide="ignore", invalid="ignore"):
+            pip_value_per_lot = np.where(entry > 0, pip_size / entry, pip_size / fallback) * contract_size
+    
+    risk_usd = account_balance * risk_percent
+    with np.errstate(divide="ignore", invalid="ignore"):
+        lots = risk_usd / (stop_pips * pip_value_per_lot)
+    lots = np.clip(np.round(lots, 2), min_lot, max_lot)
+    lots = np.where(pip_value_per_lot > 0, lots, min_lot)
+    return np.where(np.isfinite(stop_pips) & (stop_pips > 0), lots, 0.0)
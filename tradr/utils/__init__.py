@@ -1,12 +1,15 @@
 """
-Utilities module - Logging, state management, helpers.
+Utilities module - Logging, state management, scheduling, helpers.
 """
 
 from tradr.utils.logger import setup_logger, get_logger
 from tradr.utils.state import StateManager
+from tradr.utils.scheduler import LoopScheduler, PriorityLock
 
 __all__ = [
     "setup_logger",
     "get_logger",
     "StateManager",
+    "LoopScheduler",
+    "PriorityLock",
 ]
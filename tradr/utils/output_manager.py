@@ -6,7 +6,9 @@ Centralized module for all optimization output files.
 Output Files:
 -------------
 ftmo_analysis_output/{MODE}/
-├── optimization.log           # Real-time trial logging (current run only)
+├── trials.journal             # Append-only binary trial journal (all runs)
+├── trials.params.jsonl        # Params of every new best trial (append-only)
+├── optimization.log           # Human-readable trials of the current run (appended per journal batch)
 ├── best_trades_training.csv   # All trades from best trial - training period
 ├── best_trades_validation.csv # All trades from best trial - validation period  
 ├── best_trades_final.csv      # All trades from best trial - full period
@@ -16,6 +18,7 @@ ftmo_analysis_output/{MODE}/
 └── history/                   # Archived runs (each run in separate directory)
     ├── run_001/               # First optimization run
     │   ├── optimization.log
+    │   ├── trials.journal
     │   ├── best_trades_training.csv
     │   ├── best_trades_validation.csv
     │   ├── best_trades_final.csv
@@ -45,8 +48,6 @@ Usage:
     om.generate_final_report()
 """
 
-import csv
-import json
 import os
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
@@ -54,6 +55,13 @@ from pathlib import Path
 from typing import List, Dict, Any, Optional
 import pandas as pd
 
+from tradr.utils.trial_journal import (
+    JOURNAL_FILENAME,
+    PARAMS_FILENAME,
+    TrialJournal,
+    write_json_atomic,
+)
+
 
 # Base output directory - subdirectories created per optimization mode
 BASE_OUTPUT_DIR = Path("ftmo_analysis_output")
@@ -91,7 +99,8 @@ class OutputManager:
     Centralized output manager for optimization results.
     
     Features:
-    - Real-time trial logging to CSV (nohup compatible)
+    - Real-time trial logging: append-only journal, mirrored batch by batch
+      to optimization.log (nohup compatible)
     - Best trial trade exports (training/validation/final)
     - Monthly statistics breakdown
     - Symbol performance analysis
@@ -124,6 +133,8 @@ class OutputManager:
         self.monthly_stats_file = self.output_dir / "monthly_stats.csv"
         self.symbol_perf_file = self.output_dir / "symbol_performance.csv"
         self.report_file = self.output_dir / "optimization_report.csv"
+        self.journal_file = self.output_dir / JOURNAL_FILENAME
+        self.params_journal_file = self.output_dir / PARAMS_FILENAME
         
         # Track best trial
         self.best_score = float('-inf')
@@ -133,6 +144,9 @@ class OutputManager:
         
         # Initialize fresh log file (archiving happens at END of run, not start)
         self._init_log_file()
+        
+        # Trials of this run are journal records from journal.start_index on
+        self.journal = TrialJournal(self.journal_file, text_log=self.log_file)
     
     def sync_best_from_study(self, study_best_value: float, study_best_trial_number: int = None):
         """
@@ -196,9 +210,13 @@ class OutputManager:
         
         history_dir = self.output_dir / "history"
 
+        self.journal.flush()
+        
         # Files to archive (explicit list)
         files_to_archive = [
             self.log_file,
+            self.journal_file,
+            self.params_journal_file,
             self.best_training_file,
             self.best_validation_file,
             self.best_final_file,
@@ -249,9 +267,13 @@ class OutputManager:
         history_dir = self.output_dir / "history"
         history_dir.mkdir(exist_ok=True)
 
+        self.journal.flush()
+
         # Files to archive (same as regular runs)
         files_to_archive = [
             self.log_file,
+            self.journal_file,
+            self.params_journal_file,
             self.best_training_file,
             self.best_validation_file,
             self.best_final_file,
@@ -302,9 +324,10 @@ class OutputManager:
         final_metrics: Optional[Dict] = None,
         ftmo_dd_pct: Optional[float] = None,
         ftmo_challenge_passed: Optional[bool] = None,
+        params: Optional[Dict[str, Any]] = None,
     ) -> bool:
         """
-        Log a trial result to log file. Returns True if this is a new best.
+        Log a trial result to the trial journal. Returns True if this is a new best.
         
         Args:
             trial_number: Optuna trial number
@@ -318,6 +341,7 @@ class OutputManager:
             max_drawdown_pct: Maximum drawdown percentage
             val_metrics: Validation period metrics (dict with total_r, sharpe, win_rate, profit_usd)
             final_metrics: Final period metrics (dict with total_r, sharpe, win_rate, profit_usd)
+            params: Trial parameters, appended to trials.params.jsonl when this is a new best
         
         Returns:
             True if this trial is new best, False otherwise
@@ -327,34 +351,28 @@ class OutputManager:
             self.best_score = score
             self.best_trial_number = trial_number
         
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        
-        # Write to log file in human-readable format
-        with open(self.log_file, 'a') as f:
-            if is_best:
-                f.write("-" * 80 + "\n")
-                f.write(f"🏆 NEW BEST - Trial #{trial_number} [{timestamp}]\n")
-                f.write("-" * 80 + "\n")
-            else:
-                f.write(f"Trial #{trial_number} [{timestamp}]\n")
-            
-            f.write(f"  Score: {score:.2f} | R: {total_r:+.1f} | Sharpe: {sharpe_ratio:.3f}\n")
-            f.write(f"  Win Rate: {win_rate:.1f}% | PF: {profit_factor:.2f} | Trades: {total_trades}\n")
-            f.write(f"  Profit: ${profit_usd:,.2f} | Max DD: {max_drawdown_pct:.2f}%\n")
-
-            if ftmo_dd_pct is not None:
-                status = "PASS" if ftmo_challenge_passed else "FAIL"
-                f.write(f"  FTMO DD: {ftmo_dd_pct:.1f}% | Challenge: {status}\n")
-            
-            if val_metrics:
-                f.write(f"  [Validation] R: {val_metrics['total_r']:+.1f} | ")
-                f.write(f"WR: {val_metrics['win_rate']:.1f}% | ${val_metrics['profit_usd']:,.2f}\n")
-            
-            if final_metrics:
-                f.write(f"  [Final 2023-2025] R: {final_metrics['total_r']:+.1f} | ")
-                f.write(f"WR: {final_metrics['win_rate']:.1f}% | ${final_metrics['profit_usd']:,.2f}\n")
-            
-            f.write("\n")
+        # Fixed-size binary record; each flushed batch is also appended to optimization.log
+        self.journal.append(
+            trial_number=trial_number,
+            score=score,
+            total_r=total_r,
+            sharpe_ratio=sharpe_ratio,
+            win_rate=win_rate,
+            profit_factor=profit_factor,
+            total_trades=total_trades,
+            profit_usd=profit_usd,
+            max_drawdown_pct=max_drawdown_pct,
+            is_best=is_best,
+            ftmo_dd_pct=ftmo_dd_pct,
+            ftmo_challenge_passed=ftmo_challenge_passed,
+            val_metrics=val_metrics,
+            final_metrics=final_metrics,
+        )
+        if is_best:
+            # Keep the best record durable right away (a halted run still has it)
+            self.journal.flush()
+            if params:
+                self.journal.append_params(trial_number, score, params)
         
         self.trials_logged += 1
         
@@ -422,8 +440,9 @@ class OutputManager:
             "parameters": params_dict
         }
         
-        with open(params_file, 'w') as f:
-            json.dump(params_with_meta, f, indent=2)
+        write_json_atomic(params_file, params_with_meta)
+        if self.best_trial_number is not None:
+            self.journal.append_params(self.best_trial_number, self.best_score, params_dict, source="final")
         
         print(f"💾 Best parameters saved to: {params_file.name}")
     
@@ -434,46 +453,10 @@ class OutputManager:
         risk_pct: float,
         account_size: float,
     ):
-        """Export trades to CSV file."""
-        if not trades:
-            # Create empty file with headers
-            headers = [
-                'trade_id', 'symbol', 'direction', 'entry_date', 'exit_date',
-                'entry_price', 'exit_price', 'stop_loss', 'take_profit',
-                'result_r', 'profit_usd', 'win', 'confluence_score', 'quality_factors'
-            ]
-            with open(filepath, 'w', newline='') as f:
-                writer = csv.writer(f)
-                writer.writerow(headers)
-            return
+        """Export trades to CSV file (streamed in chunks; header only when empty)."""
+        from tradr.utils.trade_export import export_summary_trades
         
-        risk_per_trade = account_size * (risk_pct / 100)
-        
-        rows = []
-        for i, t in enumerate(trades, 1):
-            # Support both 'rr' (from strategy_core.Trade) and 'result_r' (legacy)
-            result_r = getattr(t, 'rr', getattr(t, 'result_r', 0))
-            profit_usd = result_r * risk_per_trade
-            
-            rows.append({
-                'trade_id': i,
-                'symbol': getattr(t, 'symbol', ''),
-                'direction': getattr(t, 'direction', ''),
-                'entry_date': str(getattr(t, 'entry_date', '')),
-                'exit_date': str(getattr(t, 'exit_date', '')),
-                'entry_price': getattr(t, 'entry_price', 0),
-                'exit_price': getattr(t, 'exit_price', 0),
-                'stop_loss': getattr(t, 'stop_loss', 0),
-                'take_profit': getattr(t, 'tp1', 0),
-                'result_r': round(result_r, 2),
-                'profit_usd': round(profit_usd, 2),
-                'win': 1 if result_r > 0 else 0,
-                'confluence_score': getattr(t, 'confluence_score', 0),
-                'quality_factors': getattr(t, 'quality_factors', 0),
-            })
-        
-        df = pd.DataFrame(rows)
-        df.to_csv(filepath, index=False)
+        export_summary_trades(trades, filepath, risk_pct, account_size)
     
     def generate_monthly_stats(
         self,
@@ -702,8 +685,11 @@ class OutputManager:
             self.monthly_stats_file,
             self.symbol_perf_file,
             self.report_file,
+            self.journal_file,
+            self.params_journal_file,
         ]
         
+        self.journal.close()
         for f in files_to_clear:
             if f.exists():
                 f.unlink()
@@ -712,6 +698,7 @@ class OutputManager:
         self.best_trial_number = None
         self.trials_logged = 0
         self._init_log_file()
+        self.journal = TrialJournal(self.journal_file, text_log=self.log_file)
         
         print("🗑️  Output files cleared for fresh optimization run")
 
@@ -0,0 +1,234 @@
+"""
+Threaded task scheduler for the live bot.
+
+Tasks are grouped into lanes; each lane is a thread that runs its tasks on
+their own cadence. A slow task only delays the other tasks in its lane, so
+heavy scanning can live in a background lane while drawdown protection
+keeps its interval.
+
+Tasks that touch broker or bot state share a PriorityLock. Critical tasks
+(protection) jump ahead of normal tasks waiting on the lock, and long-running
+tasks release it between steps instead of holding it throughout.
+
+Per-task loop-lag metrics (how late each run started relative to its
+schedule, how long it took, how often it overran its interval) are kept for
+logging and status reporting.
+"""
+
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional
+
+from tradr.utils.logger import get_logger
+
+
+log = get_logger("tradr")
+
+
+class PriorityLock:
+    """
+    Re-entrant mutex where critical acquirers go ahead of normal ones.
+
+    While any critical acquirer is waiting, normal acquirers keep waiting even
+    if the lock is momentarily free, so protection never queues behind a
+    stream of short scan steps.
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._owner: Optional[int] = None
+        self._depth = 0
+        self._critical_waiting = 0
+
+    def acquire(self, critical: bool = False) -> None:
+        me = threading.get_ident()
+        with self._cond:
+            if self._owner == me:
+                self._depth += 1
+                return
+            if critical:
+                self._critical_waiting += 1
+            try:
+                while self._owner is not None or (not critical and self._critical_waiting):
+                    self._cond.wait()
+            finally:
+                if critical:
+                    self._critical_waiting -= 1
+            self._owner = me
+            self._depth = 1
+
+    def release(self) -> None:
+        with self._cond:
+            if self._owner != threading.get_ident():
+                raise RuntimeError("PriorityLock released by a thread that does not own it")
+            self._depth -= 1
+            if self._depth == 0:
+                self._owner = None
+                self._cond.notify_all()
+
+    @contextmanager
+    def critical(self):
+        self.acquire(critical=True)
+        try:
+            yield
+        finally:
+            self.release()
+
+    @contextmanager
+    def normal(self):
+        self.acquire(critical=False)
+        try:
+            yield
+        finally:
+            self.release()
+
+
+@dataclass
+class TaskStats:
+    """Loop-lag and duration metrics for one scheduled task (seconds)."""
+    runs: int = 0
+    errors: int = 0
+    overruns: int = 0
+    last_lag: float = 0.0
+    max_lag: float = 0.0
+    total_lag: float = 0.0
+    last_duration: float = 0.0
+    max_duration: float = 0.0
+
+    @property
+    def avg_lag(self) -> float:
+        return self.total_lag / self.runs if self.runs else 0.0
+
+    def to_dict(self) -> Dict:
+        return {
+            "runs": self.runs,
+            "errors": self.errors,
+            "overruns": self.overruns,
+            "last_lag": round(self.last_lag, 3),
+            "avg_lag": round(self.avg_lag, 3),
+            "max_lag": round(self.max_lag, 3),
+            "last_duration": round(self.last_duration, 3),
+            "max_duration": round(self.max_duration, 3),
+        }
+
+
+@dataclass
+class ScheduledTask:
+    """A callable run every `interval` seconds on one lane."""
+    name: str
+    interval: float
+    func: Callable[[], None]
+    lane: str = "normal"
+    critical: bool = False
+    locked: bool = True
+    next_run: float = 0.0
+    stats: TaskStats = field(default_factory=TaskStats)
+
+
+class LoopScheduler:
+    """
+    Runs scheduled tasks on one thread per lane.
+
+    Within a lane tasks run in due-time order. A run that starts more than
+    one interval late counts as an overrun; missed runs are not replayed,
+    the next run is scheduled one interval after the late one.
+
+    Tasks with locked=True run while holding the shared PriorityLock
+    (critical=True tasks get priority); tasks with locked=False are
+    expected to take the lock themselves around each step.
+    """
+
+    def __init__(self, lock: Optional[PriorityLock] = None):
+        self.lock = lock or PriorityLock()
+        self._tasks: List[ScheduledTask] = []
+        self._threads: List[threading.Thread] = []
+        self._stop = threading.Event()
+
+    def add_task(
+        self,
+        name: str,
+        interval_seconds: float,
+        func: Callable[[], None],
+        lane: str = "normal",
+        critical: bool = False,
+        locked: bool = True,
+        run_immediately: bool = True,
+    ) -> ScheduledTask:
+        task = ScheduledTask(
+            name=name,
+            interval=interval_seconds,
+            func=func,
+            lane=lane,
+            critical=critical,
+            locked=locked,
+            next_run=time.monotonic() + (0.0 if run_immediately else interval_seconds),
+        )
+        self._tasks.append(task)
+        return task
+
+    def start(self) -> None:
+        self._stop.clear()
+        lanes: Dict[str, List[ScheduledTask]] = {}
+        for task in self._tasks:
+            lanes.setdefault(task.lane, []).append(task)
+        for lane, tasks in lanes.items():
+            thread = threading.Thread(
+                target=self._run_lane, args=(tasks,), name=f"tradr-{lane}", daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self, timeout: float = 30.0) -> None:
+        """Signal all lanes to stop and wait for in-flight tasks to finish."""
+        self._stop.set()
+        deadline = time.monotonic() + timeout
+        for thread in self._threads:
+            thread.join(max(0.0, deadline - time.monotonic()))
+        self._threads = []
+
+    @property
+    def stopped(self) -> bool:
+        return self._stop.is_set()
+
+    def metrics(self) -> Dict[str, Dict]:
+        """Per-task loop-lag metrics keyed by task name."""
+        return {task.name: {"lane": task.lane, **task.stats.to_dict()} for task in self._tasks}
+
+    def _run_lane(self, tasks: List[ScheduledTask]) -> None:
+        while not self._stop.is_set():
+            task = min(tasks, key=lambda t: t.next_run)
+            delay = task.next_run - time.monotonic()
+            if delay > 0 and self._stop.wait(delay):
+                break
+            self._run_task(task)
+
+    def _run_task(self, task: ScheduledTask) -> None:
+        if task.locked:
+            self.lock.acquire(critical=task.critical)
+        try:
+            started = time.monotonic()
+            lag = max(0.0, started - task.next_run)
+            try:
+                task.func()
+            except Exception as e:
+                task.stats.errors += 1
+                log.error(f"[scheduler] Task {task.name} failed: {e}", exc_info=True)
+            finished = time.monotonic()
+        finally:
+            if task.locked:
+                self.lock.release()
+
+        stats = task.stats
+        stats.runs += 1
+        stats.last_lag = lag
+        stats.max_lag = max(stats.max_lag, lag)
+        stats.total_lag += lag
+        if lag > task.interval:
+            stats.overruns += 1
+        stats.last_duration = finished - started
+        stats.max_duration = max(stats.max_duration, stats.last_duration)
+        task.next_run += task.interval
+        if task.next_run <= finished:
+            task.next_run = started + task.interval
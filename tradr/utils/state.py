@@ -2,40 +2,40 @@
 State management utilities for persisting bot state.
 """
 
-import json
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+from tradr.utils.state_store import state_store_for
+
 
 class StateManager:
     """
-    Generic state manager for persisting data to JSON.
+    Generic state manager for persisting a JSON document.
+    
+    The document lives in the directory's state store (see state_store.py);
+    an existing `state_file` is imported on first load.
     """
     
     def __init__(self, state_file: str = "bot_state.json"):
         self.state_file = Path(state_file)
+        self._store = state_store_for(self.state_file)
         self._state: Dict[str, Any] = {}
         self._load()
     
     def _load(self):
-        """Load state from file."""
-        if self.state_file.exists():
-            try:
-                with open(self.state_file, 'r') as f:
-                    self._state = json.load(f)
-            except Exception as e:
-                print(f"[StateManager] Error loading state: {e}")
-                self._state = {}
-        else:
+        """Load state from the state store."""
+        try:
+            self._state = self._store.get(self.state_file.name, {}, legacy_file=self.state_file)
+        except Exception as e:
+            print(f"[StateManager] Error loading state: {e}")
             self._state = {}
     
     def save(self):
-        """Save state to file."""
+        """Queue state for the next batched, atomic commit."""
         try:
             self._state["_last_updated"] = datetime.now(timezone.utc).isoformat()
-            with open(self.state_file, 'w') as f:
-                json.dump(self._state, f, indent=2, default=str)
+            self._store.put(self.state_file.name, self._state)
         except Exception as e:
             print(f"[StateManager] Error saving state: {e}")
     
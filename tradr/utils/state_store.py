@@ -0,0 +1,229 @@
+"""
+Crash-safe state store for the live bot.
+
+The bot's state files (challenge_state.json, pending_setups.json,
+trading_days.json, trade_state.json, bot_state.json) used to be rewritten
+in full, in place, on every mutation from inside the trading loop; a crash
+mid-write left a truncated file. They are now documents in one SQLite
+database per directory (STATE_DB_NAME), opened in WAL mode:
+
+- put() serializes the document in the caller's thread (a snapshot of the
+  state at that moment) and returns immediately; a writer thread commits
+  everything put within STATE_FLUSH_SECONDS in one transaction, so several
+  saves in one loop iteration cost one commit and the protection lane
+  never waits on disk I/O.
+- Each commit is atomic: after a crash a document is either the previous
+  or the new version, never a mix.
+- Startup replay is one SELECT per document. A document that is not in the
+  database yet is imported once from its legacy JSON file; once the import
+  is committed the file is renamed to *.json.migrated (LEGACY_SUFFIX), so
+  deleting the database later never brings back stale JSON state.
+
+Usage:
+    from tradr.utils.state_store import state_store_for
+
+    store = state_store_for("challenge_state.json")
+    data = store.get("challenge_state.json", legacy_file=Path("challenge_state.json"))
+    store.put("challenge_state.json", data)
+    store.flush()   # on shutdown; also runs at exit
+"""
+
+import atexit
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+
+STATE_DB_NAME = "bot_state.db"
+
+# Saves arriving within this window are committed together
+STATE_FLUSH_SECONDS = 0.2
+
+# Appended to a legacy JSON file once it has been imported
+LEGACY_SUFFIX = ".migrated"
+
+_MISSING = object()
+
+
+class StateStore:
+    """JSON documents in a SQLite WAL database, written by a background thread."""
+
+    def __init__(self, db_path: Path, flush_seconds: float = STATE_FLUSH_SECONDS):
+        self.db_path = Path(db_path)
+        self.flush_seconds = flush_seconds
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=FULL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS documents ("
+            " name TEXT PRIMARY KEY,"
+            " body TEXT NOT NULL,"
+            " updated_at REAL NOT NULL)"
+        )
+        self._db_lock = threading.Lock()
+
+        # name -> serialized body (None = delete); last put wins
+        self._pending: Dict[str, Optional[str]] = {}
+        self._cond = threading.Condition()
+        self._committed_seq = 0
+        self._put_seq = 0
+        self._closed = False
+
+        self._writer = threading.Thread(target=self._write_loop, name=f"state-store-{self.db_path.name}", daemon=True)
+        self._writer.start()
+        atexit.register(self.close)
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def get(self, name: str, default: Any = None, legacy_file: Optional[Path] = None) -> Any:
+        """
+        Current document (including saves not committed yet).
+
+        When the document isn't stored yet and `legacy_file` exists, its
+        JSON is imported and stored, and the file is renamed with
+        LEGACY_SUFFIX after the commit. If the commit can't be confirmed the
+        file stays in place and is imported again next time.
+        """
+        with self._cond:
+            body = self._pending.get(name, _MISSING)
+        if body is _MISSING:
+            with self._db_lock:
+                row = self._conn.execute("SELECT body FROM documents WHERE name = ?", (name,)).fetchone()
+            body = row[0] if row else _MISSING
+
+        if body is _MISSING and legacy_file is not None and Path(legacy_file).exists():
+            try:
+                with open(legacy_file, 'r') as f:
+                    data = json.load(f)
+            except Exception as e:
+                print(f"[StateStore] Error importing {legacy_file}: {e}")
+                return default
+            self.put(name, data)
+            print(f"[StateStore] Imported {legacy_file} into {self.db_path}")
+            self._retire_legacy(Path(legacy_file))
+            return data
+
+        if body is _MISSING or body is None:
+            return default
+        return json.loads(body)
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def put(self, name: str, value: Any):
+        """Queue a document for the next batched commit (never blocks on disk)."""
+        body = json.dumps(value, default=str, separators=(",", ":"))
+        with self._cond:
+            self._pending[name] = body
+            self._put_seq += 1
+            self._cond.notify_all()
+
+    def delete(self, name: str):
+        with self._cond:
+            self._pending[name] = None
+            self._put_seq += 1
+            self._cond.notify_all()
+
+    def flush(self, timeout: Optional[float] = 5.0) -> bool:
+        """Wait until everything put so far is committed; False on timeout."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            target = self._put_seq
+            self._cond.notify_all()
+            while self._committed_seq < target and not self._closed:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+            return self._committed_seq >= target
+
+    def close(self):
+        if self._closed:
+            return
+        self.flush()
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._writer.join(timeout=5.0)
+        with self._db_lock:
+            self._conn.close()
+
+    def _retire_legacy(self, legacy_file: Path):
+        """Rename an imported legacy file once its document is committed."""
+        if not self.flush():
+            print(f"[StateStore] Import of {legacy_file} not committed yet; keeping the file")
+            return
+        migrated = legacy_file.with_name(legacy_file.name + LEGACY_SUFFIX)
+        try:
+            legacy_file.replace(migrated)
+        except OSError as e:
+            print(f"[StateStore] Error renaming {legacy_file}: {e}")
+
+    def _write_loop(self):
+        while True:
+            with self._cond:
+                while not self._pending and not self._closed:
+                    self._cond.wait()
+                if self._closed and not self._pending:
+                    return
+            # Let the rest of this loop iteration's saves arrive
+            time.sleep(self.flush_seconds)
+
+            with self._cond:
+                batch, self._pending = self._pending, {}
+                seq = self._put_seq
+            try:
+                self._commit(batch)
+            except sqlite3.Error as e:
+                print(f"[StateStore] Error saving state: {e}")
+                with self._cond:
+                    # Keep newer puts, retry the failed documents next round
+                    for name, body in batch.items():
+                        self._pending.setdefault(name, body)
+                time.sleep(1.0)
+                continue
+            with self._cond:
+                self._committed_seq = max(self._committed_seq, seq)
+                self._cond.notify_all()
+
+    def _commit(self, batch: Dict[str, Optional[str]]):
+        now = time.time()
+        with self._db_lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                for name, body in batch.items():
+                    if body is None:
+                        self._conn.execute("DELETE FROM documents WHERE name = ?", (name,))
+                    else:
+                        self._conn.execute(
+                            "INSERT INTO documents (name, body, updated_at) VALUES (?, ?, ?) "
+                            "ON CONFLICT(name) DO UPDATE SET body = excluded.body, updated_at = excluded.updated_at",
+                            (name, body, now),
+                        )
+                self._conn.execute("COMMIT")
+            except sqlite3.Error:
+                self._conn.execute("ROLLBACK")
+                raise
+
+
+_STORES: Dict[Path, StateStore] = {}
+_STORES_LOCK = threading.Lock()
+
+
+def state_store_for(state_file) -> StateStore:
+    """Shared StateStore for the directory a state file lives in."""
+    db_path = (Path(state_file).parent / STATE_DB_NAME).resolve()
+    with _STORES_LOCK:
+        store = _STORES.get(db_path)
+        if store is None or store._closed:
+            store = StateStore(db_path)
+            _STORES[db_path] = store
+        return store
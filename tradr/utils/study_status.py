@@ -0,0 +1,235 @@
+"""
+Study status straight from the Optuna SQLite storage.
+
+optuna.load_study() + study.trials deserializes every trial with all of
+its params and user_attrs (compliance_report, quarterly_stats, ...) just to
+count states or find the best few trials. The queries here read only the
+columns they need from Optuna's tables:
+
+    studies, study_directions            study id and objective directions
+    trials                               state, number, datetimes
+    trial_values                         objective values
+    trial_params                         params of the K returned trials
+    trial_user_attributes                scalar attrs of the K returned trials
+
+State counts are one GROUP BY over the study_id index; top-K and recent
+trials are ORDER BY ... LIMIT K over an index, so they return K rows
+regardless of study size. The optimizer adds an (objective, value) index
+on trial_values when it creates or loads the study (ensure_value_index;
+Optuna ignores extra indexes). Without it top-K is a single sorted scan in
+SQLite, still well under a second at six-figure trial counts.
+
+The DB is opened read-only through a URI, so status checks never take the
+writer lock of a running optimization.
+
+Usage:
+    from tradr.utils.study_status import StudyStatusReader
+
+    with StudyStatusReader("sqlite:///regime_adaptive_v2_clean.db", "regime_adaptive_v2_clean") as status:
+        status.state_counts(), status.top(5), status.recent(10), status.best_params()
+"""
+
+import json
+import sqlite3
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+
+VALUE_INDEX_NAME = "ix_trial_values_objective_value"
+
+# Scalar user attrs fetched with top/recent trials (the heavy dict attrs are never read)
+SUMMARY_ATTRS = (
+    "sharpe_ratio", "win_rate", "total_r", "max_drawdown_pct",
+    "profit_factor", "total_trades", "ftmo_challenge_passed",
+)
+
+
+def sqlite_path(storage: str) -> Path:
+    """File path of a sqlite:/// storage URL (plain paths pass through)."""
+    if storage.startswith("sqlite:///"):
+        return Path(storage[len("sqlite:///"):])
+    return Path(storage)
+
+
+def ensure_value_index(storage) -> bool:
+    """
+    Create the (objective, value) index on trial_values; False if the DB can't be written.
+
+    Takes the writer lock (and scans trial_values on the first call), so it
+    belongs where the optimizer opens its study, not in status checks.
+    """
+    db_path = sqlite_path(str(storage))
+    try:
+        conn = sqlite3.connect(str(db_path), timeout=1.0)
+        try:
+            conn.execute(
+                f"CREATE INDEX IF NOT EXISTS {VALUE_INDEX_NAME} ON trial_values (objective, value)"
+            )
+            conn.commit()
+        finally:
+            conn.close()
+        return True
+    except sqlite3.Error:
+        return False
+
+
+def _decode_param(value: float, distribution_json: str) -> Any:
+    """Optuna stores params in internal float form; map back to the sampled value."""
+    try:
+        distribution = json.loads(distribution_json)
+    except (TypeError, ValueError):
+        return value
+    name = distribution.get("name", "")
+    attributes = distribution.get("attributes", {})
+    if name == "CategoricalDistribution":
+        return attributes["choices"][int(value)]
+    if name.startswith("Int"):
+        return int(value)
+    return value
+
+
+def _decode_attr(value_json: str) -> Any:
+    try:
+        return json.loads(value_json)
+    except (TypeError, ValueError):
+        return value_json
+
+
+class StudyStatusReader:
+    """Column-level queries over one study in an Optuna SQLite storage."""
+
+    def __init__(self, storage: str, study_name: str, create_index: bool = False):
+        self.db_path = sqlite_path(storage)
+        if not self.db_path.exists():
+            raise FileNotFoundError(f"Optuna storage not found: {self.db_path}")
+        if create_index:
+            ensure_value_index(self.db_path)
+        self._conn = sqlite3.connect(f"file:{self.db_path.resolve()}?mode=ro", uri=True, timeout=5.0)
+
+        row = self._conn.execute(
+            "SELECT study_id FROM studies WHERE study_name = ?", (study_name,)
+        ).fetchone()
+        if row is None:
+            self._conn.close()
+            raise KeyError(f"Study '{study_name}' not found in {self.db_path}")
+        self.study_name = study_name
+        self.study_id = row[0]
+        self.directions = [
+            d for _, d in self._conn.execute(
+                "SELECT objective, direction FROM study_directions WHERE study_id = ? ORDER BY objective",
+                (self.study_id,),
+            )
+        ] or ["MAXIMIZE"]
+
+    def close(self):
+        self._conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def state_counts(self) -> Dict[str, int]:
+        """Trials per state (COMPLETE, RUNNING, PRUNED, FAIL, WAITING)."""
+        return dict(self._conn.execute(
+            "SELECT state, COUNT(*) FROM trials WHERE study_id = ? GROUP BY state", (self.study_id,)
+        ))
+
+    def _rows(self, sql: str, args: tuple) -> List[Dict[str, Any]]:
+        rows = [
+            {
+                "trial_id": trial_id,
+                "number": number,
+                "state": state,
+                "value": value,
+                "datetime_complete": completed,
+            }
+            for trial_id, number, state, value, completed in self._conn.execute(sql, args)
+        ]
+        self._attach_attrs(rows)
+        return rows
+
+    def _attach_attrs(self, rows: List[Dict[str, Any]]):
+        if not rows:
+            return
+        by_id = {row["trial_id"]: row for row in rows}
+        for row in rows:
+            row["user_attrs"] = {}
+        id_marks = ",".join("?" * len(by_id))
+        key_marks = ",".join("?" * len(SUMMARY_ATTRS))
+        for trial_id, key, value_json in self._conn.execute(
+            f"SELECT trial_id, key, value_json FROM trial_user_attributes "
+            f"WHERE trial_id IN ({id_marks}) AND key IN ({key_marks})",
+            (*by_id, *SUMMARY_ATTRS),
+        ):
+            by_id[trial_id]["user_attrs"][key] = _decode_attr(value_json)
+
+    def top(self, k: int = 5, objective: int = 0) -> List[Dict[str, Any]]:
+        """K best COMPLETE trials by one objective (direction-aware), best first."""
+        order = "ASC" if self.directions[min(objective, len(self.directions) - 1)] == "MINIMIZE" else "DESC"
+        return self._rows(
+            f"""
+            SELECT t.trial_id, t.number, t.state, v.value, t.datetime_complete
+            FROM trial_values v
+            JOIN trials t ON t.trial_id = v.trial_id
+            WHERE v.objective = ? AND v.value IS NOT NULL
+              AND t.study_id = ? AND t.state = 'COMPLETE'
+            ORDER BY v.value {order}
+            LIMIT ?
+            """,
+            (objective, self.study_id, k),
+        )
+
+    def best(self, objective: int = 0) -> Optional[Dict[str, Any]]:
+        top = self.top(1, objective)
+        return top[0] if top else None
+
+    def recent(self, n: int = 10) -> List[Dict[str, Any]]:
+        """Last n trials of the study (any state), oldest first."""
+        rows = self._rows(
+            """
+            SELECT t.trial_id, t.number, t.state, v.value, t.datetime_complete
+            FROM trials t
+            LEFT JOIN trial_values v ON v.trial_id = t.trial_id AND v.objective = 0
+            WHERE t.study_id = ?
+            ORDER BY t.trial_id DESC
+            LIMIT ?
+            """,
+            (self.study_id, n),
+        )
+        return rows[::-1]
+
+    def params(self, trial_id: int) -> Dict[str, Any]:
+        """Params of one trial, decoded from Optuna's internal representation."""
+        return {
+            name: _decode_param(value, distribution_json)
+            for name, value, distribution_json in self._conn.execute(
+                "SELECT param_name, param_value, distribution_json FROM trial_params WHERE trial_id = ?",
+                (trial_id,),
+            )
+        }
+
+    def best_params(self, objective: int = 0) -> Dict[str, Any]:
+        best = self.best(objective)
+        return self.params(best["trial_id"]) if best else {}
+
+    def last_complete(self) -> Optional[str]:
+        row = self._conn.execute(
+            "SELECT datetime_complete FROM trials WHERE study_id = ? AND state = 'COMPLETE' "
+            "ORDER BY trial_id DESC LIMIT 1",
+            (self.study_id,),
+        ).fetchone()
+        return row[0] if row else None
+
+    def summary(self, top_k: int = 5, recent: int = 10) -> Dict[str, Any]:
+        counts = self.state_counts()
+        return {
+            "study_name": self.study_name,
+            "directions": self.directions,
+            "total_trials": sum(counts.values()),
+            "state_counts": counts,
+            "last_complete": self.last_complete(),
+            "top": self.top(top_k),
+            "recent": self.recent(recent),
+        }
@@ -0,0 +1,257 @@
+"""
+Columnar trade export.
+
+Trades are exported from a TradeBuffer (strategy_core) in chunks: each
+chunk becomes one DataFrame built from whole columns (dates parsed once,
+lot sizes computed per symbol group with calculate_lot_sizes) and is
+appended to the output file before the next chunk is built. Memory stays
+bounded by EXPORT_CHUNK_SIZE rows and no per-trade dicts or BacktestTrade
+objects are built.
+
+Output format follows the file suffix: .parquet needs pyarrow, anything
+else is written as CSV.
+
+Usage:
+    from tradr.utils.trade_export import export_backtest_trades
+
+    export_backtest_trades(trades, Path("ftmo_analysis_output/all_trades.csv"), risk_per_trade_pct=0.5)
+"""
+
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from strategy_core import TradeBuffer
+from tradr.risk.position_sizing import calculate_lot_sizes, get_contract_specs
+
+
+EXPORT_CHUNK_SIZE = 5000
+
+REGIME_NOTES = "Regime-Adaptive V2: Trend (ADX >= threshold) + Conservative Range (ADX < threshold)"
+
+# Empty-file headers of OutputManager's best-trial CSVs
+SUMMARY_COLUMNS = [
+    'trade_id', 'symbol', 'direction', 'entry_date', 'exit_date',
+    'entry_price', 'exit_price', 'stop_loss', 'take_profit',
+    'result_r', 'profit_usd', 'win', 'confluence_score', 'quality_factors',
+]
+
+
+def _to_utc(values: np.ndarray) -> pd.DatetimeIndex:
+    """Parse a column of datetimes/ISO strings once (unparseable -> NaT)."""
+    return pd.DatetimeIndex(pd.to_datetime(pd.Series(values), utc=True, errors="coerce", format="ISO8601"))
+
+
+def _date_strings(dates: pd.DatetimeIndex) -> np.ndarray:
+    """UTC datetimes as 'YYYY-MM-DD HH:MM:SS+00:00' strings ('' for NaT)."""
+    values = dates.tz_convert(None).to_numpy().astype("datetime64[s]")
+    text = np.char.replace(np.datetime_as_string(values, unit="s"), "T", " ")
+    text = np.char.add(text, "+00:00").astype(object)
+    text[np.isnat(values)] = ""
+    return text
+
+
+def _tp_level(exit_reasons: np.ndarray) -> np.ndarray:
+    """Highest TP number named in each exit reason (0 if none)."""
+    reasons = pd.Series(exit_reasons, dtype=object).fillna("").astype(str)
+    level = np.zeros(len(reasons), dtype=np.int64)
+    for n in range(1, 6):
+        level[reasons.str.contains(f"TP{n}", regex=False).to_numpy()] = n
+    return level
+
+
+def _lot_sizes(
+    symbols: np.ndarray,
+    entry: np.ndarray,
+    stop: np.ndarray,
+    account_size: float,
+    risk_per_trade_pct: float,
+) -> np.ndarray:
+    lots = np.zeros(len(symbols))
+    names, codes = np.unique(symbols.astype(str), return_inverse=True)
+    for code, symbol in enumerate(names):
+        idx = np.flatnonzero(codes == code)
+        lots[idx] = calculate_lot_sizes(
+            symbol, entry[idx], stop[idx],
+            account_balance=account_size,
+            risk_percent=risk_per_trade_pct / 100,
+            max_lot=100.0,
+            min_lot=0.01,
+        )
+    return lots
+
+
+def _pip_units(symbols: np.ndarray) -> np.ndarray:
+    units = {s: get_contract_specs(s).get("pip_value", 0.0001) for s in set(symbols.tolist())}
+    return np.array([units[s] for s in symbols.tolist()], dtype=np.float64)
+
+
+def backtest_trade_frame(
+    buffer: TradeBuffer,
+    start: int,
+    stop: int,
+    risk_per_trade_pct: float,
+    account_size: float,
+) -> pd.DataFrame:
+    """Rows start..stop of the buffer in the BacktestTrade CSV layout."""
+    symbols = buffer.column("symbol", start, stop)
+    entry_price = buffer.column("entry_price", start, stop)
+    stop_loss = buffer.column("stop_loss", start, stop)
+    rr = np.nan_to_num(buffer.column("rr", start, stop))
+    entry_dt = _to_utc(buffer.column("entry_date", start, stop))
+    exit_dt = _to_utc(buffer.column("exit_date", start, stop))
+    exit_reason = pd.Series(buffer.column("exit_reason", start, stop), dtype=object).fillna("").astype(str)
+
+    holding_hours = np.abs((exit_dt - entry_dt).total_seconds().to_numpy() / 3600)
+    pip_units = _pip_units(symbols)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        risk_pips = np.where(pip_units > 0, np.abs(entry_price - stop_loss) / pip_units, 0.0)
+    risk_usd = account_size * (risk_per_trade_pct / 100)
+    tp_level = _tp_level(exit_reason.to_numpy())
+    yes_no = np.array(["No", "Yes"], dtype=object)
+
+    columns = {
+        "Trade#": np.arange(start + 1, stop + 1),
+        "Symbol": symbols,
+        "Direction": pd.Series(buffer.column("direction", start, stop), dtype=object).fillna("").str.upper(),
+        "Entry Date": _date_strings(entry_dt),
+        "Entry Price": entry_price,
+        "Stop Loss Price": stop_loss,
+        "TP1 Price": np.nan_to_num(buffer.column("tp1", start, stop)),
+        "TP2 Price": buffer.column("tp2", start, stop),
+        "TP3 Price": buffer.column("tp3", start, stop),
+        "TP4 Price": buffer.column("tp4", start, stop),
+        "TP5 Price": buffer.column("tp5", start, stop),
+        "Exit Date": _date_strings(exit_dt),
+        "Exit Price": buffer.column("exit_price", start, stop),
+    }
+    for n in range(1, 6):
+        columns[f"TP{n} Hit?"] = yes_no[(tp_level >= n).astype(np.int64)]
+    columns.update({
+        "SL Hit?": yes_no[(exit_reason == "SL").to_numpy().astype(np.int64)],
+        "Final Exit Reason": exit_reason.to_numpy(),
+        "R Multiple": np.round(rr, 2),
+        "Profit/Loss USD": np.round(rr * risk_usd, 2),
+        "Confluence Score": np.nan_to_num(buffer.column("confluence_score", start, stop)).astype(np.int64),
+        "Holding Time (hours)": np.round(np.nan_to_num(holding_hours), 1),
+        "Lot Size": np.round(_lot_sizes(symbols, entry_price, stop_loss, account_size, risk_per_trade_pct), 2),
+        "Risk Pips": np.round(risk_pips, 1),
+        "ADX Value": np.zeros(stop - start),
+        "Validation Notes": REGIME_NOTES,
+    })
+    return pd.DataFrame(columns)
+
+
+def summary_trade_frame(
+    buffer: TradeBuffer,
+    start: int,
+    stop: int,
+    risk_per_trade_pct: float,
+    account_size: float,
+    quality_factors: Optional[List] = None,
+) -> pd.DataFrame:
+    """Rows start..stop of the buffer in OutputManager's best-trial CSV layout."""
+    rr = np.nan_to_num(buffer.column("rr", start, stop))
+    risk_usd = account_size * (risk_per_trade_pct / 100)
+    return pd.DataFrame({
+        'trade_id': np.arange(start + 1, stop + 1),
+        'symbol': buffer.column("symbol", start, stop),
+        'direction': buffer.column("direction", start, stop),
+        'entry_date': _date_strings(_to_utc(buffer.column("entry_date", start, stop))),
+        'exit_date': _date_strings(_to_utc(buffer.column("exit_date", start, stop))),
+        'entry_price': np.nan_to_num(buffer.column("entry_price", start, stop)),
+        'exit_price': np.nan_to_num(buffer.column("exit_price", start, stop)),
+        'stop_loss': np.nan_to_num(buffer.column("stop_loss", start, stop)),
+        'take_profit': np.nan_to_num(buffer.column("tp1", start, stop)),
+        'result_r': np.round(rr, 2),
+        'profit_usd': np.round(rr * risk_usd, 2),
+        'win': (rr > 0).astype(np.int64),
+        'confluence_score': np.nan_to_num(buffer.column("confluence_score", start, stop)).astype(np.int64),
+        'quality_factors': quality_factors[start:stop] if quality_factors is not None else 0,
+    })
+
+
+def iter_chunks(
+    buffer: TradeBuffer,
+    build: Callable[..., pd.DataFrame],
+    chunk_size: int = EXPORT_CHUNK_SIZE,
+    **kwargs,
+) -> Iterator[pd.DataFrame]:
+    for start in range(0, len(buffer), chunk_size):
+        yield build(buffer, start, min(start + chunk_size, len(buffer)), **kwargs)
+
+
+def write_chunks(path: Path, frames: Iterable[pd.DataFrame], columns: Optional[List[str]] = None) -> int:
+    """
+    Stream DataFrames to one CSV or Parquet file; returns rows written.
+
+    With no frames, a CSV gets just the `columns` header row.
+    """
+    path = Path(path)
+    rows = 0
+    if path.suffix == ".parquet":
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ImportError("Parquet export needs pyarrow: pip install pyarrow")
+        writer = None
+        try:
+            for df in frames:
+                table = pa.Table.from_pandas(df, preserve_index=False)
+                if writer is None:
+                    writer = pq.ParquetWriter(path, table.schema)
+                writer.write_table(table)
+                rows += len(df)
+        finally:
+            if writer is not None:
+                writer.close()
+        return rows
+
+    with open(path, 'w', newline='') as f:
+        header = True
+        for df in frames:
+            df.to_csv(f, header=header, index=False)
+            header = False
+            rows += len(df)
+        if header and columns:
+            f.write(",".join(columns) + "\n")
+    return rows
+
+
+def export_backtest_trades(
+    trades,
+    path: Path,
+    risk_per_trade_pct: float = 0.5,
+    account_size: float = 60000.0,
+    chunk_size: int = EXPORT_CHUNK_SIZE,
+) -> int:
+    """Write trades (list or TradeBuffer) in the BacktestTrade layout."""
+    buffer = TradeBuffer.from_trades(trades)
+    frames = iter_chunks(
+        buffer, backtest_trade_frame, chunk_size,
+        risk_per_trade_pct=risk_per_trade_pct, account_size=account_size,
+    )
+    return write_chunks(path, frames)
+
+
+def export_summary_trades(
+    trades,
+    path: Path,
+    risk_per_trade_pct: float,
+    account_size: float,
+    chunk_size: int = EXPORT_CHUNK_SIZE,
+) -> int:
+    """Write trades (list or TradeBuffer) in OutputManager's best-trial layout."""
+    quality_factors = None
+    if not isinstance(trades, TradeBuffer) and any(hasattr(t, 'quality_factors') for t in trades or []):
+        quality_factors = [getattr(t, 'quality_factors', 0) for t in trades]
+    buffer = TradeBuffer.from_trades(trades)
+    frames = iter_chunks(
+        buffer, summary_trade_frame, chunk_size,
+        risk_per_trade_pct=risk_per_trade_pct, account_size=account_size,
+        quality_factors=quality_factors,
+    )
+    return write_chunks(path, frames, columns=SUMMARY_COLUMNS)
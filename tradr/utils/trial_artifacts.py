@@ -0,0 +1,160 @@
+"""
+Side store for heavy per-trial optimization artifacts.
+
+Optuna keeps every user_attr of every trial in its SQLite DB and
+deserializes all of them on each study.trials access (TPE sampling,
+callbacks, validate_top_trials). The nested per-trial reports
+(compliance_report, quarterly_stats, overall_stats, score_breakdown) are
+therefore written here instead, and the trial only carries scalar attrs
+plus ARTIFACT_ATTR, the key of its blob.
+
+Layout under ARTIFACT_ROOT/<study_name>/:
+
+    objects/<k[:2]>/<key>.json.gz   gzip'd JSON, key = sha256 of the content
+                                    (identical reports, e.g. every rejected
+                                    trial's empty stats, share one file)
+    index.jsonl                     {"trial": n, "key": ...} per stored trial
+
+Blobs are written to a temp file and renamed, so a reader never sees a
+partial object; an existing key is never rewritten.
+
+Usage:
+    from tradr.utils.trial_artifacts import TrialArtifactStore, load_trial_artifacts
+
+    store = TrialArtifactStore.for_study("regime_adaptive_v2_clean")
+    key = store.put(trial.number, {"quarterly_stats": ..., "compliance_report": ...})
+    trial.set_user_attr(ARTIFACT_ATTR, key)
+
+    artifacts = load_trial_artifacts(trial, store)   # also reads pre-store trials
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+
+ARTIFACT_ROOT = Path("ftmo_analysis_output") / "trial_artifacts"
+
+# user_attr holding the blob key
+ARTIFACT_ATTR = "artifact_key"
+
+# Attrs that used to live in user_attrs and now go to the store
+ARTIFACT_KEYS = ("quarterly_stats", "overall_stats", "compliance_report", "score_breakdown")
+
+# Hex digits of sha256 kept as the key
+KEY_LENGTH = 32
+
+# Recently stored artifacts kept in memory for the progress callback
+RECENT_CACHE_SIZE = 64
+
+
+def _encode(artifacts: Dict[str, Any]) -> bytes:
+    return json.dumps(artifacts, sort_keys=True, separators=(",", ":"), default=str).encode("utf-8")
+
+
+class TrialArtifactStore:
+    """Content-addressed, gzip-compressed artifact files for one study."""
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+        self.objects_dir = self.root / "objects"
+        self.index_file = self.root / "index.jsonl"
+        self._lock = threading.Lock()
+        self._recent: "OrderedDict[int, Dict[str, Any]]" = OrderedDict()
+        self._index: Dict[int, str] = {}
+        self._index_size = 0
+
+    @classmethod
+    def for_study(cls, study_name: str, root: Path = ARTIFACT_ROOT) -> "TrialArtifactStore":
+        return cls(Path(root) / study_name)
+
+    def object_path(self, key: str) -> Path:
+        return self.objects_dir / key[:2] / f"{key}.json.gz"
+
+    def put(self, trial_number: int, artifacts: Dict[str, Any]) -> str:
+        """Store artifacts for a trial; returns the content key."""
+        data = _encode(artifacts)
+        key = hashlib.sha256(data).hexdigest()[:KEY_LENGTH]
+        path = self.object_path(key)
+
+        with self._lock:
+            if not path.exists():
+                path.parent.mkdir(parents=True, exist_ok=True)
+                tmp = path.with_name(f"{path.name}.{os.getpid()}.part")
+                # mtime=0 keeps the compressed bytes a pure function of the content
+                with open(tmp, "wb") as f:
+                    f.write(gzip.compress(data, compresslevel=6, mtime=0))
+                os.replace(tmp, path)
+
+            with open(self.index_file, "a") as f:
+                f.write(json.dumps({"trial": trial_number, "key": key}) + "\n")
+
+            self._index[trial_number] = key
+            self._recent[trial_number] = artifacts
+            self._recent.move_to_end(trial_number)
+            while len(self._recent) > RECENT_CACHE_SIZE:
+                self._recent.popitem(last=False)
+        return key
+
+    def get(self, key: str) -> Dict[str, Any]:
+        """Artifacts stored under a key ({} if the object is missing)."""
+        path = self.object_path(key)
+        if not path.exists():
+            return {}
+        with open(path, "rb") as f:
+            return json.loads(gzip.decompress(f.read()))
+
+    def _refresh_index(self):
+        """Read index lines appended since the last call (other processes may write too)."""
+        if not self.index_file.exists():
+            return
+        size = self.index_file.stat().st_size
+        if size <= self._index_size:
+            return
+        with open(self.index_file, "rb") as f:
+            f.seek(self._index_size)
+            chunk = f.read(size - self._index_size)
+        # Only consume complete lines
+        end = chunk.rfind(b"\n") + 1
+        for line in chunk[:end].splitlines():
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue
+            self._index[int(entry["trial"])] = entry["key"]
+        self._index_size += end
+
+    def key_for_trial(self, trial_number: int) -> Optional[str]:
+        with self._lock:
+            if trial_number not in self._index:
+                self._refresh_index()
+            return self._index.get(trial_number)
+
+    def get_trial(self, trial_number: int) -> Dict[str, Any]:
+        """Artifacts of a trial by number ({} if none were stored)."""
+        with self._lock:
+            cached = self._recent.get(trial_number)
+        if cached is not None:
+            return cached
+        key = self.key_for_trial(trial_number)
+        return self.get(key) if key else {}
+
+
+def load_trial_artifacts(trial, store: Optional[TrialArtifactStore] = None) -> Dict[str, Any]:
+    """
+    Heavy artifacts of an Optuna trial (FrozenTrial or Trial).
+
+    Trials from before the side store still carry them in user_attrs; those
+    are returned as-is so old studies keep working.
+    """
+    attrs = trial.user_attrs
+    key = attrs.get(ARTIFACT_ATTR)
+    if key and store is not None:
+        cached = store._recent.get(trial.number)
+        return cached if cached is not None else store.get(key)
+    return {name: attrs[name] for name in ARTIFACT_KEYS if name in attrs}
@@ -0,0 +1,397 @@
+"""
+Append-only trial journal for optimization runs.
+
+Every finished trial becomes one fixed-size binary record (RECORD_DTYPE)
+appended to `trials.journal` in the run's output directory. Records are
+buffered in memory and written with one write + fsync per batch
+(JOURNAL_FLUSH_EVERY records or JOURNAL_FLUSH_SECONDS, whichever comes
+first), so a crash loses at most one batch and never leaves a half record
+that the reader would trust.
+
+Parameters of each new best trial go to a small JSONL sidecar
+(`trials.params.jsonl`), one line per improvement, instead of rewriting
+best_params.json on every trial.
+
+With `text_log` set, each flushed batch is also appended to a text log in
+the format_trial() layout (optimization.log), so `tail -f` shows progress
+batch by batch.
+
+TrialJournalReader memory-maps the file as a numpy record array, so status
+queries (counts, best, top-K, recent trials) over 100k+ trials are a few
+vectorized operations and never touch the Optuna SQLite DB.
+
+Usage:
+    from tradr.utils.trial_journal import TrialJournal, TrialJournalReader
+
+    journal = TrialJournal(Path("ftmo_analysis_output/TPE/trials.journal"))
+    journal.append(trial_number=12, score=104.2, total_r=38.5, ...)
+    journal.close()
+
+    reader = TrialJournalReader(Path("ftmo_analysis_output/TPE/trials.journal"))
+    reader.summary(), reader.top(5), reader.recent(10)
+"""
+
+import atexit
+import json
+import os
+import struct
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+
+JOURNAL_FILENAME = "trials.journal"
+PARAMS_FILENAME = "trials.params.jsonl"
+
+JOURNAL_MAGIC = b"TRJ1"
+JOURNAL_VERSION = 1
+
+# Records kept in memory before a write + fsync
+JOURNAL_FLUSH_EVERY = 32
+# ...or seconds since the last flush, checked on append
+JOURNAL_FLUSH_SECONDS = 10.0
+
+# Record flags
+FLAG_BEST = 1
+FLAG_FTMO_KNOWN = 2
+FLAG_FTMO_PASSED = 4
+
+# Fixed record layout; optional metrics are NaN when not reported
+RECORD_DTYPE = np.dtype([
+    ("trial_number", "<i4"),
+    ("flags", "<u4"),
+    ("timestamp", "<f8"),
+    ("score", "<f8"),
+    ("total_r", "<f8"),
+    ("sharpe_ratio", "<f8"),
+    ("win_rate", "<f8"),
+    ("profit_factor", "<f8"),
+    ("total_trades", "<i8"),
+    ("profit_usd", "<f8"),
+    ("max_drawdown_pct", "<f8"),
+    ("ftmo_dd_pct", "<f8"),
+    ("val_total_r", "<f8"),
+    ("val_win_rate", "<f8"),
+    ("val_profit_usd", "<f8"),
+    ("final_total_r", "<f8"),
+    ("final_win_rate", "<f8"),
+    ("final_profit_usd", "<f8"),
+])
+
+# magic, version, record size, reserved
+_HEADER = struct.Struct("<4sIII")
+HEADER_SIZE = _HEADER.size
+
+_METRIC_FIELDS = tuple(
+    name for name in RECORD_DTYPE.names
+    if name not in ("trial_number", "flags", "timestamp", "total_trades")
+)
+
+
+def _header_bytes() -> bytes:
+    return _HEADER.pack(JOURNAL_MAGIC, JOURNAL_VERSION, RECORD_DTYPE.itemsize, 0)
+
+
+def _check_header(path: Path, header: bytes):
+    magic, version, record_size, _ = _HEADER.unpack(header)
+    if magic != JOURNAL_MAGIC or version != JOURNAL_VERSION or record_size != RECORD_DTYPE.itemsize:
+        raise ValueError(f"{path} is not a version {JOURNAL_VERSION} trial journal")
+
+
+def params_path_for(journal_path: Path) -> Path:
+    return Path(journal_path).with_name(PARAMS_FILENAME)
+
+
+def record_to_dict(record) -> Dict[str, Any]:
+    """Plain dict for one journal record (NaN metrics -> None, flags decoded)."""
+    flags = int(record["flags"])
+    row: Dict[str, Any] = {
+        "trial_number": int(record["trial_number"]),
+        "timestamp": datetime.fromtimestamp(float(record["timestamp"])).strftime("%Y-%m-%d %H:%M:%S"),
+        "total_trades": int(record["total_trades"]),
+        "is_best": bool(flags & FLAG_BEST),
+        "ftmo_challenge_passed": bool(flags & FLAG_FTMO_PASSED) if flags & FLAG_FTMO_KNOWN else None,
+    }
+    for name in _METRIC_FIELDS:
+        value = float(record[name])
+        row[name] = None if np.isnan(value) else value
+    return row
+
+
+def _num(value: Optional[float], spec: str) -> str:
+    """Format a metric that may be None (NaN in the journal) without raising."""
+    if value is None or value != value:
+        return "None"
+    return format(value, spec)
+
+
+def format_trial(row: Dict[str, Any]) -> str:
+    """Human-readable block for optimization.log (same layout the log always had)."""
+    lines = []
+    if row["is_best"]:
+        lines.append("-" * 80)
+        lines.append(f"🏆 NEW BEST - Trial #{row['trial_number']} [{row['timestamp']}]")
+        lines.append("-" * 80)
+    else:
+        lines.append(f"Trial #{row['trial_number']} [{row['timestamp']}]")
+
+    lines.append(f"  Score: {_num(row['score'], '.2f')} | R: {_num(row['total_r'], '+.1f')} | "
+                 f"Sharpe: {_num(row['sharpe_ratio'], '.3f')}")
+    lines.append(f"  Win Rate: {_num(row['win_rate'], '.1f')}% | PF: {_num(row['profit_factor'], '.2f')} | "
+                 f"Trades: {row['total_trades']}")
+    lines.append(f"  Profit: ${_num(row['profit_usd'], ',.2f')} | Max DD: {_num(row['max_drawdown_pct'], '.2f')}%")
+
+    if row["ftmo_dd_pct"] is not None:
+        status = "PASS" if row["ftmo_challenge_passed"] else "FAIL"
+        lines.append(f"  FTMO DD: {_num(row['ftmo_dd_pct'], '.1f')}% | Challenge: {status}")
+    if row["val_total_r"] is not None:
+        lines.append(f"  [Validation] R: {_num(row['val_total_r'], '+.1f')} | "
+                     f"WR: {_num(row['val_win_rate'], '.1f')}% | ${_num(row['val_profit_usd'], ',.2f')}")
+    if row["final_total_r"] is not None:
+        lines.append(f"  [Final 2023-2025] R: {_num(row['final_total_r'], '+.1f')} | "
+                     f"WR: {_num(row['final_win_rate'], '.1f')}% | ${_num(row['final_profit_usd'], ',.2f')}")
+    return "\n".join(lines) + "\n\n"
+
+
+class TrialJournal:
+    """Buffered appender for one journal file (and its params sidecar)."""
+
+    def __init__(
+        self,
+        path: Path,
+        flush_every: int = JOURNAL_FLUSH_EVERY,
+        flush_seconds: float = JOURNAL_FLUSH_SECONDS,
+        text_log: Optional[Path] = None,
+    ):
+        self.path = Path(path)
+        self.params_path = params_path_for(self.path)
+        self.text_log = Path(text_log) if text_log is not None else None
+        self.flush_every = max(1, flush_every)
+        self.flush_seconds = flush_seconds
+        self._buffer = np.zeros(self.flush_every, dtype=RECORD_DTYPE)
+        self._pending = 0
+        self._last_flush = time.monotonic()
+        self._file = None
+        self.start_index = self._open()
+        atexit.register(self.close)
+
+    def _open(self) -> int:
+        """Open for appending; returns the number of complete records already on disk."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "r+b" if self.path.exists() else "w+b")
+        size = os.fstat(self._file.fileno()).st_size
+        if size < HEADER_SIZE:
+            self._file.truncate(0)
+            self._file.write(_header_bytes())
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            return 0
+
+        _check_header(self.path, self._file.read(HEADER_SIZE))
+        records, partial = divmod(size - HEADER_SIZE, RECORD_DTYPE.itemsize)
+        if partial:
+            # Torn write from a crash: drop the incomplete tail record
+            self._file.truncate(size - partial)
+        self._file.seek(0, os.SEEK_END)
+        return records
+
+    def append(
+        self,
+        trial_number: int,
+        score: float,
+        total_r: float = 0.0,
+        sharpe_ratio: float = 0.0,
+        win_rate: float = 0.0,
+        profit_factor: float = 0.0,
+        total_trades: int = 0,
+        profit_usd: float = 0.0,
+        max_drawdown_pct: float = 0.0,
+        is_best: bool = False,
+        ftmo_dd_pct: Optional[float] = None,
+        ftmo_challenge_passed: Optional[bool] = None,
+        val_metrics: Optional[Dict] = None,
+        final_metrics: Optional[Dict] = None,
+        timestamp: Optional[float] = None,
+    ):
+        """Buffer one trial record; flushes when the batch is full or old enough."""
+        flags = FLAG_BEST if is_best else 0
+        if ftmo_challenge_passed is not None:
+            flags |= FLAG_FTMO_KNOWN | (FLAG_FTMO_PASSED if ftmo_challenge_passed else 0)
+        val_metrics = val_metrics or {}
+        final_metrics = final_metrics or {}
+        nan = float("nan")
+
+        self._buffer[self._pending] = (
+            trial_number, flags, time.time() if timestamp is None else timestamp,
+            score, total_r, sharpe_ratio, win_rate, profit_factor, total_trades,
+            profit_usd, max_drawdown_pct,
+            nan if ftmo_dd_pct is None else ftmo_dd_pct,
+            val_metrics.get("total_r", nan), val_metrics.get("win_rate", nan), val_metrics.get("profit_usd", nan),
+            final_metrics.get("total_r", nan), final_metrics.get("win_rate", nan), final_metrics.get("profit_usd", nan),
+        )
+        self._pending += 1
+        if self._pending >= self.flush_every or time.monotonic() - self._last_flush >= self.flush_seconds:
+            self.flush()
+
+    def append_params(self, trial_number: int, score: float, params: Dict[str, Any], source: str = "trial"):
+        """Append one best-params line to the JSONL sidecar (written and fsynced at once)."""
+        line = json.dumps({
+            "trial_number": trial_number,
+            "score": score,
+            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "source": source,
+            "params": params,
+        }, default=str)
+        with open(self.params_path, "a") as f:
+            f.write(line + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def flush(self):
+        """Write buffered records with a single write and fsync (and mirror them to text_log)."""
+        if self._file is None or self._pending == 0:
+            self._last_flush = time.monotonic()
+            return
+        batch = self._buffer[:self._pending].copy()
+        self._file.write(batch.tobytes())
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        # The batch is on disk: free the buffer before anything else can fail
+        self._pending = 0
+        self._last_flush = time.monotonic()
+        if self.text_log is not None:
+            try:
+                with open(self.text_log, "a") as f:
+                    f.write("".join(format_trial(record_to_dict(record)) for record in batch))
+            except Exception as e:
+                print(f"[TrialJournal] Error writing {self.text_log}: {e}")
+
+    def __len__(self) -> int:
+        """Records in the journal, including ones not flushed yet."""
+        if self._file is None:
+            return 0
+        size = os.fstat(self._file.fileno()).st_size
+        return (size - HEADER_SIZE) // RECORD_DTYPE.itemsize + self._pending
+
+    def close(self):
+        if self._file is None:
+            return
+        self.flush()
+        self._file.close()
+        self._file = None
+
+
+class TrialJournalReader:
+    """Memory-mapped, read-only view of a trial journal."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.records = self._map()
+
+    def _map(self) -> np.ndarray:
+        if not self.path.exists():
+            return np.zeros(0, dtype=RECORD_DTYPE)
+        size = self.path.stat().st_size
+        if size < HEADER_SIZE:
+            return np.zeros(0, dtype=RECORD_DTYPE)
+        with open(self.path, "rb") as f:
+            _check_header(self.path, f.read(HEADER_SIZE))
+        # Ignore a torn tail record that a writer is still completing
+        count = (size - HEADER_SIZE) // RECORD_DTYPE.itemsize
+        if count == 0:
+            return np.zeros(0, dtype=RECORD_DTYPE)
+        return np.memmap(self.path, dtype=RECORD_DTYPE, mode="r", offset=HEADER_SIZE, shape=(count,))
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def rows(self, start: int = 0, stop: Optional[int] = None) -> List[Dict[str, Any]]:
+        return [record_to_dict(r) for r in self.records[start:stop]]
+
+    def best(self, key: str = "score") -> Optional[Dict[str, Any]]:
+        top = self.top(1, key)
+        return top[0] if top else None
+
+    def top(self, k: int = 5, key: str = "score") -> List[Dict[str, Any]]:
+        """K highest records by `key` (NaN ignored), best first."""
+        values = np.asarray(self.records[key], dtype=np.float64)
+        valid = np.flatnonzero(~np.isnan(values))
+        if valid.size == 0 or k <= 0:
+            return []
+        k = min(k, valid.size)
+        part = valid[np.argpartition(-values[valid], k - 1)[:k]]
+        order = part[np.argsort(-values[part], kind="stable")]
+        return [record_to_dict(self.records[i]) for i in order]
+
+    def recent(self, n: int = 10) -> List[Dict[str, Any]]:
+        """Last n records, oldest first."""
+        return self.rows(max(0, len(self.records) - n))
+
+    def summary(self) -> Dict[str, Any]:
+        """Trial count, pass count, best and last trial, time span."""
+        records = self.records
+        if len(records) == 0:
+            return {"trials": 0}
+        flags = np.asarray(records["flags"])
+        timestamps = np.asarray(records["timestamp"])
+        return {
+            "trials": int(len(records)),
+            "unique_trials": int(np.unique(records["trial_number"]).size),
+            "ftmo_passed": int(np.count_nonzero(flags & FLAG_FTMO_PASSED)),
+            "new_bests": int(np.count_nonzero(flags & FLAG_BEST)),
+            "first_logged": datetime.fromtimestamp(float(timestamps.min())).strftime("%Y-%m-%d %H:%M:%S"),
+            "last_logged": datetime.fromtimestamp(float(timestamps.max())).strftime("%Y-%m-%d %H:%M:%S"),
+            "best": self.best(),
+            "last": record_to_dict(records[-1]),
+        }
+
+    def latest_params(self) -> Optional[Dict[str, Any]]:
+        """Most recent line of the params sidecar, read from the end of the file."""
+        return read_latest_params(params_path_for(self.path))
+
+
+def read_latest_params(params_path: Path) -> Optional[Dict[str, Any]]:
+    """Last complete JSON line of a params sidecar (None if missing/empty)."""
+    params_path = Path(params_path)
+    if not params_path.exists():
+        return None
+    with open(params_path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        end = f.tell()
+        chunk = 4096
+        data = b""
+        while end > 0:
+            start = max(0, end - chunk)
+            f.seek(start)
+            data = f.read(end - start) + data
+            end = start
+            lines = data.rstrip(b"\n").split(b"\n")
+            if len(lines) > 1 or end == 0:
+                for line in reversed(lines):
+                    try:
+                        return json.loads(line)
+                    except ValueError:
+                        continue
+                return None
+            chunk *= 2
+    return None
+
+
+def find_journals(output_dir: Path = Path("ftmo_analysis_output")) -> List[Path]:
+    """Journals of every mode directory under the output dir, newest first."""
+    journals = [p for p in Path(output_dir).glob(f"*/{JOURNAL_FILENAME}") if p.stat().st_size > HEADER_SIZE]
+    return sorted(journals, key=lambda p: p.stat().st_mtime, reverse=True)
+
+
+def write_json_atomic(path: Path, data: Any):
+    """Write JSON via a temp file + rename so readers never see a partial file."""
+    path = Path(path)
+    tmp = path.with_name(path.name + ".part")
+    with open(tmp, "w") as f:
+        json.dump(data, f, indent=2)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)